@@ -0,0 +1,335 @@
+"""
+Auto Rigger Batch Builder
+github.com/TrevisanGMW/gt-tools
+
+Builds rigs from multiple project files (JSON) using a pool of headless Maya processes ("mayapy").
+Every project is built in its own process and saved as a Maya file. Logs and timings are collected per project.
+This script should not import "maya.cmds" at the module level, as the dispatcher runs outside of Maya.
+
+Workers load projects the same way "RiggerModel.load_project_from_file" does ("read_project_file" followed by
+"RigProject.read_data_from_dict"), but without the model. The model logs read errors and keeps its current
+(default) project, which would build and save a default rig. Workers let the error fail the build instead.
+
+Command line:
+    mayapy rig_batch_builder.py <project files or folders> -o <output folder> [-w <workers>] [-r <retries>]
+    Use "-h" to see all options. Results are also written to "<output folder>/batch_report.json".
+"""
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, asdict
+import subprocess
+import traceback
+import argparse
+import logging
+import json
+import time
+import sys
+import os
+
+# Logging Setup
+logging.basicConfig()
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+PROJECT_FILE_EXTENSIONS = (".rig", ".json")  # Project files are JSON data, but use ".rig" when saved by the rigger
+BATCH_REPORT_FILE_NAME = "batch_report.json"
+MAYA_FILE_TYPES = {".ma": "mayaAscii", ".mb": "mayaBinary"}
+
+
+@dataclass
+class BatchBuildResult:
+    """
+    Describes the build of one project file. (See "run_batch_build")
+    """
+    project_path: str  # Path to the project file (JSON)
+    output_path: str  # Path to the saved Maya file
+    log_path: str  # Path to the log file (output of all attempts)
+    success: bool = False
+    attempts: int = 0
+    duration: float = 0.0  # Total time in seconds (all attempts, including Maya startup)
+    build_duration: float = 0.0  # Time in seconds spent building the last attempt (without Maya startup)
+    error: str = None  # Error of the last failed attempt
+
+
+def get_project_files(paths):
+    """
+    Gets the project files from a list of files and folders.
+    Folders are searched for ".rig" and ".json" files. (not recursive)
+    Args:
+        paths (list): A list of paths to project files or folders containing project files.
+    Returns:
+        list: A sorted list of paths to project files (without duplicates).
+    """
+    project_files = set()
+    for path in paths:
+        if os.path.isdir(path):
+            for file_name in os.listdir(path):
+                if file_name.endswith(PROJECT_FILE_EXTENSIONS) and file_name != BATCH_REPORT_FILE_NAME:
+                    project_files.add(os.path.join(path, file_name))
+        elif os.path.isfile(path):
+            project_files.add(path)
+        else:
+            logger.warning(f'Project file or folder not found: "{path}".')
+    return sorted(os.path.abspath(path) for path in project_files)
+
+
+def get_output_names(project_paths):
+    """
+    Gets a unique output name for each project file. Output files (Maya file, log, profile) use these names.
+    Projects sharing a file name (from different folders) receive a numbered suffix. e.g. "biped", "biped_2"
+    Args:
+        project_paths (list): A list of paths to project files.
+    Returns:
+        dict: Project paths (keys) and their output names without extension (values).
+    """
+    output_names = {}
+    used_names = set()
+    for project_path in project_paths:
+        base_name = os.path.splitext(os.path.basename(project_path))[0]
+        output_name = base_name
+        suffix = 2
+        while output_name.lower() in used_names:  # Lower case, as file names are case-insensitive on Windows
+            output_name = f'{base_name}_{suffix}'
+            suffix += 1
+        used_names.add(output_name.lower())
+        output_names[project_path] = output_name
+    return output_names
+
+
+# ------------------------------------------------- Worker -------------------------------------------------
+def build_project_file(project_path, output_path, build_rig=True):
+    """
+    Builds a project file in the current Maya session and saves the result. (Runs inside Maya)
+    Args:
+        project_path (str): Path to the project file. (JSON)
+        output_path (str): Path to the Maya file to save. (".ma" or ".mb")
+        build_rig (bool, optional): If True, the rig is built. If False, only the proxy is built.
+    Raises:
+        OSError: If the project file can't be read.
+        ValueError: If the project file is not a valid project description.
+    Returns:
+        dict: Build information. Keys: "build_duration" (seconds) and "profile" (see "BuildProfiler.to_dict")
+    """
+    from gt.tools.auto_rigger.rig_serialization import read_project_file
+    from gt.tools.auto_rigger.rig_profiler import BuildProfiler
+    from gt.tools.auto_rigger.rig_framework import RigProject
+    import maya.cmds as cmds
+
+    start_time = time.perf_counter()
+    data = read_project_file(project_path)  # Raises, so invalid projects fail instead of building a default rig
+    cmds.file(new=True, force=True)
+    project = RigProject()
+    project.read_data_from_dict(data)
+    with BuildProfiler() as profiler:
+        project.build_proxy(optimized=build_rig)
+        if build_rig:
+            project.build_rig()
+    file_type = MAYA_FILE_TYPES.get(os.path.splitext(output_path)[1].lower(), "mayaBinary")
+    cmds.file(rename=output_path)
+    cmds.file(save=True, type=file_type, force=True)
+    return {"build_duration": time.perf_counter() - start_time, "profile": profiler.to_dict()}
+
+
+def run_worker(project_path, output_path, result_path, build_rig=True):
+    """
+    Entry point of the worker processes. Initializes Maya, builds the project and writes the result file.
+    Args:
+        project_path (str): Path to the project file. (JSON)
+        output_path (str): Path to the Maya file to save.
+        result_path (str): Path to the result file (JSON) read by the dispatcher.
+        build_rig (bool, optional): If True, the rig is built. If False, only the proxy is built.
+    Returns:
+        int: Exit code. 0 if the build was successful, 1 otherwise.
+    """
+    result = {"success": False}
+    try:
+        import maya.standalone
+        maya.standalone.initialize()
+        result.update(build_project_file(project_path=project_path, output_path=output_path, build_rig=build_rig))
+        result["success"] = True
+    except Exception as e:
+        result["error"] = str(e)
+        traceback.print_exc()
+    with open(result_path, "w") as result_file:
+        json.dump(result, result_file, indent=4)
+    return 0 if result.get("success") else 1
+
+
+# ----------------------------------------------- Dispatcher -----------------------------------------------
+def get_worker_command(maya_python, project_path, output_path, result_path, build_rig=True):
+    """
+    Gets the command used to start a worker process.
+    Args:
+        maya_python (str): Path to the Maya Python executable. ("mayapy")
+        project_path (str): Path to the project file. (JSON)
+        output_path (str): Path to the Maya file to save.
+        result_path (str): Path to the result file written by the worker.
+        build_rig (bool, optional): If True, the rig is built. If False, only the proxy is built.
+    Returns:
+        list: Command arguments. e.g. ["mayapy", "rig_batch_builder.py", "--worker", ...]
+    """
+    command = [maya_python, os.path.abspath(__file__), "--worker", project_path,
+               "--output", output_path, "--result", result_path]
+    if not build_rig:
+        command.append("--proxy-only")
+    return command
+
+
+def build_project_in_process(maya_python, project_path, output_dir, retries=1, build_rig=True,
+                             file_extension=".mb", timeout=None, output_name=None):
+    """
+    Builds a project in a new Maya process, retrying failed attempts.
+    Args:
+        maya_python (str): Path to the Maya Python executable. ("mayapy")
+        project_path (str): Path to the project file. (JSON)
+        output_dir (str): Folder where the Maya file and the log file are saved.
+        retries (int, optional): Number of times a failed build is attempted again.
+        build_rig (bool, optional): If True, the rig is built. If False, only the proxy is built.
+        file_extension (str, optional): Extension of the saved Maya file. ".ma" or ".mb"
+        timeout (float, optional): Maximum time (seconds) of one attempt. None means no limit.
+        output_name (str, optional): Name used for the output files (without extension).
+                                     If not provided, the project file name is used. (See "get_output_names")
+    Returns:
+        BatchBuildResult: Result of the build.
+    """
+    base_name = output_name or os.path.splitext(os.path.basename(project_path))[0]
+    result = BatchBuildResult(project_path=project_path,
+                              output_path=os.path.join(output_dir, f'{base_name}{file_extension}'),
+                              log_path=os.path.join(output_dir, f'{base_name}.log'))
+    result_path = os.path.join(output_dir, f'{base_name}_result.json')
+    command = get_worker_command(maya_python=maya_python, project_path=project_path,
+                                 output_path=result.output_path, result_path=result_path, build_rig=build_rig)
+    start_time = time.perf_counter()
+    with open(result.log_path, "w") as log_file:
+        while not result.success and result.attempts <= retries:
+            result.attempts += 1
+            log_file.write(f'# Attempt {result.attempts}: {subprocess.list2cmdline(command)}\n')
+            log_file.flush()
+            if os.path.exists(result_path):
+                os.remove(result_path)
+            try:
+                subprocess.run(command, stdout=log_file, stderr=subprocess.STDOUT, timeout=timeout)
+            except subprocess.TimeoutExpired:
+                result.error = f'Timed out after {timeout} seconds.'
+                continue
+            try:
+                with open(result_path, "r") as result_file:
+                    worker_result = json.load(result_file)
+            except Exception as e:
+                result.error = f'Unable to read worker result. Issue: {str(e)}'
+                continue
+            result.success = worker_result.get("success", False)
+            result.error = worker_result.get("error")
+            result.build_duration = worker_result.get("build_duration", 0.0)
+            if worker_result.get("profile"):
+                with open(os.path.join(output_dir, f'{base_name}_profile.json'), "w") as profile_file:
+                    json.dump(worker_result.get("profile"), profile_file, indent=4)
+    if os.path.exists(result_path):
+        os.remove(result_path)
+    result.duration = time.perf_counter() - start_time
+    return result
+
+
+def run_batch_build(project_paths, output_dir, max_workers=None, retries=1, build_rig=True,
+                    file_extension=".mb", timeout=None, maya_python=None, preferred_version=None):
+    """
+    Builds multiple project files in parallel. Each project is built in its own Maya process ("mayapy").
+    The dispatcher only waits for the processes, so the number of workers should match the number of cores.
+    Args:
+        project_paths (list): Paths to project files or folders with project files. (See "get_project_files")
+        output_dir (str): Folder where the Maya files, logs, profiles and the batch report are saved.
+        max_workers (int, optional): Number of Maya processes running at the same time. Default is the core count.
+        retries (int, optional): Number of times a failed build is attempted again.
+        build_rig (bool, optional): If True, the rig is built. If False, only the proxy is built.
+        file_extension (str, optional): Extension of the saved Maya files. ".ma" or ".mb"
+        timeout (float, optional): Maximum time (seconds) of one attempt. None means no limit.
+        maya_python (str, optional): Path to "mayapy". If not provided, the latest installed version is used.
+        preferred_version (str, optional): Preferred Maya version when "maya_python" is not provided. e.g. "2024"
+    Returns:
+        list: A list of BatchBuildResult objects (same order as the project files).
+    """
+    if not maya_python:
+        from gt.utils.system_utils import get_maya_executable
+        maya_python = get_maya_executable(get_maya_python=True, preferred_version=preferred_version)
+    if not maya_python or not os.path.exists(maya_python):
+        logger.warning(f'Unable to run batch build. Maya Python ("mayapy") not found.')
+        return []
+    project_files = get_project_files(project_paths)
+    if not project_files:
+        logger.warning(f'Unable to run batch build. No project files found.')
+        return []
+    os.makedirs(output_dir, exist_ok=True)
+    max_workers = max_workers or os.cpu_count() or 1
+    output_names = get_output_names(project_files)
+
+    start_time = time.perf_counter()
+    results = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(build_project_in_process, maya_python, project_path, output_dir,
+                                   retries, build_rig, file_extension, timeout,
+                                   output_names.get(project_path)): project_path
+                   for project_path in project_files}
+        for future in as_completed(futures):
+            result = future.result()
+            results[futures.get(future)] = result
+            status = "Built" if result.success else "Failed"
+            logger.info(f'{status}: "{result.project_path}" ({result.duration:.1f}s, '
+                        f'{result.attempts} attempt(s)). Log: "{result.log_path}"')
+    results = [results.get(project_path) for project_path in project_files]
+
+    duration = time.perf_counter() - start_time
+    report = {"duration": duration,
+              "workers": max_workers,
+              "built": sum(result.success for result in results),
+              "failed": sum(not result.success for result in results),
+              "results": [asdict(result) for result in results]}
+    with open(os.path.join(output_dir, BATCH_REPORT_FILE_NAME), "w") as report_file:
+        json.dump(report, report_file, indent=4)
+    logger.info(f'Batch build finished in {duration:.1f}s: {report.get("built")} built, '
+                f'{report.get("failed")} failed. ({max_workers} workers)')
+    return results
+
+
+def main(args=None):
+    """
+    Command line entry point. Runs the dispatcher or, when using "--worker", a worker process.
+    Args:
+        args (list, optional): Command line arguments. Default is "sys.argv[1:]"
+    Returns:
+        int: Exit code. 0 if all projects were built, 1 otherwise.
+    """
+    parser = argparse.ArgumentParser(description="Builds auto rigger project files using headless Maya processes.")
+    parser.add_argument("projects", nargs="+", help="Project files (JSON) or folders containing project files.")
+    parser.add_argument("-o", "--output", help="Output folder. (Maya file when using \"--worker\")")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="Number of Maya processes. (Core count)")
+    parser.add_argument("-r", "--retries", type=int, default=1, help="Retries for failed builds.")
+    parser.add_argument("-t", "--timeout", type=float, default=None, help="Time limit per attempt in seconds.")
+    parser.add_argument("--ascii", action="store_true", help="Save Maya ASCII files instead of Maya binary.")
+    parser.add_argument("--proxy-only", action="store_true", help="Build only the proxy.")
+    parser.add_argument("--mayapy", default=None, help="Path to \"mayapy\". (Latest installed version)")
+    parser.add_argument("--maya-version", default=None, help="Preferred Maya version. e.g. \"2024\"")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--result", help=argparse.SUPPRESS)
+    parsed_args = parser.parse_args(args)
+
+    if parsed_args.worker:
+        return run_worker(project_path=parsed_args.projects[0], output_path=parsed_args.output,
+                          result_path=parsed_args.result, build_rig=not parsed_args.proxy_only)
+    if not parsed_args.output:
+        parser.error("Missing output folder. Use \"-o <output folder>\".")
+    results = run_batch_build(project_paths=parsed_args.projects,
+                              output_dir=parsed_args.output,
+                              max_workers=parsed_args.workers,
+                              retries=parsed_args.retries,
+                              build_rig=not parsed_args.proxy_only,
+                              file_extension=".ma" if parsed_args.ascii else ".mb",
+                              timeout=parsed_args.timeout,
+                              maya_python=parsed_args.mayapy,
+                              preferred_version=parsed_args.maya_version)
+    return 0 if results and all(result.success for result in results) else 1
+
+
+if __name__ == "__main__":
+    _package_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+    if _package_root not in sys.path:
+        sys.path.append(_package_root)  # Ensure package is available when running as a script
+    sys.exit(main())
@@ -19,7 +19,9 @@ from gt.tools.auto_rigger.rig_utils import parent_proxies, create_proxy_root_cur
 from gt.tools.auto_rigger.rig_utils import find_skeleton_group, create_direction_curve, get_meta_purpose_from_dict
 from gt.tools.auto_rigger.rig_utils import find_driver_from_uuid, find_proxy_from_uuid, create_control_root_curve
 from gt.tools.auto_rigger.rig_utils import create_utility_groups, create_root_group, find_proxy_root_group
-from gt.tools.auto_rigger.rig_utils import find_drivers_from_joint
+from gt.tools.auto_rigger.rig_utils import find_drivers_from_joint, RigBuildCache, delete_proxy_visualization_lines
+from gt.tools.auto_rigger.rig_utils import find_proxy_root_curve, find_objects_with_attr, find_rig_root_group
+from gt.tools.auto_rigger.rig_profiler import profile_phase
 from gt.utils.attr_utils import add_separator_attr, set_attr, add_attr, list_user_defined_attr, get_attr
 from gt.utils.string_utils import remove_prefix, camel_case_split, remove_suffix, upper_first_char
 from gt.utils.uuid_utils import add_uuid_attr, is_uuid_valid, is_short_uuid_valid, generate_uuid
@@ -27,6 +29,8 @@ from gt.utils.color_utils import add_side_color_setup, ColorConstants, set_color
 from gt.utils.transform_utils import Transform, match_translate, match_rotate
 from gt.utils.curve_utils import Curve, get_curve, add_shape_scale_cluster
 from gt.utils.iterable_utils import get_highest_int_from_str_list
+from gt.utils.math_utils import is_float_equal
+from gt.utils.scene_utils import CreatedNodesRecorder
 from gt.utils.naming_utils import NamingConstants, get_long_name
 from gt.utils.uuid_utils import get_object_from_uuid_attr
 from gt.utils.control_utils import add_snapping_shape
@@ -37,7 +41,10 @@ from gt.utils import hierarchy_utils
 from gt.ui import resource_library
 from dataclasses import dataclass
 import maya.cmds as cmds
+import hashlib
 import logging
+import json
+import copy
 import re
 
 
@@ -52,6 +59,7 @@ class ProxyData:
     """
     A proxy data class used as the proxy response for when the proxy is built.
     """
+    __slots__ = ("name", "offset", "setup", "uuid")  # Fields have no defaults, so slots don't conflict with them
     name: str  # Long name of the generated proxy (full Maya path)
     offset: str  # Name of the proxy offset (parent of the proxy)
     setup: tuple  # Name of the proxy setup items (rig setup items)
@@ -120,6 +128,8 @@ class OrientationData:
         inherit = "inherit"  # Inherits the joint orientation from the proxy used to generate it.
         world = "world"  # Orients the joint to the world.
 
+    __slots__ = ("method", "aim_axis", "up_axis", "up_dir")
+
     def __init__(self, method=Methods.automatic,
                  aim_axis=(1, 0, 0),
                  up_axis=(0, 1, 0),
@@ -303,25 +313,51 @@ class OrientationData:
 
 
 class Proxy:
+    # Proxies are created in large numbers (one per joint in every module), slots keep them small and fast to create
+    __slots__ = ("name", "transform", "offset_transform", "_curve", "uuid", "parent_uuid", "locator_scale",
+                 "attr_dict", "metadata", "built_snapshot")
+
     def __init__(self, name=None, uuid=None):
 
         # Default Values
         self.name = "proxy"
         self.transform = None
         self.offset_transform = None
-        self.curve = get_curve('_proxy_joint')
-        self.curve.set_name(name=self.name)
+        self._curve = None  # Default curve is only created when used. (See "curve")
         self.uuid = generate_uuid(remove_dashes=True)
         self.parent_uuid = None
         self.locator_scale = 1  # 100% - Initial curve scale
         self.attr_dict = {}
         self.metadata = None
+        self.built_snapshot = None  # Proxy data used in the last proxy build (see "get_dirty_keys")
 
         if name:
             self.set_name(name)
         if uuid:
             self.set_uuid(uuid)
 
+    @property
+    def curve(self):
+        """
+        Gets the curve used to build the proxy element. The default curve is created on first access, as most
+        proxies loaded from projects or created by modules are replaced or discarded before being built.
+        Returns:
+            Curve or None: Curve object used to build the proxy.
+        """
+        if self._curve is None:
+            self._curve = get_curve('_proxy_joint')
+            self._curve.set_name(name=self.name)
+        return self._curve
+
+    @curve.setter
+    def curve(self, curve):
+        """
+        Sets the curve used to build the proxy element. (See "set_curve" for a validated version)
+        Args:
+            curve (Curve): A Curve object to be used for building the proxy element (its shape)
+        """
+        self._curve = curve
+
     def is_valid(self):
         """
         Checks if the current proxy element is valid
@@ -463,7 +499,8 @@ class Proxy:
         if name is None or not isinstance(name, str):
             logger.warning(f'Unable to set new name. Expected string but got "{str(type(name))}"')
             return
-        self.curve.set_name(name)
+        if self._curve is not None:  # Default curve gets its name when created
+            self._curve.set_name(name)
         self.name = name
 
     def set_transform(self, transform):
@@ -811,7 +848,7 @@ class Proxy:
         offset_transform = proxy_dict.get('offsetTransform')
         if offset_transform and len(offset_transform) == 3:
             self._initialize_offset_transform()
-            self.offset_transform.set_transform_from_dict(transform_dict=transform)
+            self.offset_transform.set_transform_from_dict(transform_dict=offset_transform)
 
         attributes = proxy_dict.get('attributes')
         if attributes:
@@ -972,6 +1009,96 @@ class Proxy:
 
         return proxy_data
 
+    # ----------------------------------------------- Dirty Tracking -----------------------------------------------
+    def get_proxy_snapshot(self):
+        """
+        Gets a copy of the data used to build this proxy. Used to detect changes made after it was built.
+        Returns:
+            dict: Proxy data (see "get_proxy_as_dict") plus a "curve" key describing the curve shapes.
+        """
+        snapshot = copy.deepcopy(self.get_proxy_as_dict())
+        snapshot["curve"] = self.curve.get_shapes_key() if self.curve else None
+        return snapshot
+
+    def update_built_snapshot(self):
+        """
+        Stores the current proxy data as the built data. Called after the proxy is built or updated in the scene.
+        """
+        self.built_snapshot = self.get_proxy_snapshot()
+
+    def clear_built_snapshot(self):
+        """
+        Clears the built data, so the proxy is considered changed (dirty) until it's built again.
+        """
+        self.built_snapshot = None
+
+    def get_dirty_keys(self):
+        """
+        Gets the keys of the proxy data that changed since the proxy was built. (See "get_proxy_snapshot")
+        e.g. {"transform", "attributes"} - Colors are stored in the attributes.
+        Returns:
+            set: Keys of the changed data. Empty if nothing changed. All keys if the proxy was never built.
+        """
+        snapshot = self.get_proxy_snapshot()
+        if self.built_snapshot is None:
+            return set(snapshot)
+        keys = set(snapshot) | set(self.built_snapshot)
+        return {key for key in keys if snapshot.get(key) != self.built_snapshot.get(key)}
+
+    def is_dirty(self):
+        """
+        Checks if the proxy data changed since the proxy was built.
+        Returns:
+            bool: True if changed (or never built), False otherwise.
+        """
+        return bool(self.get_dirty_keys())
+
+    def has_scene_changes(self, tolerance=0.001):
+        """
+        Checks if the built proxy was edited in the scene (e.g. moved in the viewport) since it was built or updated.
+        The transform and the user-defined attributes found in the scene are compared against the built data.
+        Args:
+            tolerance (float, optional): Maximum difference between numeric values considered equal.
+        Returns:
+            bool: True if the proxy in the scene is missing or doesn't match the built data, False otherwise.
+                  Proxies that were never built are not considered changed.
+        """
+        if self.built_snapshot is None:
+            return False
+        if not find_proxy_from_uuid(self.uuid):
+            return True
+        scene_proxy = Proxy(uuid=self.uuid).read_data_from_scene()
+        built_transform = self.built_snapshot.get("transform") or Transform().get_transform_as_dict()
+        scene_transform = (scene_proxy.transform or Transform()).get_transform_as_dict()
+        if not self._is_value_close(built_transform, scene_transform, tolerance=tolerance):
+            return True
+        built_attrs = self.built_snapshot.get("attributes") or {}
+        for attr, value in scene_proxy.get_attr_dict().items():
+            if attr in built_attrs and not self._is_value_close(built_attrs.get(attr), value, tolerance=tolerance):
+                return True
+        return False
+
+    @staticmethod
+    def _is_value_close(value_a, value_b, tolerance=0.001):
+        """
+        Compares two values. Numbers are compared using a tolerance, dictionaries and sequences are compared per item.
+        Args:
+            value_a (any): First value.
+            value_b (any): Second value.
+            tolerance (float, optional): Maximum difference between numeric values considered equal.
+        Returns:
+            bool: True if the values are equal (or close enough), False otherwise.
+        """
+        if isinstance(value_a, (int, float)) and isinstance(value_b, (int, float)):
+            return is_float_equal(value_a, value_b, tolerance=tolerance)
+        if isinstance(value_a, dict) and isinstance(value_b, dict):
+            return set(value_a) == set(value_b) and \
+                all(Proxy._is_value_close(value_a.get(key), value_b.get(key), tolerance) for key in value_a)
+        if isinstance(value_a, (list, tuple)) and isinstance(value_b, (list, tuple)):
+            return len(value_a) == len(value_b) and \
+                all(Proxy._is_value_close(item_a, item_b, tolerance) for item_a, item_b in zip(value_a, value_b))
+        return value_a == value_b
+
 
 class ModuleGeneric:
     __version__ = '0.1.1-beta'
@@ -993,6 +1120,7 @@ class ModuleGeneric:
         self.metadata = None
         self.active = True
         self.orientation = OrientationData()
+        self.built_snapshot = None  # Module data used in the last proxy build (see "is_proxy_rebuild_required")
 
         if name:
             self.set_name(name)
@@ -1478,6 +1606,85 @@ class ModuleGeneric:
         module_data["proxies"] = module_proxies
         return module_data
 
+    def get_module_hash(self):
+        """
+        Gets a hash of the module data (see "get_module_as_dict"). Modules with the same hash build the same rig.
+        Used to detect modules that changed since the rig was built. (See "RigProject.update_rig")
+        Returns:
+            str: Hexadecimal hash string.
+        """
+        module_data = json.dumps(self.get_module_as_dict(), sort_keys=True, default=str)
+        return hashlib.sha256(module_data.encode("utf-8")).hexdigest()
+
+    def get_module_snapshot(self):
+        """
+        Gets a copy of the module settings that determine how its proxies are built. (proxy data is not included)
+        Used to detect changes that require the proxies of this module to be rebuilt. e.g. A new prefix.
+        Returns:
+            dict: Module data (see "get_module_as_dict") with a list of proxy UUIDs instead of the proxy data.
+        """
+        snapshot = copy.deepcopy(self.get_module_as_dict())
+        snapshot.pop("name", None)  # Display name only, not used by proxies
+        snapshot["proxies"] = self.get_proxies_uuids()
+        return snapshot
+
+    def update_built_snapshot(self):
+        """
+        Stores the current module and proxy data as the built data. Called after the proxies are built or updated.
+        """
+        self.built_snapshot = self.get_module_snapshot()
+        for proxy in self.proxies:
+            proxy.update_built_snapshot()
+
+    def clear_built_snapshot(self):
+        """
+        Clears the built data, so the module is considered changed (dirty) until it's built again.
+        """
+        self.built_snapshot = None
+        for proxy in self.proxies:
+            proxy.clear_built_snapshot()
+
+    def get_built_proxies_uuids(self):
+        """
+        Gets the UUIDs of the proxies created in the last proxy build. (Can differ from the current proxies)
+        Returns:
+            list: A list of UUIDs. Empty if never built.
+        """
+        if not self.built_snapshot:
+            return []
+        return self.built_snapshot.get("proxies", [])
+
+    def get_dirty_proxies(self):
+        """
+        Gets the proxies of this module with data changed since they were built. (See "Proxy.get_dirty_keys")
+        Returns:
+            list: A list of Proxy objects.
+        """
+        return [proxy for proxy in self.proxies if proxy.is_dirty()]
+
+    def is_proxy_rebuild_required(self):
+        """
+        Checks if the proxies of this module must be rebuilt (instead of updated) to match the module data.
+        This happens when the module was never built, its settings changed (e.g. prefix or orientation),
+        proxies were added or removed, or the name or curve of a proxy changed.
+        Returns:
+            bool: True if a rebuild is required, False if the built proxies can be updated in place.
+        """
+        if self.built_snapshot is None or self.built_snapshot != self.get_module_snapshot():
+            return True
+        for proxy in self.proxies:
+            if proxy.get_dirty_keys() & {"name", "curve"}:
+                return True
+        return False
+
+    def is_dirty(self):
+        """
+        Checks if the module or any of its proxies changed since they were built.
+        Returns:
+            bool: True if changed (or never built), False otherwise.
+        """
+        return self.is_proxy_rebuild_required() or bool(self.get_dirty_proxies())
+
     def get_module_class_name(self, remove_module_prefix=False, formatted=False, remove_side=False):
         """
         Gets the name of this class
@@ -1917,6 +2124,8 @@ class RigProject:
         self.prefix = None
         self.modules = []
         self.metadata = None
+        self.built_proxy_modules = None  # Modules used in the last (not optimized) proxy build. See "update_proxy"
+        self.built_rig_data = None  # Module hashes and created nodes of the last rig build. See "update_rig"
 
         if name:
             self.set_name(name=name)
@@ -2166,51 +2375,237 @@ class RigProject:
         """
         cmds.refresh(suspend=True)
         try:
-            root_group = create_root_group(is_proxy=True)
-            root_transform = create_proxy_root_curve()
-            hierarchy_utils.parent(source_objects=root_transform, target_parent=root_group)
-            category_groups = create_utility_groups(line=True, target_parent=root_group)
-            line_grp = category_groups.get(RiggerConstants.REF_ATTR_LINES)
-            attr_to_activate = ['overrideEnabled', 'overrideDisplayType', "hiddenInOutliner"]
-            set_attr(obj_list=line_grp, attr_list=attr_to_activate, value=1)
-            add_attr(obj_list=str(root_transform),
-                     attributes="linesVisibility",
-                     attr_type="bool",
-                     default=True)
-            cmds.connectAttr(f'{root_transform}.linesVisibility', f'{line_grp}.visibility')
-
-            # Build Proxy
-            proxy_data_list = []
-            for module in self.modules:
-                if not module.is_active():  # If not active, skip
-                    continue
+            with RigBuildCache():  # Scene lookups are repeated many times during builds
+                self.built_proxy_modules = None
+                root_group = create_root_group(is_proxy=True)
+                root_transform = create_proxy_root_curve()
+                hierarchy_utils.parent(source_objects=root_transform, target_parent=root_group)
+                category_groups = create_utility_groups(line=True, target_parent=root_group)
+                line_grp = category_groups.get(RiggerConstants.REF_ATTR_LINES)
+                attr_to_activate = ['overrideEnabled', 'overrideDisplayType', "hiddenInOutliner"]
+                set_attr(obj_list=line_grp, attr_list=attr_to_activate, value=1)
+                add_attr(obj_list=str(root_transform),
+                         attributes="linesVisibility",
+                         attr_type="bool",
+                         default=True)
+                cmds.connectAttr(f'{root_transform}.linesVisibility', f'{line_grp}.visibility')
+
+                active_modules = [module for module in self.modules if module.is_active()]
+                self._build_module_proxies(modules=active_modules,
+                                           root_transform=root_transform,
+                                           line_grp=line_grp,
+                                           optimized=optimized)
+                if not optimized:  # Optimized proxies can't be updated (see "update_proxy")
+                    self._update_built_proxy_modules(modules=active_modules)
+
+                cmds.select(clear=True)
+        except Exception as e:
+            raise e
+        finally:
+            cmds.refresh(suspend=False)
+            cmds.refresh()
+
+    def _build_module_proxies(self, modules, root_transform, line_grp, optimized=False):
+        """
+        Builds the proxies of the provided modules and their proxy setup. (Used by "build_proxy" and "update_proxy")
+        Args:
+            modules (list): Active modules to build.
+            root_transform (str): Proxy root curve. Built proxies are parented under it (or under their parent proxy)
+            line_grp (str): Group used to store the visualization lines and the proxy setup items.
+            optimized (bool, optional): If True, display operations are skipped. (See "ModuleGeneric.build_proxy")
+        """
+        # Build Proxy
+        proxy_data_list = []
+        for module in modules:
+            with profile_phase("build_proxy", module=module):
                 proxy_data_list += module.build_proxy(optimized=optimized)
 
-            for proxy_data in proxy_data_list:
-                add_side_color_setup(obj=proxy_data.get_long_name())
-                hierarchy_utils.parent(source_objects=proxy_data.get_setup(), target_parent=line_grp)
-                hierarchy_utils.parent(source_objects=proxy_data.get_offset(), target_parent=root_transform)
+        for proxy_data in proxy_data_list:
+            add_side_color_setup(obj=proxy_data.get_long_name())
+            hierarchy_utils.parent(source_objects=proxy_data.get_setup(), target_parent=line_grp)
+            hierarchy_utils.parent(source_objects=proxy_data.get_offset(), target_parent=root_transform)
 
-            # Parent Proxy
-            for module in self.modules:
-                if not module.is_active():  # If not active, skip
-                    continue
+        # Parent Proxy
+        for module in modules:
+            with profile_phase("parent_proxies", module=module):
                 parent_proxies(proxy_list=module.get_proxies())
                 if not optimized:
                     create_proxy_visualization_lines(proxy_list=module.get_proxies(), lines_parent=line_grp)
                 for proxy in module.get_proxies():
                     proxy.apply_attr_dict()
-            for module in self.modules:
-                if not module.is_active():  # If not active, skip
-                    continue
+        for module in modules:
+            with profile_phase("build_proxy_setup", module=module):
                 module.build_proxy_setup()
 
-            cmds.select(clear=True)
+    def _update_built_proxy_modules(self, modules):
+        """
+        Stores the provided modules as the modules used in the last proxy build and updates their built data.
+        Args:
+            modules (list): Modules found in the proxy. (All active modules)
+        """
+        self.built_proxy_modules = list(modules)
+        for module in modules:
+            module.update_built_snapshot()
+
+    def _update_module_proxies(self, module, root_transform, line_grp):
+        """
+        Applies the changed data of the module proxies to the built proxies without rebuilding them.
+        Handles changes to transforms, attributes (including colors), locator scale and parent.
+        Args:
+            module (ModuleGeneric): Module with the proxies to update.
+            root_transform (str): Proxy root curve. Used when a proxy no longer has a parent.
+            line_grp (str): Group used to store the visualization lines.
+        Returns:
+            bool: True if updated, False if the module needs to be rebuilt (missing proxy or failed update).
+        """
+        for proxy in module.get_proxies():
+            built_proxy = find_proxy_from_uuid(proxy.get_uuid())
+            if not built_proxy:
+                return False
+            dirty_keys = proxy.get_dirty_keys()
+            if not dirty_keys:
+                continue
+            try:
+                if dirty_keys & {"parent", "metadata"}:  # Metadata stores the line parent
+                    hierarchy_utils.parent(source_objects=get_proxy_offset(built_proxy), target_parent=root_transform)
+                    parent_proxies(proxy_list=[proxy])
+                    delete_proxy_visualization_lines(uuid_list=[proxy.get_uuid()], lines_parent=line_grp)
+                    create_proxy_visualization_lines(proxy_list=[proxy], lines_parent=line_grp)
+                if dirty_keys & {"transform", "offsetTransform"}:
+                    proxy.apply_transforms(apply_offset="offsetTransform" in dirty_keys)
+                if "attributes" in dirty_keys:
+                    proxy.apply_attr_dict(target_obj=built_proxy)
+                if "locatorScale" in dirty_keys:
+                    set_attr(attribute_path=f'{built_proxy}.{RiggerConstants.ATTR_PROXY_SCALE}',
+                             value=proxy.get_locator_scale())
+            except Exception as e:
+                logger.debug(f'Unable to update proxy "{proxy.get_name()}". Module will be rebuilt. Issue: {str(e)}')
+                return False
+        return True
+
+    @staticmethod
+    def _delete_built_proxies(uuid_list):
+        """
+        Deletes built proxies, their offset groups and their setup items (locator scale clusters).
+        Children parented under the deleted proxies are also deleted.
+        Args:
+            uuid_list (list, set): UUIDs of the proxies to delete.
+        """
+        to_delete = []
+        for uuid in uuid_list:
+            built_proxy = find_proxy_from_uuid(uuid)
+            if not built_proxy:
+                continue
+            scale_attr = f'{built_proxy}.{RiggerConstants.ATTR_PROXY_SCALE}'
+            if cmds.objExists(scale_attr):
+                to_delete += cmds.listConnections(scale_attr, source=False, destination=True) or []
+            to_delete.append(get_proxy_offset(built_proxy) or built_proxy)
+        for obj in to_delete:
+            if obj and cmds.objExists(obj):  # Might have been deleted with its parent
+                cmds.delete(obj)
+
+    def is_proxy_update_possible(self):
+        """
+        Checks if the proxy in the scene can be updated by "update_proxy" instead of being fully rebuilt.
+        Returns:
+            bool: True if the proxy was built by this project (not optimized) and is still in the scene.
+        """
+        if self.built_proxy_modules is None:
+            return False
+        if not find_proxy_root_group() or not find_proxy_root_curve():
+            return False
+        if not find_objects_with_attr(RiggerConstants.REF_ATTR_LINES):
+            return False
+        return True
+
+    def has_proxy_scene_changes(self):
+        """
+        Checks if the proxy in the scene was edited (e.g. moved in the viewport) since it was built or updated.
+        These edits are not part of the project data, so "update_proxy" would neither read nor reset them.
+        Returns:
+            bool: True if a built proxy was edited or deleted in the scene, False otherwise.
+        """
+        for module in self.built_proxy_modules or []:
+            for proxy in module.get_proxies():
+                if proxy.has_scene_changes():
+                    return True
+        return False
+
+    def update_proxy(self):
+        """
+        Updates the proxy in the scene to match the project data. Only proxies that changed since they were built
+        are created, deleted or modified (see "Proxy.get_dirty_keys"). Modules with new settings, added or removed
+        proxies, or proxies with a new name or curve are rebuilt. Other changes are applied to the existing proxies.
+        If the proxy can't be updated (see "is_proxy_update_possible"), it's deleted and built again.
+        Returns:
+            bool: True if the proxy was updated, False if it was fully rebuilt.
+        """
+        if not self.is_proxy_update_possible():
+            proxy_root = find_proxy_root_group()
+            if proxy_root:
+                cmds.delete(proxy_root)
+            self.build_proxy()
+            return False
+
+        cmds.refresh(suspend=True)
+        try:
+            with RigBuildCache():  # Scene lookups are repeated many times during builds
+                root_transform = find_proxy_root_curve()
+                line_grp = find_objects_with_attr(RiggerConstants.REF_ATTR_LINES)
+                active_modules = [module for module in self.modules if module.is_active()]
+                removed_modules = [module for module in self.built_proxy_modules if module not in active_modules]
+
+                # Update Changed Proxies
+                rebuild_modules = []
+                for module in active_modules:
+                    with profile_phase("update_proxy", module=module):
+                        if module.is_proxy_rebuild_required() or \
+                                not self._update_module_proxies(module, root_transform=root_transform,
+                                                                line_grp=line_grp):
+                            rebuild_modules.append(module)
+                if not rebuild_modules and not removed_modules:
+                    self._update_built_proxy_modules(modules=active_modules)
+                    return True
+
+                # Detach Children - Proxies from other modules parented to proxies that will be replaced
+                deleted_uuids = set()
+                for module in rebuild_modules + removed_modules:
+                    deleted_uuids.update(module.get_built_proxies_uuids())
+                replaced_uuids = set(deleted_uuids)
+                for module in rebuild_modules:
+                    replaced_uuids.update(module.get_proxies_uuids())
+                detached_proxies = []
+                for module in active_modules:
+                    if module in rebuild_modules:
+                        continue
+                    for proxy in module.get_proxies():
+                        if proxy.get_parent_uuid() in replaced_uuids or proxy.get_meta_parent_uuid() in replaced_uuids:
+                            detached_proxies.append(proxy)
+                for proxy in detached_proxies:
+                    offset = get_proxy_offset(find_proxy_from_uuid(proxy.get_uuid()))
+                    hierarchy_utils.parent(source_objects=offset, target_parent=root_transform)
+
+                # Delete Changed Modules
+                detached_uuids = {proxy.get_uuid() for proxy in detached_proxies}
+                delete_proxy_visualization_lines(uuid_list=deleted_uuids | detached_uuids, lines_parent=line_grp)
+                self._delete_built_proxies(uuid_list=deleted_uuids)
+
+                # Rebuild Changed Modules
+                self._build_module_proxies(modules=rebuild_modules, root_transform=root_transform, line_grp=line_grp)
+                parent_proxies(proxy_list=detached_proxies)
+                create_proxy_visualization_lines(proxy_list=detached_proxies, lines_parent=line_grp)
+                self._update_built_proxy_modules(modules=active_modules)
+                logger.debug(f'Proxy updated. Rebuilt modules: {[module.get_name() for module in rebuild_modules]}. '
+                             f'Removed modules: {[module.get_name() for module in removed_modules]}.')
+
+                cmds.select(clear=True)
         except Exception as e:
+            self.built_proxy_modules = None  # Unknown state, next update will rebuild the proxy
             raise e
         finally:
             cmds.refresh(suspend=False)
             cmds.refresh()
+        return True
 
     def build_rig(self, delete_proxy=True):
         """
@@ -2218,54 +2613,263 @@ class RigProject:
         """
         cmds.refresh(suspend=True)
         try:
-            root_group = create_root_group()
-            root_ctrl = create_control_root_curve()
-            dir_ctrl = create_direction_curve()
-            category_groups = create_utility_groups(geometry=True,
-                                                    skeleton=True,
-                                                    control=True,
-                                                    setup=True,
-                                                    target_parent=root_group)
-            control_grp = category_groups.get(RiggerConstants.REF_ATTR_CONTROL)
-            hierarchy_utils.parent(source_objects=list(category_groups.values()), target_parent=root_group)
-            hierarchy_utils.parent(source_objects=root_ctrl, target_parent=control_grp)
-            hierarchy_utils.parent(source_objects=dir_ctrl, target_parent=root_ctrl)
-
-            # ------------------------------------- Build Skeleton
-            for module in self.modules:
-                if not module.is_active():  # If not active, skip
-                    continue
+            with RigBuildCache():  # Scene lookups are repeated many times during builds
+                self.built_rig_data = None
+                root_group = create_root_group()
+                root_ctrl = create_control_root_curve()
+                dir_ctrl = create_direction_curve()
+                category_groups = create_utility_groups(geometry=True,
+                                                        skeleton=True,
+                                                        control=True,
+                                                        setup=True,
+                                                        target_parent=root_group)
+                control_grp = category_groups.get(RiggerConstants.REF_ATTR_CONTROL)
+                hierarchy_utils.parent(source_objects=list(category_groups.values()), target_parent=root_group)
+                hierarchy_utils.parent(source_objects=root_ctrl, target_parent=control_grp)
+                hierarchy_utils.parent(source_objects=dir_ctrl, target_parent=root_ctrl)
+
+                active_modules = [module for module in self.modules if module.is_active()]
+                created_nodes = self._build_module_rigs(modules=active_modules)
+                self.built_rig_data = {}
+                self._update_built_rig_data(modules=active_modules, created_nodes=created_nodes)
+
+                # Delete Proxy
+                if delete_proxy:
+                    proxy_root = find_proxy_root_group()
+                    if proxy_root:
+                        cmds.delete(proxy_root)
+                    self.built_proxy_modules = None
+        except Exception as e:
+            raise e
+        finally:
+            cmds.refresh(suspend=False)
+            cmds.refresh()
+            cmds.select(clear=True)
+
+    @staticmethod
+    def _build_module_rigs(modules):
+        """
+        Runs the rig build steps of the provided modules and records the nodes created by each module.
+        Args:
+            modules (list): Active modules to build. Their proxies must exist in the scene.
+        Returns:
+            dict: Module UUIDs (keys) and lists of Maya UUIDs of the nodes created by each module (values)
+        """
+        created_nodes = {module.get_uuid(): [] for module in modules}
+
+        # ------------------------------------- Build Skeleton
+        for module in modules:
+            with profile_phase("build_skeleton_joints", module=module), CreatedNodesRecorder() as recorder:
                 module.build_skeleton_joints()
+            created_nodes[module.get_uuid()] += recorder.get_uuids()
 
-            # ------------------------------------- Build Skeleton Hierarchy
-            for module in self.modules:
-                if not module.is_active():  # If not active, skip
-                    continue
+        # ------------------------------------- Build Skeleton Hierarchy
+        for module in modules:
+            with profile_phase("build_skeleton_hierarchy", module=module), CreatedNodesRecorder() as recorder:
                 module.build_skeleton_hierarchy()
+            created_nodes[module.get_uuid()] += recorder.get_uuids()
 
-            # ------------------------------------- Build Rig
-            for module in self.modules:
-                if not module.is_active():  # If not active, skip
-                    continue
+        # ------------------------------------- Build Rig
+        for module in modules:
+            with profile_phase("build_rig", module=module), CreatedNodesRecorder() as recorder:
                 module.build_rig()
+            created_nodes[module.get_uuid()] += recorder.get_uuids()
+
+        # ------------------------------------- Build Rig Post
+        for module in modules:
+            with profile_phase("build_rig_post", module=module), CreatedNodesRecorder() as recorder:
+                module.build_rig_post()
+            created_nodes[module.get_uuid()] += recorder.get_uuids()
+        return created_nodes
+
+    def _update_built_rig_data(self, modules, created_nodes):
+        """
+        Stores the hash, the proxy UUIDs and the created nodes of the provided modules as their built rig data.
+        Args:
+            modules (list): Modules that were built.
+            created_nodes (dict): Nodes created by each module. (See "_build_module_rigs")
+        """
+        for module in modules:
+            self.built_rig_data[module.get_uuid()] = {"hash": module.get_module_hash(),
+                                                      "proxies": module.get_proxies_uuids(),
+                                                      "nodes": created_nodes.get(module.get_uuid(), [])}
 
-            # ------------------------------------- Build Rig Post
+    @staticmethod
+    def _delete_built_rig_nodes(maya_uuids):
+        """
+        Deletes nodes created during a rig build.
+        DAG nodes with descendants that are not in the list are kept. (e.g. automation groups shared by modules)
+        Args:
+            maya_uuids (list): Maya UUIDs of the nodes to delete.
+        """
+        if not maya_uuids:
+            return  # "cmds.ls" with an empty list returns every node in the scene
+        nodes = cmds.ls(list(maya_uuids), long=True) or []
+        node_set = set(nodes)
+        to_delete = []
+        for node in nodes:
+            if cmds.objectType(node, isAType="dagNode"):
+                descendants = cmds.listRelatives(node, allDescendents=True, fullPath=True) or []
+                if any(descendant not in node_set for descendant in descendants):
+                    continue  # Shared with modules that are not being rebuilt
+            to_delete.append(cmds.ls(node, uuid=True)[0])
+        for uuid in to_delete:
+            node = cmds.ls(uuid, long=True)  # Might have been deleted with its parent
+            if node:
+                cmds.delete(node)
+
+    def get_dependent_modules(self, proxy_uuids):
+        """
+        Gets the active modules parented (directly or indirectly) to the provided proxies.
+        A module is parented to a proxy when the module, or one of its proxies, uses it as parent (or line parent).
+        Args:
+            proxy_uuids (list, set): UUIDs of the parent proxies.
+        Returns:
+            list: Dependent modules, following the order of the project modules.
+        """
+        parent_uuids = set(proxy_uuids)
+        dependents = []
+        found_new = True
+        while found_new:
+            found_new = False
             for module in self.modules:
-                if not module.is_active():  # If not active, skip
+                if not module.is_active() or module in dependents:
                     continue
-                module.build_rig_post()
+                module_parents = {module.get_parent_uuid()}
+                for proxy in module.get_proxies():
+                    module_parents.update([proxy.get_parent_uuid(), proxy.get_meta_parent_uuid()])
+                if module_parents & parent_uuids:
+                    dependents.append(module)
+                    parent_uuids.update(module.get_proxies_uuids())
+                    found_new = True
+        return [module for module in self.modules if module in dependents]
 
-            # Delete Proxy
-            if delete_proxy:
-                proxy_root = find_proxy_root_group()
-                if proxy_root:
-                    cmds.delete(proxy_root)
+    def get_rig_modules_to_rebuild(self):
+        """
+        Gets the active modules that changed since the rig was built (see "ModuleGeneric.get_module_hash"),
+        including new modules and the modules parented to changed or removed modules.
+        Returns:
+            list: Modules to rebuild, following the order of the project modules. All active modules if not built.
+        """
+        active_modules = [module for module in self.modules if module.is_active()]
+        if self.built_rig_data is None:
+            return active_modules
+        active_uuids = [module.get_uuid() for module in active_modules]
+        changed_proxy_uuids = set()
+        for module_uuid, built_data in self.built_rig_data.items():  # Removed or deactivated modules
+            if module_uuid not in active_uuids:
+                changed_proxy_uuids.update(built_data.get("proxies", []))
+        changed_modules = []
+        for module in active_modules:
+            built_data = self.built_rig_data.get(module.get_uuid(), {})
+            if built_data.get("hash") != module.get_module_hash():
+                changed_modules.append(module)
+                changed_proxy_uuids.update(built_data.get("proxies", []))
+                changed_proxy_uuids.update(module.get_proxies_uuids())
+        dependents = self.get_dependent_modules(proxy_uuids=changed_proxy_uuids)
+        return [module for module in active_modules if module in changed_modules or module in dependents]
+
+    def get_rig_nodes_to_delete(self):
+        """
+        Gets the nodes "update_rig" deletes. These are the nodes created by the modules that are rebuilt
+        (see "get_rig_modules_to_rebuild") and by the modules that were removed or deactivated.
+        Returns:
+            list: Maya UUIDs of the nodes to delete. Empty if the rig was not built.
+        """
+        if self.built_rig_data is None:
+            return []
+        active_uuids = [module.get_uuid() for module in self.modules if module.is_active()]
+        deleted_uuids = [uuid for uuid in self.built_rig_data if uuid not in active_uuids]
+        deleted_uuids += [module.get_uuid() for module in self.get_rig_modules_to_rebuild()]
+        maya_uuids = []
+        for module_uuid in deleted_uuids:
+            maya_uuids += self.built_rig_data.get(module_uuid, {}).get("nodes", [])
+        return maya_uuids
+
+    def get_rig_update_skinned_joints(self):
+        """
+        Gets the joints "update_rig" would delete that are influences of a skin cluster.
+        Deleting them removes them from the skin clusters, so their skin weights are lost.
+        Returns:
+            list: Long names of the skinned joints. Empty if no skinned joints would be deleted.
+        """
+        maya_uuids = self.get_rig_nodes_to_delete()
+        if not maya_uuids:
+            return []  # "cmds.ls" with an empty list returns every node in the scene
+        joints = cmds.ls(maya_uuids, long=True, type="joint") or []
+        return [jnt for jnt in joints if cmds.listConnections(jnt, type="skinCluster")]
+
+    def is_rig_update_possible(self):
+        """
+        Checks if the rig in the scene can be updated by "update_rig" instead of being fully rebuilt.
+        Returns:
+            bool: True if the rig was built by this project and is still in the scene.
+        """
+        if self.built_rig_data is None:
+            return False
+        if not find_rig_root_group():
+            return False
+        return True
+
+    def update_rig(self, delete_proxy=True):
+        """
+        Updates the rig in the scene to match the project data. Only modules that changed since the rig was built
+        and the modules parented to them are deleted and built again (see "get_rig_modules_to_rebuild").
+        Joints, controls and automation created by other modules are kept.
+        A proxy is required to build modules. If missing, an optimized proxy is built first.
+        If the rig can't be updated (see "is_rig_update_possible"), it's deleted and built again.
+        The same happens when the update would delete skinned joints (see "get_rig_update_skinned_joints")
+        Args:
+            delete_proxy (bool, optional): If True, the proxy is deleted after the rig is updated.
+        Returns:
+            bool: True if the rig was updated, False if it was fully rebuilt.
+        """
+        if not find_proxy_root_group():
+            self.build_proxy(optimized=True)
+        skinned_joints = self.get_rig_update_skinned_joints() if self.is_rig_update_possible() else []
+        if skinned_joints:
+            logger.warning(f'Unable to update rig. Skinned joints would be deleted: {skinned_joints}. '
+                           f'Rebuilding the entire rig instead.')
+        if not self.is_rig_update_possible() or skinned_joints:
+            rig_root = find_rig_root_group()
+            if rig_root:
+                cmds.delete(rig_root)
+            self.build_rig(delete_proxy=delete_proxy)
+            return False
+
+        cmds.refresh(suspend=True)
+        try:
+            with RigBuildCache():  # Scene lookups are repeated many times during builds
+                rebuild_modules = self.get_rig_modules_to_rebuild()
+                deleted_nodes = self.get_rig_nodes_to_delete()
+
+                # Delete Changed Modules
+                kept_uuids = {module.get_uuid() for module in self.modules if module.is_active()}
+                kept_uuids -= {module.get_uuid() for module in rebuild_modules}
+                for module_uuid in list(self.built_rig_data):
+                    if module_uuid not in kept_uuids:
+                        self.built_rig_data.pop(module_uuid)
+                self._delete_built_rig_nodes(maya_uuids=deleted_nodes)
+
+                # Rebuild Changed Modules
+                created_nodes = self._build_module_rigs(modules=rebuild_modules)
+                self._update_built_rig_data(modules=rebuild_modules, created_nodes=created_nodes)
+                logger.debug(f'Rig updated. Rebuilt modules: {[module.get_name() for module in rebuild_modules]}.')
+
+                # Delete Proxy
+                if delete_proxy:
+                    proxy_root = find_proxy_root_group()
+                    if proxy_root:
+                        cmds.delete(proxy_root)
+                    self.built_proxy_modules = None
         except Exception as e:
+            self.built_rig_data = None  # Unknown state, next update will rebuild the rig
             raise e
         finally:
             cmds.refresh(suspend=False)
             cmds.refresh()
             cmds.select(clear=True)
+        return True
 
 
 if __name__ == "__main__":
@@ -0,0 +1,247 @@
+"""
+Auto Rigger Build Profiler
+github.com/TrevisanGMW/gt-tools
+
+Records how long each build phase takes for each module, including the number of Maya commands executed and
+the number of nodes created during the phase. Results can be exported as JSON or as a Chrome trace file.
+(Open trace files using "chrome://tracing" or "https://ui.perfetto.dev")
+"""
+from gt.utils.data_utils import write_json
+from contextlib import contextmanager, nullcontext
+import maya.api.OpenMaya as OpenMaya
+import logging
+import time
+
+# Logging Setup
+logging.basicConfig()
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+_active_build_profiler = None  # Used by "profile_phase" while a "BuildProfiler" context is active
+_last_build_profiler = None  # Last profiler that finished recording (see "get_last_build_profiler")
+
+
+class BuildProfiler:
+    def __init__(self):
+        """
+        Records the build phases executed while used as a context manager: "with BuildProfiler():"
+        Phases are recorded by "profile_phase", which does nothing when no profiler is active.
+        Maya commands and created nodes are counted using scene callbacks.
+        """
+        self.records = []
+        self.command_count = 0
+        self.node_count = 0
+        self.start_time = None
+        self.duration = 0.0
+        self.callback_ids = []
+        self.is_active = False
+
+    def __enter__(self):
+        """
+        Starts recording. If another profiler is already recording (nested contexts), it's used instead.
+        """
+        global _active_build_profiler
+        if _active_build_profiler is not None:
+            return _active_build_profiler
+        _active_build_profiler = self
+        self.is_active = True
+        self.add_callbacks()
+        self.start_time = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """
+        Stops recording and stores this profiler as the last build profiler.
+        """
+        global _active_build_profiler, _last_build_profiler
+        if not self.is_active:
+            return
+        self.duration = time.perf_counter() - self.start_time
+        self.remove_callbacks()
+        self.is_active = False
+        _active_build_profiler = None
+        _last_build_profiler = self
+        logger.debug(f'Build profiled: {self.duration:.3f} seconds, {self.command_count} commands, '
+                     f'{self.node_count} nodes created.')
+
+    def add_callbacks(self):
+        """
+        Adds callbacks used to count executed commands and created nodes.
+        """
+        self.callback_ids.append(OpenMaya.MCommandMessage.addCommandCallback(self.on_command))
+        self.callback_ids.append(OpenMaya.MDGMessage.addNodeAddedCallback(self.on_node_added, "dependNode"))
+
+    def remove_callbacks(self):
+        """
+        Removes callbacks added by this profiler.
+        """
+        for callback_id in self.callback_ids:
+            try:
+                OpenMaya.MMessage.removeCallback(callback_id)
+            except Exception as e:
+                logger.debug(f'Unable to remove build profiler callback. Issue: {str(e)}')
+        self.callback_ids = []
+
+    def on_command(self, *args):
+        """
+        Called when a Maya command is executed.
+        """
+        self.command_count += 1
+
+    def on_node_added(self, *args):
+        """
+        Called when a node is created.
+        """
+        self.node_count += 1
+
+    @contextmanager
+    def phase(self, phase_name, module=None):
+        """
+        Records a build phase. Phases can be nested. (e.g. module phases inside a project phase)
+        Args:
+            phase_name (str): Name of the phase. e.g. "build_rig"
+            module (ModuleGeneric, str, optional): Module (or module name) running the phase.
+        """
+        start_time = time.perf_counter()
+        start_commands = self.command_count
+        start_nodes = self.node_count
+        try:
+            yield
+        finally:
+            module_name = module
+            if hasattr(module, "get_description_name"):  # Same name shown in the modules tree
+                module_name = module.get_description_name()
+            self.records.append({"phase": phase_name,
+                                 "module": module_name,
+                                 "start": start_time - self.start_time,
+                                 "duration": time.perf_counter() - start_time,
+                                 "commands": self.command_count - start_commands,
+                                 "nodes": self.node_count - start_nodes})
+
+    def get_records(self):
+        """
+        Gets all recorded phases, sorted by start time.
+        Returns:
+            list: A list of dictionaries with the keys "phase", "module", "start", "duration", "commands" and "nodes".
+                  Times are in seconds. "start" is relative to the start of the recording.
+        """
+        return sorted(self.records, key=lambda record: record.get("start"))
+
+    def get_summary(self, group_by="phase"):
+        """
+        Gets the totals of the recorded module phases grouped by phase or by module. (Project phases are skipped)
+        Args:
+            group_by (str, optional): Record key used to group the totals. "phase" or "module".
+        Returns:
+            dict: Group names (keys) and dictionaries with the keys "duration", "commands", "nodes" and "count".
+                  Sorted by duration. (Slowest first)
+        """
+        summary = {}
+        for record in self.records:
+            if record.get("module") is None:
+                continue
+            totals = summary.setdefault(record.get(group_by), {"duration": 0.0, "commands": 0, "nodes": 0, "count": 0})
+            totals["duration"] += record.get("duration")
+            totals["commands"] += record.get("commands")
+            totals["nodes"] += record.get("nodes")
+            totals["count"] += 1
+        return dict(sorted(summary.items(), key=lambda item: item[1].get("duration"), reverse=True))
+
+    def get_report(self):
+        """
+        Gets a human-readable report with the totals per phase and per module.
+        Returns:
+            str: Formatted report.
+        """
+        lines = [f'Total: {self.duration:.3f}s, {self.command_count} commands, {self.node_count} nodes created.']
+        for group_by in ["phase", "module"]:
+            lines.append("")
+            lines.append(f'{group_by.title():<32}{"Time (s)":>10}{"Commands":>10}{"Nodes":>8}')
+            for name, totals in self.get_summary(group_by=group_by).items():
+                lines.append(f'{str(name):<32}{totals.get("duration"):>10.3f}'
+                             f'{totals.get("commands"):>10}{totals.get("nodes"):>8}')
+        return "\n".join(lines)
+
+    def to_dict(self):
+        """
+        Gets the recorded data as a dictionary. (Used when exporting JSON)
+        Returns:
+            dict: A dictionary with the totals, the summaries and all records.
+        """
+        return {"duration": self.duration,
+                "commands": self.command_count,
+                "nodes": self.node_count,
+                "phases": self.get_summary(group_by="phase"),
+                "modules": self.get_summary(group_by="module"),
+                "records": self.get_records()}
+
+    def get_chrome_trace(self):
+        """
+        Gets the recorded phases in the Chrome trace event format. ("Complete" events, times in microseconds)
+        Returns:
+            dict: A dictionary with the "traceEvents" key.
+        """
+        events = []
+        for record in self.get_records():
+            name = record.get("phase")
+            if record.get("module") is not None:
+                name = f'{record.get("module")}: {name}'
+            events.append({"name": name,
+                           "cat": record.get("phase"),
+                           "ph": "X",
+                           "ts": round(record.get("start") * 1e6),
+                           "dur": round(record.get("duration") * 1e6),
+                           "pid": 1,
+                           "tid": 1,
+                           "args": {"module": record.get("module"),
+                                    "commands": record.get("commands"),
+                                    "nodes": record.get("nodes")}})
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_json(self, path):
+        """
+        Writes the recorded data to a JSON file. (See "to_dict")
+        Args:
+            path (str): Path to the JSON file.
+        Returns:
+            str or None: Path to the written file. None if it failed.
+        """
+        return write_json(path=path, data=self.to_dict())
+
+    def export_chrome_trace(self, path):
+        """
+        Writes the recorded phases to a Chrome trace file. (See "get_chrome_trace")
+        Args:
+            path (str): Path to the trace file. (JSON)
+        Returns:
+            str or None: Path to the written file. None if it failed.
+        """
+        return write_json(path=path, data=self.get_chrome_trace())
+
+
+def profile_phase(phase_name, module=None):
+    """
+    Records a build phase in the active "BuildProfiler". Does nothing if no profiler is active.
+    Usage: "with profile_phase("build_rig", module):"
+    Args:
+        phase_name (str): Name of the phase. e.g. "build_rig"
+        module (ModuleGeneric, str, optional): Module (or module name) running the phase.
+    Returns:
+        A context manager that records the phase.
+    """
+    if _active_build_profiler is None:
+        return nullcontext()
+    return _active_build_profiler.phase(phase_name=phase_name, module=module)
+
+
+def get_last_build_profiler():
+    """
+    Gets the last profiler that finished recording.
+    Returns:
+        BuildProfiler or None: The last build profiler. None if nothing was profiled yet.
+    """
+    return _last_build_profiler
+
+
+if __name__ == "__main__":
+    logger.setLevel(logging.DEBUG)
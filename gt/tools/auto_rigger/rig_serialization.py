@@ -0,0 +1,304 @@
+"""
+Auto Rigger Project Serialization
+github.com/TrevisanGMW/gt-tools
+
+Compact, versioned encoding used by project files. (See "write_project_file" and "read_project_file")
+The encoded data is a JSON dictionary where:
+    "uuids": Every UUID used by the project (modules, proxies, parents) is stored once. Other keys use their index.
+    "transforms": Every proxy transform is a row of 9 floats (position, rotation, scale) in a single flat list.
+                  Identical rows (e.g. default offsets) are stored once and shared by all proxies using them.
+    "modules": Modules keep their dictionary format, but their proxies are lists of values. (See "PROXY_FIELDS")
+Compressed files start with "PROJECT_FILE_MAGIC" followed by the zlib compressed JSON data.
+Project files without a schema (written by older versions) are read as plain project dictionaries.
+"""
+from gt.tools.auto_rigger.rig_constants import RiggerConstants
+import logging
+import json
+import zlib
+
+# Logging Setup
+logging.basicConfig()
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+PROJECT_SCHEMA_NAME = "gt_rig_project"
+PROJECT_SCHEMA_VERSION = 1
+PROJECT_FILE_MAGIC = b'GTRIGZ'  # Start of compressed project files
+PROXY_FIELDS = ("name", "uuid", "parent", "locatorScale", "transform", "offsetTransform", "attributes", "metadata")
+TRANSFORM_ROW_SIZE = 9  # Position, rotation and scale (3 floats each)
+
+
+class _UUIDTable:
+    def __init__(self):
+        """
+        Stores UUIDs in a list, so each UUID is written only once. Used when encoding projects.
+        """
+        self.uuids = []
+        self.indices = {}
+
+    def get_index(self, uuid):
+        """
+        Gets the index of a UUID, adding it to the table when it's not yet stored.
+        Args:
+            uuid (str, None): UUID to store.
+        Returns:
+            int or None: Index of the UUID in the table. None if no UUID was provided.
+        """
+        if uuid is None:
+            return None
+        index = self.indices.get(uuid)
+        if index is None:
+            index = len(self.uuids)
+            self.indices[uuid] = index
+            self.uuids.append(uuid)
+        return index
+
+
+class _TransformTable:
+    def __init__(self):
+        """
+        Stores transform dictionaries as rows in a flat list of floats. Identical rows are only stored once.
+        """
+        self.values = []
+        self.rows = {}
+
+    def get_row(self, transform_dict):
+        """
+        Gets the row of a transform, adding it to the table when it's not yet stored.
+        Args:
+            transform_dict (dict, None): Transform dictionary. (See "Transform.get_transform_as_dict")
+        Returns:
+            int or None: Row of the transform in the table. None if no transform was provided.
+        """
+        if not transform_dict:
+            return None
+        row_values = (*transform_dict.get("position"), *transform_dict.get("rotation"), *transform_dict.get("scale"))
+        row = self.rows.get(row_values)
+        if row is None:
+            row = len(self.rows)
+            self.rows[row_values] = row
+            self.values.extend(row_values)
+        return row
+
+
+def encode_project_dict(project_dict):
+    """
+    Encodes a project dictionary using the compact project schema.
+    Args:
+        project_dict (dict): Project description. (See "RigProject.get_project_as_dict")
+    Returns:
+        dict: Encoded project data. (See "decode_project_data" for the reverse operation)
+    """
+    uuid_table = _UUIDTable()
+    transform_table = _TransformTable()
+    modules = []
+    for module_dict in project_dict.get("modules") or []:
+        module_data = dict(module_dict)
+        module_data["uuid"] = uuid_table.get_index(module_dict.get("uuid"))
+        if "parent" in module_dict:
+            module_data["parent"] = uuid_table.get_index(module_dict.get("parent"))
+        proxies = []
+        for proxy_uuid, proxy_dict in (module_dict.get("proxies") or {}).items():
+            metadata = proxy_dict.get("metadata")
+            if metadata and metadata.get(RiggerConstants.META_PROXY_LINE_PARENT):
+                metadata = dict(metadata)
+                line_parent = metadata.get(RiggerConstants.META_PROXY_LINE_PARENT)
+                metadata[RiggerConstants.META_PROXY_LINE_PARENT] = uuid_table.get_index(line_parent)
+            proxies.append([proxy_dict.get("name"),
+                            uuid_table.get_index(proxy_uuid),
+                            uuid_table.get_index(proxy_dict.get("parent")),
+                            proxy_dict.get("locatorScale"),
+                            transform_table.get_row(proxy_dict.get("transform")),
+                            transform_table.get_row(proxy_dict.get("offsetTransform")),
+                            proxy_dict.get("attributes"),
+                            metadata])
+        module_data["proxies"] = proxies
+        modules.append(module_data)
+
+    project_data = {"schema": PROJECT_SCHEMA_NAME, "version": PROJECT_SCHEMA_VERSION}
+    for key in ["name", "prefix", "metadata"]:
+        if project_dict.get(key):
+            project_data[key] = project_dict.get(key)
+    project_data["uuids"] = uuid_table.uuids
+    project_data["transforms"] = transform_table.values
+    project_data["modules"] = modules
+    return project_data
+
+
+def is_encoded_project_data(data):
+    """
+    Checks if the data was encoded using the compact project schema. (See "encode_project_dict")
+    Args:
+        data (dict): Data read from a project file.
+    Returns:
+        bool: True if the data uses the project schema, False otherwise. (e.g. A plain project dictionary)
+    """
+    return isinstance(data, dict) and "schema" in data
+
+
+def validate_project_data(data):
+    """
+    Validates encoded project data before decoding it. (See "encode_project_dict")
+    Args:
+        data (dict): Encoded project data.
+    Raises:
+        ValueError: If the data doesn't match the project schema or was written by a newer version.
+    """
+    if not isinstance(data, dict) or data.get("schema") != PROJECT_SCHEMA_NAME:
+        raise ValueError(f'Invalid project data. Expected "{PROJECT_SCHEMA_NAME}" schema.')
+    version = data.get("version")
+    if not isinstance(version, int) or version > PROJECT_SCHEMA_VERSION:
+        raise ValueError(f'Unsupported project schema version: "{version}". '
+                         f'Expected "{PROJECT_SCHEMA_VERSION}" or older.')
+    uuids = data.get("uuids")
+    if not isinstance(uuids, list) or not all(isinstance(uuid, str) for uuid in uuids):
+        raise ValueError('Invalid project data. "uuids" must be a list of strings.')
+    transforms = data.get("transforms")
+    if not isinstance(transforms, list) or len(transforms) % TRANSFORM_ROW_SIZE != 0:
+        raise ValueError(f'Invalid project data. "transforms" must be a list with rows of {TRANSFORM_ROW_SIZE} values.')
+    if not all(isinstance(value, (int, float)) for value in transforms):
+        raise ValueError('Invalid project data. "transforms" must contain only numbers.')
+    modules = data.get("modules")
+    if not isinstance(modules, list):
+        raise ValueError('Invalid project data. "modules" must be a list.')
+
+    uuid_count = len(uuids)
+    row_count = len(transforms) // TRANSFORM_ROW_SIZE
+
+    def is_index(value, count, optional=True):
+        if value is None:
+            return optional
+        return isinstance(value, int) and 0 <= value < count
+
+    for module_index, module_data in enumerate(modules):
+        if not isinstance(module_data, dict) or not isinstance(module_data.get("module"), str):
+            raise ValueError(f'Invalid project data. Module {module_index} is missing its "module" key.')
+        if not is_index(module_data.get("uuid"), uuid_count, optional=False):
+            raise ValueError(f'Invalid project data. Module {module_index} has an invalid "uuid" index.')
+        if not is_index(module_data.get("parent"), uuid_count):
+            raise ValueError(f'Invalid project data. Module {module_index} has an invalid "parent" index.')
+        proxies = module_data.get("proxies")
+        if not isinstance(proxies, list):
+            raise ValueError(f'Invalid project data. Module {module_index} "proxies" must be a list.')
+        for proxy_index, proxy_row in enumerate(proxies):
+            issue = None
+            if not isinstance(proxy_row, list) or len(proxy_row) != len(PROXY_FIELDS):
+                issue = f'must be a list with {len(PROXY_FIELDS)} values'
+            elif not isinstance(proxy_row[0], str):
+                issue = 'has an invalid "name"'
+            elif not is_index(proxy_row[1], uuid_count, optional=False) or not is_index(proxy_row[2], uuid_count):
+                issue = 'has an invalid "uuid" or "parent" index'
+            elif not is_index(proxy_row[4], row_count) or not is_index(proxy_row[5], row_count):
+                issue = 'has an invalid transform row'
+            elif not isinstance(proxy_row[6], (dict, type(None))) or not isinstance(proxy_row[7], (dict, type(None))):
+                issue = 'has invalid "attributes" or "metadata"'
+            if issue:
+                raise ValueError(f'Invalid project data. Proxy {proxy_index} of module {module_index} {issue}.')
+
+
+def decode_project_data(data, validate=True):
+    """
+    Decodes project data encoded using the compact project schema. (Reverse of "encode_project_dict")
+    Args:
+        data (dict): Encoded project data.
+        validate (bool, optional): If active, the data is validated before decoding it. (See "validate_project_data")
+    Raises:
+        ValueError: If validated and the data doesn't match the project schema.
+    Returns:
+        dict: Project description. Same format as "RigProject.get_project_as_dict"
+    """
+    if validate:
+        validate_project_data(data)
+    uuids = data.get("uuids")
+    values = data.get("transforms")
+    transforms = []  # Decoded once per row. Tuples, so proxies sharing a row can't affect each other.
+    for start in range(0, len(values), TRANSFORM_ROW_SIZE):
+        transforms.append({"position": tuple(values[start:start + 3]),
+                           "rotation": tuple(values[start + 3:start + 6]),
+                           "scale": tuple(values[start + 6:start + 9])})
+    modules = []
+    for module_data in data.get("modules"):
+        module_dict = dict(module_data)
+        module_dict["uuid"] = uuids[module_data.get("uuid")]
+        if module_data.get("parent") is not None:
+            module_dict["parent"] = uuids[module_data.get("parent")]
+        proxies = {}
+        for name, uuid, parent, locator_scale, transform, offset, attributes, metadata in module_data.get("proxies"):
+            proxy_dict = {"name": name,
+                          "parent": uuids[parent] if parent is not None else None,
+                          "locatorScale": locator_scale}
+            if transform is not None:
+                proxy_dict["transform"] = transforms[transform]
+            if offset is not None:
+                proxy_dict["offsetTransform"] = transforms[offset]
+            if attributes:
+                proxy_dict["attributes"] = attributes
+            if metadata:
+                line_parent = metadata.get(RiggerConstants.META_PROXY_LINE_PARENT)
+                if isinstance(line_parent, int):
+                    metadata = dict(metadata)
+                    metadata[RiggerConstants.META_PROXY_LINE_PARENT] = uuids[line_parent]
+                proxy_dict["metadata"] = metadata
+            proxies[uuids[uuid]] = proxy_dict
+        module_dict["proxies"] = proxies
+        modules.append(module_dict)
+
+    project_dict = {}
+    for key in ["name", "prefix"]:
+        if data.get(key):
+            project_dict[key] = data.get(key)
+    project_dict["modules"] = modules
+    if data.get("metadata"):
+        project_dict["metadata"] = data.get("metadata")
+    return project_dict
+
+
+def write_project_file(path, project_dict, compress=False):
+    """
+    Writes a project to a file using the compact project schema. (See "encode_project_dict")
+    Args:
+        path (str): Path to the project file. If it exists, it will be overwritten.
+        project_dict (dict): Project description. (See "RigProject.get_project_as_dict")
+        compress (bool, optional): If active, the data is compressed using zlib.
+    Returns:
+        str or None: Path to the written file. None if it failed.
+    """
+    data = json.dumps(encode_project_dict(project_dict), separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    if compress:
+        data = PROJECT_FILE_MAGIC + zlib.compress(data)
+    try:
+        with open(path, 'wb') as project_file:
+            project_file.write(data)
+        return path
+    except Exception as e:
+        logger.warning(f'Unable to write project file "{path}". Issue: {e}')
+
+
+def read_project_file(path):
+    """
+    Reads a project file. Compressed files, files using the project schema and plain project dictionaries (JSON)
+    are all supported. (Reverse of "write_project_file")
+    Args:
+        path (str): Path to the project file.
+    Raises:
+        ValueError: If the file is not a valid project file.
+    Returns:
+        dict: Project description. Same format as "RigProject.get_project_as_dict"
+    """
+    with open(path, 'rb') as project_file:
+        data = project_file.read()
+    try:
+        if data.startswith(PROJECT_FILE_MAGIC):
+            data = zlib.decompress(data[len(PROJECT_FILE_MAGIC):])
+        data = json.loads(data.decode('utf-8'))
+    except (zlib.error, UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise ValueError(f'Invalid project file: "{path}". Issue: {e}')
+    if is_encoded_project_data(data):
+        return decode_project_data(data)
+    if not isinstance(data, dict):
+        raise ValueError(f'Invalid project file: "{path}". Expected a project description.')
+    return data
+
+
+if __name__ == "__main__":
+    logger.setLevel(logging.DEBUG)
@@ -8,7 +8,8 @@ from gt.utils.color_utils import set_color_viewport, ColorConstants, set_color_o
 from gt.utils.curve_utils import get_curve, set_curve_width, create_connection_line
 from gt.utils.rigging_utils import duplicate_joint_for_automation, RiggingConstants
 from gt.tools.auto_rigger.rig_constants import RiggerConstants
-from gt.utils.uuid_utils import get_object_from_uuid_attr
+from gt.utils.scene_utils import SceneQueryCache, get_objects_of_type, get_parent_path, attr_path_exists
+from gt.utils.uuid_utils import get_object_from_uuid_attr, UUIDAttrIndex
 from gt.utils.string_utils import upper_first_char
 from gt.utils.naming_utils import NamingConstants
 from gt.utils import hierarchy_utils
@@ -24,6 +25,46 @@ logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
 
+class RigBuildCache:
+    def __init__(self):
+        """
+        Caches scene lookups for the duration of a build. Used as a context manager: "with RigBuildCache():"
+        Combines a "UUIDAttrIndex" (proxies, joints and drivers found by UUID) and a "SceneQueryCache"
+        (object lists, parents and attribute checks used by the lookup functions below).
+        """
+        self.uuid_index = UUIDAttrIndex()
+        self.scene_cache = SceneQueryCache()
+
+    def __enter__(self):
+        """
+        Activates the UUID index and the scene query cache.
+        """
+        self.uuid_index.__enter__()
+        self.scene_cache.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """
+        Deactivates the UUID index and the scene query cache, then logs their stats.
+        """
+        self.scene_cache.__exit__(exc_type, exc_val, exc_tb)
+        self.uuid_index.__exit__(exc_type, exc_val, exc_tb)
+        stats = self.get_stats()
+        logger.debug(f'Rig build cache: {stats.get("hits")} hits, {stats.get("misses")} misses, '
+                     f'{stats.get("uuid_lookups")} UUID lookups, {stats.get("uuid_index_builds")} UUID index builds.')
+
+    def get_stats(self):
+        """
+        Gets the cache usage. Hits are queries answered without asking the scene.
+        Returns:
+            dict: A dictionary with the keys "hits", "misses", "uuid_lookups" and "uuid_index_builds".
+        """
+        stats = self.scene_cache.get_stats()
+        stats["uuid_lookups"] = self.uuid_index.lookup_count
+        stats["uuid_index_builds"] = self.uuid_index.build_count
+        return stats
+
+
 # ------------------------------------------ Lookup functions ------------------------------------------
 def find_proxy_from_uuid(uuid_string):
     """
@@ -111,13 +152,13 @@ def find_objects_with_attr(attr_name, obj_type="transform", transform_lookup=Tru
     if isinstance(lookup_list, list):
         obj_list = lookup_list
     else:
-        obj_list = cmds.ls(typ=obj_type, long=True) or []
+        obj_list = get_objects_of_type(obj_type)
     for obj in obj_list:
         if transform_lookup and obj_type != "transform":
-            _parent = cmds.listRelatives(obj, parent=True, fullPath=True) or []
+            _parent = get_parent_path(obj)
             if _parent:
                 obj = _parent[0]
-        if cmds.objExists(f'{obj}.{attr_name}'):
+        if attr_path_exists(f'{obj}.{attr_name}'):
             return Node(obj)
 
 
@@ -225,7 +266,7 @@ def find_vis_lines_from_uuid(parent_uuid=None, child_uuid=None):
     if lines_grp:
         _children = cmds.listRelatives(str(lines_grp), children=True, fullPath=True) or []
         for child in _children:
-            if not cmds.objExists(f'{child}.{RiggerConstants.ATTR_LINE_PARENT_UUID}'):
+            if not attr_path_exists(f'{child}.{RiggerConstants.ATTR_LINE_PARENT_UUID}'):
                 continue
             if parent_uuid:
                 existing_uuid = cmds.getAttr(f'{child}.{RiggerConstants.ATTR_LINE_PARENT_UUID}')
@@ -238,13 +279,13 @@ def find_vis_lines_from_uuid(parent_uuid=None, child_uuid=None):
     if _lines:
         return tuple(_lines)
     # If nothing was found, look through all transforms - Less optimized
-    obj_list = cmds.ls(typ="nurbsCurve", long=True) or []
+    obj_list = get_objects_of_type("nurbsCurve")
     valid_items = set()
     for obj in obj_list:
-        _parent = cmds.listRelatives(obj, parent=True, fullPath=True) or []
+        _parent = get_parent_path(obj)
         if _parent:
             obj = _parent[0]
-        if cmds.objExists(f'{obj}.{RiggerConstants.ATTR_LINE_PARENT_UUID}'):
+        if attr_path_exists(f'{obj}.{RiggerConstants.ATTR_LINE_PARENT_UUID}'):
             valid_items.add(Node(obj))
     for item in valid_items:
         if parent_uuid:
@@ -317,6 +358,35 @@ def create_proxy_visualization_lines(proxy_list, lines_parent=None):
                 logger.debug(f'Failed to create visualization line. Issue: {str(e)}')
 
 
+def delete_proxy_visualization_lines(uuid_list, lines_parent):
+    """
+    Deletes the visualization lines (and their clusters) created for the provided proxies.
+    Args:
+        uuid_list (list, set): UUIDs of the proxies. (Child UUID stored in the lines)
+        lines_parent (str): Group holding the visualization lines. (See "create_proxy_visualization_lines")
+    Returns:
+        list: List of deleted lines.
+    """
+    if not lines_parent or not cmds.objExists(str(lines_parent)):
+        return []
+    uuid_list = set(uuid_list)
+    deleted_lines = []
+    for child in cmds.listRelatives(str(lines_parent), children=True, fullPath=True) or []:
+        if not attr_path_exists(f'{child}.{RiggerConstants.ATTR_LINE_CHILD_UUID}'):
+            continue
+        if cmds.getAttr(f'{child}.{RiggerConstants.ATTR_LINE_CHILD_UUID}') not in uuid_list:
+            continue
+        history = cmds.listHistory(child, pruneDagObjects=True) or []
+        clusters = [node for node in history if cmds.objectType(node) == "cluster"]
+        handles = []
+        if clusters:
+            handles = cmds.listConnections([f'{cluster}.matrix' for cluster in clusters],
+                                           source=True, destination=False) or []
+        cmds.delete([child] + handles)
+        deleted_lines.append(child)
+    return deleted_lines
+
+
 def create_root_curve(name="root"):
     """
     Creates a circle/arrow curve to be used as the root of a control rig or a proxy guide
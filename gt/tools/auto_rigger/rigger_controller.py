@@ -1,12 +1,14 @@
 """
 Auto Rigger Controller
 """
+from gt.tools.auto_rigger.rig_profiler import BuildProfiler, get_last_build_profiler
 from gt.tools.auto_rigger.rig_utils import find_proxy_root_group, find_rig_root_group
 from PySide2.QtWidgets import QTreeWidgetItem, QAction, QMessageBox
 from gt.utils.string_utils import camel_case_split, remove_prefix
 from gt.tools.auto_rigger.rig_constants import RiggerConstants
 from gt.tools.auto_rigger.rig_templates import RigTemplates
 from gt.ui.tree_widget_enhanced import QTreeItemEnhanced
+from gt.ui.input_window_text import InputWindowText
 from gt.tools.auto_rigger.rig_modules import RigModules
 from gt.tools.auto_rigger import rigger_attr_widget
 from gt.tools.auto_rigger import rig_framework
@@ -16,6 +18,7 @@ from PySide2.QtGui import QIcon, QColor
 from PySide2.QtCore import Qt
 from functools import partial
 import logging
+import os
 
 # Logging Setup
 logging.basicConfig()
@@ -63,6 +66,7 @@ class RiggerController:
         # Add Menubar
         self.add_menu_file()
         self.add_menu_modules()
+        self.add_menu_build()
 
         # Show
         self.view.show()
@@ -121,6 +125,15 @@ class RiggerController:
                     action_mod.triggered.connect(item_func)
                     self.view.add_menu_action(parent_menu=menu_templates, action=action_mod)
 
+    def add_menu_build(self):
+        """
+        Adds a menu bar to the view
+        """
+        menu_build = self.view.add_menu_parent("Build")
+        action_profile = QAction("Show Last Build Profile", icon=QIcon(resource_library.Icon.rigger_project))
+        action_profile.triggered.connect(self.show_last_build_profile)
+        self.view.add_menu_action(parent_menu=menu_build, action=action_profile)
+
     def add_module_to_project(self, module):
         """
         Adds a module to the currently loaded module, then refresh the view.
@@ -382,17 +395,69 @@ class RiggerController:
         return False
 
     def build_proxy(self):
+        project = self.model.get_project()
+        # Proxy built by this project and not edited in the scene, only data changes are applied
+        if project.is_proxy_update_possible() and not project.has_proxy_scene_changes():
+            with BuildProfiler():
+                project.update_proxy()
+            return
         if self.preprocessing_validation():
             return
-        project = self.model.get_project()
-        project.build_proxy()
+        with BuildProfiler():
+            project.build_proxy()
 
     def build_rig(self):
+        project = self.model.get_project()
+        update_possible = project.is_rig_update_possible() and not find_proxy_root_group()
+        # Only changed modules are rebuilt. Deleting skinned joints loses their weights, so the user is asked first.
+        if update_possible and not project.get_rig_update_skinned_joints():
+            with BuildProfiler():
+                project.update_rig()
+            return
         if self.preprocessing_validation():
             return
-        project = self.model.get_project()
-        project.build_proxy(optimized=True)
-        project.build_rig()
+        with BuildProfiler():
+            project.build_proxy(optimized=True)
+            project.build_rig()
+
+    # ------------------------------------------- Profiler -------------------------------------------
+    def show_last_build_profile(self):
+        """
+        Shows the time breakdown of the last build (per phase and per module) and offers to export it.
+        """
+        profiler = get_last_build_profiler()
+        if not profiler:
+            logger.warning(f'No build profile available. Build a proxy or a rig and try again.')
+            return
+        profile_win = InputWindowText(parent=self.view,
+                                      message="Time, Maya commands and nodes created per build phase and module.",
+                                      window_title="Last Build Profile",
+                                      window_icon=resource_library.Icon.rigger_project)
+        profile_win.set_confirm_button_text("Export...")
+        profile_win.set_text_field_text(profiler.get_report())
+        profile_win.confirm_button.clicked.connect(partial(self.export_build_profile, profiler))
+        profile_win.show()
+
+    @staticmethod
+    def export_build_profile(profiler):
+        """
+        Shows a save file dialog offering to export a build profile. (JSON formatted)
+        A Chrome trace file is also written next to it using the suffix "_trace". (Open in "chrome://tracing")
+        Args:
+            profiler (BuildProfiler): Profiler with the recorded build.
+        """
+        file_path = file_dialog(caption="Export Build Profile",
+                                write_mode=True,
+                                starting_directory=None,
+                                file_filter="JSON Files (*.json)",
+                                ok_caption="Export Profile",
+                                cancel_caption="Cancel")
+        if not file_path:
+            return
+        profiler.export_json(path=file_path)
+        trace_path = f'{os.path.splitext(file_path)[0]}_trace.json'
+        profiler.export_chrome_trace(path=trace_path)
+        logger.info(f'Build profile exported to "{file_path}". Chrome trace: "{trace_path}".')
 
 
 if __name__ == "__main__":
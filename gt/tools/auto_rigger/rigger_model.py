@@ -1,8 +1,8 @@
 """
 Auto Rigger Model
 """
+from gt.tools.auto_rigger.rig_serialization import write_project_file, read_project_file
 from gt.tools.auto_rigger.template_biped import create_template_biped
-from gt.utils.data_utils import write_json, read_json_dict
 from gt.tools.auto_rigger.rig_framework import RigProject
 import logging
 
@@ -69,21 +69,29 @@ class RiggerModel:
         """
         self.project.add_to_modules(module=module)
 
-    def save_project_to_file(self, path):
+    def save_project_to_file(self, path, compress=False):
         """
-        Save the current project to the provided path (JSON format)
+        Save the current project to the provided path (JSON format, see "rig_serialization")
+        Args:
+            path (str): Path to the project file.
+            compress (bool, optional): If active, the project data is compressed.
         """
         data = self.project.get_project_as_dict()
-        write_json(path=path, data=data)
+        write_project_file(path=path, project_dict=data, compress=compress)
 
     def load_project_from_file(self, path):
         """
         Loads a new project from the provided path (path should point to a project description (JSON)
+        The current project is kept if the file can't be read.
         Args:
             path (str): Path to the project description (JSON format)
         """
+        try:
+            data = read_project_file(path)
+        except Exception as e:
+            logger.warning(f'Unable to load project from file. Issue: {e}')
+            return
         self.project = RigProject()
-        data = read_json_dict(path)
         self.project.read_data_from_dict(data)
 
 
@@ -5,13 +5,15 @@ This module contains the CurveLibraryController class responsible for managing i
 CurveLibraryModel and the user interface.
 """
 from PySide2.QtWidgets import QMessageBox, QAbstractItemView
+from gt.ui.curve_preview_widget import CurvePreviewWidget
 from gt.ui.input_window_text import InputWindowText
+from gt.ui.qt_utils import QListWidgetFilter
 from gt.utils.prefs_utils import Prefs
 from gt.utils import iterable_utils
 from gt.ui import resource_library
 from PySide2.QtGui import QIcon
 from functools import partial
-from PySide2.QtCore import Qt
+from PySide2.QtCore import Qt, QTimer
 import logging
 import sys
 import os
@@ -43,6 +45,7 @@ class CurveLibraryController:
         self.preferences.set_user_files_sub_folder("user_curves")
         user_curves_dir = self.preferences.get_user_files_dir_path(create_if_missing=False)
         self.model.import_user_curve_library(source_dir=user_curves_dir)
+        self.list_filter = QListWidgetFilter(self.view.item_list)
         # Connections
         self.view.build_button.clicked.connect(self.build_view_selected_curve)
         self.view.item_list.itemSelectionChanged.connect(self.on_item_selection_changed)
@@ -99,9 +102,9 @@ class CurveLibraryController:
     def filter_list(self):
         """
         Filter the curve library list based on the search text entered by the user.
+        Rows are only hidden or shown (debounced), the list is not populated again.
         """
-        search_text = self.view.search_bar.text().lower()
-        self.populate_curve_library(filter_str=search_text)
+        self.list_filter.set_filter_text(self.view.search_bar.text())
 
     def build_view_selected_curve(self):
         """
@@ -173,6 +176,7 @@ class CurveLibraryController:
             metadata_user_crv = {"object": crv, "item_type": self.CURVE_TYPE_USER}
             self.view.add_item_view_library(item_name=crv.get_name(), icon=icon_user_crv, metadata=metadata_user_crv)
         self.view.item_list.setCurrentRow(0)  # Select index 0
+        self.list_filter.rebuild_index()  # Applies the current search text to the new items
 
     def open_parameter_editor(self):
         """ Opens an input window so the user can update the parameters of a control """
@@ -203,10 +207,34 @@ class CurveLibraryController:
         elif isinstance(parameters, str):
             formatted_dict = parameters
         param_win.set_text_field_text(formatted_dict)
+        # Preview - Drawn from cached curve data, the control is only built in the scene when "Build" is clicked
+        preview_widget = CurvePreviewWidget()
+        param_win.add_input_widget(preview_widget)
+        update_preview = partial(self.update_parameter_preview, param_win.get_text_field_text, control, preview_widget)
+        preview_timer = QTimer(param_win)
+        preview_timer.setSingleShot(True)
+        preview_timer.setInterval(250)  # Waits for the user to stop typing (debounce)
+        preview_timer.timeout.connect(update_preview)
+        param_win.text_field.textChanged.connect(preview_timer.start)
+        update_preview()
         param_win.confirm_button.clicked.connect(partial(self.model.build_control_with_custom_parameters,
                                                          param_win.get_text_field_text, control))
         param_win.show()
 
+    def update_parameter_preview(self, parameters, control, preview_widget):
+        """
+        Updates the preview of a control in the parameter editor. (See "CurveLibraryModel.get_control_preview_data")
+        Args:
+            parameters (Callable, dict, str): Function used to get parameters, dictionary or its string representation.
+            control (Control): Control being edited.
+            preview_widget (CurvePreviewWidget): Widget used to draw the control shapes.
+        """
+        preview_data = self.model.get_control_preview_data(parameters, control)
+        if preview_data:
+            preview_widget.set_shapes(preview_data.get("shapes"))
+        else:
+            preview_widget.set_message("Invalid parameters")
+
     def add_user_curve(self):
         """
         Attempts to create a user-defined curve (saved to the preferences' folder)
@@ -249,6 +277,7 @@ class CurveLibraryController:
             selected_item = self.view.item_list.currentItem()
             if selected_item:
                 self.view.item_list.takeItem(self.view.item_list.row(selected_item))
+                self.list_filter.rebuild_index()
             sys.stdout.write(f'Curve "{curve_name}" was deleted.\n')
 
     def render_curve_snapshot(self):
@@ -9,7 +9,7 @@ Classes:
     CurveLibraryModel: A class for managing a library of curves.
 """
 from gt.utils.control_utils import Controls, get_control_preview_image_path, Control
-from gt.utils.curve_utils import Curves, get_curve_preview_image_path, Curve
+from gt.utils.curve_utils import Curves, get_curve_preview_image_path, Curve, get_curve_library_names
 from gt.ui import resource_library
 import logging
 import os
@@ -193,9 +193,7 @@ class CurveLibraryModel:
         """
         Imports all curves found in "curve_utils.Curves" to the CurveLibraryModel curves list
         """
-        curve_attributes = vars(Curves)
-        curve_keys = [attr for attr in curve_attributes if not (attr.startswith('__') and attr.endswith('__'))]
-        for curve_key in curve_keys:
+        for curve_key in get_curve_library_names(library=Curves):
             curve_obj = getattr(Curves, curve_key)
             self.add_base_curve(curve_obj)
 
@@ -318,6 +316,24 @@ class CurveLibraryModel:
             finally:
                 target_control.reset_parameters()
 
+    @staticmethod
+    def get_control_preview_data(parameters, target_control):
+        """
+        Gets the curve data of a control built with custom parameters, without keeping anything in the scene.
+        Args:
+            parameters (Callable, dict, str): Function used to get parameters, dictionary or its string representation.
+            target_control (Control): Control object to preview.
+        Returns:
+            dict or None: Control preview data. None if the parameters are invalid or it failed to generate it.
+                          (See "control_utils.get_control_preview_data")
+        """
+        if callable(parameters):
+            parameters = parameters()
+        try:
+            return target_control.get_preview_data(parameters=parameters)
+        except Exception as e:
+            logger.debug(f'Unable to get control preview. Issue: "{e}".')
+
     def get_potential_user_curve_from_selection(self):
         """
         Gets a user-defined curve if it's unique and valid. (Uses user selection in Maya)
@@ -6,6 +6,7 @@ MeshLibraryModel and the user interface.
 """
 from PySide2.QtWidgets import QMessageBox, QAbstractItemView
 from gt.ui.input_window_text import InputWindowText
+from gt.ui.qt_utils import QListWidgetFilter
 from gt.utils.prefs_utils import Prefs
 from gt.utils import iterable_utils
 from gt.ui import resource_library
@@ -44,6 +45,7 @@ class MeshLibraryController:
         self.preferences.set_user_files_sub_folder("user_meshes")
         user_meshes_dir = self.preferences.get_user_files_dir_path(create_if_missing=False)
         self.model.import_user_mesh_library(source_dir=user_meshes_dir)
+        self.list_filter = QListWidgetFilter(self.view.item_list)
         # Connections
         self.view.build_button.clicked.connect(self.build_view_selected_mesh)
         self.view.item_list.itemSelectionChanged.connect(self.on_item_selection_changed)
@@ -100,9 +102,9 @@ class MeshLibraryController:
     def filter_list(self):
         """
         Filter the mesh library list based on the search text entered by the user.
+        Rows are only hidden or shown (debounced), the list is not populated again.
         """
-        search_text = self.view.search_bar.text().lower()
-        self.populate_mesh_library(filter_str=search_text)
+        self.list_filter.set_filter_text(self.view.search_bar.text())
 
     def build_view_selected_mesh(self):
         """
@@ -176,6 +178,7 @@ class MeshLibraryController:
             metadata_user_mesh = {"object": user_mesh, "item_type": self.MESH_TYPE_USER}
             self.view.add_item_view_library(item_name=mesh_name, icon=icon_user_mesh, metadata=metadata_user_mesh)
         self.view.item_list.setCurrentRow(0)  # Select index 0
+        self.list_filter.rebuild_index()  # Applies the current search text to the new items
 
     def open_parameter_editor(self):
         """ Opens an input window so the user can update the parameters of a parametric mesh """
@@ -251,6 +254,7 @@ class MeshLibraryController:
             selected_item = self.view.item_list.currentItem()
             if selected_item:
                 self.view.item_list.takeItem(self.view.item_list.row(selected_item))
+                self.list_filter.rebuild_index()
             sys.stdout.write(f'Mesh "{mesh_name}" was deleted.\n')
 
     def render_mesh_snapshot(self):
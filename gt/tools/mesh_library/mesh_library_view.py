@@ -3,6 +3,7 @@ Mesh Library View - The main GUI window class for the Curve Library tool.
 """
 from PySide2.QtWidgets import QListWidget, QPushButton, QWidget, QSplitter, QLineEdit, QDesktopWidget, QListWidgetItem
 from PySide2.QtGui import QIcon, QPixmap, QColor, QFont
+from gt.ui.preview_image_loader import PreviewImageLoader, get_preview_size
 import gt.ui.resource_library as resource_library
 from gt.ui.squared_widget import SquaredWidget
 from gt.ui.qt_utils import MayaWindowMeta
@@ -34,6 +35,8 @@ class MeshLibraryView(metaclass=MayaWindowMeta):
         self.delete_custom_button = None
         self.build_button = None
         self.preview_image = None
+        self.preview_loader = None
+        self.requested_preview_image = None
         self.description = None
         self.snapshot_button = None
         self.parameters_button = None
@@ -68,10 +71,27 @@ class MeshLibraryView(metaclass=MayaWindowMeta):
             new_image_path (str, optional): The path to the new image file.
                                             Defaults to None, which becomes "missing_preview_file"
         """
-        if new_image_path:
-            self.preview_image.set_pixmap(QPixmap(new_image_path))
-        else:
-            self.preview_image.set_pixmap(QPixmap(resource_library.Icon.library_missing_file))
+        if not new_image_path:
+            new_image_path = resource_library.Icon.library_missing_file
+        self.requested_preview_image = new_image_path
+        preview_size = get_preview_size(self.preview_image)  # Decodes it scaled instead of full-size
+        pixmap = self.preview_loader.request_pixmap(image_path=new_image_path, size=preview_size)  # None while loading
+        if pixmap:
+            self.preview_image.set_pixmap(pixmap)
+
+    def on_preview_image_loaded(self, image_path, pixmap):
+        """
+        Updates the preview image once it's loaded. Ignored if another image was requested in the meantime.
+
+        Args:
+            image_path (str): Path to the loaded image.
+            pixmap (QPixmap): Loaded image. (Null if it failed to load)
+        """
+        if image_path != self.requested_preview_image:
+            return
+        if pixmap.isNull():
+            pixmap = QPixmap(resource_library.Icon.library_missing_file)
+        self.preview_image.set_pixmap(pixmap)
 
     def create_widgets(self):
         """Create the widgets for the window."""
@@ -85,7 +105,10 @@ class MeshLibraryView(metaclass=MayaWindowMeta):
         self.search_bar = QLineEdit(self)
         self.search_bar.setFont(font)
         self.search_bar.setPlaceholderText('Search...')
+        self.search_bar.setToolTip('Use "type:" to filter by item type. e.g. "arrow type:user"')
         self.preview_image = SquaredWidget(self, center_y=False)
+        self.preview_loader = PreviewImageLoader(parent=self)
+        self.preview_loader.image_loaded.connect(self.on_preview_image_loaded)
         # Buttons
         self.add_custom_button = QPushButton("Save Mesh")
         add_custom_tooltip = "Saves a Maya selected Polygon/Surface element as a user-defined item in the Mesh Library"
@@ -4,7 +4,7 @@ Resource Library Controller
 This module contains the ResourceLibraryController class responsible for managing interactions between the
 ResourceLibraryModel and the user interface.
 """
-from gt.ui.qt_utils import create_color_icon
+from gt.ui.qt_utils import create_color_icon, QListWidgetFilter
 from gt.ui import resource_library
 from PySide2.QtCore import Qt
 import logging
@@ -37,6 +37,7 @@ class ResourceLibraryController:
         self.category_filter = "Package Assets"
         self.source_list = [self.TYPE_COLOR, self.TYPE_PACKAGE_ICON]
         self.view.source_combo_box.setCurrentIndex(1)  # Package Resources
+        self.list_filter = QListWidgetFilter(self.view.item_list)
 
         # Connections
         self.view.source_combo_box.currentIndexChanged.connect(self.update_category_filter)
@@ -111,9 +112,9 @@ class ResourceLibraryController:
     def filter_list(self):
         """
         Filter the item library list based on the search text entered by the user.
+        Rows are only hidden or shown (debounced), the list is not populated again.
         """
-        search_text = self.view.search_bar.text().lower()
-        self.populate_curve_library(filter_str=search_text)
+        self.list_filter.set_filter_text(self.view.search_bar.text())
 
     def get_selected_item_object(self):
         """
@@ -167,6 +168,7 @@ class ResourceLibraryController:
             self.view.add_item_view_library(item_name=name, icon=maya_icon, metadata=metadata_maya_icon,
                                             hex_color=resource_library.Color.Hex.white_old_lace)
         self.view.item_list.setCurrentRow(0)  # Select index 0
+        self.list_filter.rebuild_index()  # Applies the current search text to the new items
 
     def exported_selected_resource(self):
         """ Opens an input window so the user can update the parameters of a control """
@@ -195,7 +197,7 @@ class ResourceLibraryController:
             self.source_list = [self.TYPE_COLOR]
         if current_index == 4:  # Maya Icons
             self.source_list = [self.TYPE_MAYA_ICON]
-        self.filter_list()
+        self.populate_curve_library()
 
 
 if __name__ == "__main__":
@@ -5,6 +5,7 @@ from PySide2.QtWidgets import QListWidget, QPushButton, QWidget, QSplitter, QLin
 from gt.ui.syntax_highlighter import PythonSyntaxHighlighter
 from PySide2.QtGui import QIcon, QPixmap, QColor, QFont
 from PySide2.QtWidgets import QTextEdit, QComboBox
+from gt.ui.preview_image_loader import PreviewImageLoader, get_preview_size
 import gt.ui.resource_library as resource_library
 from gt.ui.squared_widget import SquaredWidget
 from gt.ui.qt_utils import MayaWindowMeta
@@ -34,6 +35,8 @@ class ResourceLibraryView(metaclass=MayaWindowMeta):
         self.item_list = None
         self.save_btn = None
         self.preview_image = None
+        self.preview_loader = None
+        self.requested_preview_image = None
         self.description = None
         self.resource_path = None
         self.source_combo_box = None
@@ -69,12 +72,31 @@ class ResourceLibraryView(metaclass=MayaWindowMeta):
             new_image (str, QPixmap, optional): The path to the new image file.
                                                      Defaults to None, which becomes "missing_preview_file"
         """
-        if new_image:
-            if isinstance(new_image, str):
-                new_image = QPixmap(new_image)
-            self.preview_image.set_pixmap(new_image)
+        if not new_image:
+            new_image = resource_library.Icon.library_missing_file
+        if isinstance(new_image, str):  # Paths are loaded in the background
+            self.requested_preview_image = new_image
+            preview_size = get_preview_size(self.preview_image)  # Decodes it scaled instead of full-size
+            new_image = self.preview_loader.request_pixmap(image_path=new_image, size=preview_size)
+            if not new_image:
+                return
         else:
-            self.preview_image.set_pixmap(QPixmap(resource_library.Icon.library_missing_file))
+            self.requested_preview_image = None
+        self.preview_image.set_pixmap(new_image)
+
+    def on_preview_image_loaded(self, image_path, pixmap):
+        """
+        Updates the preview image once it's loaded. Ignored if another image was requested in the meantime.
+
+        Args:
+            image_path (str): Path to the loaded image.
+            pixmap (QPixmap): Loaded image. (Null if it failed to load)
+        """
+        if image_path != self.requested_preview_image:
+            return
+        if pixmap.isNull():
+            pixmap = QPixmap(resource_library.Icon.library_missing_file)
+        self.preview_image.set_pixmap(pixmap)
 
     def create_widgets(self):
         """Create the widgets for the window."""
@@ -88,7 +110,10 @@ class ResourceLibraryView(metaclass=MayaWindowMeta):
         self.search_bar = QLineEdit(self)
         self.search_bar.setFont(font)
         self.search_bar.setPlaceholderText('Search...')
+        self.search_bar.setToolTip('Use "type:" to filter by item type. e.g. "arrow type:maya_icon"')
         self.preview_image = SquaredWidget(self, center_y=False)
+        self.preview_loader = PreviewImageLoader(parent=self)
+        self.preview_loader.image_loaded.connect(self.on_preview_image_loaded)
         self.resource_path = QTextEdit()
         PythonSyntaxHighlighter(self.resource_path.document())
         self.resource_path.setFontPointSize(10)
@@ -18,11 +18,15 @@
  Minor PEP8 Cleanup
  Dropped Python 2 support (Only Python 3+ now)
 
+ 1.1.0 - 2026-10-17
+ Extraction samples all objects per frame through a DG context (no current time changes)
+ Bake writes keys in bulk (one call per channel) as a single undoable command
+
  TODO:
     Add sparse key option
 """
 # Tool Version
-__version_tuple__ = (1, 0, 2)
+__version_tuple__ = (1, 1, 0)
 __version_suffix__ = ''
 __version__ = '.'.join(str(n) for n in __version_tuple__) + __version_suffix__
 
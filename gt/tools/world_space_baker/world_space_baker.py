@@ -14,6 +14,10 @@
  Minor PEP8 Cleanup
  Dropped Python 2 support (Only Python 3+ now)
 
+ 1.1.0 - 2026-10-17
+ Extraction samples all objects per frame through a DG context (no current time changes)
+ Bake writes keys in bulk (one call per channel) as a single undoable command
+
  TODO:
     Add sparse key option
 
@@ -22,6 +26,7 @@ from maya import OpenMayaUI as OpenMayaUI
 from PySide2.QtWidgets import QWidget
 from PySide2.QtGui import QIcon
 from shiboken2 import wrapInstance
+from gt.utils.anim_utils import get_world_space_samples, bake_world_space_samples
 from gt.ui import resource_library
 import maya.cmds as cmds
 import logging
@@ -351,6 +356,7 @@ def select_existing_objects(stored_list):
 def extract_world_space_data():
     """
     Extracts the world space data from the objects that were loaded into selections
+    All objects are sampled in a single pass per frame without changing the current time.
     """
     # Double check target availability
     available_ctrls = []
@@ -358,108 +364,45 @@ def extract_world_space_data():
         if cmds.objExists(obj):
             available_ctrls.append(obj)
 
-    # Store Current Time
-    original_time = cmds.currentTime(q=True)
-
     # Last Validation
-    is_valid = True
-    if available_ctrls == 0:
-        is_valid = False
+    if not available_ctrls:
         cmds.warning("Loaded objects couldn't be found. Please review your settings and try again")
-    elif gt_world_space_baker_settings.get('start_time_range') >= gt_world_space_baker_settings.get('end_time_range'):
-        is_valid = False
+        return False
+    if gt_world_space_baker_settings.get('start_time_range') >= gt_world_space_baker_settings.get('end_time_range'):
         cmds.warning(
             "Starting frame can't be higher than ending frame. Review your animation range settings and try again.")
-
-    # Extract Keyframes:
-    if is_valid:
-        try:
-            cmds.refresh(suspend=True)
-            for obj in available_ctrls:
-                attributes = cmds.listAnimatable(obj)
-                needs_ws_transforms = True
-                frame_translate_values = []
-                frame_rotate_values = []
-                for attr in attributes:
-
-                    try:
-                        # WS Values # Translate and Rotate for the desired frame range
-                        if 'translate' in attr or 'rotate' in attr:
-                            if needs_ws_transforms:
-                                cmds.currentTime(gt_world_space_baker_settings.get('start_time_range'))
-
-                                for index in range(gt_world_space_baker_settings.get(
-                                        'end_time_range') - gt_world_space_baker_settings.get('start_time_range') + 1):
-                                    frame_translate_values.append(
-                                        [cmds.currentTime(q=True), cmds.xform(obj, ws=True, q=True, t=True)])
-                                    frame_rotate_values.append(
-                                        [cmds.currentTime(q=True), cmds.xform(obj, ws=True, q=True, ro=True)])
-                                    cmds.currentTime(cmds.currentTime(q=True) + 1)
-                                needs_ws_transforms = False
-
-                            if attr.split('.')[-1].startswith('translate'):
-                                gt_world_space_baker_anim_storage[
-                                    '{}.{}'.format(obj, 'translate')] = frame_translate_values
-
-                            if attr.split('.')[-1].startswith('rotate'):
-                                gt_world_space_baker_anim_storage['{}.{}'.format(obj, 'rotate')] = frame_rotate_values
-                    except Exception as e:
-                        logger.debug(str(e))  # 0 keyframes
-        except Exception as e:
-            logger.debug(str(e))  # 0 keyframes
-        finally:
-            cmds.refresh(suspend=False)
-
-    cmds.currentTime(original_time)
+        return False
+
+    # Extract World Space Samples
+    try:
+        samples = get_world_space_samples(available_ctrls,
+                                          start_frame=gt_world_space_baker_settings.get('start_time_range'),
+                                          end_frame=gt_world_space_baker_settings.get('end_time_range'))
+    except Exception as e:
+        logger.debug(str(e))
+        cmds.warning("Unable to extract world space data. Open the script editor for more information.")
+        return False
+    gt_world_space_baker_anim_storage.clear()
+    gt_world_space_baker_anim_storage.update(samples)
     return True
 
 
 def bake_world_space_data():
     """
     Bakes extracted data using stored world space dictionary (only translate and rotate)
+    Keys are written in bulk (one call per channel) without changing the current time. The bake can be undone.
     """
-
-    # Store Current Time
-    original_time = cmds.currentTime(q=True)
-
     # Last Validation
-    is_valid = True
-    if len(gt_world_space_baker_anim_storage) == 0:
-        is_valid = False
+    if not gt_world_space_baker_anim_storage.get('objects'):
         cmds.warning("Couldn't find stored data. Please try extracting it again.")
+        return
 
     # Bake Keyframes:
-    if is_valid:
-        try:
-            cmds.refresh(suspend=True)
-            cmds.undoInfo(openChunk=True, chunkName='GT World Space Bake')
-            for key, dict_value in gt_world_space_baker_anim_storage.items():
-                for key_data in dict_value:
-                    try:
-                        obj, attr = key.split('.')
-                        time = key_data[0]
-                        value = key_data[1]
-                        cmds.currentTime(time)
-                        if attr == 'translate':
-                            cmds.xform(obj, ws=True, t=value)
-                            cmds.setKeyframe(obj, time=time, attribute='tx')
-                            cmds.setKeyframe(obj, time=time, attribute='ty')
-                            cmds.setKeyframe(obj, time=time, attribute='tz')
-                        if attr == 'rotate':
-                            cmds.xform(obj, ws=True, ro=value)
-                            cmds.setKeyframe(obj, time=time, attribute='rx')
-                            cmds.setKeyframe(obj, time=time, attribute='ry')
-                            cmds.setKeyframe(obj, time=time, attribute='rz')
-                    except Exception as e:
-                        logger.debug(str(e))
-        except Exception as e:
-            logger.debug(str(e))
-        finally:
-            cmds.undoInfo(closeChunk=True, chunkName='GT World Space Bake')
-            cmds.refresh(suspend=False)
-
-    # Reset to Original Time
-    cmds.currentTime(original_time)
+    try:
+        bake_world_space_samples(gt_world_space_baker_anim_storage)
+    except Exception as e:
+        logger.debug(str(e))
+        cmds.warning("Unable to bake world space data. Open the script editor for more information.")
 
 
 # Build UI
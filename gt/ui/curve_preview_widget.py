@@ -0,0 +1,135 @@
+"""
+Curve Preview Widget - Draws curve shapes from their data (points, knots and degree) without creating them in Maya.
+Used by the Curve Library parameter editor to preview controls while their parameters are edited.
+"""
+from gt.utils.array_math_utils import evaluate_curve_points, get_points_bounds
+from PySide2.QtGui import QPainter, QPen, QColor, QPolygonF
+from PySide2.QtCore import Qt, QPointF
+from PySide2.QtWidgets import QWidget
+import gt.ui.resource_library as resource_library
+import logging
+
+# Logging Setup
+logging.basicConfig()
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+class CurvePreviewWidget(QWidget):
+    def __init__(self, parent=None, margin=10):
+        """
+        Widget that draws curve shapes projected to the two axes they spread the most. (e.g. "XZ" for flat controls)
+
+        Args:
+            parent (QWidget, optional): The parent widget.
+            margin (int, optional): Space in pixels kept around the drawn curves.
+        """
+        super().__init__(parent=parent)
+        self.margin = margin
+        self.curves_points = []  # One list of (x, y, z) positions per shape
+        self.message = ""
+        self.setMinimumHeight(150)
+
+    def set_shapes(self, shapes):
+        """
+        Sets the shapes to draw. Higher degree curves are evaluated, so they are drawn smooth.
+
+        Args:
+            shapes (list): A list of dictionaries with the "points", "knot" and "degree" of each shape.
+                           Same pattern returned by "curve_utils.get_curve_shape_data".
+        """
+        self.curves_points = []
+        for shape in shapes or []:
+            points = evaluate_curve_points(points=shape.get("points") or [],
+                                           knots=shape.get("knot") or [],
+                                           degree=shape.get("degree") or 1)
+            if points:
+                self.curves_points.append(points)
+        self.message = ""
+        self.update()
+
+    def set_message(self, message):
+        """
+        Clears the drawn shapes and shows a message instead. e.g. "Invalid parameters"
+
+        Args:
+            message (str): Message to display.
+        """
+        self.curves_points = []
+        self.message = message or ""
+        self.update()
+
+    def get_projection_axes(self):
+        """
+        Gets the two axes used to draw the curves. The axes where the curves spread the most are used.
+
+        Returns:
+            tuple: Indices of the horizontal and vertical axes. e.g. (0, 2) for "XZ"
+        """
+        bounds = get_points_bounds([point for points in self.curves_points for point in points])
+        if not bounds:
+            return 0, 1
+        sizes = [maximum - minimum for minimum, maximum in zip(*bounds)]
+        horizontal, vertical = sorted(sorted(range(3), key=lambda axis: sizes[axis], reverse=True)[:2])
+        return horizontal, vertical
+
+    def get_projected_polygons(self):
+        """
+        Gets the curves projected and fitted to the widget. (Keeps aspect ratio, centered)
+
+        Returns:
+            list: A list of QPolygonF, one per curve.
+        """
+        if not self.curves_points:
+            return []
+        horizontal, vertical = self.get_projection_axes()
+        all_points = [point for points in self.curves_points for point in points]
+        bounds = get_points_bounds(all_points)
+        min_x, min_y = bounds[0][horizontal], bounds[0][vertical]
+        size_x = bounds[1][horizontal] - min_x
+        size_y = bounds[1][vertical] - min_y
+        available_x = max(self.width() - 2 * self.margin, 1)
+        available_y = max(self.height() - 2 * self.margin, 1)
+        scale = min(available_x / size_x if size_x else float("inf"), available_y / size_y if size_y else float("inf"))
+        if scale == float("inf"):
+            scale = 1  # Single point
+        offset_x = self.margin + (available_x - size_x * scale) / 2
+        offset_y = self.margin + (available_y - size_y * scale) / 2
+        polygons = []
+        for points in self.curves_points:
+            # Maya's Z grows towards the viewer (drawn down), other axes grow up (drawn up)
+            if vertical == 2:
+                projected = [QPointF(offset_x + (point[horizontal] - min_x) * scale,
+                                     offset_y + (point[vertical] - min_y) * scale) for point in points]
+            else:
+                projected = [QPointF(offset_x + (point[horizontal] - min_x) * scale,
+                                     offset_y + (size_y - (point[vertical] - min_y)) * scale) for point in points]
+            polygons.append(QPolygonF(projected))
+        return polygons
+
+    def paintEvent(self, event):
+        """
+        Override the paintEvent to draw the curves or the message.
+
+        Args:
+            event (QPaintEvent): The paint event.
+        """
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.fillRect(self.rect(), QColor(resource_library.Color.Hex.gray_darker_mid))
+        if self.message:
+            painter.setPen(QColor(resource_library.Color.Hex.gray_dark))
+            painter.drawText(self.rect(), Qt.AlignCenter, self.message)
+            return
+        painter.setPen(QPen(QColor(resource_library.Color.Hex.yellow), 1.5))
+        for polygon in self.get_projected_polygons():
+            painter.drawPolyline(polygon)
+
+
+if __name__ == "__main__":
+    from gt.ui import qt_utils
+
+    with qt_utils.QtApplicationContext():
+        preview = CurvePreviewWidget()
+        preview.set_shapes([{"points": [[0, 0, 0], [1, 0, 1], [2, 0, 0]], "knot": [0, 0, 1, 1], "degree": 2}])
+        preview.show()
@@ -161,6 +161,15 @@ class InputWindowText(metaclass=MayaWindowMeta):
         if text and isinstance(text, str):
             self.text_field.setPlaceholderText(text)
 
+    def add_input_widget(self, widget):
+        """
+        Adds a widget below the text field. e.g. A preview of the result of the entered text.
+
+        Args:
+            widget (QWidget): The widget to add.
+        """
+        self.layout_input.addWidget(widget)
+
     def create_layout(self):
         """
         Create the layout for the widget.
@@ -185,9 +194,9 @@ class InputWindowText(metaclass=MayaWindowMeta):
         layout_description.setContentsMargins(15, 15, 15, 15)
         # -------------------------------- Description Layout End --------------------------------
 
-        layout_input = QVBoxLayout()
-        layout_input.setContentsMargins(0, 15, 0, 0)
-        layout_input.addWidget(self.text_field)
+        self.layout_input = QVBoxLayout()
+        self.layout_input.setContentsMargins(0, 15, 0, 0)
+        self.layout_input.addWidget(self.text_field)
 
         layout_button = QHBoxLayout()
         layout_button.addWidget(self.confirm_button)
@@ -195,7 +204,7 @@ class InputWindowText(metaclass=MayaWindowMeta):
 
         layout_main = QVBoxLayout()
         layout_main.addLayout(layout_description)
-        layout_main.addLayout(layout_input)
+        layout_main.addLayout(self.layout_input)
         layout_main.addLayout(layout_button)
         self.setLayout(layout_main)
 
@@ -0,0 +1,207 @@
+"""
+Preview Image Loader - Loads preview images in background threads and keeps the most recent ones in memory.
+Used by the library views (curves, meshes, resources) so changing the selection never waits for an image to decode.
+"""
+from PySide2.QtCore import QObject, QRunnable, QThreadPool, QSize, Signal, Qt
+from PySide2.QtGui import QImageReader, QPixmap
+from collections import OrderedDict
+import logging
+import os
+
+# Logging Setup
+logging.basicConfig()
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+def get_preview_size(widget, step=128, minimum=256):
+    """
+    Gets the size a preview image should be decoded at to fill a widget.
+    The size is rounded up to a multiple of "step", so small resizes can still reuse the cached pixmaps.
+
+    Args:
+        widget (QWidget): Widget the image is displayed in.
+        step (int, optional): Value the size is rounded up to. Default is 128.
+        minimum (int, optional): Minimum size. Used when the widget wasn't laid out yet. Default is 256.
+
+    Returns:
+        QSize: A square size matching the widget's largest side. (Considers the device pixel ratio)
+    """
+    side = max(widget.width(), widget.height()) * widget.devicePixelRatioF()
+    side = max(int(side), minimum)
+    side = -(-side // step) * step  # Round up
+    return QSize(side, side)
+
+
+class PreviewImageSignals(QObject):
+    """
+    Signals emitted by the background tasks. QRunnable is not a QObject, so it can't emit signals on its own.
+    """
+    loaded = Signal(object, object)  # Cache key, QImage
+
+
+class PreviewImageTask(QRunnable):
+    def __init__(self, key, image_path, size, signals):
+        """
+        Background task that decodes an image file into a QImage. (QPixmap can only be created in the main thread)
+
+        Args:
+            key (tuple): Cache key for the image. Sent back with the decoded image.
+            image_path (str): Path to the image file.
+            size (QSize, None): If provided, the image is decoded already scaled to fit this size (keeps aspect ratio)
+            signals (PreviewImageSignals): Object used to send the decoded image back to the main thread.
+        """
+        super().__init__()
+        self.key = key
+        self.image_path = image_path
+        self.size = size
+        self.signals = signals
+
+    def run(self):
+        """
+        Decodes the image and emits it through the "loaded" signal. A null QImage is emitted if it fails.
+        """
+        reader = QImageReader(self.image_path)
+        if self.size and reader.size().isValid():
+            reader.setScaledSize(reader.size().scaled(self.size, Qt.KeepAspectRatio))
+        image = reader.read()
+        if image.isNull():
+            logger.debug(f'Unable to load preview image "{self.image_path}". Issue: {reader.errorString()}')
+        self.signals.loaded.emit(self.key, image)
+
+
+class PreviewImageLoader(QObject):
+    image_loaded = Signal(str, QPixmap)  # Image path, loaded pixmap (null if it failed)
+
+    def __init__(self, parent=None, max_cached=64, max_threads=2):
+        """
+        Loads preview images asynchronously and stores them in a bounded LRU (least recently used) cache.
+        Cached images are keyed by (path, modification time, size), so changed files are loaded again.
+
+        Args:
+            parent (QObject, optional): Parent object.
+            max_cached (int, optional): Maximum number of pixmaps kept in memory.
+            max_threads (int, optional): Maximum number of threads used to decode images.
+        """
+        super().__init__(parent)
+        self.max_cached = max_cached
+        self.cache = OrderedDict()
+        self.pending = set()
+        self.signals = PreviewImageSignals()
+        self.signals.loaded.connect(self.on_image_loaded)
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(max_threads)
+
+    @staticmethod
+    def get_cache_key(image_path, size=None):
+        """
+        Gets the key used to store an image in the cache.
+
+        Args:
+            image_path (str): Path to the image file.
+            size (QSize, optional): Size the image is scaled to fit.
+
+        Returns:
+            tuple: (path, modification time, size) - Modification time is None when the file is missing.
+        """
+        try:
+            modified_time = os.path.getmtime(image_path)
+        except OSError:
+            modified_time = None
+        size_key = None
+        if isinstance(size, QSize):
+            size_key = (size.width(), size.height())
+        return image_path, modified_time, size_key
+
+    def get_cached_pixmap(self, image_path, size=None):
+        """
+        Gets a pixmap from the cache without loading it.
+
+        Args:
+            image_path (str): Path to the image file.
+            size (QSize, optional): Size the image was scaled to fit.
+
+        Returns:
+            QPixmap or None: Cached pixmap, None if it's not in the cache.
+        """
+        key = self.get_cache_key(image_path=image_path, size=size)
+        pixmap = self.cache.get(key)
+        if pixmap is not None:
+            self.cache.move_to_end(key)
+        return pixmap
+
+    def request_pixmap(self, image_path, size=None):
+        """
+        Gets a pixmap from the cache or starts loading it in the background.
+        When loaded, the "image_loaded" signal is emitted with the image path and the pixmap.
+
+        Args:
+            image_path (str): Path to the image file.
+            size (QSize, optional): If provided, the image is scaled to fit this size (keeps aspect ratio)
+
+        Returns:
+            QPixmap or None: The pixmap if it was already cached, None if it's being loaded.
+        """
+        key = self.get_cache_key(image_path=image_path, size=size)
+        pixmap = self.cache.get(key)
+        if pixmap is not None:
+            self.cache.move_to_end(key)
+            return pixmap
+        if key not in self.pending:
+            self.pending.add(key)
+            self.thread_pool.start(PreviewImageTask(key=key, image_path=image_path, size=size, signals=self.signals))
+
+    def preload(self, image_paths, size=None):
+        """
+        Starts loading multiple images in the background. Already cached images are ignored.
+
+        Args:
+            image_paths (list): A list of paths to image files.
+            size (QSize, optional): If provided, the images are scaled to fit this size (keeps aspect ratio)
+        """
+        for image_path in image_paths:
+            self.request_pixmap(image_path=image_path, size=size)
+
+    def on_image_loaded(self, key, image):
+        """
+        Called in the main thread when a background task is done. Converts the image and stores it in the cache.
+
+        Args:
+            key (tuple): Cache key of the loaded image.
+            image (QImage): Decoded image. (Null if it failed)
+        """
+        self.pending.discard(key)
+        pixmap = QPixmap.fromImage(image)
+        if not pixmap.isNull():
+            self.cache[key] = pixmap
+            while len(self.cache) > self.max_cached:
+                self.cache.popitem(last=False)  # Least recently used
+        self.image_loaded.emit(key[0], pixmap)
+
+    def clear(self):
+        """
+        Removes all pixmaps from the cache.
+        """
+        self.cache.clear()
+
+    def wait_for_done(self, msecs=-1):
+        """
+        Waits for the background tasks to finish.
+
+        Args:
+            msecs (int, optional): Maximum time to wait in milliseconds. Default is -1 (no timeout)
+
+        Returns:
+            bool: True if all tasks were finished, False if it timed out.
+        """
+        return self.thread_pool.waitForDone(msecs)
+
+
+if __name__ == "__main__":
+    from gt.ui.resource_library import Icon
+    from gt.ui import qt_utils
+
+    with qt_utils.QtApplicationContext():
+        loader = PreviewImageLoader()
+        loader.image_loaded.connect(lambda path, _pixmap: print(f'Loaded: "{path}" ({_pixmap.size()})'))
+        loader.request_pixmap(Icon.library_missing_file)
@@ -2,9 +2,11 @@ from PySide2.QtWidgets import QApplication, QWidget, QDesktopWidget, QDialog, QM
 from PySide2.QtGui import QFontDatabase, QColor, QFont, QPixmap, QIcon, QKeyEvent
 from gt.utils.session_utils import is_script_in_interactive_maya
 from gt.utils.system_utils import is_system_macos
+from gt.utils.string_utils import TrigramIndex
 from PySide2 import QtGui, QtCore, QtWidgets
 from PySide2.QtCore import QPoint, Qt
 import logging
+import time
 import sys
 import os
 import re
@@ -711,6 +713,162 @@ class ConfirmableQLineEdit(QLineEdit):
             super().keyPressEvent(event)  # Continue with the default behavior for other keys
 
 
+class QListWidgetFilter:
+    TYPE_FILTER_PATTERN = re.compile(r'(?:^|\s)type:(\S*)', re.IGNORECASE)
+
+    def __init__(self, list_widget, delay=100):
+        """
+        Filters the items of a QListWidget by hiding and showing rows instead of recreating them.
+        Item names are stored in a trigram index (see "string_utils.TrigramIndex") when "rebuild_index" is called,
+        so each search only compares the few items that could match.
+        Item types (the "item_type" metadata) are kept out of the name index. They are only matched through
+        explicit "type:" tokens. e.g. "arrow type:user" finds user items containing "arrow" in their names.
+
+        Args:
+            list_widget (QListWidget): List widget to filter.
+            delay (int, optional): Time in milliseconds to wait for more input before filtering. (Debounce)
+        """
+        self.list_widget = list_widget
+        self.items = []
+        self.item_types = []
+        self.index = TrigramIndex()
+        self.visible_ids = set()
+        self.filter_text = ""
+        self.pending_text = ""
+        self.last_duration = 0  # Time in milliseconds the last filter took
+        self.timer = QtCore.QTimer(list_widget)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(delay)
+        self.timer.timeout.connect(self.apply_filter)
+
+    @staticmethod
+    def get_search_text(item):
+        """
+        Gets the text used to find an item by name. Metadata is not included. (See "get_item_type")
+
+        Args:
+            item (QListWidgetItem): Item to get the text from.
+
+        Returns:
+            str: Item name.
+        """
+        return item.text()
+
+    @staticmethod
+    def get_item_type(item):
+        """
+        Gets the type of an item as matched by "type:" tokens. It's the "item_type" string found in the
+        metadata (the dictionary stored as "Qt.UserRole" data), lower case with spaces replaced by underscores.
+        e.g. "User Curve" becomes "user_curve"
+
+        Args:
+            item (QListWidgetItem): Item to get the type from.
+
+        Returns:
+            str: Item type. Empty if the item has no type.
+        """
+        metadata = item.data(Qt.UserRole)
+        if not isinstance(metadata, dict) or not isinstance(metadata.get("item_type"), str):
+            return ""
+        return "_".join(metadata.get("item_type").lower().split())
+
+    @classmethod
+    def parse_filter_text(cls, text):
+        """
+        Splits the filter text into the name term and the type prefixes. e.g. "arrow type:user" becomes
+        ("arrow", ["user"]). Items must contain the name term and have a type starting with one of the prefixes.
+
+        Args:
+            text (str): Filter text.
+
+        Returns:
+            tuple: (name_term, type_prefixes) - Name term (str) and list of lower case type prefixes.
+        """
+        type_prefixes = [prefix.lower() for prefix in cls.TYPE_FILTER_PATTERN.findall(text)]
+        name_term = cls.TYPE_FILTER_PATTERN.sub(" ", text).strip()
+        return name_term, type_prefixes
+
+    def rebuild_index(self):
+        """
+        Indexes the items currently in the list widget and applies the current filter to them.
+        Call it whenever items are added or removed from the list widget.
+        """
+        self.items = [self.list_widget.item(row) for row in range(self.list_widget.count())]
+        self.item_types = [self.get_item_type(item) for item in self.items]
+        self.index = TrigramIndex([self.get_search_text(item) for item in self.items])
+        self.visible_ids = {item_id for item_id, item in enumerate(self.items) if not item.isHidden()}
+        current_text = self.filter_text
+        self.filter_text = ""  # Full search, new items were never filtered
+        self.apply_filter(current_text)
+
+    def set_filter_text(self, text):
+        """
+        Sets the text used to filter the list. The filter is applied after the delay (debounce), so typing
+        multiple characters quickly only filters the list once.
+
+        Args:
+            text (str): Text items should contain to be visible. (Case-insensitive)
+        """
+        self.pending_text = text
+        self.timer.start()
+
+    def is_narrower_filter(self, text):
+        """
+        Checks if a filter text can only match items matched by the current filter text.
+        True when its name term contains the current name term and each type prefix extends the current one.
+
+        Args:
+            text (str): New filter text.
+
+        Returns:
+            bool: True if only the currently visible items need to be searched, False otherwise.
+        """
+        if not self.filter_text:
+            return False
+        name_term, type_prefixes = self.parse_filter_text(text)
+        last_name_term, last_type_prefixes = self.parse_filter_text(self.filter_text)
+        if last_name_term.lower() not in name_term.lower() or len(type_prefixes) != len(last_type_prefixes):
+            return False
+        return all(prefix.startswith(last_prefix) for prefix, last_prefix in zip(type_prefixes, last_type_prefixes))
+
+    def apply_filter(self, text=None):
+        """
+        Filters the list immediately. Only items that changed visibility are updated.
+        If the current item gets hidden, the first visible item becomes the current item.
+
+        Args:
+            text (str, optional): Text items should contain to be visible. If not provided, the last text received
+                                  by "set_filter_text" is used. "type:" tokens filter the items by type instead.
+        Returns:
+            set: IDs (rows) of the visible items.
+        """
+        self.timer.stop()
+        if text is None:
+            text = self.pending_text
+        self.pending_text = text
+        start_time = time.perf_counter()
+        candidates = None
+        if self.is_narrower_filter(text):
+            candidates = self.visible_ids  # Adding characters can only narrow the previous result
+        name_term, type_prefixes = self.parse_filter_text(text)
+        matching_ids = self.index.search(name_term, candidates=candidates)
+        if type_prefixes:
+            matching_ids = {item_id for item_id in matching_ids
+                            if any(self.item_types[item_id].startswith(prefix) for prefix in type_prefixes)}
+        for item_id in self.visible_ids - matching_ids:
+            self.items[item_id].setHidden(True)
+        for item_id in matching_ids - self.visible_ids:
+            self.items[item_id].setHidden(False)
+        self.visible_ids = matching_ids
+        self.filter_text = text
+        current_item = self.list_widget.currentItem()
+        if self.visible_ids and (current_item is None or current_item.isHidden()):
+            self.list_widget.setCurrentRow(min(self.visible_ids))
+        self.last_duration = (time.perf_counter() - start_time) * 1000
+        logger.debug(f'Filtered "{text}": {len(matching_ids)}/{len(self.items)} items in {self.last_duration:.2f} ms')
+        return matching_ids
+
+
 if __name__ == "__main__":
     with QtApplicationContext() as context:
         print(context)
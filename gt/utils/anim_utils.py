@@ -1,9 +1,18 @@
 """
 Animation Utilities
 """
+from gt.utils.transform_utils import get_local_rotation
 from gt.utils.feedback_utils import FeedbackMessage
+from gt.utils.data_utils import DataDirConstants
+from gt.utils.plugin_utils import load_plugin
+import maya.api.OpenMayaAnim as OpenMayaAnim
+import maya.api.OpenMaya as OpenMaya
 import maya.cmds as cmds
+import contextlib
+import functools
 import logging
+import array
+import os
 
 # Logging Setup
 logging.basicConfig()
@@ -105,6 +114,267 @@ def delete_double_keyframes():
         cmds.undoInfo(closeChunk=True, chunkName=function_name)
 
 
+TRANSLATE_CHANNELS = ("translateX", "translateY", "translateZ")
+ROTATE_CHANNELS = ("rotateX", "rotateY", "rotateZ")
+KEY_EDIT_PLUGIN = os.path.join(DataDirConstants.DIR_PLUGINS, "gt_anim_key_edit.py")
+KEY_EDIT_COMMAND = "gtAnimKeyEdit"
+_pending_key_edit = {}  # Key edit waiting to be run by the key edit command. (See "run_undoable_key_edit")
+
+
+def run_undoable_key_edit(key_edit):
+    """
+    Runs a function that edits animation curves through the API as a single undoable command. ("gtAnimKeyEdit")
+    The function receives an "MAnimCurveChange" and an "MDGModifier" ("anim_change" and "dg_modifier" arguments).
+    Both must be passed to every API edit (See "set_keys_in_bulk"), so the command can undo and redo them.
+    Args:
+        key_edit (callable): Function receiving the "anim_change" and "dg_modifier" keyword arguments.
+    Raises:
+        RuntimeError: If the key edit plugin can't be loaded or the key edit fails.
+    Returns:
+        any: The value returned by the key edit function.
+    """
+    if not load_plugin(KEY_EDIT_PLUGIN):
+        raise RuntimeError(f'Unable to load key edit plugin: "{KEY_EDIT_PLUGIN}".')
+    _pending_key_edit.clear()
+    _pending_key_edit["function"] = key_edit
+    try:
+        getattr(cmds, KEY_EDIT_COMMAND)()
+        return _pending_key_edit.get("result")
+    finally:
+        _pending_key_edit.clear()
+
+
+def run_pending_key_edit(anim_change, dg_modifier):
+    """
+    Runs the key edit waiting to be executed. Called by the key edit command. (See "run_undoable_key_edit")
+    Args:
+        anim_change (OpenMayaAnim.MAnimCurveChange): Records the key changes.
+        dg_modifier (OpenMaya.MDGModifier): Records the created animation curves.
+    """
+    key_edit = _pending_key_edit.pop("function", None)
+    if key_edit:
+        _pending_key_edit["result"] = key_edit(anim_change=anim_change, dg_modifier=dg_modifier)
+
+
+def _get_context_guard(frame):
+    """
+    Gets a context manager that evaluates plugs at the provided frame without changing the current time.
+    Args:
+        frame (float): Frame used for the evaluation. (Current time unit)
+    Returns:
+        tuple: The context manager and the DG context. The context must be passed to the plug getters.
+    """
+    context = OpenMaya.MDGContext(OpenMaya.MTime(frame, OpenMaya.MTime.uiUnit()))
+    if hasattr(OpenMaya, "MDGContextGuard"):  # Plugs read inside the guard use the context
+        return OpenMaya.MDGContextGuard(context), None
+    return contextlib.nullcontext(), context
+
+
+def _get_plug_double(plug, context=None):
+    """
+    Gets the value of a numeric plug. Uses the provided DG context if there is one.
+    Args:
+        plug (OpenMaya.MPlug): Plug to read.
+        context (OpenMaya.MDGContext, optional): Context of the evaluation. If None, the active context is used.
+    Returns:
+        float: Plug value. (Internal units)
+    """
+    return plug.asDouble() if context is None else plug.asDouble(context)
+
+
+def _get_plug_matrix(plug, context=None):
+    """
+    Gets the value of a matrix plug. Uses the provided DG context if there is one.
+    Args:
+        plug (OpenMaya.MPlug): Plug to read. e.g. "worldMatrix[0]"
+        context (OpenMaya.MDGContext, optional): Context of the evaluation. If None, the active context is used.
+    Returns:
+        OpenMaya.MMatrix: Plug value.
+    """
+    data = plug.asMObject() if context is None else plug.asMObject(context)
+    return OpenMaya.MFnMatrixData(data).matrix()
+
+
+def _get_dag_path(obj):
+    """
+    Gets the DAG path of an object.
+    Args:
+        obj (str): Name of the object.
+    Returns:
+        OpenMaya.MDagPath or None: The DAG path of the object. None if missing or not a transform.
+    """
+    selection = OpenMaya.MSelectionList()
+    try:
+        selection.add(str(obj))
+        dag_path = selection.getDagPath(0)
+    except Exception as e:
+        logger.debug(f'Unable to get DAG path for "{str(obj)}". Issue: {str(e)}')
+        return None
+    if not dag_path.hasFn(OpenMaya.MFn.kTransform):
+        return None
+    return dag_path
+
+
+def _get_matrix_plug(dag_path, attr_name):
+    """
+    Gets the instance element of a matrix array plug. e.g. "worldMatrix[0]" or "parentMatrix[0]"
+    Args:
+        dag_path (OpenMaya.MDagPath): Path to the object.
+        attr_name (str): Name of the matrix array attribute.
+    Returns:
+        OpenMaya.MPlug: The plug of the element used by the DAG path instance.
+    """
+    node_fn = OpenMaya.MFnDependencyNode(dag_path.node())
+    return node_fn.findPlug(attr_name, False).elementByLogicalIndex(dag_path.instanceNumber())
+
+
+def get_world_space_samples(obj_list, start_frame, end_frame):
+    """
+    Samples the world translation and rotation of many objects for every frame of a range.
+    All objects are evaluated per frame through a DG context, so the current time (and viewport) is never changed.
+    World translation is the same value returned by "cmds.xform(q=True, t=True, ws=True)".
+
+    Args:
+        obj_list (list, str): Transforms to sample. Strings are automatically converted to a list with a single item.
+        start_frame (int): First frame of the range.
+        end_frame (int): Last frame of the range. (Inclusive)
+    Returns:
+        dict: A dictionary with the keys "start_frame", "end_frame" and "objects".
+              "objects" uses the full path of the objects as keys and dictionaries as values, where "translate"
+              is an array with three floats per frame (XYZ) and "rotate" is an array with four floats per frame
+              (world rotation quaternion XYZW). Missing objects or non-transforms are ignored.
+    """
+    if isinstance(obj_list, str):
+        obj_list = [obj_list]
+    sample_plugs = []  # Tuples: (full path, translate plugs, parent matrix plug, world matrix plug)
+    for obj in obj_list:
+        dag_path = _get_dag_path(obj)
+        if not dag_path:
+            logger.debug(f'Unable to sample world space data. Missing transform: "{str(obj)}".')
+            continue
+        node_fn = OpenMaya.MFnDependencyNode(dag_path.node())
+        translate_plugs = [node_fn.findPlug(channel, False) for channel in TRANSLATE_CHANNELS]
+        sample_plugs.append((dag_path.fullPathName(), translate_plugs,
+                             _get_matrix_plug(dag_path, "parentMatrix"), _get_matrix_plug(dag_path, "worldMatrix")))
+
+    objects = {path: {"translate": array.array('d'), "rotate": array.array('d')} for path, _, _, _ in sample_plugs}
+    for frame in range(int(start_frame), int(end_frame) + 1):
+        guard, context = _get_context_guard(frame)
+        with guard:
+            for path, translate_plugs, parent_plug, world_plug in sample_plugs:
+                translation = OpenMaya.MPoint(*[_get_plug_double(plug, context) for plug in translate_plugs])
+                translation *= _get_plug_matrix(parent_plug, context)
+                rotation = OpenMaya.MTransformationMatrix(_get_plug_matrix(world_plug, context))
+                rotation = rotation.rotation(asQuaternion=True)
+                objects[path]["translate"].extend((translation.x, translation.y, translation.z))
+                objects[path]["rotate"].extend((rotation.x, rotation.y, rotation.z, rotation.w))
+    return {"start_frame": int(start_frame), "end_frame": int(end_frame), "objects": objects}
+
+
+def set_keys_in_bulk(plug, frames, values, anim_change=None, dg_modifier=None):
+    """
+    Keys a plug at many frames with a single "MFnAnimCurve.addKeys" call.
+    Existing keys within the range of the provided frames are replaced, keys outside of it are kept.
+    Edits are only undoable when running inside "run_undoable_key_edit" and using its change records.
+    Args:
+        plug (OpenMaya.MPlug): Plug to key. An animation curve is created if the plug doesn't have one.
+        frames (list): Frames to key (current time unit). Must be sorted.
+        values (list): One value per frame. (Internal units: centimeters for distance, radians for angles)
+        anim_change (OpenMayaAnim.MAnimCurveChange, optional): Records the key changes, so they can be undone.
+        dg_modifier (OpenMaya.MDGModifier, optional): Records the created animation curve, so it can be undone.
+    Returns:
+        bool: True if the keys were created, False if the plug can't be keyed. (e.g. locked or connected)
+    """
+    if not frames or plug.isLocked or not plug.isKeyable:
+        return False
+    curve_fn = OpenMayaAnim.MFnAnimCurve()
+    animation = OpenMayaAnim.MAnimUtil.findAnimation(plug)
+    if len(animation):
+        curve_fn.setObject(animation[0])
+    elif plug.isDestination:
+        logger.debug(f'Unable to key "{plug.name()}". Plug is connected to a non-animation curve node.')
+        return False
+    elif dg_modifier:
+        curve_fn.create(plug, modifier=dg_modifier)
+        dg_modifier.doIt()  # Connects the new curve
+    else:
+        curve_fn.create(plug)
+
+    time_unit = OpenMaya.MTime.uiUnit()
+    for index in reversed(range(curve_fn.numKeys)):  # Replace keys within the range
+        if frames[0] <= curve_fn.input(index).asUnits(time_unit) <= frames[-1]:
+            curve_fn.remove(index, anim_change)
+    times = OpenMaya.MTimeArray()
+    key_values = OpenMaya.MDoubleArray()
+    for frame, value in zip(frames, values):
+        times.append(OpenMaya.MTime(frame, time_unit))
+        key_values.append(value)
+    curve_fn.addKeys(times, key_values, keepExistingKeys=True, change=anim_change)
+    return True
+
+
+def bake_world_space_samples(samples, translate=True, rotate=True, undoable=True, anim_change=None,
+                             dg_modifier=None):
+    """
+    Keys the objects of the provided samples, so they follow their sampled world translation and rotation.
+    Local values are computed against the parent matrix of each frame (evaluated through a DG context) and written
+    with one "MFnAnimCurve.addKeys" call per channel. Parents are baked before their children.
+    The whole bake is a single undoable command. (See "run_undoable_key_edit")
+
+    Args:
+        samples (dict): World space samples. See "get_world_space_samples".
+        translate (bool, optional): If True, translate channels are keyed.
+        rotate (bool, optional): If True, rotate channels are keyed.
+        undoable (bool, optional): If True, the bake runs through the undoable key edit command.
+                                   If False, keys are written directly and can only be undone through the
+                                   provided change records.
+        anim_change (OpenMayaAnim.MAnimCurveChange, optional): Records the key changes. (See "set_keys_in_bulk")
+        dg_modifier (OpenMaya.MDGModifier, optional): Records the created animation curves.
+    Returns:
+        list: Full paths of the baked objects.
+    """
+    if undoable:
+        return run_undoable_key_edit(functools.partial(bake_world_space_samples, samples,
+                                                       translate=translate, rotate=rotate, undoable=False))
+    frames = list(range(samples.get("start_frame"), samples.get("end_frame") + 1))
+    baked_objects = []
+    objects = samples.get("objects", {})
+    for path in sorted(objects, key=lambda obj_path: obj_path.count('|')):  # Parents first
+        dag_path = _get_dag_path(path)
+        if not dag_path:
+            logger.debug(f'Unable to bake world space data. Missing transform: "{path}".')
+            continue
+        translations = objects[path].get("translate")
+        rotations = objects[path].get("rotate")
+        parent_plug = _get_matrix_plug(dag_path, "parentMatrix")
+        channel_values = {channel: [] for channel in TRANSLATE_CHANNELS + ROTATE_CHANNELS}
+        previous_rotation = None
+        for index, frame in enumerate(frames):
+            guard, context = _get_context_guard(frame)
+            with guard:
+                parent_matrix = _get_plug_matrix(parent_plug, context)
+            if translate:
+                local = OpenMaya.MPoint(*translations[index * 3:index * 3 + 3]) * parent_matrix.inverse()
+                for channel, value in zip(TRANSLATE_CHANNELS, (local.x, local.y, local.z)):
+                    channel_values[channel].append(value)
+            if rotate:
+                world_rotation = OpenMaya.MQuaternion(*rotations[index * 4:index * 4 + 4]).asMatrix()
+                local = get_local_rotation(dag_path, world_rotation, parent_matrix)
+                if previous_rotation is not None:  # Avoid flips between frames (Euler filter)
+                    local = local.closestSolution(previous_rotation)
+                previous_rotation = local
+                for channel, value in zip(ROTATE_CHANNELS, (local.x, local.y, local.z)):
+                    channel_values[channel].append(value)
+
+        node_fn = OpenMaya.MFnDependencyNode(dag_path.node())
+        for channel, values in channel_values.items():
+            if values:
+                set_keys_in_bulk(node_fn.findPlug(channel, False), frames, values,
+                                 anim_change=anim_change, dg_modifier=dg_modifier)
+        baked_objects.append(path)
+    return baked_objects
+
+
 if __name__ == "__main__":
     logger.setLevel(logging.DEBUG)
     from pprint import pprint
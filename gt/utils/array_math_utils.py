@@ -0,0 +1,357 @@
+"""
+Array Math Utilities - Batched vector and matrix operations (many points or matrices per call)
+Uses NumPy when it can be imported and falls back to pure Python otherwise.
+Results are always Python lists/tuples. (NumPy arrays are also accepted as input)
+Matrices use Maya's layout: 16 floats (row-major, translation in the last row), as returned by "cmds.xform".
+This script should not globally import "maya.cmds" as it's also intended to be used outside of Maya.
+github.com/TrevisanGMW/gt-tools
+"""
+import itertools
+import logging
+import math
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Logging Setup
+logging.basicConfig()
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+class MathBackends:
+    def __init__(self):
+        """
+        Constant names of the available math backends.
+        """
+    NUMPY = "numpy"
+    PYTHON = "python"
+
+
+_active_backend = MathBackends.NUMPY if numpy is not None else MathBackends.PYTHON
+
+
+def is_numpy_available():
+    """
+    Checks if NumPy can be used by the batched operations.
+    Returns:
+        bool: True if NumPy was imported, False otherwise.
+    """
+    return numpy is not None
+
+
+def get_math_backend():
+    """
+    Gets the name of the backend used by the batched operations.
+    Returns:
+        str: "numpy" or "python". See "MathBackends".
+    """
+    return _active_backend
+
+
+def set_math_backend(backend):
+    """
+    Sets the backend used by the batched operations. (e.g. to compare results or performance)
+    Args:
+        backend (str): "numpy" or "python". See "MathBackends".
+    Raises:
+        ValueError: If the backend is unknown or if NumPy is requested, but not available.
+    """
+    global _active_backend
+    if backend not in (MathBackends.NUMPY, MathBackends.PYTHON):
+        raise ValueError(f'Unknown math backend: "{backend}".')
+    if backend == MathBackends.NUMPY and numpy is None:
+        raise ValueError('Unable to use the NumPy math backend. NumPy is not available.')
+    _active_backend = backend
+
+
+def _use_numpy():
+    """
+    Checks if the batched operations should use NumPy.
+    Returns:
+        bool: True if the active backend is NumPy.
+    """
+    return _active_backend == MathBackends.NUMPY
+
+
+def _as_array(values, width=3):
+    """
+    Converts a list of vectors (or matrices) into a NumPy array. "fromiter" avoids creating a row object per element.
+    Args:
+        values (list, numpy.ndarray): A list of vectors with "width" elements each, or an existing array.
+        width (int, optional): Number of elements per vector. e.g. 3 for XYZ positions, 16 for flat matrices.
+    Returns:
+        numpy.ndarray: A two-dimensional array of floats with "width" columns.
+    """
+    if isinstance(values, numpy.ndarray):
+        return numpy.asarray(values, dtype=float).reshape(-1, width)
+    return numpy.fromiter(itertools.chain.from_iterable(values), dtype=float,
+                          count=len(values) * width).reshape(-1, width)
+
+
+def flatten_matrix(matrix):
+    """
+    Gets a 4x4 matrix as a flat list with 16 elements.
+    Args:
+        matrix (list, tuple): A flat matrix (16 elements) or a nested matrix (4 rows with 4 elements).
+    Returns:
+        list: A flat list with 16 elements.
+    Raises:
+        ValueError: If the matrix doesn't have 16 elements.
+    """
+    if len(matrix) == 4:
+        matrix = [value for row in matrix for value in row]
+    else:
+        matrix = list(matrix)
+    if len(matrix) != 16:
+        raise ValueError(f'Expected a 4x4 matrix. Received {len(matrix)} elements.')
+    return matrix
+
+
+def _get_matrix_pairs(matrices_a, matrices_b):
+    """
+    Pairs two lists of matrices. A list with a single matrix is paired with every matrix of the other list.
+    Args:
+        matrices_a (list): A list of 4x4 matrices.
+        matrices_b (list): A list of 4x4 matrices.
+    Returns:
+        tuple: Two lists of flat matrices with the same length.
+    Raises:
+        ValueError: If the lists have different lengths (and neither has a single matrix).
+    """
+    matrices_a = [flatten_matrix(matrix) for matrix in matrices_a]
+    matrices_b = [flatten_matrix(matrix) for matrix in matrices_b]
+    if len(matrices_a) == 1 and len(matrices_b) > 1:
+        matrices_a = matrices_a * len(matrices_b)
+    elif len(matrices_b) == 1 and len(matrices_a) > 1:
+        matrices_b = matrices_b * len(matrices_a)
+    if len(matrices_a) != len(matrices_b):
+        raise ValueError(f'Unable to pair {len(matrices_a)} matrices with {len(matrices_b)} matrices.')
+    return matrices_a, matrices_b
+
+
+def _check_same_length(values_a, values_b):
+    """
+    Validates that two lists of vectors have the same length.
+    Args:
+        values_a (list): First list of vectors.
+        values_b (list): Second list of vectors.
+    Raises:
+        ValueError: If the lists have different lengths.
+    """
+    if len(values_a) != len(values_b):
+        raise ValueError(f'Unable to pair {len(values_a)} vectors with {len(values_b)} vectors.')
+
+
+def transform_points(matrix, points):
+    """
+    Transforms many points by a single matrix. Same as multiplying each point (as a row vector) by the matrix.
+    Args:
+        matrix (list, tuple): A 4x4 matrix. Flat (16 elements) or nested (4 rows). e.g. "cmds.xform(q=True, m=True)"
+        points (list): A list of XYZ positions. e.g. [(0, 1, 0), (1, 0, 0)]
+    Returns:
+        list: A list of transformed positions. (XYZ lists)
+    """
+    if len(points) == 0:
+        return []
+    m = flatten_matrix(matrix)
+    if _use_numpy():
+        matrix_array = numpy.asarray(m, dtype=float).reshape(4, 4)
+        return (_as_array(points) @ matrix_array[:3, :3] + matrix_array[3, :3]).tolist()
+    return [[x * m[0] + y * m[4] + z * m[8] + m[12],
+             x * m[1] + y * m[5] + z * m[9] + m[13],
+             x * m[2] + y * m[6] + z * m[10] + m[14]] for x, y, z in points]
+
+
+def multiply_matrices(matrices_a, matrices_b):
+    """
+    Multiplies pairs of 4x4 matrices. (e.g. a list of local matrices by a list of parent matrices)
+    A list with a single matrix is multiplied with every matrix of the other list.
+    Args:
+        matrices_a (list): A list of 4x4 matrices. Flat (16 elements) or nested (4 rows).
+        matrices_b (list): A list of 4x4 matrices. Flat (16 elements) or nested (4 rows).
+    Returns:
+        list: A list of flat matrices (16 elements each), one per pair. e.g. "matrices_a[0] * matrices_b[0]"
+    """
+    matrices_a, matrices_b = _get_matrix_pairs(matrices_a, matrices_b)
+    if not matrices_a:
+        return []
+    if _use_numpy():
+        result = _as_array(matrices_a, width=16).reshape(-1, 4, 4) @ _as_array(matrices_b, width=16).reshape(-1, 4, 4)
+        return result.reshape(-1, 16).tolist()
+    result = []
+    for a, b in zip(matrices_a, matrices_b):
+        product = []
+        for row in range(0, 16, 4):
+            a0, a1, a2, a3 = a[row:row + 4]
+            for column in range(4):
+                product.append(a0 * b[column] + a1 * b[column + 4] + a2 * b[column + 8] + a3 * b[column + 12])
+        result.append(product)
+    return result
+
+
+def get_distances(points_a, points_b):
+    """
+    Gets the distances between pairs of XYZ positions.
+    Args:
+        points_a (list): A list of XYZ positions.
+        points_b (list): A list of XYZ positions with the same length as "points_a".
+    Returns:
+        list: A list of distances (floats), one per pair.
+    """
+    _check_same_length(points_a, points_b)
+    if len(points_a) == 0:
+        return []
+    if _use_numpy():
+        deltas = _as_array(points_a) - _as_array(points_b)
+        return numpy.sqrt(numpy.einsum('ij,ij->i', deltas, deltas)).tolist()
+    return [math.sqrt((ax - bx) ** 2 + (ay - by) ** 2 + (az - bz) ** 2)
+            for (ax, ay, az), (bx, by, bz) in zip(points_a, points_b)]
+
+
+def get_path_length(points):
+    """
+    Gets the sum of the distances between consecutive XYZ positions.
+    Args:
+        points (list): A list of XYZ positions.
+    Returns:
+        float: The length of the path going through all positions in order. Zero if fewer than two are provided.
+    """
+    if len(points) < 2:
+        return 0
+    if _use_numpy():
+        deltas = numpy.diff(_as_array(points), axis=0)
+        return float(numpy.sqrt(numpy.einsum('ij,ij->i', deltas, deltas)).sum())
+    return math.fsum(get_distances(points[:-1], points[1:]))
+
+
+def dot_products(vectors_a, vectors_b):
+    """
+    Gets the dot products of pairs of vectors.
+    Args:
+        vectors_a (list): A list of XYZ vectors.
+        vectors_b (list): A list of XYZ vectors with the same length as "vectors_a".
+    Returns:
+        list: A list of dot products (floats), one per pair.
+    """
+    _check_same_length(vectors_a, vectors_b)
+    if len(vectors_a) == 0:
+        return []
+    if _use_numpy():
+        return numpy.einsum('ij,ij->i', _as_array(vectors_a), _as_array(vectors_b)).tolist()
+    return [ax * bx + ay * by + az * bz for (ax, ay, az), (bx, by, bz) in zip(vectors_a, vectors_b)]
+
+
+def cross_products(vectors_a, vectors_b):
+    """
+    Gets the cross products of pairs of vectors.
+    Args:
+        vectors_a (list): A list of XYZ vectors.
+        vectors_b (list): A list of XYZ vectors with the same length as "vectors_a".
+    Returns:
+        list: A list of cross products (XYZ lists), one per pair.
+    """
+    _check_same_length(vectors_a, vectors_b)
+    if len(vectors_a) == 0:
+        return []
+    if _use_numpy():
+        return numpy.cross(_as_array(vectors_a), _as_array(vectors_b)).tolist()
+    return [[ay * bz - az * by, az * bx - ax * bz, ax * by - ay * bx]
+            for (ax, ay, az), (bx, by, bz) in zip(vectors_a, vectors_b)]
+
+
+def get_points_center(points):
+    """
+    Gets the average of XYZ positions.
+    Args:
+        points (list): A list of XYZ positions.
+    Returns:
+        tuple: The average position (x, y, z). Origin (0, 0, 0) if no positions are provided.
+    """
+    if len(points) == 0:
+        return 0, 0, 0
+    if _use_numpy():
+        return tuple(_as_array(points).mean(axis=0).tolist())
+    count = len(points)
+    return tuple(math.fsum(axis_values) / count for axis_values in zip(*points))
+
+
+def get_points_bounds(points):
+    """
+    Gets the minimum and maximum values of XYZ positions. (Axis-aligned bounding box)
+    Args:
+        points (list): A list of XYZ positions.
+    Returns:
+        tuple: Two tuples, the minimum (x, y, z) and the maximum (x, y, z). None if no positions are provided.
+    """
+    if len(points) == 0:
+        return None
+    if _use_numpy():
+        points_array = _as_array(points)
+        return tuple(points_array.min(axis=0).tolist()), tuple(points_array.max(axis=0).tolist())
+    axes = list(zip(*points))
+    return tuple(min(values) for values in axes), tuple(max(values) for values in axes)
+
+
+def _get_de_boor_point(span, parameter, knots, points, degree):
+    """
+    Evaluates one point of a B-spline using the De Boor algorithm.
+    Args:
+        span (int): Index of the knot span containing the parameter. (knots[span] <= parameter <= knots[span + 1])
+        parameter (float): Curve parameter to evaluate.
+        knots (list): Full knot vector. (Number of points + degree + 1 knots)
+        points (list): Control points (x, y, z).
+        degree (int): Curve degree.
+    Returns:
+        tuple: Position (x, y, z) of the curve at the parameter.
+    """
+    control = [points[index + span - degree] for index in range(degree + 1)]
+    for level in range(1, degree + 1):
+        for index in range(degree, level - 1, -1):
+            start = knots[index + span - degree]
+            end = knots[index + 1 + span - level]
+            alpha = (parameter - start) / (end - start) if end != start else 0
+            control[index] = tuple((1 - alpha) * value_a + alpha * value_b
+                                   for value_a, value_b in zip(control[index - 1], control[index]))
+    return control[degree]
+
+
+def evaluate_curve_points(points, knots, degree, samples_per_span=8):
+    """
+    Gets points along a NURBS curve (non-rational B-spline) without Maya. Used to draw curves outside the viewport.
+    Args:
+        points (list): Control points (x, y, z). Periodic curves must include their overlapping points.
+        knots (list): Knot vector using Maya's format. (Number of points + degree - 1 knots) e.g. "curve.knot"
+        degree (int): Curve degree.
+        samples_per_span (int, optional): Number of points evaluated in each knot span.
+    Returns:
+        list: Positions (x, y, z) along the curve, from start to end. Linear curves, or curves with knots that don't
+              match their points, return their control points instead.
+    """
+    points = [tuple(point) for point in points]
+    point_count = len(points)
+    if degree <= 1 or point_count <= degree or len(knots or []) != point_count + degree - 1:
+        return points
+    full_knots = [knots[0]] + list(knots) + [knots[-1]]  # Maya omits the first and last knots
+    curve_points = []
+    last_span = None
+    for span in range(degree, point_count):
+        start, end = full_knots[span], full_knots[span + 1]
+        if end <= start:
+            continue  # Empty span (repeated knot)
+        for sample in range(samples_per_span):
+            parameter = start + (end - start) * sample / samples_per_span
+            curve_points.append(_get_de_boor_point(span, parameter, full_knots, points, degree))
+        last_span = span
+    if last_span is None:
+        return points
+    curve_points.append(_get_de_boor_point(last_span, full_knots[last_span + 1], full_knots, points, degree))
+    return curve_points
+
+
+if __name__ == "__main__":
+    logger.setLevel(logging.DEBUG)
+    print(get_math_backend())
+    print(transform_points([1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, 1, 2, 3, 1], [(0, 0, 0), (1, 1, 1)]))
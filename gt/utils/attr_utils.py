@@ -4,6 +4,7 @@ github.com/TrevisanGMW/gt-tools
 """
 from gt.utils.feedback_utils import FeedbackMessage, log_when_true
 from gt.utils.string_utils import remove_suffix, remove_prefix
+from gt.utils.scene_utils import invalidate_scene_query_cache
 import maya.cmds as cmds
 import logging
 
@@ -70,6 +71,8 @@ def set_attr(attribute_path=None, value=None, obj_list=None, attr_list=None, cla
                     cmds.setAttr(attr_path, lock=False)
             if isinstance(value, str):
                 cmds.setAttr(attr_path, value, typ="string", clamp=clamp)
+                from gt.utils.uuid_utils import invalidate_uuid_attr_index  # Avoids circular import
+                invalidate_uuid_attr_index(attr_name=attr_path.split('.')[-1])  # String attributes store UUIDs
             if isinstance(value, (tuple, list)):
                 cmds.setAttr(attr_path, *value, typ="double3", clamp=clamp)
             else:
@@ -716,6 +719,7 @@ def add_attr_double_three(obj, attr_name, suffix="RGB", keyable=True):
     cmds.addAttr(obj, ln=attr_name + suffix[0], at='double', k=keyable, parent=attr_name)
     cmds.addAttr(obj, ln=attr_name + suffix[1], at='double', k=keyable, parent=attr_name)
     cmds.addAttr(obj, ln=attr_name + suffix[2], at='double', k=keyable, parent=attr_name)
+    invalidate_scene_query_cache(attributes_only=True)
 
 
 def add_separator_attr(target_object, attr_name="separator", custom_value=None):
@@ -737,6 +741,7 @@ def add_separator_attr(target_object, attr_name="separator", custom_value=None):
     if not cmds.objExists(attribute_path):
         cmds.addAttr(target_object, ln=attr_name, at='enum', en=separator_value, keyable=True)
         cmds.setAttr(attribute_path, e=True, lock=True)
+        invalidate_scene_query_cache(attributes_only=True)
     else:
         logger.warning(f'Separator attribute "{attribute_path}" already exists. Add Separator operation skipped.')
     return f'{target_object}.{attr_name}'
@@ -789,6 +794,11 @@ def add_attr(obj_list, attributes, attr_type="double", minimum=None, maximum=Non
                         added_attrs.append(full_attr_name)
                 except Exception as e:
                     issues[full_attr_name] = e
+    if added_attrs:
+        invalidate_scene_query_cache(attributes_only=True)
+        if attr_type == "string":
+            from gt.utils.uuid_utils import invalidate_uuid_attr_index  # Avoids circular import
+            invalidate_uuid_attr_index()
     if issues and verbose:
         for attr, error in issues.items():
             logger.warning(f'"{attr}" returned the error: "{error}".')
@@ -828,6 +838,7 @@ def delete_user_defined_attrs(obj_list, delete_locked=True, verbose=True, raise_
                     cmds.setAttr(f"{attr}", lock=False)
                 cmds.deleteAttr(attr)
                 deleted_attributes.append(attr)
+                invalidate_scene_query_cache(attributes_only=True)
             except Exception as e:
                 logger.debug(str(e))
     except Exception as e:
@@ -0,0 +1,374 @@
+"""
+Component Utilities - Lightweight component sets (e.g. vertices or CVs) stored as index ranges
+github.com/TrevisanGMW/gt-tools
+"""
+import maya.cmds as cmds
+import logging
+import bisect
+import re
+
+# Logging Setup
+logging.basicConfig()
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+COMPONENT_NAME_PATTERN = re.compile(r'^(.+)\.(\w+)\[(\d+)(?::(\d+))?\]$')  # e.g. "mesh.vtx[2]" or "mesh.vtx[0:7]"
+
+
+def merge_index_ranges(ranges):
+    """
+    Sorts and merges overlapping or touching index ranges.
+    Args:
+        ranges (list): A list of half-open ranges as tuples (start, stop). e.g. [(4, 8), (0, 5)]
+    Returns:
+        list: A sorted list of non-overlapping ranges. e.g. [(0, 8)]
+    """
+    merged = []
+    for start, stop in sorted(ranges):
+        if stop <= start:
+            continue
+        if merged and start <= merged[-1][1]:
+            if stop > merged[-1][1]:
+                merged[-1] = (merged[-1][0], stop)
+            continue
+        merged.append((start, stop))
+    return merged
+
+
+def get_index_ranges(indices):
+    """
+    Converts indices into half-open index ranges.
+    Args:
+        indices (iterable): Component indices (integers). Order and duplicates are ignored. e.g. [0, 1, 2, 5]
+    Returns:
+        list: A sorted list of non-overlapping ranges. e.g. [(0, 3), (5, 6)]
+    """
+    ranges = []
+    for index in sorted(set(indices)):
+        if ranges and index == ranges[-1][1]:
+            ranges[-1] = (ranges[-1][0], index + 1)
+        else:
+            ranges.append((index, index + 1))
+    return ranges
+
+
+class ComponentSet:
+    __slots__ = ['node', 'component_type', '_ranges', '_offsets']
+
+    def __init__(self, node=None, component_type=None, ranges=None):
+        """
+        Set of components (e.g. vertices) of a single node, stored as index ranges instead of one string per component.
+        Component names (e.g. "mesh.vtx[0]") are only created when requested, for example, while iterating.
+        It can be iterated, indexed and compared to lists as if it was the list returned by "cmds.ls(flatten=True)".
+
+        Args:
+            node (str, optional): Name of the node the components belong to, as used in their names. e.g. "mesh"
+            component_type (str, optional): Component type, as used in their names. e.g. "vtx", "e", "f" or "cv"
+            ranges (list, optional): Half-open index ranges as tuples (start, stop). e.g. [(0, 8)] = vtx[0] to vtx[7]
+        """
+        self.node = node
+        self.component_type = component_type
+        self._ranges = merge_index_ranges(ranges or [])
+        self._offsets = []  # Number of components before each range (used for indexing)
+        count = 0
+        for start, stop in self._ranges:
+            self._offsets.append(count)
+            count += stop - start
+
+    @classmethod
+    def from_count(cls, node, component_type, count):
+        """
+        Creates a component set with all components from zero to "count".
+        Args:
+            node (str): Name of the node the components belong to. e.g. "mesh"
+            component_type (str): Component type. e.g. "vtx"
+            count (int): Number of components. e.g. 8 = vtx[0] to vtx[7]
+        Returns:
+            ComponentSet: A component set with the components.
+        """
+        return cls(node=node, component_type=component_type, ranges=[(0, count)])
+
+    @classmethod
+    def from_indices(cls, node, component_type, indices):
+        """
+        Creates a component set from component indices.
+        Args:
+            node (str): Name of the node the components belong to. e.g. "mesh"
+            component_type (str): Component type. e.g. "vtx"
+            indices (iterable): Component indices (integers). e.g. [0, 1, 2, 5]
+        Returns:
+            ComponentSet: A component set with the components.
+        """
+        return cls(node=node, component_type=component_type, ranges=get_index_ranges(indices))
+
+    @classmethod
+    def from_names(cls, names):
+        """
+        Creates a component set from component names. Accepts flattened or compact names.
+        e.g. ["mesh.vtx[0]", "mesh.vtx[1]"] or ["mesh.vtx[0:7]"] (as returned by "cmds.ls" without "flatten")
+        Args:
+            names (list, str): Component names. Strings are automatically converted to a list with a single item.
+        Returns:
+            ComponentSet: A component set with the components. Empty (without node or type) if no names are provided.
+        Raises:
+            ValueError: If a name can't be parsed or if the components belong to different nodes or types.
+        """
+        if isinstance(names, str):
+            names = [names]
+        node = None
+        component_type = None
+        ranges = []
+        for name in names or []:
+            match = COMPONENT_NAME_PATTERN.match(str(name))
+            if not match:
+                raise ValueError(f'Unable to parse component name: "{name}"')
+            if node is None:
+                node, component_type = match.group(1), match.group(2)
+            elif (match.group(1), match.group(2)) != (node, component_type):
+                raise ValueError(f'Component "{name}" does not belong to "{node}.{component_type}".')
+            start = int(match.group(3))
+            stop = int(match.group(4)) if match.group(4) is not None else start
+            ranges.append((start, stop + 1))
+        return cls(node=node, component_type=component_type, ranges=ranges)
+
+    def get_prefix(self):
+        """
+        Gets the prefix used by the component names.
+        Returns:
+            str: Node and component type. e.g. "mesh.vtx"
+        """
+        return f'{self.node}.{self.component_type}'
+
+    def get_ranges(self):
+        """
+        Gets the index ranges of the set.
+        Returns:
+            list: A sorted list of half-open ranges as tuples (start, stop). e.g. [(0, 8)]
+        """
+        return list(self._ranges)
+
+    def get_indices(self):
+        """
+        Gets the component indices of the set.
+        Returns:
+            list: A sorted list of component indices. e.g. [0, 1, 2]
+        """
+        return [index for start, stop in self._ranges for index in range(start, stop)]
+
+    def iter_indices(self):
+        """
+        Iterates through the component indices of the set without creating a list.
+        Yields:
+            int: Component index.
+        """
+        for start, stop in self._ranges:
+            yield from range(start, stop)
+
+    def get_name(self, index):
+        """
+        Gets the name of a component.
+        Args:
+            index (int): Component index. e.g. 2
+        Returns:
+            str: Component name. e.g. "mesh.vtx[2]"
+        """
+        return f'{self.node}.{self.component_type}[{index}]'
+
+    def get_names(self):
+        """
+        Gets compact component names, one per range. They are accepted by Maya commands. (e.g. "cmds.move")
+        Returns:
+            list: A list of compact component names. e.g. ["mesh.vtx[0:7]", "mesh.vtx[9]"]
+        """
+        prefix = self.get_prefix()
+        names = []
+        for start, stop in self._ranges:
+            if stop - start == 1:
+                names.append(f'{prefix}[{start}]')
+            else:
+                names.append(f'{prefix}[{start}:{stop - 1}]')
+        return names
+
+    def get_flattened_names(self):
+        """
+        Gets the name of every component in the set. Same as "cmds.ls(flatten=True)".
+        Returns:
+            list: A list of component names. e.g. ["mesh.vtx[0]", "mesh.vtx[1]"]
+        """
+        return list(self)
+
+    def _get_index_at(self, position):
+        """
+        Gets the component index found at a position of the set.
+        Args:
+            position (int): Position in the set. Negative positions count from the end.
+        Returns:
+            int: Component index.
+        Raises:
+            IndexError: If the position is out of range.
+        """
+        count = len(self)
+        if position < 0:
+            position += count
+        if position < 0 or position >= count:
+            raise IndexError('component set index out of range')
+        range_index = bisect.bisect_right(self._offsets, position) - 1
+        return self._ranges[range_index][0] + position - self._offsets[range_index]
+
+    def _get_compatible(self, other):
+        """
+        Validates that another set can be combined with this one. Empty sets are compatible with any set.
+        Args:
+            other (ComponentSet): Other component set.
+        Returns:
+            tuple: Node and component type used by the resulting set.
+        Raises:
+            ValueError: If the sets belong to different nodes or component types.
+        """
+        if not isinstance(other, ComponentSet):
+            raise TypeError(f'Unable to combine component set with "{type(other).__name__}".')
+        if not self._ranges and self.node is None:
+            return other.node, other.component_type
+        if not other._ranges and other.node is None:
+            return self.node, self.component_type
+        if (self.node, self.component_type) != (other.node, other.component_type):
+            raise ValueError(f'Unable to combine "{self.get_prefix()}" and "{other.get_prefix()}" components.')
+        return self.node, self.component_type
+
+    def union(self, other):
+        """
+        Gets the components found in this set or in the other set.
+        Args:
+            other (ComponentSet): Other component set.
+        Returns:
+            ComponentSet: A new component set.
+        """
+        node, component_type = self._get_compatible(other)
+        return ComponentSet(node=node, component_type=component_type, ranges=self._ranges + other._ranges)
+
+    def intersection(self, other):
+        """
+        Gets the components found in both sets.
+        Args:
+            other (ComponentSet): Other component set.
+        Returns:
+            ComponentSet: A new component set.
+        """
+        node, component_type = self._get_compatible(other)
+        ranges = []
+        index_a = index_b = 0
+        while index_a < len(self._ranges) and index_b < len(other._ranges):
+            start_a, stop_a = self._ranges[index_a]
+            start_b, stop_b = other._ranges[index_b]
+            start, stop = max(start_a, start_b), min(stop_a, stop_b)
+            if start < stop:
+                ranges.append((start, stop))
+            if stop_a < stop_b:
+                index_a += 1
+            else:
+                index_b += 1
+        return ComponentSet(node=node, component_type=component_type, ranges=ranges)
+
+    def difference(self, other):
+        """
+        Gets the components found in this set, but not in the other set.
+        Args:
+            other (ComponentSet): Other component set.
+        Returns:
+            ComponentSet: A new component set.
+        """
+        node, component_type = self._get_compatible(other)
+        ranges = []
+        for start, stop in self._ranges:
+            for other_start, other_stop in other._ranges:
+                if other_stop <= start:
+                    continue
+                if other_start >= stop:
+                    break
+                if other_start > start:
+                    ranges.append((start, other_start))
+                start = max(start, other_stop)
+            if start < stop:
+                ranges.append((start, stop))
+        return ComponentSet(node=node, component_type=component_type, ranges=ranges)
+
+    def __or__(self, other):
+        return self.union(other)
+
+    def __and__(self, other):
+        return self.intersection(other)
+
+    def __sub__(self, other):
+        return self.difference(other)
+
+    def __len__(self):
+        if not self._ranges:
+            return 0
+        start, stop = self._ranges[-1]
+        return self._offsets[-1] + stop - start
+
+    def __iter__(self):
+        prefix = self.get_prefix()
+        for index in self.iter_indices():
+            yield f'{prefix}[{index}]'
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return [self.get_name(self._get_index_at(position)) for position in range(*item.indices(len(self)))]
+        return self.get_name(self._get_index_at(item))
+
+    def __contains__(self, item):
+        if isinstance(item, int):
+            index = item
+        else:
+            match = COMPONENT_NAME_PATTERN.match(str(item))
+            if not match or match.group(4) is not None:
+                return False
+            if (match.group(1), match.group(2)) != (self.node, self.component_type):
+                return False
+            index = int(match.group(3))
+        range_index = bisect.bisect_right(self._ranges, (index, float('inf'))) - 1
+        return range_index >= 0 and self._ranges[range_index][0] <= index < self._ranges[range_index][1]
+
+    def __eq__(self, other):
+        if isinstance(other, ComponentSet):
+            if not self._ranges and not other._ranges:
+                return True
+            return (self.node, self.component_type, self._ranges) == (other.node, other.component_type, other._ranges)
+        if isinstance(other, (list, tuple)):
+            return len(self) == len(other) and list(self) == list(other)
+        return NotImplemented
+
+    def __bool__(self):
+        return bool(self._ranges)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.get_names()})'
+
+
+def get_components(obj, component_type="vtx", full_path=False):
+    """
+    Gets all components of a type from an object as a "ComponentSet" without listing every component name.
+    Args:
+        obj (str): Object (transform or shape) to get the components from. e.g. "pCube1"
+        component_type (str, optional): Component type. e.g. "vtx", "e", "f" or "cv"
+        full_path (bool, optional): When True, the node uses its full path instead of its short name.
+    Returns:
+        ComponentSet: All components of the given type. Empty if the object has no components of the given type.
+    Example:
+        out = get_components("cube_one")
+        print(out)  # ComponentSet(['cube_one.vtx[0:7]'])
+    """
+    names = cmds.ls(f'{obj}.{component_type}[*]', long=full_path) or []  # Compact names. e.g. "mesh.vtx[0:7]"
+    try:
+        return ComponentSet.from_names(names)
+    except ValueError as e:
+        logger.debug(f'Unable to get components as a set. Issue: {e}')
+        return ComponentSet.from_names([])
+
+
+if __name__ == "__main__":
+    logger.setLevel(logging.DEBUG)
+    out = ComponentSet.from_indices("mesh", "vtx", [0, 1, 2, 5]) | ComponentSet.from_count("mesh", "vtx", 2)
+    print(out)
+    print(list(out))
@@ -10,13 +10,17 @@ from gt.utils.naming_utils import NamingConstants, get_short_name
 from gt.utils.data.controls import cluster_driven, slider
 from gt.utils.iterable_utils import sanitize_maya_list
 from gt.utils.transform_utils import match_transform
-from gt.utils.data_utils import DataDirConstants
-from gt.utils.curve_utils import Curve
+from gt.utils.data_utils import DataDirConstants, get_directory_file_index
+from gt.utils.curve_utils import Curve, get_curve_shape_data, CURVE_TYPES, CURVE_TYPE_BEZIER
+from gt.utils.scene_utils import CreatedNodesRecorder
 from gt.utils.node_utils import Node
 from gt.utils import iterable_utils
 from gt.utils import system_utils
+from collections import OrderedDict
 import maya.cmds as cmds
 import logging
+import copy
+import json
 import ast
 import os
 
@@ -77,10 +81,9 @@ def get_control_preview_image_path(control_name):
         logger.debug(f'Unable to retrieve control preview image. Incorrect argument type: "{str(type(control_name))}".')
         return
 
-    for ext in ["jpg", "png"]:
-        path_to_image = os.path.join(DataDirConstants.DIR_CONTROLS, "preview_images", f'{control_name}.{ext}')
-        if os.path.exists(path_to_image):
-            return path_to_image
+    preview_images_dir = os.path.join(DataDirConstants.DIR_CONTROLS, "preview_images")
+    preview_images = get_directory_file_index(preview_images_dir, extensions=["jpg", "png"])
+    return preview_images.get(control_name)
 
 
 class Control(Curve):
@@ -213,6 +216,50 @@ class Control(Curve):
         except Exception as e:
             logger.warning(f'Unable to build control. Build function raised an error: {e}')
 
+    def get_preview_data(self, parameters=None):
+        """
+        Gets the curve data this control generates without keeping it in the scene. (See "get_control_preview_data")
+        Args:
+            parameters (dict, str, optional): Parameters used to generate the control. A dictionary or its string
+                                              representation. If not provided, the current parameters are used.
+        Returns:
+            dict or None: Preview data with the world space shapes of the control. None if the parameters are invalid
+                          (see "validate_parameters") or if it failed to generate the control.
+        """
+        if not self.is_curve_valid():
+            logger.warning("Control object is missing a callable function.")
+            return
+        if parameters is None:
+            parameters = self.parameters
+        if isinstance(parameters, str):
+            try:
+                parameters = ast.literal_eval(parameters)
+            except Exception as e:
+                logger.debug(f'Unable to get control preview. Invalid dictionary. Issue: {str(e)}')
+                return
+        if not isinstance(parameters, dict):
+            return
+        if not iterable_utils.compare_identical_dict_keys(parameters, self._original_parameters) or \
+                not iterable_utils.compare_identical_dict_values_types(parameters, self._original_parameters,
+                                                                       allow_none=True):
+            logger.debug(f'Unable to get control preview. Invalid parameters.')
+            return
+        return get_control_preview_data(build_function=self.build_function, parameters=parameters)
+
+    def get_preview_curve(self, parameters=None):
+        """
+        Gets a simple Curve with the shapes this control generates. (See "get_preview_data")
+        Building it only creates curve shapes, without the extra elements of the control. (e.g. clusters)
+        Args:
+            parameters (dict, str, optional): Parameters used to generate the control.
+                                              If not provided, the current parameters are used.
+        Returns:
+            Curve or None: A Curve with the world space shapes of the control. None if it failed.
+        """
+        preview_data = self.get_preview_data(parameters=parameters)
+        if preview_data:
+            return get_curve_from_preview_data(preview_data)
+
     def is_curve_valid(self):
         """
         Checks if the Curve object has enough data to create/generate a curve.
@@ -257,6 +304,146 @@ class Control(Curve):
                 self.set_name(param_name)
 
 
+CONTROL_PREVIEW_CACHE_SIZE = 128  # Maximum number of parameter sets kept in memory
+_control_preview_cache = OrderedDict()  # (Build function, parameters): Preview data
+
+
+def get_control_preview_cache_key(build_function, parameters):
+    """
+    Gets the key used to store the preview of a control build function with the given parameters.
+    Args:
+        build_function (callable): Function used to build the control.
+        parameters (dict): Keyword arguments used when calling the build function.
+    Returns:
+        tuple: (Function module, function name, parameters serialized as sorted JSON)
+    """
+    function_name = getattr(build_function, "__qualname__", None) or getattr(build_function, "__name__", "")
+    serialized_parameters = json.dumps(parameters or {}, sort_keys=True, default=str)
+    return getattr(build_function, "__module__", None), function_name, serialized_parameters
+
+
+def _get_recorded_nodes(recorder):
+    """
+    Gets the long names of the nodes recorded by a "CreatedNodesRecorder" that still exist.
+    Args:
+        recorder (CreatedNodesRecorder): Recorder used while building.
+    Returns:
+        list: Long names of the recorded nodes.
+    """
+    uuids = recorder.get_uuids()
+    if not uuids:
+        return []  # "cmds.ls" with an empty list returns every node in the scene
+    return cmds.ls(uuids, long=True) or []
+
+
+def _generate_control_preview_data(build_function, parameters):
+    """
+    Runs a control build function, reads the curve shapes it created and deletes everything it created.
+    The undo queue is disabled while it runs and the selection is restored, so the scene is left as it was.
+    Args:
+        build_function (callable): Function used to build the control.
+        parameters (dict): Keyword arguments used when calling the build function.
+    Returns:
+        dict or None: Preview data. (See "get_control_preview_data") None if it failed or no curves were created.
+    """
+    undo_state = cmds.undoInfo(query=True, state=True)
+    selection = cmds.ls(selection=True, long=True) or []
+    shapes_data = []
+    recorder = CreatedNodesRecorder()
+    cmds.undoInfo(stateWithoutFlush=False)
+    try:
+        with recorder:
+            build_function(**parameters)
+        created_nodes = _get_recorded_nodes(recorder)
+        created_shapes = (cmds.ls(created_nodes, type=CURVE_TYPES, long=True) or []) if created_nodes else []
+        for shape in created_shapes:
+            if cmds.getAttr(f'{shape}.intermediateObject'):
+                continue
+            shape_data = get_curve_shape_data(shape, decimals=None, world_space=True)
+            if not shape_data:
+                continue
+            shape_data["name"] = get_short_name(shape)
+            shape_data["is_bezier"] = cmds.objectType(shape) == CURVE_TYPE_BEZIER
+            shapes_data.append(shape_data)
+    except Exception as e:
+        logger.warning(f'Unable to generate control preview. Build function raised an error: {e}')
+        return
+    finally:
+        for node in sorted(_get_recorded_nodes(recorder), key=len):
+            if cmds.objExists(node):  # Parents first, their children are deleted with them
+                try:
+                    cmds.delete(node)
+                except Exception as e:
+                    logger.debug(f'Unable to delete control preview node "{node}". Issue: {e}')
+        selection = [obj for obj in selection if cmds.objExists(obj)]
+        if selection:
+            cmds.select(selection, replace=True)
+        else:
+            cmds.select(clear=True)
+        cmds.undoInfo(stateWithoutFlush=undo_state)
+    if shapes_data:
+        return {"name": parameters.get("name"), "shapes": shapes_data}
+
+
+def get_control_preview_data(build_function, parameters=None):
+    """
+    Gets the curve data generated by a control build function, so it can be previewed without building it.
+    Results are memoized by function and parameters (See "get_control_preview_cache_key"). A cached parameter set
+    doesn't touch the scene. A new one runs the build function once and deletes everything it created.
+    Args:
+        build_function (callable): Function used to build the control.
+        parameters (dict, optional): Keyword arguments used when calling the build function.
+    Returns:
+        dict or None: Preview data, None if the build function failed or created no curves. e.g.
+                      {"name": "ctrl", "shapes": [{"name": "ctrlShape", "points": [[0, 0, 0], [0, 0, 1]],
+                       "knot": [0, 1], "degree": 1, "form": 0, "is_bezier": False}]}
+                      Points are in world space. Knots, degree and form follow "curve_utils.get_curve_shape_data"
+    """
+    parameters = parameters or {}
+    key = get_control_preview_cache_key(build_function=build_function, parameters=parameters)
+    preview_data = _control_preview_cache.get(key)
+    if preview_data is None:
+        preview_data = _generate_control_preview_data(build_function=build_function, parameters=parameters)
+        if not preview_data:
+            return
+        _control_preview_cache[key] = preview_data
+        while len(_control_preview_cache) > CONTROL_PREVIEW_CACHE_SIZE:
+            _control_preview_cache.popitem(last=False)  # Least recently used
+    _control_preview_cache.move_to_end(key)
+    return copy.deepcopy(preview_data)  # Cached data is never modified
+
+
+def get_curve_from_preview_data(preview_data):
+    """
+    Creates a simple Curve from control preview data. (See "get_control_preview_data")
+    Args:
+        preview_data (dict): Control preview data.
+    Returns:
+        Curve: A Curve with the shapes found in the preview data.
+    """
+    shapes = []
+    for shape_data in preview_data.get("shapes", []):
+        is_bezier = shape_data.get("is_bezier")
+        form = shape_data.get("form")
+        shapes.append({"name": shape_data.get("name"),
+                       "points": shape_data.get("points"),
+                       "degree": shape_data.get("degree"),
+                       "knot": shape_data.get("knot") if is_bezier or form == 2 else None,
+                       "periodic": form,
+                       "is_bezier": is_bezier})
+    curve = Curve(data_from_dict={"name": preview_data.get("name"), "shapes": shapes})
+    for shape, shape_data in zip(curve.shapes, shapes):
+        shape.is_bezier = shape_data.get("is_bezier")  # Not read by "set_data_from_dict"
+    return curve
+
+
+def clear_control_preview_cache():
+    """
+    Removes all cached control previews.
+    """
+    _control_preview_cache.clear()
+
+
 class Controls:
     def __init__(self):
         """
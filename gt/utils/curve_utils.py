@@ -4,15 +4,20 @@ github.com/TrevisanGMW/gt-tools
 """
 from gt.utils.naming_utils import get_short_name, NamingConstants
 from gt.utils.attr_utils import add_separator_attr, set_attr
-from gt.utils.data_utils import read_json_dict, write_json
+from gt.utils.data_utils import read_json_dict, write_json, get_directory_file_index
 from gt.utils.transform_utils import Transform, Vector3
+from gt.utils.component_utils import get_components
+from gt.utils.color_utils import set_color_viewport
 from gt.utils.system_utils import DataDirConstants
 from gt.utils.math_utils import remap_value
 import maya.OpenMaya as OpenMaya
 from gt.utils import attr_utils
-from decimal import Decimal
 import maya.cmds as cmds
 import logging
+import hashlib
+import struct
+import json
+import mmap
 import sys
 import os
 
@@ -27,6 +32,13 @@ CURVE_TYPE_NURBS = "nurbsCurve"
 CURVE_TYPE_BEZIER = "bezierCurve"
 CURVE_TYPES = [CURVE_TYPE_NURBS, CURVE_TYPE_BEZIER]
 CURVE_FILE_EXTENSION = "crv"
+CURVE_BUNDLE_EXTENSION = "crvb"
+CURVE_BUNDLE_MAGIC = b'GTCRVB'
+CURVE_BUNDLE_VERSION = 1
+CURVE_BUNDLE_HEADER_FORMAT = '<6sHI'  # Magic, version, index size
+CURVE_BUNDLE_DECIMALS = 3  # Same precision used when extracting curve shapes
+PACKAGE_CURVE_BUNDLE = os.path.join(DataDirConstants.DIR_CURVES, f'curves.{CURVE_BUNDLE_EXTENSION}')
+CURVE_THUMBNAIL_MANIFEST = "thumbnails_manifest.json"
 PROJECTION_AXIS_KEY = 'projectionAxis'
 PROJECTION_SCALE_KEY = 'projectionScale'
 PROJECTION_FIT_KEY = 'projectionFit'
@@ -34,19 +46,27 @@ PROJECTION_FIT_KEY = 'projectionFit'
 
 def get_curve_file_path(file_name):
     """
-    Get the path to a curve data file. This file should exist inside the utils/data/curves folder.
+    Get the path to the file holding a curve's data. This file should exist inside the utils/data/curves folder.
+    Package curves are stored in the package curve bundle (".crvb"), so its path is returned for them.
+    A loose curve file (".crv") with the same name takes priority over the bundle.
     Args:
         file_name (str): Name of the file. It doesn't need to contain its extension as it will always be "crv"
     Returns:
-        str or None: Path to the curve description file. None if not found.
+        str or None: Path to the curve description file or curve bundle. None if not found.
     """
     if not isinstance(file_name, str):
         logger.debug(f'Unable to retrieve curve file. Incorrect argument type: "{str(type(file_name))}".')
         return
-    if not file_name.endswith(f'.{CURVE_FILE_EXTENSION}'):
-        file_name = f'{file_name}.{CURVE_FILE_EXTENSION}'
-    path_to_curve = os.path.join(DataDirConstants.DIR_CURVES, file_name)
-    return path_to_curve
+    curve_name = file_name
+    if curve_name.endswith(f'.{CURVE_FILE_EXTENSION}'):
+        curve_name = curve_name[:-len(f'.{CURVE_FILE_EXTENSION}')]
+    path_to_curve = os.path.join(DataDirConstants.DIR_CURVES, f'{curve_name}.{CURVE_FILE_EXTENSION}')
+    if os.path.exists(path_to_curve):
+        return path_to_curve
+    bundle = get_curve_bundle()
+    if bundle and bundle.has_curve(curve_name):
+        return bundle.file_path
+    logger.debug(f'Unable to retrieve curve file. Missing curve: "{curve_name}".')
 
 
 def get_curve_preview_image_path(curve_name):
@@ -62,15 +82,14 @@ def get_curve_preview_image_path(curve_name):
         logger.debug(f'Unable to retrieve curve preview image. Incorrect argument type: "{str(type(curve_name))}".')
         return
 
-    for ext in ["jpg", "png"]:
-        path_to_image = os.path.join(DataDirConstants.DIR_CURVES, f'{curve_name}.{ext}')
-        if os.path.exists(path_to_image):
-            return path_to_image
+    preview_images = get_directory_file_index(DataDirConstants.DIR_CURVES, extensions=["jpg", "png"])
+    return preview_images.get(curve_name)
 
 
 def get_curve(file_name, curve_dir=None):
     """
     Get the curve object from the path to a curve data file. This file should exist inside the utils/data/curves folder.
+    Curves from the package directory are read from the package curve bundle when available.
     Args:
         file_name (str): File name (not path). It doesn't need to contain its extension as it will always be "crv"
         curve_dir (str, optional): Path to the curve folder where it should look for the file. Default is None
@@ -82,19 +101,255 @@ def get_curve(file_name, curve_dir=None):
     if not isinstance(file_name, str):
         logger.debug(f'Unable to retrieve curve file. Incorrect argument type: "{str(type(file_name))}".')
         return
-    if not file_name.endswith(f'.{CURVE_FILE_EXTENSION}'):
-        file_name = f'{file_name}.{CURVE_FILE_EXTENSION}'
+    curve_name = file_name
+    if curve_name.endswith(f'.{CURVE_FILE_EXTENSION}'):
+        curve_name = curve_name[:-len(f'.{CURVE_FILE_EXTENSION}')]
     _curve_dir = DataDirConstants.DIR_CURVES
     if curve_dir and isinstance(curve_dir, str):
         if os.path.exists(curve_dir):
             _curve_dir = curve_dir
         else:
             logger.debug(f'Missing custom directory curve directory. Attempting to use package directory instead.')
-    path_to_curve = os.path.join(_curve_dir, file_name)
+    if _curve_dir == DataDirConstants.DIR_CURVES:
+        bundle = get_curve_bundle()
+        if bundle and bundle.has_curve(curve_name):
+            return bundle.get_curve(curve_name)
+    path_to_curve = os.path.join(_curve_dir, f'{curve_name}.{CURVE_FILE_EXTENSION}')
     if os.path.exists(path_to_curve):
         return Curve(data_from_file=path_to_curve)
 
 
+class CurveBundle:
+    def __init__(self, file_path):
+        """
+        Read-only access to a compiled curve bundle (".crvb").
+        A bundle is a single file with a JSON index followed by packed little-endian float32 arrays (points and knots).
+        The file is memory-mapped, so only the curves that are requested get decoded.
+        Args:
+            file_path (str): Path to an existing curve bundle file.
+        Raises:
+            ValueError: If the file is not a valid curve bundle.
+        """
+        self.file_path = file_path
+        self.index = {}
+        self.decimals = None
+        self.data_offset = 0
+        self.buffer = None
+        self.values_cache = {}  # Key: (offset, count), Value: decoded values (tuple). Repeated curves are decoded once
+        self.read_index()
+
+    def read_index(self):
+        """
+        Maps the bundle file and reads its index (curve descriptions without the packed point data).
+        Raises:
+            ValueError: If the file is not a valid curve bundle or was written by a newer version.
+        """
+        with open(self.file_path, 'rb') as bundle_file:
+            self.buffer = mmap.mmap(bundle_file.fileno(), 0, access=mmap.ACCESS_READ)
+        header_size = struct.calcsize(CURVE_BUNDLE_HEADER_FORMAT)
+        if len(self.buffer) < header_size:
+            self.close()
+            raise ValueError(f'Invalid curve bundle: "{self.file_path}".')
+        magic, version, index_size = struct.unpack_from(CURVE_BUNDLE_HEADER_FORMAT, self.buffer, 0)
+        if magic != CURVE_BUNDLE_MAGIC:
+            self.close()
+            raise ValueError(f'Invalid curve bundle: "{self.file_path}".')
+        if version > CURVE_BUNDLE_VERSION:
+            self.close()
+            raise ValueError(f'Unsupported curve bundle version: "{version}". '
+                             f'Expected "{CURVE_BUNDLE_VERSION}" or older.')
+        index = json.loads(self.buffer[header_size:header_size + index_size].decode('utf-8'))
+        self.decimals = index.get('decimals')
+        self.index = index.get('curves') or {}
+        self.data_offset = header_size + index_size
+
+    def close(self):
+        """
+        Closes the memory-mapped file. The bundle can't be read after closing it.
+        """
+        if self.buffer:
+            self.buffer.close()
+            self.buffer = None
+
+    def read_values(self, offset, count):
+        """
+        Reads packed values from the data block.
+        Args:
+            offset (int): Offset in bytes from the start of the data block.
+            count (int): Number of float values to read.
+        Returns:
+            list: A list of floats (rounded to the bundle decimals when available)
+        """
+        values = self.values_cache.get((offset, count))
+        if values is None:
+            values = struct.unpack_from(f'<{count}f', self.buffer, self.data_offset + offset)
+            if self.decimals is not None:
+                scale = 10 ** self.decimals
+                values = tuple(round(value * scale) / scale for value in values)  # Faster than "round(value, decimals)"
+            self.values_cache[(offset, count)] = values
+        return list(values)
+
+    def has_curve(self, curve_name):
+        """
+        Checks if a curve exists in the bundle.
+        Args:
+            curve_name (str): Name of the curve (same as its original file name, without extension)
+        Returns:
+            bool: True if the curve is in the bundle, False otherwise.
+        """
+        return curve_name in self.index
+
+    def get_curve_names(self):
+        """
+        Gets the name of every curve stored in the bundle. (Only reads the index)
+        Returns:
+            list: A list of curve names (same as their original file names, without extension)
+        """
+        return list(self.index)
+
+    def get_curve_data(self, curve_name):
+        """
+        Gets the data of a curve as a dictionary. Same format used by the curve files (".crv")
+        Args:
+            curve_name (str): Name of the curve (same as its original file name, without extension)
+        Returns:
+            dict or None: Curve data dictionary, None if the curve is not in the bundle.
+        """
+        curve_entry = self.index.get(curve_name)
+        if not curve_entry:
+            logger.debug(f'Unable to read curve data. Missing "{curve_name}" in bundle: "{self.file_path}".')
+            return
+        shapes = []
+        for shape_entry in curve_entry.get('shapes') or []:
+            shape_data = dict(shape_entry)
+            point_offset, point_count = shape_entry.get('points')
+            values = self.read_values(offset=point_offset, count=point_count * 3)
+            shape_data['points'] = [values[index:index + 3] for index in range(0, len(values), 3)]
+            if shape_entry.get('knot'):
+                knot_offset, knot_count = shape_entry.get('knot')
+                shape_data['knot'] = self.read_values(offset=knot_offset, count=knot_count)
+            shapes.append(shape_data)
+        curve_data = dict(curve_entry)
+        curve_data['shapes'] = shapes
+        return curve_data
+
+    def get_curve(self, curve_name):
+        """
+        Gets a Curve object using the data stored in the bundle.
+        Args:
+            curve_name (str): Name of the curve (same as its original file name, without extension)
+        Returns:
+            Curve or None: Curve object, None if the curve is not in the bundle.
+        """
+        curve_data = self.get_curve_data(curve_name)
+        if curve_data:
+            return Curve(data_from_dict=curve_data)
+
+
+_curve_bundles = {}  # Opened bundles, so each bundle file is only opened and indexed once.
+
+
+def get_curve_bundle(file_path=None):
+    """
+    Gets an opened curve bundle. Bundles are only opened once and then reused.
+    Args:
+        file_path (str, optional): Path to a curve bundle. If not provided, the package curve bundle is used.
+    Returns:
+        CurveBundle or None: The curve bundle. None if missing or invalid.
+    """
+    if not file_path:
+        file_path = PACKAGE_CURVE_BUNDLE
+    bundle = _curve_bundles.get(file_path)
+    if bundle and bundle.buffer:  # Closed bundles are opened again
+        return bundle
+    if not os.path.exists(file_path):
+        logger.debug(f'Unable to open curve bundle. Missing file: "{file_path}".')
+        return
+    try:
+        bundle = CurveBundle(file_path)
+    except Exception as e:
+        logger.warning(f'Unable to open curve bundle. Issue: "{e}".')
+        return
+    _curve_bundles[file_path] = bundle
+    return bundle
+
+
+def write_curve_bundle(source_dir, bundle_path=None, decimals=CURVE_BUNDLE_DECIMALS):
+    """
+    Compiles every curve file (".crv") found in the source directory into a single curve bundle (".crvb").
+    Args:
+        source_dir (str): Path to a directory containing curve files.
+        bundle_path (str, optional): Path to the bundle file. If it exists, it will be overwritten.
+                                     If not provided, the package curve bundle is used.
+        decimals (int, optional): Decimals kept when reading the float32 values back.
+                                  If None, the values are read without rounding.
+    Returns:
+        str or None: Path to the written bundle. None if it failed.
+    """
+    if not source_dir or not os.path.isdir(source_dir):
+        logger.warning(f'Unable to write curve bundle. Missing source directory: "{source_dir}".')
+        return
+    if not bundle_path:
+        bundle_path = PACKAGE_CURVE_BUNDLE
+    curves_index = {}
+    data = bytearray()
+    for file in sorted(os.listdir(source_dir)):
+        if not file.endswith(f'.{CURVE_FILE_EXTENSION}'):
+            continue
+        curve_data = read_json_dict(os.path.join(source_dir, file))
+        if not curve_data or not curve_data.get('shapes'):
+            logger.debug(f'Curve file was skipped. Missing shapes: "{file}".')
+            continue
+        shape_entries = []
+        for shape_data in curve_data.get('shapes'):
+            shape_entry = dict(shape_data)
+            points = shape_data.get('points') or []
+            values = [float(value) for point in points for value in point]
+            shape_entry['points'] = [len(data), len(points)]
+            data += struct.pack(f'<{len(values)}f', *values)
+            knot = shape_data.get('knot')
+            if knot:
+                shape_entry['knot'] = [len(data), len(knot)]
+                data += struct.pack(f'<{len(knot)}f', *knot)
+            shape_entries.append(shape_entry)
+        curve_entry = dict(curve_data)
+        curve_entry['shapes'] = shape_entries
+        curves_index[file[:-len(f'.{CURVE_FILE_EXTENSION}')]] = curve_entry
+    index = json.dumps({'decimals': decimals, 'curves': curves_index}, separators=(',', ':')).encode('utf-8')
+
+    opened_bundle = _curve_bundles.pop(bundle_path, None)
+    if opened_bundle:  # Mapped files can't be overwritten on Windows
+        opened_bundle.close()
+    with open(bundle_path, 'wb') as bundle_file:
+        bundle_file.write(struct.pack(CURVE_BUNDLE_HEADER_FORMAT, CURVE_BUNDLE_MAGIC, CURVE_BUNDLE_VERSION, len(index)))
+        bundle_file.write(index)
+        bundle_file.write(data)
+    return bundle_path
+
+
+def extract_curve_bundle(target_dir, bundle_path=None):
+    """
+    Writes every curve stored in a curve bundle back to individual curve files (".crv"). Reverse of "write_curve_bundle"
+    Args:
+        target_dir (str): Path to a directory where the curve files will be written.
+        bundle_path (str, optional): Path to a curve bundle. If not provided, the package curve bundle is used.
+    Returns:
+        list: A list of paths to the written curve files.
+    """
+    bundle = get_curve_bundle(file_path=bundle_path)
+    if not bundle:
+        logger.warning(f'Unable to extract curve bundle. Missing or invalid bundle.')
+        return []
+    if not os.path.exists(target_dir):
+        os.makedirs(target_dir)
+    written_files = []
+    for curve_name in bundle.get_curve_names():
+        file_path = os.path.join(target_dir, f'{curve_name}.{CURVE_FILE_EXTENSION}')
+        write_json(path=file_path, data=bundle.get_curve_data(curve_name))
+        written_files.append(file_path)
+    return written_files
+
+
 def combine_curves_list(curve_list, convert_bezier_to_nurbs=True):
     """
     Moves the shape objects of all elements in the provided input (curve_list) to a single group
@@ -366,6 +621,46 @@ def create_text(text, font="MS Shell Dlg 2"):
     return curve
 
 
+def get_curve_shape_data(crv_shape, decimals=CURVE_BUNDLE_DECIMALS, world_space=False):
+    """
+    Reads the CVs, knots, degree and form of a curve shape in a single pass using "OpenMaya.MFnNurbsCurve".
+    Periodic curves include their overlapping CVs. e.g. A periodic degree 3 curve repeats its first 3 CVs at the end.
+    Args:
+        crv_shape (str): Name of the curve shape (nurbs or bezier). Must exist and be unique or a long name.
+        decimals (int, None, optional): Decimals kept when rounding the CV positions. If None, values are not rounded.
+        world_space (bool, optional): If True, CV positions are read in world space instead of object space.
+    Returns:
+        dict or None: Curve shape data, None if it fails to read the shape. e.g.
+                      {"points": [[0.0, 0.0, 0.0], [0.0, 0.0, -1.0]], "knot": [0.0, 1.0], "degree": 1, "form": 0}
+                      Form follows the values of the "form" attribute. 0: Open, 1: Closed: 2: Periodic
+    """
+    selection = OpenMaya.MSelectionList()
+    dag_path = OpenMaya.MDagPath()
+    try:
+        selection.add(crv_shape)
+        selection.getDagPath(0, dag_path)
+        curve_fn = OpenMaya.MFnNurbsCurve(dag_path)
+        cv_array = OpenMaya.MPointArray()
+        curve_fn.getCVs(cv_array, OpenMaya.MSpace.kWorld if world_space else OpenMaya.MSpace.kObject)
+        knot_array = OpenMaya.MDoubleArray()
+        curve_fn.getKnots(knot_array)
+        degree = curve_fn.degree()
+        form = curve_fn.form() - 1  # API form starts at 1 (kOpen) as 0 is "kInvalid"
+    except Exception as e:
+        logger.debug(f'Unable to read curve shape "{crv_shape}". Issue: {str(e)}')
+        return
+    values = []
+    for index in range(cv_array.length()):
+        point = cv_array[index]
+        values += (point.x, point.y, point.z)
+    if decimals is not None:
+        values = [round(value, decimals) for value in values]
+    return {"points": [values[index:index + 3] for index in range(0, len(values), 3)],
+            "knot": [knot_array[index] for index in range(knot_array.length())],
+            "degree": degree,
+            "form": form}
+
+
 class Curve:
     def __init__(self,
                  name=None,
@@ -388,6 +683,8 @@ class Curve:
             data_from_dict (dict, optional): If provided, this dictionary is used to populate the curve data.
             data_from_file (str, optional): Path to a JSON file describing the curve.
                                                        It reads the JSON content as a "read_curve_data" dictionary.
+                                                       Curve bundles (".crvb") are also accepted, in which case
+                                                       the provided "name" is used to find the curve in the bundle.
         """
         self.name = name
         self.transform = transform
@@ -429,10 +726,9 @@ class Curve:
         # Basic elements -----------------------------------------
         if not self.is_curve_valid():
             return
-        generated_shapes = []
-        for shape in self.shapes:
-            generated_shapes.append(shape.build())
-        generated_curve = combine_curves_list(generated_shapes)
+        generated_curve = self.build_shapes()
+        if not generated_curve:
+            return
         if self.name:
             generated_curve = cmds.rename(generated_curve, self.name)
         if self.transform:
@@ -440,6 +736,40 @@ class Curve:
         cmds.select(clear=True)
         return generated_curve
 
+    def build_shapes(self):
+        """
+        Generates all shapes of the curve under a single transform. The curve name and transform are not applied.
+        Newly created nurbs curves have no transformations, so their shapes are re-parented in a single operation.
+        Bezier curves still go through "combine_curves_list", so they are converted to nurbs.
+        Returns:
+            str or None: Name of the transform holding the generated shapes. (Named after its first shape)
+        """
+        generated_shapes = []
+        for shape in self.shapes:
+            generated_shape = shape.build()
+            if generated_shape:
+                generated_shapes.append(generated_shape)
+        if not generated_shapes:
+            return
+        if any(shape.is_bezier for shape in self.shapes):
+            return combine_curves_list(generated_shapes)
+        generated_curve = generated_shapes[0]
+        if len(generated_shapes) > 1:
+            extra_transforms = generated_shapes[1:]
+            extra_shapes = cmds.listRelatives(extra_transforms, shapes=True, fullPath=True) or []
+            cmds.parent(extra_shapes, generated_curve, relative=True, shape=True)
+            cmds.delete(extra_transforms)
+        return generated_curve
+
+    def get_shapes_key(self):
+        """
+        Gets a key describing the shapes of the curve. Curves with the same key generate the same shapes.
+        Returns:
+            str: Key describing the shapes (build parameters of every shape)
+        """
+        shape_parameters = [shape.get_parameters() for shape in self.shapes or []]
+        return json.dumps(shape_parameters, sort_keys=True, default=str)
+
     def read_data_from_existing_curve(self, existing_curve):
         """
         Initializes Curve object using the data found in an existing curve.
@@ -667,13 +997,21 @@ class Curve:
         """
         return self.transform
 
-    def read_curve_from_file(self, file_path):
+    def read_curve_from_file(self, file_path, curve_name=None):
         """
         Reads the data from a file.
         Args:
-            file_path (str): Path to an existing file containing a curve description.
+            file_path (str): Path to an existing file containing a curve description. (".crv" or ".crvb")
+            curve_name (str, optional): Name of the curve to read when the file is a curve bundle (".crvb").
+                                        If not provided, the current curve name is used.
         """
-        received_data = read_json_dict(file_path)
+        if isinstance(file_path, str) and file_path.endswith(f'.{CURVE_BUNDLE_EXTENSION}'):
+            bundle = get_curve_bundle(file_path=file_path)
+            if not bundle:
+                return
+            received_data = bundle.get_curve_data(curve_name or self.name)
+        else:
+            received_data = read_json_dict(file_path)
         self.set_data_from_dict(received_data)
 
     def write_curve_to_file(self, file_path):
@@ -784,49 +1122,21 @@ class CurveShape:
         if cmds.objectType(crv_shape) == CURVE_TYPE_BEZIER:
             is_bezier = True
         # Extract Data
-        crv_info_node = None
-        try:
-            periodic = cmds.getAttr(crv_shape + '.form')
-            knot = None
-            if is_bezier or periodic == 2:  # 0: Open, 1: Closed: 2: Periodic
-                crv_info_node = cmds.arclen(crv_shape, ch=True)
-                knot = cmds.getAttr(crv_info_node + '.knots[*]')
-                cmds.delete(crv_info_node)
-
-            cvs = cmds.getAttr(crv_shape + '.cv[*]')
-            cvs_list = []
-
-            for c in cvs:
-                data = [float(Decimal("%.3f" % c[0])), float(Decimal("%.3f" % c[1])), float(Decimal("%.3f" % c[2]))]
-                cvs_list.append(data)
-
-            periodic_end_cvs = []
-            if periodic == 2 and len(cvs) > 2:
-                for i in range(3):
-                    periodic_end_cvs += [cvs_list[i]]
-
-            points = cvs_list
-            if periodic_end_cvs:
-                points.extend(periodic_end_cvs)
-
-            degree = cmds.getAttr(crv_shape + '.degree')
-            # Store Extracted Values
-            self.name = get_short_name(crv_shape)
-            self.points = points
-            self.periodic = periodic
-            self.knot = knot
-            self.degree = degree
-            self.is_bezier = is_bezier
-        except Exception as e:
-            logger.warning(f'Unable to extract curve shape data. Issue: {str(e)}')
-        finally:  # Clean-up temp nodes - In case they were left behind
-            to_delete = [crv_info_node]
-            for obj in to_delete:
-                if obj and cmds.objExists(obj):
-                    try:
-                        cmds.delete(obj)
-                    except Exception as e:
-                        logger.debug(f'Unable to clean up scene after extracting curve. Issue: {str(e)}')
+        shape_data = get_curve_shape_data(crv_shape)
+        if not shape_data:
+            logger.warning(f'Unable to extract curve shape data. Failed to read shape: "{crv_shape}".')
+            return
+        periodic = shape_data.get("form")
+        knot = None
+        if is_bezier or periodic == 2:  # 0: Open, 1: Closed: 2: Periodic
+            knot = shape_data.get("knot")
+        # Store Extracted Values
+        self.name = get_short_name(crv_shape)
+        self.points = shape_data.get("points")
+        self.periodic = periodic
+        self.knot = knot
+        self.degree = shape_data.get("degree")
+        self.is_bezier = is_bezier
 
     def get_parameters(self):
         """
@@ -954,446 +1264,494 @@ class CurveShape:
         return self.build(replace_crv=target_curve)
 
 
+class LazyCurve:
+    def __init__(self, file_name, curve_dir=None):
+        """
+        Descriptor used to describe a curve file without reading it.
+        The file is only read the first time the attribute is accessed, after that the same Curve object is returned.
+        Args:
+            file_name (str): File name (not path). It doesn't need to contain its extension as it will always be "crv"
+            curve_dir (str, optional): Path to the curve folder where it should look for the file. Default is None
+                                       When not provided, it's assumed to be the package "curves" directory.
+        """
+        self.file_name = file_name
+        self.curve_dir = curve_dir
+        self.curve = None
+        self.is_loaded = False
+
+    def __get__(self, instance, owner):
+        """
+        Reads the curve file when accessed for the first time and returns the memoized Curve object.
+        Returns:
+            Curve or None: Curve object described in the file. None if not found.
+        """
+        if not self.is_loaded:
+            self.curve = get_curve(file_name=self.file_name, curve_dir=self.curve_dir)
+            self.is_loaded = True
+        return self.curve
+
+    def clear(self):
+        """
+        Clears the memoized curve, so the file is read again next time the attribute is accessed.
+        """
+        self.curve = None
+        self.is_loaded = False
+
+
 class Curves:
     def __init__(self):
         """
         A library of curve objects.
+        Curves are only read from their files when accessed for the first time.
         Use "build()" to create them in Maya.
         """
-    arrow_circle_to_head = get_curve(file_name="arrow_circle_to_head")
-    arrow_content_moved = get_curve(file_name="arrow_content_moved")
-    arrow_corner_broken = get_curve(file_name="arrow_corner_broken")
-    arrow_curved_converge = get_curve(file_name="arrow_curved_converge")
-    arrow_curved_return = get_curve(file_name="arrow_curved_return")
-    arrow_direction_eight_sides = get_curve(file_name="arrow_direction_eight_sides")
-    arrow_direction_four_sides = get_curve(file_name="arrow_direction_four_sides")
-    arrow_direction_four_sides_skinny = get_curve(file_name="arrow_direction_four_sides_skinny")
-    arrow_direction_two_sides = get_curve(file_name="arrow_direction_two_sides")
-    arrow_direction_two_sides_skinny = get_curve(file_name="arrow_direction_two_sides_skinny")
-    arrow_direction_two_sides_skinny_heads = get_curve(file_name="arrow_direction_two_sides_skinny_heads")
-    arrow_direction_two_sides_small = get_curve(file_name="arrow_direction_two_sides_small")
-    arrow_direction_two_sides_smaller = get_curve(file_name="arrow_direction_two_sides_smaller")
-    arrow_eight_detailed = get_curve(file_name="arrow_eight_detailed")
-    arrow_fletching_nock_flat = get_curve(file_name="arrow_fletching_nock_flat")
-    arrow_four_maximize = get_curve(file_name="arrow_four_maximize")
-    arrow_head_aim_flat_four_sides = get_curve(file_name="arrow_head_aim_flat_four_sides")
-    arrow_head_candy_corn_smooth = get_curve(file_name="arrow_head_candy_corn_smooth")
-    arrow_head_flat_aim = get_curve(file_name="arrow_head_flat_aim")
-    arrow_head_flat_concave = get_curve(file_name="arrow_head_flat_concave")
-    arrow_head_flat_triangle = get_curve(file_name="arrow_head_flat_triangle")
-    arrow_head_flat_triangle_small = get_curve(file_name="arrow_head_flat_triangle_small")
-    arrow_head_outline_no_base = get_curve(file_name="arrow_head_outline_no_base")
-    arrow_head_stylized = get_curve(file_name="arrow_head_stylized")
-    arrow_long = get_curve(file_name="arrow_long")
-    arrow_loop_infinite = get_curve(file_name="arrow_loop_infinite")
-    arrow_return_squared_back = get_curve(file_name="arrow_return_squared_back")
-    arrow_return_squared_full = get_curve(file_name="arrow_return_squared_full")
-    arrow_skinny = get_curve(file_name="arrow_skinny")
-    arrow_suit_spades_beet = get_curve(file_name="arrow_suit_spades_beet")
-    arrow_symbol_refresh = get_curve(file_name="arrow_symbol_refresh")
-    arrow_symbol_refresh1 = get_curve(file_name="arrow_symbol_refresh1")
-    arrow_symbol_return = get_curve(file_name="arrow_symbol_return")
-    arrow_thick_small = get_curve(file_name="arrow_thick_small")
-    arrow_two_compressing = get_curve(file_name="arrow_two_compressing")
-    circle = get_curve(file_name="circle")
-    circle_arrow = get_curve(file_name="circle_arrow")
-    circle_arrow_rotation_half = get_curve(file_name="circle_arrow_rotation_half")
-    circle_arrow_rotation_half_skinny = get_curve(file_name="circle_arrow_rotation_half_skinny")
-    circle_arrow_rotation_half_thick = get_curve(file_name="circle_arrow_rotation_half_thick")
-    circle_arrow_rotation_short = get_curve(file_name="circle_arrow_rotation_short")
-    circle_arrow_rotation_short_skinny = get_curve(file_name="circle_arrow_rotation_short_skinny")
-    circle_arrow_rotation_short_thick = get_curve(file_name="circle_arrow_rotation_short_thick")
-    circle_flower_six_sides = get_curve(file_name="circle_flower_six_sides")
-    circle_four_arrows = get_curve(file_name="circle_four_arrows")
-    circle_four_arrows_detached = get_curve(file_name="circle_four_arrows_detached")
-    circle_four_arrows_stylized = get_curve(file_name="circle_four_arrows_stylized")
-    circle_four_arrows_thick = get_curve(file_name="circle_four_arrows_thick")
-    circle_fractal_hexagon = get_curve(file_name="circle_fractal_hexagon")
-    circle_pipe = get_curve(file_name="circle_pipe")
-    circle_pizza_missing_slice = get_curve(file_name="circle_pizza_missing_slice")
-    circle_rotation_arrow_skinny = get_curve(file_name="circle_rotation_arrow_skinny")
-    circle_saw_detailed = get_curve(file_name="circle_saw_detailed")
-    circle_saw_eight_sides = get_curve(file_name="circle_saw_eight_sides")
-    circle_six_blobs = get_curve(file_name="circle_six_blobs")
-    circle_sun_eight_triangles = get_curve(file_name="circle_sun_eight_triangles")
-    circle_wavy_eight_sides = get_curve(file_name="circle_wavy_eight_sides")
-    circle_wavy_eight_sides_sun = get_curve(file_name="circle_wavy_eight_sides_sun")
-    circle_wavy_hips = get_curve(file_name="circle_wavy_hips")
-    circle_wavy_ten_sides = get_curve(file_name="circle_wavy_ten_sides")
-    coffee_mug_plate_side = get_curve(file_name="coffee_mug_plate_side")
-    concave_crescent = get_curve(file_name="concave_crescent")
-    concave_crescent_handle = get_curve(file_name="concave_crescent_handle")
-    concave_crescent_skinny = get_curve(file_name="concave_crescent_skinny")
-    creature_batman_symbol = get_curve(file_name="creature_batman_symbol")
-    creature_bat_simplified = get_curve(file_name="creature_bat_simplified")
-    creature_bat_simplified_two = get_curve(file_name="creature_bat_simplified_two")
-    creature_bird_seagull_side = get_curve(file_name="creature_bird_seagull_side")
-    creature_bird_side_stylized = get_curve(file_name="creature_bird_side_stylized")
-    creature_bird_symbol_side = get_curve(file_name="creature_bird_symbol_side")
-    creature_bull_side = get_curve(file_name="creature_bull_side")
-    creature_butterfly_top = get_curve(file_name="creature_butterfly_top")
-    creature_cat_side = get_curve(file_name="creature_cat_side")
-    creature_cat_stylized_front = get_curve(file_name="creature_cat_stylized_front")
-    creature_claw_horny_nail_bird = get_curve(file_name="creature_claw_horny_nail_bird")
-    creature_cow_front = get_curve(file_name="creature_cow_front")
-    creature_crab_top = get_curve(file_name="creature_crab_top")
-    creature_deer_side = get_curve(file_name="creature_deer_side")
-    creature_dinosaur_pterodactyl = get_curve(file_name="creature_dinosaur_pterodactyl")
-    creature_dinosaur_trex = get_curve(file_name="creature_dinosaur_trex")
-    creature_dog_face_front = get_curve(file_name="creature_dog_face_front")
-    creature_dog_schnauzer = get_curve(file_name="creature_dog_schnauzer")
-    creature_dog_side = get_curve(file_name="creature_dog_side")
-    creature_dog_sitting_side = get_curve(file_name="creature_dog_sitting_side")
-    creature_dragonfly_top = get_curve(file_name="creature_dragonfly_top")
-    creature_dragon_bat_wing = get_curve(file_name="creature_dragon_bat_wing")
-    creature_dragon_side = get_curve(file_name="creature_dragon_side")
-    creature_dragon_side_body = get_curve(file_name="creature_dragon_side_body")
-    creature_duck_stylized = get_curve(file_name="creature_duck_stylized")
-    creature_evil_boss_blood = get_curve(file_name="creature_evil_boss_blood")
-    creature_evil_cell_virus = get_curve(file_name="creature_evil_cell_virus")
-    creature_fish_eating = get_curve(file_name="creature_fish_eating")
-    creature_fish_side_small = get_curve(file_name="creature_fish_side_small")
-    creature_frog_persp = get_curve(file_name="creature_frog_persp")
-    creature_frog_webbed_feet_paw = get_curve(file_name="creature_frog_webbed_feet_paw")
-    creature_gecko_lizard_top = get_curve(file_name="creature_gecko_lizard_top")
-    creature_giraffe_persp = get_curve(file_name="creature_giraffe_persp")
-    creature_gorilla = get_curve(file_name="creature_gorilla")
-    creature_heads_hydra_dragon = get_curve(file_name="creature_heads_hydra_dragon")
-    creature_horse_head_front = get_curve(file_name="creature_horse_head_front")
-    creature_lion_side = get_curve(file_name="creature_lion_side")
-    creature_llama_side = get_curve(file_name="creature_llama_side")
-    creature_long_dragon = get_curve(file_name="creature_long_dragon")
-    creature_lower_teeth_vampire = get_curve(file_name="creature_lower_teeth_vampire")
-    creature_octopus = get_curve(file_name="creature_octopus")
-    creature_paw = get_curve(file_name="creature_paw")
-    creature_paw_claw = get_curve(file_name="creature_paw_claw")
-    creature_paw_four_toes = get_curve(file_name="creature_paw_four_toes")
-    creature_pig_side = get_curve(file_name="creature_pig_side")
-    creature_rabbit_side = get_curve(file_name="creature_rabbit_side")
-    creature_rabbit_side_outline = get_curve(file_name="creature_rabbit_side_outline")
-    creature_reptile_lizard_side = get_curve(file_name="creature_reptile_lizard_side")
-    creature_shark_teeth = get_curve(file_name="creature_shark_teeth")
-    creature_sheep_side = get_curve(file_name="creature_sheep_side")
-    creature_side_bird_dove = get_curve(file_name="creature_side_bird_dove")
-    creature_snake_front = get_curve(file_name="creature_snake_front")
-    creature_snake_side = get_curve(file_name="creature_snake_side")
-    creature_snake_top = get_curve(file_name="creature_snake_top")
-    creature_spider_top = get_curve(file_name="creature_spider_top")
-    creature_tentacle = get_curve(file_name="creature_tentacle")
-    creature_tentacle_inside_suckers = get_curve(file_name="creature_tentacle_inside_suckers")
-    creature_tentacle_spiky = get_curve(file_name="creature_tentacle_spiky")
-    creature_tentacle_suckers = get_curve(file_name="creature_tentacle_suckers")
-    creature_three_heads_hydra = get_curve(file_name="creature_three_heads_hydra")
-    creature_tutle_top = get_curve(file_name="creature_tutle_top")
-    creature_unicorn = get_curve(file_name="creature_unicorn")
-    creature_whale_side = get_curve(file_name="creature_whale_side")
-    creature_wings_angel = get_curve(file_name="creature_wings_angel")
-    creature_wings_fairy = get_curve(file_name="creature_wings_fairy")
-    creature_wing_bat_dragon = get_curve(file_name="creature_wing_bat_dragon")
-    creature_wing_thin_side = get_curve(file_name="creature_wing_thin_side")
-    creature_wolf_side_dog = get_curve(file_name="creature_wolf_side_dog")
-    creature_wolf_stylized = get_curve(file_name="creature_wolf_stylized")
-    cross_circle_heads = get_curve(file_name="cross_circle_heads")
-    cross_plus_add = get_curve(file_name="cross_plus_add")
-    cross_plus_small = get_curve(file_name="cross_plus_small")
-    dice_die_six_four = get_curve(file_name="dice_die_six_four")
-    dice_die_six_give = get_curve(file_name="dice_die_six_give")
-    dice_die_six_one = get_curve(file_name="dice_die_six_one")
-    dice_die_six_six = get_curve(file_name="dice_die_six_six")
-    dice_die_six_three = get_curve(file_name="dice_die_six_three")
-    dice_die_six_two = get_curve(file_name="dice_die_six_two")
-    extrude_profile_baseboard_a = get_curve(file_name="extrude_profile_baseboard_a")
-    extrude_profile_faucet_pipe_a = get_curve(file_name="extrude_profile_faucet_pipe_a")
-    four_leaf_clover = get_curve(file_name="four_leaf_clover")
-    gear_crown_eight_sides = get_curve(file_name="gear_crown_eight_sides")
-    gear_eight_sides = get_curve(file_name="gear_eight_sides")
-    gear_eight_sides_smooth = get_curve(file_name="gear_eight_sides_smooth")
-    gear_four_sides = get_curve(file_name="gear_four_sides")
-    gear_sharp_smooth = get_curve(file_name="gear_sharp_smooth")
-    gear_sixteen_sides = get_curve(file_name="gear_sixteen_sides")
-    gear_six_sides = get_curve(file_name="gear_six_sides")
-    gear_twelve_sides = get_curve(file_name="gear_twelve_sides")
-    gear_twenty_sides = get_curve(file_name="gear_twenty_sides")
-    human_arm_strong_side = get_curve(file_name="human_arm_strong_side")
-    human_baby_symbol = get_curve(file_name="human_baby_symbol")
-    human_ear = get_curve(file_name="human_ear")
-    human_enlight_shine_man = get_curve(file_name="human_enlight_shine_man")
-    human_eye_front_active = get_curve(file_name="human_eye_front_active")
-    human_eye_front_inactive = get_curve(file_name="human_eye_front_inactive")
-    human_eye_iris_closeup = get_curve(file_name="human_eye_iris_closeup")
-    human_face_side = get_curve(file_name="human_face_side")
-    human_foot_outline = get_curve(file_name="human_foot_outline")
-    human_foot_shoe_heel = get_curve(file_name="human_foot_shoe_heel")
-    human_foot_stylized = get_curve(file_name="human_foot_stylized")
-    human_hand_fist_stylized = get_curve(file_name="human_hand_fist_stylized")
-    human_hand_open_fingers = get_curve(file_name="human_hand_open_fingers")
-    human_hand_raising = get_curve(file_name="human_hand_raising")
-    human_hand_side = get_curve(file_name="human_hand_side")
-    human_hand_simplified = get_curve(file_name="human_hand_simplified")
-    human_hand_squared = get_curve(file_name="human_hand_squared")
-    human_hand_stylized = get_curve(file_name="human_hand_stylized")
-    human_head_gears_thinking = get_curve(file_name="human_head_gears_thinking")
-    human_head_outline_front = get_curve(file_name="human_head_outline_front")
-    human_head_outline_side = get_curve(file_name="human_head_outline_side")
-    human_man_open_arms = get_curve(file_name="human_man_open_arms")
-    human_man_running = get_curve(file_name="human_man_running")
-    human_man_torso_front = get_curve(file_name="human_man_torso_front")
-    human_man_walking = get_curve(file_name="human_man_walking")
-    human_man_wc = get_curve(file_name="human_man_wc")
-    human_man_ws_short = get_curve(file_name="human_man_ws_short")
-    human_mouth_lips = get_curve(file_name="human_mouth_lips")
-    human_skull_side = get_curve(file_name="human_skull_side")
-    human_strong_man_front = get_curve(file_name="human_strong_man_front")
-    human_symbol_eye_side = get_curve(file_name="human_symbol_eye_side")
-    human_walking_dog = get_curve(file_name="human_walking_dog")
-    human_woman_outline_front = get_curve(file_name="human_woman_outline_front")
-    human_woman_running = get_curve(file_name="human_woman_running")
-    human_woman_walking = get_curve(file_name="human_woman_walking")
-    human_woman_wc = get_curve(file_name="human_woman_wc")
-    icon_apple = get_curve(file_name="icon_apple")
-    icon_autodesk = get_curve(file_name="icon_autodesk")
-    icon_blender = get_curve(file_name="icon_blender")
-    icon_code_c_plus_plus = get_curve(file_name="icon_code_c_plus_plus")
-    icon_code_c_sharp = get_curve(file_name="icon_code_c_sharp")
-    icon_code_js_javascript = get_curve(file_name="icon_code_js_javascript")
-    icon_cursor = get_curve(file_name="icon_cursor")
-    icon_github_octocat = get_curve(file_name="icon_github_octocat")
-    icon_github_octocat_detailed = get_curve(file_name="icon_github_octocat_detailed")
-    icon_godot_logo = get_curve(file_name="icon_godot_logo")
-    icon_hand_click_index = get_curve(file_name="icon_hand_click_index")
-    icon_houdini_sidefx = get_curve(file_name="icon_houdini_sidefx")
-    icon_maya_autodesk_retro_word = get_curve(file_name="icon_maya_autodesk_retro_word")
-    icon_python = get_curve(file_name="icon_python")
-    icon_raspberry_pi = get_curve(file_name="icon_raspberry_pi")
-    icon_review_star = get_curve(file_name="icon_review_star")
-    icon_review_star_half = get_curve(file_name="icon_review_star_half")
-    icon_splash = get_curve(file_name="icon_splash")
-    icon_unity_logo = get_curve(file_name="icon_unity_logo")
-    icon_unity_logo_retro = get_curve(file_name="icon_unity_logo_retro")
-    icon_unreal_engine = get_curve(file_name="icon_unreal_engine")
-    icon_windows = get_curve(file_name="icon_windows")
-    icon_zbrush_maxon = get_curve(file_name="icon_zbrush_maxon")
-    letter_asterisk = get_curve(file_name="letter_asterisk")
-    line_two_points = get_curve(file_name="line_two_points")
-    locator = get_curve(file_name="locator")
-    locator_handle_arrows = get_curve(file_name="locator_handle_arrows")
-    locator_handle_xyz = get_curve(file_name="locator_handle_xyz")
-    locator_with_axis = get_curve(file_name="locator_with_axis")
-    peanut = get_curve(file_name="peanut")
-    pin = get_curve(file_name="pin")
-    pin_arrow_to_circle = get_curve(file_name="pin_arrow_to_circle")
-    pin_arrow_to_target = get_curve(file_name="pin_arrow_to_target")
-    pin_circle_to_arrow = get_curve(file_name="pin_circle_to_arrow")
-    pin_diamond_six_sides = get_curve(file_name="pin_diamond_six_sides")
-    pin_flag = get_curve(file_name="pin_flag")
-    pin_four_sides_flat_pyramids = get_curve(file_name="pin_four_sides_flat_pyramids")
-    pin_hollow_two_sides = get_curve(file_name="pin_hollow_two_sides")
-    pin_large = get_curve(file_name="pin_large")
-    pin_large_four_sides = get_curve(file_name="pin_large_four_sides")
-    pin_large_two_sides = get_curve(file_name="pin_large_two_sides")
-    pin_speech_bubble = get_curve(file_name="pin_speech_bubble")
-    pin_target_to_arrow = get_curve(file_name="pin_target_to_arrow")
-    primitive_cone = get_curve(file_name="primitive_cone")
-    primitive_cube = get_curve(file_name="primitive_cube")
-    primitive_hexagonal_tube = get_curve(file_name="primitive_hexagonal_tube")
-    primitive_pyramid = get_curve(file_name="primitive_pyramid")
-    primitive_pyramid_half = get_curve(file_name="primitive_pyramid_half")
-    primitive_tube = get_curve(file_name="primitive_tube")
-    primitive_tube_half = get_curve(file_name="primitive_tube_half")
-    primitive_tube_ring = get_curve(file_name="primitive_tube_ring")
-    revolve_profile_bottle_a = get_curve(file_name="revolve_profile_bottle_a")
-    revolve_profile_bowl_a = get_curve(file_name="revolve_profile_bowl_a")
-    revolve_profile_bowl_b = get_curve(file_name="revolve_profile_bowl_b")
-    revolve_profile_cork_a = get_curve(file_name="revolve_profile_cork_a")
-    revolve_profile_faucet_base_a = get_curve(file_name="revolve_profile_faucet_base_a")
-    revolve_profile_faucet_head_a = get_curve(file_name="revolve_profile_faucet_head_a")
-    revolve_profile_plate_b = get_curve(file_name="revolve_profile_plate_b")
-    revolve_profile_plate_c = get_curve(file_name="revolve_profile_plate_c")
-    rhombus = get_curve(file_name="rhombus")
-    rhombus_long = get_curve(file_name="rhombus_long")
-    sphere_dome = get_curve(file_name="sphere_dome")
-    sphere_four_directions = get_curve(file_name="sphere_four_directions")
-    sphere_half_arrow = get_curve(file_name="sphere_half_arrow")
-    sphere_half_double_arrows = get_curve(file_name="sphere_half_double_arrows")
-    sphere_half_double_arrows_skinny = get_curve(file_name="sphere_half_double_arrows_skinny")
-    sphere_half_four_arrows = get_curve(file_name="sphere_half_four_arrows")
-    sphere_half_top_four_arrows = get_curve(file_name="sphere_half_top_four_arrows")
-    sphere_half_two_arrows = get_curve(file_name="sphere_half_two_arrows")
-    sphere_joint = get_curve(file_name="sphere_joint")
-    sphere_joint_loc = get_curve(file_name="sphere_joint_loc")
-    sphere_joint_smooth = get_curve(file_name="sphere_joint_smooth")
-    sphere_two_directions = get_curve(file_name="sphere_two_directions")
-    spring = get_curve(file_name="spring")
-    spring_high_frequency = get_curve(file_name="spring_high_frequency")
-    spring_low_frequency = get_curve(file_name="spring_low_frequency")
-    square = get_curve(file_name="square")
-    squares_connected = get_curve(file_name="squares_connected")
-    square_corner_flat = get_curve(file_name="square_corner_flat")
-    square_corner_flat_skinny = get_curve(file_name="square_corner_flat_skinny")
-    swirl_five_spaces = get_curve(file_name="swirl_five_spaces")
-    swirl_thick_round_four_spaces = get_curve(file_name="swirl_thick_round_four_spaces")
-    swirl_thick_squared_four_spaces = get_curve(file_name="swirl_thick_squared_four_spaces")
-    swirl_two_spaces = get_curve(file_name="swirl_two_spaces")
-    switch_ik_fk_left = get_curve(file_name="switch_ik_fk_left")
-    switch_ik_fk_right = get_curve(file_name="switch_ik_fk_right")
-    symbol_attach_clip = get_curve(file_name="symbol_attach_clip")
-    symbol_attach_clip_squared = get_curve(file_name="symbol_attach_clip_squared")
-    symbol_batman_simplified = get_curve(file_name="symbol_batman_simplified")
-    symbol_bell = get_curve(file_name="symbol_bell")
-    symbol_bones_crossed = get_curve(file_name="symbol_bones_crossed")
-    symbol_bones_crossed_bottom = get_curve(file_name="symbol_bones_crossed_bottom")
-    symbol_bone_simple = get_curve(file_name="symbol_bone_simple")
-    symbol_bug_low_res_retro = get_curve(file_name="symbol_bug_low_res_retro")
-    symbol_bug_smoth = get_curve(file_name="symbol_bug_smoth")
-    symbol_camera_front = get_curve(file_name="symbol_camera_front")
-    symbol_camera_hollow = get_curve(file_name="symbol_camera_hollow")
-    symbol_camera_simple = get_curve(file_name="symbol_camera_simple")
-    symbol_canada_maple_leaf = get_curve(file_name="symbol_canada_maple_leaf")
-    symbol_card_suits_clover_clubs = get_curve(file_name="symbol_card_suits_clover_clubs")
-    symbol_card_suits_spades_pikes = get_curve(file_name="symbol_card_suits_spades_pikes")
-    symbol_chain_constraint = get_curve(file_name="symbol_chain_constraint")
-    symbol_chess_pawn_side = get_curve(file_name="symbol_chess_pawn_side")
-    symbol_chess_tower_rook = get_curve(file_name="symbol_chess_tower_rook")
-    symbol_code = get_curve(file_name="symbol_code")
-    symbol_computer_desktop = get_curve(file_name="symbol_computer_desktop")
-    symbol_connected_four = get_curve(file_name="symbol_connected_four")
-    symbol_connected_three_webhook = get_curve(file_name="symbol_connected_three_webhook")
-    symbol_controller_old = get_curve(file_name="symbol_controller_old")
-    symbol_control_pad = get_curve(file_name="symbol_control_pad")
-    symbol_cube_vertex_connected = get_curve(file_name="symbol_cube_vertex_connected")
-    symbol_danger_energy = get_curve(file_name="symbol_danger_energy")
-    symbol_diamond = get_curve(file_name="symbol_diamond")
-    symbol_dollar_sign_money = get_curve(file_name="symbol_dollar_sign_money")
-    symbol_eighteen_plus = get_curve(file_name="symbol_eighteen_plus")
-    symbol_emoji_one_hundred = get_curve(file_name="symbol_emoji_one_hundred")
-    symbol_emoji_poop = get_curve(file_name="symbol_emoji_poop")
-    symbol_emoji_robot = get_curve(file_name="symbol_emoji_robot")
-    symbol_emoji_skull = get_curve(file_name="symbol_emoji_skull")
-    symbol_emoji_smiley_face = get_curve(file_name="symbol_emoji_smiley_face")
-    symbol_emoji_smiley_ghost = get_curve(file_name="symbol_emoji_smiley_ghost")
-    symbol_emoji_smiley_missing = get_curve(file_name="symbol_emoji_smiley_missing")
-    symbol_emoji_thumbs_up = get_curve(file_name="symbol_emoji_thumbs_up")
-    symbol_family_holding_hands = get_curve(file_name="symbol_family_holding_hands")
-    symbol_female = get_curve(file_name="symbol_female")
-    symbol_filter = get_curve(file_name="symbol_filter")
-    symbol_flag_brazil = get_curve(file_name="symbol_flag_brazil")
-    symbol_flag_canada = get_curve(file_name="symbol_flag_canada")
-    symbol_flag_usa = get_curve(file_name="symbol_flag_usa")
-    symbol_flag_usa_simplified = get_curve(file_name="symbol_flag_usa_simplified")
-    symbol_flames = get_curve(file_name="symbol_flames")
-    symbol_focus_a = get_curve(file_name="symbol_focus_a")
-    symbol_food_fork_knife = get_curve(file_name="symbol_food_fork_knife")
-    symbol_four_loops = get_curve(file_name="symbol_four_loops")
-    symbol_frame_photo = get_curve(file_name="symbol_frame_photo")
-    symbol_game_controller_retro = get_curve(file_name="symbol_game_controller_retro")
-    symbol_heart = get_curve(file_name="symbol_heart")
-    symbol_heart_squared_smooth = get_curve(file_name="symbol_heart_squared_smooth")
-    symbol_hold_weapon_sword = get_curve(file_name="symbol_hold_weapon_sword")
-    symbol_human_dress = get_curve(file_name="symbol_human_dress")
-    symbol_human_man_touch = get_curve(file_name="symbol_human_man_touch")
-    symbol_human_shirt = get_curve(file_name="symbol_human_shirt")
-    symbol_icon_keyframe = get_curve(file_name="symbol_icon_keyframe")
-    symbol_infinite = get_curve(file_name="symbol_infinite")
-    symbol_key = get_curve(file_name="symbol_key")
-    symbol_key_front_simple = get_curve(file_name="symbol_key_front_simple")
-    symbol_key_side_detailed = get_curve(file_name="symbol_key_side_detailed")
-    symbol_key_side_round = get_curve(file_name="symbol_key_side_round")
-    symbol_key_side_squared = get_curve(file_name="symbol_key_side_squared")
-    symbol_key_squared = get_curve(file_name="symbol_key_squared")
-    symbol_kunai_knife = get_curve(file_name="symbol_kunai_knife")
-    symbol_letter = get_curve(file_name="symbol_letter")
-    symbol_lighting_energy_simple = get_curve(file_name="symbol_lighting_energy_simple")
-    symbol_lighting_energy_smooth = get_curve(file_name="symbol_lighting_energy_smooth")
-    symbol_lock_locked = get_curve(file_name="symbol_lock_locked")
-    symbol_lock_unlocked = get_curve(file_name="symbol_lock_unlocked")
-    symbol_magic_wand = get_curve(file_name="symbol_magic_wand")
-    symbol_male = get_curve(file_name="symbol_male")
-    symbol_man_fencing_sword = get_curve(file_name="symbol_man_fencing_sword")
-    symbol_man_front = get_curve(file_name="symbol_man_front")
-    symbol_man_strong = get_curve(file_name="symbol_man_strong")
-    symbol_music_two_notes = get_curve(file_name="symbol_music_two_notes")
-    symbol_music_two_notes_same = get_curve(file_name="symbol_music_two_notes_same")
-    symbol_old_sign = get_curve(file_name="symbol_old_sign")
-    symbol_omega = get_curve(file_name="symbol_omega")
-    symbol_paint_bucket = get_curve(file_name="symbol_paint_bucket")
-    symbol_parameters = get_curve(file_name="symbol_parameters")
-    symbol_pirate = get_curve(file_name="symbol_pirate")
-    symbol_pirate_skull_bones_crossed = get_curve(file_name="symbol_pirate_skull_bones_crossed")
-    symbol_pirate_sword_skull = get_curve(file_name="symbol_pirate_sword_skull")
-    symbol_plant_fin_grow = get_curve(file_name="symbol_plant_fin_grow")
-    symbol_plug = get_curve(file_name="symbol_plug")
-    symbol_plug_side = get_curve(file_name="symbol_plug_side")
-    symbol_pointy_sun = get_curve(file_name="symbol_pointy_sun")
-    symbol_puzzle = get_curve(file_name="symbol_puzzle")
-    symbol_question_mark = get_curve(file_name="symbol_question_mark")
-    symbol_radioactive = get_curve(file_name="symbol_radioactive")
-    symbol_radioactive_circle = get_curve(file_name="symbol_radioactive_circle")
-    symbol_shield_simple = get_curve(file_name="symbol_shield_simple")
-    symbol_smelly_poop = get_curve(file_name="symbol_smelly_poop")
-    symbol_snowflake = get_curve(file_name="symbol_snowflake")
-    symbol_snowflake_complex = get_curve(file_name="symbol_snowflake_complex")
-    symbol_snowflake_simplified = get_curve(file_name="symbol_snowflake_simplified")
-    symbol_speech_bubble = get_curve(file_name="symbol_speech_bubble")
-    symbol_squared_lock_locked = get_curve(file_name="symbol_squared_lock_locked")
-    symbol_squared_lock_unlocked = get_curve(file_name="symbol_squared_lock_unlocked")
-    symbol_sun_light = get_curve(file_name="symbol_sun_light")
-    symbol_sword = get_curve(file_name="symbol_sword")
-    symbol_tag_simple = get_curve(file_name="symbol_tag_simple")
-    symbol_tag_x = get_curve(file_name="symbol_tag_x")
-    symbol_tech_fan = get_curve(file_name="symbol_tech_fan")
-    symbol_tech_fan_case = get_curve(file_name="symbol_tech_fan_case")
-    symbol_three_hexagons = get_curve(file_name="symbol_three_hexagons")
-    symbol_tool_hammer = get_curve(file_name="symbol_tool_hammer")
-    symbol_uv_unwrapped = get_curve(file_name="symbol_uv_unwrapped")
-    symbol_virus_proteins = get_curve(file_name="symbol_virus_proteins")
-    symbol_wand_magic_star = get_curve(file_name="symbol_wand_magic_star")
-    symbol_wc_woman_front = get_curve(file_name="symbol_wc_woman_front")
-    symbol_woman_arms_up = get_curve(file_name="symbol_woman_arms_up")
-    symbol_wrench = get_curve(file_name="symbol_wrench")
-    symbol_zoom_in_plus = get_curve(file_name="symbol_zoom_in_plus")
-    target_aim_circle = get_curve(file_name="target_aim_circle")
-    target_aim_circle_drain = get_curve(file_name="target_aim_circle_drain")
-    target_circle = get_curve(file_name="target_circle")
-    target_circle_barrel_detailed = get_curve(file_name="target_circle_barrel_detailed")
-    target_squared = get_curve(file_name="target_squared")
-    target_squared_thick = get_curve(file_name="target_squared_thick")
-    target_square_circle_thick = get_curve(file_name="target_square_circle_thick")
-    target_wheel_helm_complex = get_curve(file_name="target_wheel_helm_complex")
-    target_wheel_helm_simple = get_curve(file_name="target_wheel_helm_simple")
-    tool_dial_caliper_measure = get_curve(file_name="tool_dial_caliper_measure")
-    tool_grass_cutter = get_curve(file_name="tool_grass_cutter")
-    tool_magnet = get_curve(file_name="tool_magnet")
-    tool_pair_scissors = get_curve(file_name="tool_pair_scissors")
-    tool_pickaxe = get_curve(file_name="tool_pickaxe")
-    tool_robot_arm_side = get_curve(file_name="tool_robot_arm_side")
-    tool_ruler = get_curve(file_name="tool_ruler")
-    tool_screwdriver = get_curve(file_name="tool_screwdriver")
-    tool_shovel = get_curve(file_name="tool_shovel")
-    tool_wrench = get_curve(file_name="tool_wrench")
-    triangle_pyramid_flat_four_arrows = get_curve(file_name="triangle_pyramid_flat_four_arrows")
-    triangle_pyramid_flat_two_arrows = get_curve(file_name="triangle_pyramid_flat_two_arrows")
-    ui_attention_exclamation = get_curve(file_name="ui_attention_exclamation")
-    weapon_battle_axe_side = get_curve(file_name="weapon_battle_axe_side")
-    weapon_dagger_top = get_curve(file_name="weapon_dagger_top")
-    weapon_grenade_launcher = get_curve(file_name="weapon_grenade_launcher")
-    weapon_hook_lance_teeth_thorn = get_curve(file_name="weapon_hook_lance_teeth_thorn")
-    weapon_mp4_rifle = get_curve(file_name="weapon_mp4_rifle")
-    weapon_pistols_crossed = get_curve(file_name="weapon_pistols_crossed")
-    weapon_pistol_modern_side = get_curve(file_name="weapon_pistol_modern_side")
-    weapon_pistol_side = get_curve(file_name="weapon_pistol_side")
-    weapon_rifle_modern = get_curve(file_name="weapon_rifle_modern")
-    weapon_shrunken_five = get_curve(file_name="weapon_shrunken_five")
-    weapon_shrunken_four = get_curve(file_name="weapon_shrunken_four")
-    weapon_shrunken_four_blades = get_curve(file_name="weapon_shrunken_four_blades")
-    weapon_sword_rapier = get_curve(file_name="weapon_sword_rapier")
-    weapon_symbol_bomb = get_curve(file_name="weapon_symbol_bomb")
-    weapon_symbol_bomb_two = get_curve(file_name="weapon_symbol_bomb_two")
-    weapon_symbol_grenade = get_curve(file_name="weapon_symbol_grenade")
+    arrow_circle_to_head = LazyCurve(file_name="arrow_circle_to_head")
+    arrow_content_moved = LazyCurve(file_name="arrow_content_moved")
+    arrow_corner_broken = LazyCurve(file_name="arrow_corner_broken")
+    arrow_curved_converge = LazyCurve(file_name="arrow_curved_converge")
+    arrow_curved_return = LazyCurve(file_name="arrow_curved_return")
+    arrow_direction_eight_sides = LazyCurve(file_name="arrow_direction_eight_sides")
+    arrow_direction_four_sides = LazyCurve(file_name="arrow_direction_four_sides")
+    arrow_direction_four_sides_skinny = LazyCurve(file_name="arrow_direction_four_sides_skinny")
+    arrow_direction_two_sides = LazyCurve(file_name="arrow_direction_two_sides")
+    arrow_direction_two_sides_skinny = LazyCurve(file_name="arrow_direction_two_sides_skinny")
+    arrow_direction_two_sides_skinny_heads = LazyCurve(file_name="arrow_direction_two_sides_skinny_heads")
+    arrow_direction_two_sides_small = LazyCurve(file_name="arrow_direction_two_sides_small")
+    arrow_direction_two_sides_smaller = LazyCurve(file_name="arrow_direction_two_sides_smaller")
+    arrow_eight_detailed = LazyCurve(file_name="arrow_eight_detailed")
+    arrow_fletching_nock_flat = LazyCurve(file_name="arrow_fletching_nock_flat")
+    arrow_four_maximize = LazyCurve(file_name="arrow_four_maximize")
+    arrow_head_aim_flat_four_sides = LazyCurve(file_name="arrow_head_aim_flat_four_sides")
+    arrow_head_candy_corn_smooth = LazyCurve(file_name="arrow_head_candy_corn_smooth")
+    arrow_head_flat_aim = LazyCurve(file_name="arrow_head_flat_aim")
+    arrow_head_flat_concave = LazyCurve(file_name="arrow_head_flat_concave")
+    arrow_head_flat_triangle = LazyCurve(file_name="arrow_head_flat_triangle")
+    arrow_head_flat_triangle_small = LazyCurve(file_name="arrow_head_flat_triangle_small")
+    arrow_head_outline_no_base = LazyCurve(file_name="arrow_head_outline_no_base")
+    arrow_head_stylized = LazyCurve(file_name="arrow_head_stylized")
+    arrow_long = LazyCurve(file_name="arrow_long")
+    arrow_loop_infinite = LazyCurve(file_name="arrow_loop_infinite")
+    arrow_return_squared_back = LazyCurve(file_name="arrow_return_squared_back")
+    arrow_return_squared_full = LazyCurve(file_name="arrow_return_squared_full")
+    arrow_skinny = LazyCurve(file_name="arrow_skinny")
+    arrow_suit_spades_beet = LazyCurve(file_name="arrow_suit_spades_beet")
+    arrow_symbol_refresh = LazyCurve(file_name="arrow_symbol_refresh")
+    arrow_symbol_refresh1 = LazyCurve(file_name="arrow_symbol_refresh1")
+    arrow_symbol_return = LazyCurve(file_name="arrow_symbol_return")
+    arrow_thick_small = LazyCurve(file_name="arrow_thick_small")
+    arrow_two_compressing = LazyCurve(file_name="arrow_two_compressing")
+    circle = LazyCurve(file_name="circle")
+    circle_arrow = LazyCurve(file_name="circle_arrow")
+    circle_arrow_rotation_half = LazyCurve(file_name="circle_arrow_rotation_half")
+    circle_arrow_rotation_half_skinny = LazyCurve(file_name="circle_arrow_rotation_half_skinny")
+    circle_arrow_rotation_half_thick = LazyCurve(file_name="circle_arrow_rotation_half_thick")
+    circle_arrow_rotation_short = LazyCurve(file_name="circle_arrow_rotation_short")
+    circle_arrow_rotation_short_skinny = LazyCurve(file_name="circle_arrow_rotation_short_skinny")
+    circle_arrow_rotation_short_thick = LazyCurve(file_name="circle_arrow_rotation_short_thick")
+    circle_flower_six_sides = LazyCurve(file_name="circle_flower_six_sides")
+    circle_four_arrows = LazyCurve(file_name="circle_four_arrows")
+    circle_four_arrows_detached = LazyCurve(file_name="circle_four_arrows_detached")
+    circle_four_arrows_stylized = LazyCurve(file_name="circle_four_arrows_stylized")
+    circle_four_arrows_thick = LazyCurve(file_name="circle_four_arrows_thick")
+    circle_fractal_hexagon = LazyCurve(file_name="circle_fractal_hexagon")
+    circle_pipe = LazyCurve(file_name="circle_pipe")
+    circle_pizza_missing_slice = LazyCurve(file_name="circle_pizza_missing_slice")
+    circle_rotation_arrow_skinny = LazyCurve(file_name="circle_rotation_arrow_skinny")
+    circle_saw_detailed = LazyCurve(file_name="circle_saw_detailed")
+    circle_saw_eight_sides = LazyCurve(file_name="circle_saw_eight_sides")
+    circle_six_blobs = LazyCurve(file_name="circle_six_blobs")
+    circle_sun_eight_triangles = LazyCurve(file_name="circle_sun_eight_triangles")
+    circle_wavy_eight_sides = LazyCurve(file_name="circle_wavy_eight_sides")
+    circle_wavy_eight_sides_sun = LazyCurve(file_name="circle_wavy_eight_sides_sun")
+    circle_wavy_hips = LazyCurve(file_name="circle_wavy_hips")
+    circle_wavy_ten_sides = LazyCurve(file_name="circle_wavy_ten_sides")
+    coffee_mug_plate_side = LazyCurve(file_name="coffee_mug_plate_side")
+    concave_crescent = LazyCurve(file_name="concave_crescent")
+    concave_crescent_handle = LazyCurve(file_name="concave_crescent_handle")
+    concave_crescent_skinny = LazyCurve(file_name="concave_crescent_skinny")
+    creature_batman_symbol = LazyCurve(file_name="creature_batman_symbol")
+    creature_bat_simplified = LazyCurve(file_name="creature_bat_simplified")
+    creature_bat_simplified_two = LazyCurve(file_name="creature_bat_simplified_two")
+    creature_bird_seagull_side = LazyCurve(file_name="creature_bird_seagull_side")
+    creature_bird_side_stylized = LazyCurve(file_name="creature_bird_side_stylized")
+    creature_bird_symbol_side = LazyCurve(file_name="creature_bird_symbol_side")
+    creature_bull_side = LazyCurve(file_name="creature_bull_side")
+    creature_butterfly_top = LazyCurve(file_name="creature_butterfly_top")
+    creature_cat_side = LazyCurve(file_name="creature_cat_side")
+    creature_cat_stylized_front = LazyCurve(file_name="creature_cat_stylized_front")
+    creature_claw_horny_nail_bird = LazyCurve(file_name="creature_claw_horny_nail_bird")
+    creature_cow_front = LazyCurve(file_name="creature_cow_front")
+    creature_crab_top = LazyCurve(file_name="creature_crab_top")
+    creature_deer_side = LazyCurve(file_name="creature_deer_side")
+    creature_dinosaur_pterodactyl = LazyCurve(file_name="creature_dinosaur_pterodactyl")
+    creature_dinosaur_trex = LazyCurve(file_name="creature_dinosaur_trex")
+    creature_dog_face_front = LazyCurve(file_name="creature_dog_face_front")
+    creature_dog_schnauzer = LazyCurve(file_name="creature_dog_schnauzer")
+    creature_dog_side = LazyCurve(file_name="creature_dog_side")
+    creature_dog_sitting_side = LazyCurve(file_name="creature_dog_sitting_side")
+    creature_dragonfly_top = LazyCurve(file_name="creature_dragonfly_top")
+    creature_dragon_bat_wing = LazyCurve(file_name="creature_dragon_bat_wing")
+    creature_dragon_side = LazyCurve(file_name="creature_dragon_side")
+    creature_dragon_side_body = LazyCurve(file_name="creature_dragon_side_body")
+    creature_duck_stylized = LazyCurve(file_name="creature_duck_stylized")
+    creature_evil_boss_blood = LazyCurve(file_name="creature_evil_boss_blood")
+    creature_evil_cell_virus = LazyCurve(file_name="creature_evil_cell_virus")
+    creature_fish_eating = LazyCurve(file_name="creature_fish_eating")
+    creature_fish_side_small = LazyCurve(file_name="creature_fish_side_small")
+    creature_frog_persp = LazyCurve(file_name="creature_frog_persp")
+    creature_frog_webbed_feet_paw = LazyCurve(file_name="creature_frog_webbed_feet_paw")
+    creature_gecko_lizard_top = LazyCurve(file_name="creature_gecko_lizard_top")
+    creature_giraffe_persp = LazyCurve(file_name="creature_giraffe_persp")
+    creature_gorilla = LazyCurve(file_name="creature_gorilla")
+    creature_heads_hydra_dragon = LazyCurve(file_name="creature_heads_hydra_dragon")
+    creature_horse_head_front = LazyCurve(file_name="creature_horse_head_front")
+    creature_lion_side = LazyCurve(file_name="creature_lion_side")
+    creature_llama_side = LazyCurve(file_name="creature_llama_side")
+    creature_long_dragon = LazyCurve(file_name="creature_long_dragon")
+    creature_lower_teeth_vampire = LazyCurve(file_name="creature_lower_teeth_vampire")
+    creature_octopus = LazyCurve(file_name="creature_octopus")
+    creature_paw = LazyCurve(file_name="creature_paw")
+    creature_paw_claw = LazyCurve(file_name="creature_paw_claw")
+    creature_paw_four_toes = LazyCurve(file_name="creature_paw_four_toes")
+    creature_pig_side = LazyCurve(file_name="creature_pig_side")
+    creature_rabbit_side = LazyCurve(file_name="creature_rabbit_side")
+    creature_rabbit_side_outline = LazyCurve(file_name="creature_rabbit_side_outline")
+    creature_reptile_lizard_side = LazyCurve(file_name="creature_reptile_lizard_side")
+    creature_shark_teeth = LazyCurve(file_name="creature_shark_teeth")
+    creature_sheep_side = LazyCurve(file_name="creature_sheep_side")
+    creature_side_bird_dove = LazyCurve(file_name="creature_side_bird_dove")
+    creature_snake_front = LazyCurve(file_name="creature_snake_front")
+    creature_snake_side = LazyCurve(file_name="creature_snake_side")
+    creature_snake_top = LazyCurve(file_name="creature_snake_top")
+    creature_spider_top = LazyCurve(file_name="creature_spider_top")
+    creature_tentacle = LazyCurve(file_name="creature_tentacle")
+    creature_tentacle_inside_suckers = LazyCurve(file_name="creature_tentacle_inside_suckers")
+    creature_tentacle_spiky = LazyCurve(file_name="creature_tentacle_spiky")
+    creature_tentacle_suckers = LazyCurve(file_name="creature_tentacle_suckers")
+    creature_three_heads_hydra = LazyCurve(file_name="creature_three_heads_hydra")
+    creature_tutle_top = LazyCurve(file_name="creature_tutle_top")
+    creature_unicorn = LazyCurve(file_name="creature_unicorn")
+    creature_whale_side = LazyCurve(file_name="creature_whale_side")
+    creature_wings_angel = LazyCurve(file_name="creature_wings_angel")
+    creature_wings_fairy = LazyCurve(file_name="creature_wings_fairy")
+    creature_wing_bat_dragon = LazyCurve(file_name="creature_wing_bat_dragon")
+    creature_wing_thin_side = LazyCurve(file_name="creature_wing_thin_side")
+    creature_wolf_side_dog = LazyCurve(file_name="creature_wolf_side_dog")
+    creature_wolf_stylized = LazyCurve(file_name="creature_wolf_stylized")
+    cross_circle_heads = LazyCurve(file_name="cross_circle_heads")
+    cross_plus_add = LazyCurve(file_name="cross_plus_add")
+    cross_plus_small = LazyCurve(file_name="cross_plus_small")
+    dice_die_six_four = LazyCurve(file_name="dice_die_six_four")
+    dice_die_six_give = LazyCurve(file_name="dice_die_six_give")
+    dice_die_six_one = LazyCurve(file_name="dice_die_six_one")
+    dice_die_six_six = LazyCurve(file_name="dice_die_six_six")
+    dice_die_six_three = LazyCurve(file_name="dice_die_six_three")
+    dice_die_six_two = LazyCurve(file_name="dice_die_six_two")
+    extrude_profile_baseboard_a = LazyCurve(file_name="extrude_profile_baseboard_a")
+    extrude_profile_faucet_pipe_a = LazyCurve(file_name="extrude_profile_faucet_pipe_a")
+    four_leaf_clover = LazyCurve(file_name="four_leaf_clover")
+    gear_crown_eight_sides = LazyCurve(file_name="gear_crown_eight_sides")
+    gear_eight_sides = LazyCurve(file_name="gear_eight_sides")
+    gear_eight_sides_smooth = LazyCurve(file_name="gear_eight_sides_smooth")
+    gear_four_sides = LazyCurve(file_name="gear_four_sides")
+    gear_sharp_smooth = LazyCurve(file_name="gear_sharp_smooth")
+    gear_sixteen_sides = LazyCurve(file_name="gear_sixteen_sides")
+    gear_six_sides = LazyCurve(file_name="gear_six_sides")
+    gear_twelve_sides = LazyCurve(file_name="gear_twelve_sides")
+    gear_twenty_sides = LazyCurve(file_name="gear_twenty_sides")
+    human_arm_strong_side = LazyCurve(file_name="human_arm_strong_side")
+    human_baby_symbol = LazyCurve(file_name="human_baby_symbol")
+    human_ear = LazyCurve(file_name="human_ear")
+    human_enlight_shine_man = LazyCurve(file_name="human_enlight_shine_man")
+    human_eye_front_active = LazyCurve(file_name="human_eye_front_active")
+    human_eye_front_inactive = LazyCurve(file_name="human_eye_front_inactive")
+    human_eye_iris_closeup = LazyCurve(file_name="human_eye_iris_closeup")
+    human_face_side = LazyCurve(file_name="human_face_side")
+    human_foot_outline = LazyCurve(file_name="human_foot_outline")
+    human_foot_shoe_heel = LazyCurve(file_name="human_foot_shoe_heel")
+    human_foot_stylized = LazyCurve(file_name="human_foot_stylized")
+    human_hand_fist_stylized = LazyCurve(file_name="human_hand_fist_stylized")
+    human_hand_open_fingers = LazyCurve(file_name="human_hand_open_fingers")
+    human_hand_raising = LazyCurve(file_name="human_hand_raising")
+    human_hand_side = LazyCurve(file_name="human_hand_side")
+    human_hand_simplified = LazyCurve(file_name="human_hand_simplified")
+    human_hand_squared = LazyCurve(file_name="human_hand_squared")
+    human_hand_stylized = LazyCurve(file_name="human_hand_stylized")
+    human_head_gears_thinking = LazyCurve(file_name="human_head_gears_thinking")
+    human_head_outline_front = LazyCurve(file_name="human_head_outline_front")
+    human_head_outline_side = LazyCurve(file_name="human_head_outline_side")
+    human_man_open_arms = LazyCurve(file_name="human_man_open_arms")
+    human_man_running = LazyCurve(file_name="human_man_running")
+    human_man_torso_front = LazyCurve(file_name="human_man_torso_front")
+    human_man_walking = LazyCurve(file_name="human_man_walking")
+    human_man_wc = LazyCurve(file_name="human_man_wc")
+    human_man_ws_short = LazyCurve(file_name="human_man_ws_short")
+    human_mouth_lips = LazyCurve(file_name="human_mouth_lips")
+    human_skull_side = LazyCurve(file_name="human_skull_side")
+    human_strong_man_front = LazyCurve(file_name="human_strong_man_front")
+    human_symbol_eye_side = LazyCurve(file_name="human_symbol_eye_side")
+    human_walking_dog = LazyCurve(file_name="human_walking_dog")
+    human_woman_outline_front = LazyCurve(file_name="human_woman_outline_front")
+    human_woman_running = LazyCurve(file_name="human_woman_running")
+    human_woman_walking = LazyCurve(file_name="human_woman_walking")
+    human_woman_wc = LazyCurve(file_name="human_woman_wc")
+    icon_apple = LazyCurve(file_name="icon_apple")
+    icon_autodesk = LazyCurve(file_name="icon_autodesk")
+    icon_blender = LazyCurve(file_name="icon_blender")
+    icon_code_c_plus_plus = LazyCurve(file_name="icon_code_c_plus_plus")
+    icon_code_c_sharp = LazyCurve(file_name="icon_code_c_sharp")
+    icon_code_js_javascript = LazyCurve(file_name="icon_code_js_javascript")
+    icon_cursor = LazyCurve(file_name="icon_cursor")
+    icon_github_octocat = LazyCurve(file_name="icon_github_octocat")
+    icon_github_octocat_detailed = LazyCurve(file_name="icon_github_octocat_detailed")
+    icon_godot_logo = LazyCurve(file_name="icon_godot_logo")
+    icon_hand_click_index = LazyCurve(file_name="icon_hand_click_index")
+    icon_houdini_sidefx = LazyCurve(file_name="icon_houdini_sidefx")
+    icon_maya_autodesk_retro_word = LazyCurve(file_name="icon_maya_autodesk_retro_word")
+    icon_python = LazyCurve(file_name="icon_python")
+    icon_raspberry_pi = LazyCurve(file_name="icon_raspberry_pi")
+    icon_review_star = LazyCurve(file_name="icon_review_star")
+    icon_review_star_half = LazyCurve(file_name="icon_review_star_half")
+    icon_splash = LazyCurve(file_name="icon_splash")
+    icon_unity_logo = LazyCurve(file_name="icon_unity_logo")
+    icon_unity_logo_retro = LazyCurve(file_name="icon_unity_logo_retro")
+    icon_unreal_engine = LazyCurve(file_name="icon_unreal_engine")
+    icon_windows = LazyCurve(file_name="icon_windows")
+    icon_zbrush_maxon = LazyCurve(file_name="icon_zbrush_maxon")
+    letter_asterisk = LazyCurve(file_name="letter_asterisk")
+    line_two_points = LazyCurve(file_name="line_two_points")
+    locator = LazyCurve(file_name="locator")
+    locator_handle_arrows = LazyCurve(file_name="locator_handle_arrows")
+    locator_handle_xyz = LazyCurve(file_name="locator_handle_xyz")
+    locator_with_axis = LazyCurve(file_name="locator_with_axis")
+    peanut = LazyCurve(file_name="peanut")
+    pin = LazyCurve(file_name="pin")
+    pin_arrow_to_circle = LazyCurve(file_name="pin_arrow_to_circle")
+    pin_arrow_to_target = LazyCurve(file_name="pin_arrow_to_target")
+    pin_circle_to_arrow = LazyCurve(file_name="pin_circle_to_arrow")
+    pin_diamond_six_sides = LazyCurve(file_name="pin_diamond_six_sides")
+    pin_flag = LazyCurve(file_name="pin_flag")
+    pin_four_sides_flat_pyramids = LazyCurve(file_name="pin_four_sides_flat_pyramids")
+    pin_hollow_two_sides = LazyCurve(file_name="pin_hollow_two_sides")
+    pin_large = LazyCurve(file_name="pin_large")
+    pin_large_four_sides = LazyCurve(file_name="pin_large_four_sides")
+    pin_large_two_sides = LazyCurve(file_name="pin_large_two_sides")
+    pin_speech_bubble = LazyCurve(file_name="pin_speech_bubble")
+    pin_target_to_arrow = LazyCurve(file_name="pin_target_to_arrow")
+    primitive_cone = LazyCurve(file_name="primitive_cone")
+    primitive_cube = LazyCurve(file_name="primitive_cube")
+    primitive_hexagonal_tube = LazyCurve(file_name="primitive_hexagonal_tube")
+    primitive_pyramid = LazyCurve(file_name="primitive_pyramid")
+    primitive_pyramid_half = LazyCurve(file_name="primitive_pyramid_half")
+    primitive_tube = LazyCurve(file_name="primitive_tube")
+    primitive_tube_half = LazyCurve(file_name="primitive_tube_half")
+    primitive_tube_ring = LazyCurve(file_name="primitive_tube_ring")
+    revolve_profile_bottle_a = LazyCurve(file_name="revolve_profile_bottle_a")
+    revolve_profile_bowl_a = LazyCurve(file_name="revolve_profile_bowl_a")
+    revolve_profile_bowl_b = LazyCurve(file_name="revolve_profile_bowl_b")
+    revolve_profile_cork_a = LazyCurve(file_name="revolve_profile_cork_a")
+    revolve_profile_faucet_base_a = LazyCurve(file_name="revolve_profile_faucet_base_a")
+    revolve_profile_faucet_head_a = LazyCurve(file_name="revolve_profile_faucet_head_a")
+    revolve_profile_plate_b = LazyCurve(file_name="revolve_profile_plate_b")
+    revolve_profile_plate_c = LazyCurve(file_name="revolve_profile_plate_c")
+    rhombus = LazyCurve(file_name="rhombus")
+    rhombus_long = LazyCurve(file_name="rhombus_long")
+    sphere_dome = LazyCurve(file_name="sphere_dome")
+    sphere_four_directions = LazyCurve(file_name="sphere_four_directions")
+    sphere_half_arrow = LazyCurve(file_name="sphere_half_arrow")
+    sphere_half_double_arrows = LazyCurve(file_name="sphere_half_double_arrows")
+    sphere_half_double_arrows_skinny = LazyCurve(file_name="sphere_half_double_arrows_skinny")
+    sphere_half_four_arrows = LazyCurve(file_name="sphere_half_four_arrows")
+    sphere_half_top_four_arrows = LazyCurve(file_name="sphere_half_top_four_arrows")
+    sphere_half_two_arrows = LazyCurve(file_name="sphere_half_two_arrows")
+    sphere_joint = LazyCurve(file_name="sphere_joint")
+    sphere_joint_loc = LazyCurve(file_name="sphere_joint_loc")
+    sphere_joint_smooth = LazyCurve(file_name="sphere_joint_smooth")
+    sphere_two_directions = LazyCurve(file_name="sphere_two_directions")
+    spring = LazyCurve(file_name="spring")
+    spring_high_frequency = LazyCurve(file_name="spring_high_frequency")
+    spring_low_frequency = LazyCurve(file_name="spring_low_frequency")
+    square = LazyCurve(file_name="square")
+    squares_connected = LazyCurve(file_name="squares_connected")
+    square_corner_flat = LazyCurve(file_name="square_corner_flat")
+    square_corner_flat_skinny = LazyCurve(file_name="square_corner_flat_skinny")
+    swirl_five_spaces = LazyCurve(file_name="swirl_five_spaces")
+    swirl_thick_round_four_spaces = LazyCurve(file_name="swirl_thick_round_four_spaces")
+    swirl_thick_squared_four_spaces = LazyCurve(file_name="swirl_thick_squared_four_spaces")
+    swirl_two_spaces = LazyCurve(file_name="swirl_two_spaces")
+    switch_ik_fk_left = LazyCurve(file_name="switch_ik_fk_left")
+    switch_ik_fk_right = LazyCurve(file_name="switch_ik_fk_right")
+    symbol_attach_clip = LazyCurve(file_name="symbol_attach_clip")
+    symbol_attach_clip_squared = LazyCurve(file_name="symbol_attach_clip_squared")
+    symbol_batman_simplified = LazyCurve(file_name="symbol_batman_simplified")
+    symbol_bell = LazyCurve(file_name="symbol_bell")
+    symbol_bones_crossed = LazyCurve(file_name="symbol_bones_crossed")
+    symbol_bones_crossed_bottom = LazyCurve(file_name="symbol_bones_crossed_bottom")
+    symbol_bone_simple = LazyCurve(file_name="symbol_bone_simple")
+    symbol_bug_low_res_retro = LazyCurve(file_name="symbol_bug_low_res_retro")
+    symbol_bug_smoth = LazyCurve(file_name="symbol_bug_smoth")
+    symbol_camera_front = LazyCurve(file_name="symbol_camera_front")
+    symbol_camera_hollow = LazyCurve(file_name="symbol_camera_hollow")
+    symbol_camera_simple = LazyCurve(file_name="symbol_camera_simple")
+    symbol_canada_maple_leaf = LazyCurve(file_name="symbol_canada_maple_leaf")
+    symbol_card_suits_clover_clubs = LazyCurve(file_name="symbol_card_suits_clover_clubs")
+    symbol_card_suits_spades_pikes = LazyCurve(file_name="symbol_card_suits_spades_pikes")
+    symbol_chain_constraint = LazyCurve(file_name="symbol_chain_constraint")
+    symbol_chess_pawn_side = LazyCurve(file_name="symbol_chess_pawn_side")
+    symbol_chess_tower_rook = LazyCurve(file_name="symbol_chess_tower_rook")
+    symbol_code = LazyCurve(file_name="symbol_code")
+    symbol_computer_desktop = LazyCurve(file_name="symbol_computer_desktop")
+    symbol_connected_four = LazyCurve(file_name="symbol_connected_four")
+    symbol_connected_three_webhook = LazyCurve(file_name="symbol_connected_three_webhook")
+    symbol_controller_old = LazyCurve(file_name="symbol_controller_old")
+    symbol_control_pad = LazyCurve(file_name="symbol_control_pad")
+    symbol_cube_vertex_connected = LazyCurve(file_name="symbol_cube_vertex_connected")
+    symbol_danger_energy = LazyCurve(file_name="symbol_danger_energy")
+    symbol_diamond = LazyCurve(file_name="symbol_diamond")
+    symbol_dollar_sign_money = LazyCurve(file_name="symbol_dollar_sign_money")
+    symbol_eighteen_plus = LazyCurve(file_name="symbol_eighteen_plus")
+    symbol_emoji_one_hundred = LazyCurve(file_name="symbol_emoji_one_hundred")
+    symbol_emoji_poop = LazyCurve(file_name="symbol_emoji_poop")
+    symbol_emoji_robot = LazyCurve(file_name="symbol_emoji_robot")
+    symbol_emoji_skull = LazyCurve(file_name="symbol_emoji_skull")
+    symbol_emoji_smiley_face = LazyCurve(file_name="symbol_emoji_smiley_face")
+    symbol_emoji_smiley_ghost = LazyCurve(file_name="symbol_emoji_smiley_ghost")
+    symbol_emoji_smiley_missing = LazyCurve(file_name="symbol_emoji_smiley_missing")
+    symbol_emoji_thumbs_up = LazyCurve(file_name="symbol_emoji_thumbs_up")
+    symbol_family_holding_hands = LazyCurve(file_name="symbol_family_holding_hands")
+    symbol_female = LazyCurve(file_name="symbol_female")
+    symbol_filter = LazyCurve(file_name="symbol_filter")
+    symbol_flag_brazil = LazyCurve(file_name="symbol_flag_brazil")
+    symbol_flag_canada = LazyCurve(file_name="symbol_flag_canada")
+    symbol_flag_usa = LazyCurve(file_name="symbol_flag_usa")
+    symbol_flag_usa_simplified = LazyCurve(file_name="symbol_flag_usa_simplified")
+    symbol_flames = LazyCurve(file_name="symbol_flames")
+    symbol_focus_a = LazyCurve(file_name="symbol_focus_a")
+    symbol_food_fork_knife = LazyCurve(file_name="symbol_food_fork_knife")
+    symbol_four_loops = LazyCurve(file_name="symbol_four_loops")
+    symbol_frame_photo = LazyCurve(file_name="symbol_frame_photo")
+    symbol_game_controller_retro = LazyCurve(file_name="symbol_game_controller_retro")
+    symbol_heart = LazyCurve(file_name="symbol_heart")
+    symbol_heart_squared_smooth = LazyCurve(file_name="symbol_heart_squared_smooth")
+    symbol_hold_weapon_sword = LazyCurve(file_name="symbol_hold_weapon_sword")
+    symbol_human_dress = LazyCurve(file_name="symbol_human_dress")
+    symbol_human_man_touch = LazyCurve(file_name="symbol_human_man_touch")
+    symbol_human_shirt = LazyCurve(file_name="symbol_human_shirt")
+    symbol_icon_keyframe = LazyCurve(file_name="symbol_icon_keyframe")
+    symbol_infinite = LazyCurve(file_name="symbol_infinite")
+    symbol_key = LazyCurve(file_name="symbol_key")
+    symbol_key_front_simple = LazyCurve(file_name="symbol_key_front_simple")
+    symbol_key_side_detailed = LazyCurve(file_name="symbol_key_side_detailed")
+    symbol_key_side_round = LazyCurve(file_name="symbol_key_side_round")
+    symbol_key_side_squared = LazyCurve(file_name="symbol_key_side_squared")
+    symbol_key_squared = LazyCurve(file_name="symbol_key_squared")
+    symbol_kunai_knife = LazyCurve(file_name="symbol_kunai_knife")
+    symbol_letter = LazyCurve(file_name="symbol_letter")
+    symbol_lighting_energy_simple = LazyCurve(file_name="symbol_lighting_energy_simple")
+    symbol_lighting_energy_smooth = LazyCurve(file_name="symbol_lighting_energy_smooth")
+    symbol_lock_locked = LazyCurve(file_name="symbol_lock_locked")
+    symbol_lock_unlocked = LazyCurve(file_name="symbol_lock_unlocked")
+    symbol_magic_wand = LazyCurve(file_name="symbol_magic_wand")
+    symbol_male = LazyCurve(file_name="symbol_male")
+    symbol_man_fencing_sword = LazyCurve(file_name="symbol_man_fencing_sword")
+    symbol_man_front = LazyCurve(file_name="symbol_man_front")
+    symbol_man_strong = LazyCurve(file_name="symbol_man_strong")
+    symbol_music_two_notes = LazyCurve(file_name="symbol_music_two_notes")
+    symbol_music_two_notes_same = LazyCurve(file_name="symbol_music_two_notes_same")
+    symbol_old_sign = LazyCurve(file_name="symbol_old_sign")
+    symbol_omega = LazyCurve(file_name="symbol_omega")
+    symbol_paint_bucket = LazyCurve(file_name="symbol_paint_bucket")
+    symbol_parameters = LazyCurve(file_name="symbol_parameters")
+    symbol_pirate = LazyCurve(file_name="symbol_pirate")
+    symbol_pirate_skull_bones_crossed = LazyCurve(file_name="symbol_pirate_skull_bones_crossed")
+    symbol_pirate_sword_skull = LazyCurve(file_name="symbol_pirate_sword_skull")
+    symbol_plant_fin_grow = LazyCurve(file_name="symbol_plant_fin_grow")
+    symbol_plug = LazyCurve(file_name="symbol_plug")
+    symbol_plug_side = LazyCurve(file_name="symbol_plug_side")
+    symbol_pointy_sun = LazyCurve(file_name="symbol_pointy_sun")
+    symbol_puzzle = LazyCurve(file_name="symbol_puzzle")
+    symbol_question_mark = LazyCurve(file_name="symbol_question_mark")
+    symbol_radioactive = LazyCurve(file_name="symbol_radioactive")
+    symbol_radioactive_circle = LazyCurve(file_name="symbol_radioactive_circle")
+    symbol_shield_simple = LazyCurve(file_name="symbol_shield_simple")
+    symbol_smelly_poop = LazyCurve(file_name="symbol_smelly_poop")
+    symbol_snowflake = LazyCurve(file_name="symbol_snowflake")
+    symbol_snowflake_complex = LazyCurve(file_name="symbol_snowflake_complex")
+    symbol_snowflake_simplified = LazyCurve(file_name="symbol_snowflake_simplified")
+    symbol_speech_bubble = LazyCurve(file_name="symbol_speech_bubble")
+    symbol_squared_lock_locked = LazyCurve(file_name="symbol_squared_lock_locked")
+    symbol_squared_lock_unlocked = LazyCurve(file_name="symbol_squared_lock_unlocked")
+    symbol_sun_light = LazyCurve(file_name="symbol_sun_light")
+    symbol_sword = LazyCurve(file_name="symbol_sword")
+    symbol_tag_simple = LazyCurve(file_name="symbol_tag_simple")
+    symbol_tag_x = LazyCurve(file_name="symbol_tag_x")
+    symbol_tech_fan = LazyCurve(file_name="symbol_tech_fan")
+    symbol_tech_fan_case = LazyCurve(file_name="symbol_tech_fan_case")
+    symbol_three_hexagons = LazyCurve(file_name="symbol_three_hexagons")
+    symbol_tool_hammer = LazyCurve(file_name="symbol_tool_hammer")
+    symbol_uv_unwrapped = LazyCurve(file_name="symbol_uv_unwrapped")
+    symbol_virus_proteins = LazyCurve(file_name="symbol_virus_proteins")
+    symbol_wand_magic_star = LazyCurve(file_name="symbol_wand_magic_star")
+    symbol_wc_woman_front = LazyCurve(file_name="symbol_wc_woman_front")
+    symbol_woman_arms_up = LazyCurve(file_name="symbol_woman_arms_up")
+    symbol_wrench = LazyCurve(file_name="symbol_wrench")
+    symbol_zoom_in_plus = LazyCurve(file_name="symbol_zoom_in_plus")
+    target_aim_circle = LazyCurve(file_name="target_aim_circle")
+    target_aim_circle_drain = LazyCurve(file_name="target_aim_circle_drain")
+    target_circle = LazyCurve(file_name="target_circle")
+    target_circle_barrel_detailed = LazyCurve(file_name="target_circle_barrel_detailed")
+    target_squared = LazyCurve(file_name="target_squared")
+    target_squared_thick = LazyCurve(file_name="target_squared_thick")
+    target_square_circle_thick = LazyCurve(file_name="target_square_circle_thick")
+    target_wheel_helm_complex = LazyCurve(file_name="target_wheel_helm_complex")
+    target_wheel_helm_simple = LazyCurve(file_name="target_wheel_helm_simple")
+    tool_dial_caliper_measure = LazyCurve(file_name="tool_dial_caliper_measure")
+    tool_grass_cutter = LazyCurve(file_name="tool_grass_cutter")
+    tool_magnet = LazyCurve(file_name="tool_magnet")
+    tool_pair_scissors = LazyCurve(file_name="tool_pair_scissors")
+    tool_pickaxe = LazyCurve(file_name="tool_pickaxe")
+    tool_robot_arm_side = LazyCurve(file_name="tool_robot_arm_side")
+    tool_ruler = LazyCurve(file_name="tool_ruler")
+    tool_screwdriver = LazyCurve(file_name="tool_screwdriver")
+    tool_shovel = LazyCurve(file_name="tool_shovel")
+    tool_wrench = LazyCurve(file_name="tool_wrench")
+    triangle_pyramid_flat_four_arrows = LazyCurve(file_name="triangle_pyramid_flat_four_arrows")
+    triangle_pyramid_flat_two_arrows = LazyCurve(file_name="triangle_pyramid_flat_two_arrows")
+    ui_attention_exclamation = LazyCurve(file_name="ui_attention_exclamation")
+    weapon_battle_axe_side = LazyCurve(file_name="weapon_battle_axe_side")
+    weapon_dagger_top = LazyCurve(file_name="weapon_dagger_top")
+    weapon_grenade_launcher = LazyCurve(file_name="weapon_grenade_launcher")
+    weapon_hook_lance_teeth_thorn = LazyCurve(file_name="weapon_hook_lance_teeth_thorn")
+    weapon_mp4_rifle = LazyCurve(file_name="weapon_mp4_rifle")
+    weapon_pistols_crossed = LazyCurve(file_name="weapon_pistols_crossed")
+    weapon_pistol_modern_side = LazyCurve(file_name="weapon_pistol_modern_side")
+    weapon_pistol_side = LazyCurve(file_name="weapon_pistol_side")
+    weapon_rifle_modern = LazyCurve(file_name="weapon_rifle_modern")
+    weapon_shrunken_five = LazyCurve(file_name="weapon_shrunken_five")
+    weapon_shrunken_four = LazyCurve(file_name="weapon_shrunken_four")
+    weapon_shrunken_four_blades = LazyCurve(file_name="weapon_shrunken_four_blades")
+    weapon_sword_rapier = LazyCurve(file_name="weapon_sword_rapier")
+    weapon_symbol_bomb = LazyCurve(file_name="weapon_symbol_bomb")
+    weapon_symbol_bomb_two = LazyCurve(file_name="weapon_symbol_bomb_two")
+    weapon_symbol_grenade = LazyCurve(file_name="weapon_symbol_grenade")
 
 
 # ------------------------------ Curves Class Utilities Start ------------------------------
 
 
+def get_curve_library_names(library=None):
+    """
+    Gets the name of every curve found in a curve library class without reading their files.
+    Args:
+        library (type, optional): Class holding curves as attributes. If not provided, "Curves" is used.
+    Returns:
+        list: A list of attribute names (curve names) in the order they were declared.
+    """
+    if library is None:
+        library = Curves
+    return [key for key, value in vars(library).items() if isinstance(value, (LazyCurve, Curve))]
+
+
 def add_thumbnail_metadata_attr_to_selection():
     """
     Adds projection attributes to the selected objects.
@@ -1608,7 +1966,105 @@ def generate_package_curve_thumbnail(target_dir, curve, image_format="jpg", line
     return target_dir
 
 
-def generate_package_curves_thumbnails(target_dir=None, force=False):
+def get_curve_thumbnail_hash(curve, image_format="jpg", line_width=5, rgb_color=(1, 1, 0.1)):
+    """
+    Gets a hash describing the thumbnail of a curve. It changes when the curve data or the render settings change.
+    Args:
+        curve (Curve): The curve object displayed in the thumbnail.
+        image_format (str, optional): Format of the output file. Can be "jpg" or "png". Default: "jpg"
+        line_width (float, optional): Width of the line used for the rendered curves.
+        rgb_color (tuple, optional): A tuple representing red, green and blue values. e.g. (1, 0, 0) = Red
+    Returns:
+        str: Hash (SHA-1 hex digest) of the curve data and render settings.
+    """
+    thumbnail_data = {"curve": curve.get_data_as_dict(),
+                      "image_format": image_format,
+                      "line_width": line_width,
+                      "rgb_color": list(rgb_color)}
+    serialized_data = json.dumps(thumbnail_data, sort_keys=True, default=str)
+    return hashlib.sha1(serialized_data.encode("utf-8")).hexdigest()
+
+
+def read_curve_thumbnail_manifest(target_dir):
+    """
+    Reads the thumbnail manifest of a directory. The manifest stores the hash of every generated thumbnail.
+    Args:
+        target_dir (str): Path to the directory where the thumbnails are stored.
+    Returns:
+        dict: Curve names and the hashes of their thumbnails. Empty if the manifest is missing.
+    """
+    manifest_path = os.path.join(target_dir, CURVE_THUMBNAIL_MANIFEST)
+    if not os.path.exists(manifest_path):
+        return {}
+    return read_json_dict(manifest_path) or {}
+
+
+def get_curve_thumbnail_hashes(curve_names=None, image_format="jpg", line_width=5, rgb_color=(1, 1, 0.1)):
+    """
+    Gets the thumbnail hashes of multiple curves from the "Curves" class. (See "get_curve_thumbnail_hash")
+    Args:
+        curve_names (list, optional): Names of the curves. If not provided, all "Curves" are used.
+        image_format (str, optional): Format of the output file. Can be "jpg" or "png". Default: "jpg"
+        line_width (float, optional): Width of the line used for the rendered curves.
+        rgb_color (tuple, optional): A tuple representing red, green and blue values. e.g. (1, 0, 0) = Red
+    Returns:
+        dict: Curve names and their thumbnail hashes.
+    """
+    if curve_names is None:
+        curve_names = get_curve_library_names(library=Curves)
+    thumbnail_hashes = {}
+    for curve_name in curve_names:
+        curve_obj = getattr(Curves, curve_name, None)
+        if not curve_obj:
+            raise Exception(f'Missing curve: {curve_name}')
+        if not curve_obj.shapes:
+            raise Exception(f'Missing shapes for a curve: {curve_obj}')
+        thumbnail_hashes[curve_name] = get_curve_thumbnail_hash(curve=curve_obj, image_format=image_format,
+                                                                line_width=line_width, rgb_color=rgb_color)
+    return thumbnail_hashes
+
+
+def get_outdated_curve_thumbnails(target_dir, curve_names=None, image_format="jpg", line_width=5,
+                                  rgb_color=(1, 1, 0.1)):
+    """
+    Gets the curves that need a new thumbnail. A thumbnail is outdated when its image is missing or when the hash
+    stored in the manifest doesn't match the current curve data and render settings.
+    Args:
+        target_dir (str): Path to the directory where the thumbnails are stored.
+        curve_names (list, optional): Names of the curves to check. If not provided, all "Curves" are checked.
+        image_format (str, optional): Format of the output file. Can be "jpg" or "png". Default: "jpg"
+        line_width (float, optional): Width of the line used for the rendered curves.
+        rgb_color (tuple, optional): A tuple representing red, green and blue values. e.g. (1, 0, 0) = Red
+    Returns:
+        dict: Outdated curve names and their current thumbnail hash.
+    """
+    thumbnail_hashes = get_curve_thumbnail_hashes(curve_names=curve_names, image_format=image_format,
+                                                  line_width=line_width, rgb_color=rgb_color)
+    manifest = read_curve_thumbnail_manifest(target_dir)
+    outdated = {}
+    for curve_name, thumbnail_hash in thumbnail_hashes.items():
+        image_file = os.path.join(target_dir, f'{curve_name}.{image_format}')
+        if manifest.get(curve_name) != thumbnail_hash or not os.path.exists(image_file):
+            outdated[curve_name] = thumbnail_hash
+    return outdated
+
+
+def update_curve_thumbnail_manifest(target_dir, thumbnail_hashes):
+    """
+    Adds or updates entries in the thumbnail manifest of a directory.
+    Args:
+        target_dir (str): Path to the directory where the thumbnails are stored.
+        thumbnail_hashes (dict): Curve names and the hashes of their generated thumbnails.
+    Returns:
+        str or None: Path to the manifest file. None if it failed to write it.
+    """
+    manifest = read_curve_thumbnail_manifest(target_dir)
+    manifest.update(thumbnail_hashes)
+    return write_json(path=os.path.join(target_dir, CURVE_THUMBNAIL_MANIFEST), data=manifest)
+
+
+def generate_package_curves_thumbnails(target_dir=None, force=False, curve_names=None, incremental=True,
+                                       progress_callback=None, open_dir=True):
     """
     Iterates through the Curves class attributes rendering a thumbnail for each one of the found Curves.
     At the end of the operation, it opens the target directory.
@@ -1616,6 +2072,14 @@ def generate_package_curves_thumbnails(target_dir=None, force=False):
         target_dir (str, optional): Path to a directory where the thumbnails will be stored.
                                     If not provided, they are rendered to Desktop/curves_thumbnails
         force (bool, optional): If activated, it will skip the unsaved changes detected dialog and run.
+        curve_names (list, optional): Names of the curves to render. If not provided, all "Curves" are rendered.
+        incremental (bool, optional): If active, only curves with a missing or outdated thumbnail are rendered.
+                                      (Compares the curve data against the hashes stored in the manifest)
+        progress_callback (callable, optional): Called after each thumbnail with the number of rendered thumbnails,
+                                                the total and the curve name. e.g. callback(3, 10, "circle")
+        open_dir (bool, optional): If active, the target directory is opened at the end of the operation.
+    Returns:
+        list: Names of the curves that had their thumbnails rendered.
     """
     if cmds.file(q=True, modified=True) and not force:
         user_input = cmds.confirmDialog(title='Unsaved changes detected.',
@@ -1630,7 +2094,7 @@ def generate_package_curves_thumbnails(target_dir=None, force=False):
                                         icon="warning")
         if user_input == 'No':
             logger.warning("Thumbnail generation cancelled.")
-            return
+            return []
 
     if not target_dir or not os.path.exists(target_dir):
         from gt.utils.system_utils import get_desktop_path
@@ -1638,23 +2102,34 @@ def generate_package_curves_thumbnails(target_dir=None, force=False):
         if not os.path.exists(target_dir):
             os.makedirs(target_dir)
 
-    curve_attributes = vars(Curves)
-    curve_keys = [attr for attr in curve_attributes if not (attr.startswith('__') and attr.endswith('__'))]
-    for curve_key in curve_keys:
-        curve_obj = getattr(Curves, curve_key)
-        if not curve_obj:
-            raise Exception(f'Missing curve: {curve_key}')
-        if not curve_obj.shapes:
-            raise Exception(f'Missing shapes for a curve: {curve_obj}')
-        generate_package_curve_thumbnail(target_dir=target_dir, curve=curve_obj)
-    from gt.utils.system_utils import open_file_dir
-    open_file_dir(target_dir)
+    if incremental:
+        to_render = get_outdated_curve_thumbnails(target_dir=target_dir, curve_names=curve_names)
+    else:
+        to_render = get_curve_thumbnail_hashes(curve_names=curve_names)
+    rendered_hashes = {}
+    try:
+        for curve_name, thumbnail_hash in to_render.items():
+            curve_obj = getattr(Curves, curve_name)
+            generate_package_curve_thumbnail(target_dir=target_dir, curve=curve_obj)
+            rendered_hashes[curve_name] = thumbnail_hash
+            if callable(progress_callback):
+                progress_callback(len(rendered_hashes), len(to_render), curve_name)
+    finally:
+        if rendered_hashes:
+            update_curve_thumbnail_manifest(target_dir=target_dir, thumbnail_hashes=rendered_hashes)
+    if not to_render:
+        sys.stdout.write(f'All thumbnails are up to date: "{target_dir}".\n')
+    if open_dir:
+        from gt.utils.system_utils import open_file_dir
+        open_file_dir(target_dir)
     cmds.file(new=True, force=True)
+    return list(rendered_hashes)
 
 
 def print_code_for_crv_files(target_dir=None, ignore_private=True, use_output_window=False):
     """
     Internal function used to create Python code lines for every ".crv" file found in the "target_dir"
+    Curves stored in curve bundles (".crvb") found in the "target_dir" are also included.
     It prints all lines, so they can be copied/pasted into the Curves class.
     Curves starting with underscore "_" will be ignored as these are considered private curves (usually used for ctrls)
     Args:
@@ -1666,13 +2141,20 @@ def print_code_for_crv_files(target_dir=None, ignore_private=True, use_output_wi
     """
     if not target_dir:
         target_dir = DataDirConstants.DIR_CURVES
-    print_lines = []
+    curve_names = []
     for file in os.listdir(target_dir):
-        if file.endswith(".crv"):
-            file_stripped = file.replace('.crv', '')
-            line = f'{file_stripped} = get_curve(file_name="{file_stripped}")'
-            if file.startswith("_") and ignore_private:
-                continue
+        if file.endswith(f'.{CURVE_FILE_EXTENSION}'):
+            curve_names.append(file[:-len(f'.{CURVE_FILE_EXTENSION}')])
+        elif file.endswith(f'.{CURVE_BUNDLE_EXTENSION}'):
+            bundle = get_curve_bundle(file_path=os.path.join(target_dir, file))
+            if bundle:
+                curve_names.extend(bundle.get_curve_names())
+    print_lines = []
+    for curve_name in curve_names:
+        line = f'{curve_name} = LazyCurve(file_name="{curve_name}")'
+        if curve_name.startswith("_") and ignore_private:
+            continue
+        if line not in print_lines:  # Loose files can share a name with a bundled curve
             print_lines.append(line)
 
     output = ''
@@ -1773,8 +2255,10 @@ def get_python_shape_code(crv_list):
     output = ''
 
     for shape in shapes:
-        curve_data = zip(cmds.ls(f'{shape}.cv[*]', flatten=True), cmds.getAttr(f'{shape}.cv[*]'))
-        curve_data_list = list(curve_data)
+        shape_data = get_curve_shape_data(shape, decimals=None) or {}
+        cv_positions = [tuple(point) for point in shape_data.get("points", [])]
+        # Overlapping CVs of periodic curves are not listed, so "zip" ignores them
+        curve_data_list = list(zip(get_components(shape, component_type="cv"), cv_positions))
         # Assemble command:
         if curve_data_list:
             output += '# Shape state for "' + str(shape).split('|')[-1] + '":\n'
@@ -1965,7 +2449,9 @@ if __name__ == "__main__":
     logger.setLevel(logging.DEBUG)
     # add_thumbnail_metadata_attr_to_selection()
     # print_code_for_crv_files()
-    # write_curve_files_from_selection(target_dir=DataDirConstants.DIR_CURVES, overwrite=True)  # Extract Curve
+    # extract_curve_bundle(target_dir=r"curves_source")  # Package bundle to ".crv" files (for editing)
+    # write_curve_files_from_selection(target_dir=r"curves_source", overwrite=True)  # Extract Curve
+    # write_curve_bundle(source_dir=r"curves_source")  # ".crv" files to package bundle
     # generate_curves_thumbnails(target_dir=None, force=True)  # Generate Thumbnails - (target_dir=None = Desktop)
     crv_transform = cmds.ls(selection=True)[0]
     rescale_curve(curve_transform=crv_transform, scale=1.1)
@@ -0,0 +1,89 @@
+"""
+Anim Key Edit Plugin
+github.com/TrevisanGMW/gt-tools
+
+Registers the "gtAnimKeyEdit" command. It runs the key edit waiting in "anim_utils" (See "run_undoable_key_edit")
+and records its animation curve changes, so edits done through the API can be undone and redone.
+"""
+import maya.api.OpenMayaAnim as OpenMayaAnim
+import maya.api.OpenMaya as OpenMaya
+
+KEY_EDIT_COMMAND = "gtAnimKeyEdit"
+
+
+def maya_useNewAPI():
+    """
+    Tells Maya that this plugin uses the Python API 2.0
+    """
+    pass
+
+
+class AnimKeyEditCommand(OpenMaya.MPxCommand):
+    def __init__(self):
+        """
+        Initializes the command with empty change records.
+        """
+        super().__init__()
+        self.anim_change = OpenMayaAnim.MAnimCurveChange()
+        self.dg_modifier = OpenMaya.MDGModifier()
+
+    @staticmethod
+    def creator():
+        """
+        Creates a new instance of the command. (Used when registering it)
+        Returns:
+            AnimKeyEditCommand: New command instance.
+        """
+        return AnimKeyEditCommand()
+
+    def doIt(self, args):
+        """
+        Runs the pending key edit, recording its changes. Partial changes are reverted if the edit fails.
+        Args:
+            args (OpenMaya.MArgList): Command arguments. (Not used)
+        """
+        from gt.utils import anim_utils
+        try:
+            anim_utils.run_pending_key_edit(anim_change=self.anim_change, dg_modifier=self.dg_modifier)
+        except Exception:
+            self.undoIt()
+            raise
+
+    def redoIt(self):
+        """
+        Applies the recorded changes again. Animation curves are created before their keys are restored.
+        """
+        self.dg_modifier.doIt()
+        self.anim_change.redoIt()
+
+    def undoIt(self):
+        """
+        Reverts the recorded changes. Keys are reverted before created animation curves are deleted.
+        """
+        self.anim_change.undoIt()
+        self.dg_modifier.undoIt()
+
+    def isUndoable(self):
+        """
+        Returns:
+            bool: Always True, so the command is added to the undo queue.
+        """
+        return True
+
+
+def initializePlugin(plugin):
+    """
+    Registers the key edit command.
+    Args:
+        plugin (OpenMaya.MObject): Plugin object provided by Maya.
+    """
+    OpenMaya.MFnPlugin(plugin, "GT Tools").registerCommand(KEY_EDIT_COMMAND, AnimKeyEditCommand.creator)
+
+
+def uninitializePlugin(plugin):
+    """
+    Deregisters the key edit command.
+    Args:
+        plugin (OpenMaya.MObject): Plugin object provided by Maya.
+    """
+    OpenMaya.MFnPlugin(plugin).deregisterCommand(KEY_EDIT_COMMAND)
@@ -0,0 +1,97 @@
+"""
+Skin Weights Edit Plugin
+github.com/TrevisanGMW/gt-tools
+
+Registers the "gtSkinWeightsEdit" command. It runs the weights edit waiting in "skin_utils"
+(See "run_undoable_skin_edit") and records the replaced weights, so edits done through the API can be undone and redone.
+"""
+import maya.api.OpenMaya as OpenMaya
+
+SKIN_EDIT_COMMAND = "gtSkinWeightsEdit"
+
+
+def maya_useNewAPI():
+    """
+    Tells Maya that this plugin uses the Python API 2.0
+    """
+    pass
+
+
+class SkinWeightsEditCommand(OpenMaya.MPxCommand):
+    def __init__(self):
+        """
+        Initializes the command with an empty change record.
+        """
+        super().__init__()
+        self.weight_changes = []
+
+    @staticmethod
+    def creator():
+        """
+        Creates a new instance of the command. (Used when registering it)
+        Returns:
+            SkinWeightsEditCommand: New command instance.
+        """
+        return SkinWeightsEditCommand()
+
+    def doIt(self, args):
+        """
+        Runs the pending weights edit, recording its changes. Partial changes are reverted if the edit fails.
+        Args:
+            args (OpenMaya.MArgList): Command arguments. (Not used)
+        """
+        from gt.utils import skin_utils
+        try:
+            skin_utils.run_pending_skin_edit(weight_changes=self.weight_changes)
+        except Exception:
+            self.undoIt()
+            raise
+
+    def _set_weights(self, key, changes):
+        """
+        Sets the recorded weights of the provided changes. ("MFnSkinCluster.setWeights")
+        Args:
+            key (str): Recorded weights to set. "weights" (new) or "old_weights".
+            changes (list): Changes recorded by "skin_utils.apply_skin_weights_array".
+        """
+        for change in changes:
+            change.get("skin_cluster_fn").setWeights(change.get("geometry_path"), change.get("components"),
+                                                     change.get("influence_indices"), change.get(key),
+                                                     False)  # normalize=False
+
+    def redoIt(self):
+        """
+        Applies the recorded weights again.
+        """
+        self._set_weights(key="weights", changes=self.weight_changes)
+
+    def undoIt(self):
+        """
+        Restores the weights found before the edit. Changes are reverted in the reverse order they were made.
+        """
+        self._set_weights(key="old_weights", changes=reversed(self.weight_changes))
+
+    def isUndoable(self):
+        """
+        Returns:
+            bool: Always True, so the command is added to the undo queue.
+        """
+        return True
+
+
+def initializePlugin(plugin):
+    """
+    Registers the skin weights edit command.
+    Args:
+        plugin (OpenMaya.MObject): Plugin object provided by Maya.
+    """
+    OpenMaya.MFnPlugin(plugin, "GT Tools").registerCommand(SKIN_EDIT_COMMAND, SkinWeightsEditCommand.creator)
+
+
+def uninitializePlugin(plugin):
+    """
+    Deregisters the skin weights edit command.
+    Args:
+        plugin (OpenMaya.MObject): Plugin object provided by Maya.
+    """
+    OpenMaya.MFnPlugin(plugin).deregisterCommand(SKIN_EDIT_COMMAND)
@@ -29,6 +29,7 @@ class DataDirConstants:
     DIR_CONTROLS = os.path.join(DIR_DATA, 'controls')
     DIR_MESHES = os.path.join(DIR_DATA, 'meshes')
     DIR_PARAMETRIC_MESHES = os.path.join(DIR_DATA, 'py_meshes')
+    DIR_PLUGINS = os.path.join(DIR_DATA, 'plugins')
 
 
 def write_data(path, data):
@@ -402,5 +403,52 @@ def make_empty_file(path):
         logger.debug(f'Unable to create empty file. Issue {str(e)}')
 
 
+_directory_file_indexes = {}  # Directory path: (modification time, extensions, index)
+
+
+def get_directory_file_index(directory, extensions=None):
+    """
+    Gets a dictionary of the files found in a directory, keyed by their names without extension.
+    The directory is listed once and only listed again when its modification time changes (a file was added/removed).
+    This avoids checking the existence of every possible file individually. e.g. preview images of a library.
+
+    Args:
+        directory (str): Path to the directory to index.
+        extensions (list, optional): A list of accepted extensions (without the dot) in order of priority.
+                                     e.g. ["jpg", "png"] - If both "a.jpg" and "a.png" exist, "a" will be "a.jpg".
+                                     If not provided, all files are indexed.
+
+    Returns:
+        dict: A dictionary where the keys are the file names (without extension) and the values are their paths.
+              Empty if the directory is missing.
+    """
+    try:
+        modified_time = os.stat(directory).st_mtime_ns
+    except OSError:
+        return {}
+    extensions_key = tuple(extensions) if extensions else None
+    cached_index = _directory_file_indexes.get(directory)
+    if cached_index and cached_index[0] == modified_time and cached_index[1] == extensions_key:
+        return cached_index[2]
+
+    priorities = {extension.lower(): priority for priority, extension in enumerate(extensions_key or [])}
+    file_index = {}
+    file_priorities = {}
+    for entry in os.scandir(directory):
+        if not entry.is_file():
+            continue
+        file_name, extension = os.path.splitext(entry.name)
+        extension = extension[1:].lower()
+        if extensions_key:
+            if extension not in priorities:
+                continue
+            if file_name in file_priorities and file_priorities[file_name] <= priorities[extension]:
+                continue
+            file_priorities[file_name] = priorities[extension]
+        file_index[file_name] = entry.path
+    _directory_file_indexes[directory] = (modified_time, extensions_key, file_index)
+    return file_index
+
+
 if __name__ == "__main__":
     logger.setLevel(logging.DEBUG)
@@ -4,6 +4,7 @@ github.com/TrevisanGMW/gt-tools
 """
 from gt.utils.attr_utils import delete_user_defined_attrs, set_attr_state, DEFAULT_ATTRS
 from gt.utils.naming_utils import get_long_name, get_short_name
+from gt.utils.component_utils import get_components
 from gt.utils.transform_utils import match_transform
 from gt.utils.feedback_utils import log_when_true
 from gt.utils.node_utils import Node
@@ -177,6 +178,33 @@ def duplicate_object(obj, name=None, parent_to_world=True, reset_attributes=True
     return duplicated_obj
 
 
+def get_shape_component_set(shape, mesh_component_type="vertices", full_path=False):
+    """
+    Gets all components of a shape as a "ComponentSet", which behaves like a list of names, but only creates the names
+    when they are requested. (Use its "get_names" function to get compact names for Maya commands)
+    Only mesh and curve shapes are supported, as a set can only hold one component type of a node.
+    Args:
+        shape (str): The shape node.
+        mesh_component_type (str, optional): The type of component to return when the shape is of the type "mesh".
+                                             Can be: "vertices"/"vtx", "edges"/"e" or "faces"/"f".
+        full_path (bool, optional): when True, returns the full path to the components instead of their short name.
+    Returns:
+        ComponentSet or None: All components for the given shape. None if the shape or component type is not supported.
+    Example:
+        out = get_shape_component_set(shape=transform, mesh_component_type="faces")
+        print(out.get_names())  # ['cube_one.f[0:5]']
+    """
+    if not shape or not cmds.objExists(shape):
+        return
+    if cmds.nodeType(shape) == "mesh":
+        component_types = {"vertices": "vtx", "vtx": "vtx", "edges": "e", "e": "e", "faces": "f", "f": "f"}
+        component_type = component_types.get(mesh_component_type)
+        if component_type:
+            return get_components(shape, component_type=component_type, full_path=full_path)
+    elif cmds.nodeType(shape) == "nurbsCurve":
+        return get_components(shape, component_type="cv", full_path=full_path)
+
+
 def get_shape_components(shape, mesh_component_type="vertices", full_path=False):
     """
     Get all components of a shape.
@@ -188,31 +216,25 @@ def get_shape_components(shape, mesh_component_type="vertices", full_path=False)
         full_path (bool, optional): when True, returns the full path to the components instead of their short name.
     Returns:
         List[str]: List of all components for the given shape.
+                   (See "get_shape_component_set" to avoid creating one name per component)
     Example:
         out = get_shape_components(shape=transform, mesh_component_type="faces")
         print (out)  # ['cube_one.f[0]', 'cube_one.f[1]']
     """
     if not shape or not cmds.objExists(shape):
         return []
-    if cmds.nodeType(shape) == "mesh":
-        if mesh_component_type == 'vertices' or mesh_component_type == 'vtx':
-            return cmds.ls(f"{shape}.vtx[*]", flatten=True, long=full_path)
-        elif mesh_component_type == 'edges' or mesh_component_type == 'e':
-            return cmds.ls(f"{shape}.e[*]", flatten=True, long=full_path)
-        elif mesh_component_type == 'faces' or mesh_component_type == 'f':
-            return cmds.ls(f"{shape}.f[*]", flatten=True, long=full_path)
-        elif mesh_component_type == 'all':
-            components = cmds.ls(f"{shape}.vtx[*]", flatten=True, long=full_path)
-            components += cmds.ls(f"{shape}.e[*]", flatten=True, long=full_path)
-            components += cmds.ls(f"{shape}.f[*]", flatten=True, long=full_path)
-            return components
-        return []
+    if cmds.nodeType(shape) == "mesh" and mesh_component_type == 'all':
+        components = cmds.ls(f"{shape}.vtx[*]", flatten=True, long=full_path)
+        components += cmds.ls(f"{shape}.e[*]", flatten=True, long=full_path)
+        components += cmds.ls(f"{shape}.f[*]", flatten=True, long=full_path)
+        return components
     elif cmds.nodeType(shape) == "nurbsSurface":
         return cmds.ls(f"{shape}.cv[*][*]", flatten=True, long=full_path)
-    elif cmds.nodeType(shape) == "nurbsCurve":
-        return cmds.ls(f"{shape}.cv[*]", flatten=True, long=full_path)
-    else:
+    component_set = get_shape_component_set(shape=shape, mesh_component_type=mesh_component_type,
+                                            full_path=full_path)
+    if component_set is None:
         return []
+    return list(component_set)
 
 
 def create_group(name=None, children=None):
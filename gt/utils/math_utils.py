@@ -3,6 +3,7 @@ Math Utilities
 github.com/TrevisanGMW/gt-tools
 """
 
+from gt.utils.array_math_utils import get_path_length, get_points_center
 import maya.api.OpenMaya as OpenMaya
 import maya.cmds as cmds
 import logging
@@ -188,29 +189,29 @@ def dist_path_sum(input_list):
     Returns:
         float: The sum of distances between consecutive elements. For example: 12.0
     """
-    total_distance = 0
-    num_elements = len(input_list)
-
-    if num_elements < 2:
+    if len(input_list) < 2:
         logger.debug("At least two elements are required to properly calculate distances. "
                      "Distance is zero otherwise.")
-        return total_distance
-
-    for index in range(num_elements - 1):
-        element_a = input_list[index]
-        element_b = input_list[index + 1]
-        if isinstance(element_a, str):
-            element_a = cmds.xform(element_a, q=True, ws=True, t=True)
-        if isinstance(element_b, str):
-            element_b = cmds.xform(element_b, q=True, ws=True, t=True)
-        if isinstance(element_a, (tuple, list)) and isinstance(element_b, (tuple, list)):
-            distance = dist_xyz_to_xyz(element_a[0], element_a[1], element_a[2],   # A: XYZ
-                                       element_b[0], element_b[1], element_b[2])   # B: XYZ
-        else:
-            logger.warning("Unsupported types detected. Total distance might not be accurate. "
-                           "Please provide only Maya paths (str) or XYZ positions. (tuple/list)")
+        return 0
+
+    positions = []
+    for element in input_list:
+        if isinstance(element, str):
+            element = cmds.xform(element, q=True, ws=True, t=True)
+        positions.append(element if isinstance(element, (tuple, list)) else None)
+
+    if None in positions:
+        logger.warning("Unsupported types detected. Total distance might not be accurate. "
+                       "Please provide only Maya paths (str) or XYZ positions. (tuple/list)")
+    # Unsupported elements break the path (distances to and from them are ignored)
+    total_distance = 0
+    path = []
+    for position in positions + [None]:
+        if position is not None:
+            path.append(position[:3])
             continue
-        total_distance += distance
+        total_distance += get_path_length(path)
+        path = []
     return total_distance
 
 
@@ -264,7 +265,7 @@ def get_bbox_position(obj_list, alignment=None, axis="x"):
     bbox = cmds.exactWorldBoundingBox(all_points)
     bb_min = bbox[:3]
     bb_max = bbox[3:6]
-    mid_point = list((b_max + b_min) / 2 for b_min, b_max in zip(bb_min, bb_max))
+    mid_point = list(get_points_center([bb_min, bb_max]))
 
     index = {"x": 0, "y": 1, "z": 2}[axis]
     if alignment == "+":
@@ -286,35 +287,11 @@ def get_transforms_center_position(transform_list):
     Returns:
         tuple: Center position as a tuple (x, y, z).
     """
-    # Initialize variables to store total position and count
-    total_position = [0, 0, 0]
-    num_transforms = 0
-
-    # Iterate through each transform
-    for transform_name in transform_list:
-        # Check if the transform exists
-        if cmds.objExists(transform_name):
-            # Get the translation values of the transform
-            transform_position = cmds.xform(transform_name, query=True, translation=True, worldSpace=True)
-            # Add the position values to the total
-            total_position[0] += transform_position[0]
-            total_position[1] += transform_position[1]
-            total_position[2] += transform_position[2]
-            num_transforms += 1  # Increment the count of existing transforms
-
-    # Check if any transforms exist
-    if num_transforms == 0:
-        # If no transforms exist, return the origin
-        return 0, 0, 0
-
-    # Calculate the average position by dividing the total by the number of existing transforms
-    center_position = (
-        total_position[0] / num_transforms,
-        total_position[1] / num_transforms,
-        total_position[2] / num_transforms
-    )
-
-    return center_position
+    positions = [cmds.xform(transform, query=True, translation=True, worldSpace=True)
+                 for transform in transform_list if cmds.objExists(transform)]
+    if not positions:
+        return 0, 0, 0  # If no transforms exist, return the origin
+    return get_points_center(positions)
 
 
 def remap_value(value, old_range, new_range):
@@ -4,7 +4,8 @@ github.com/TrevisanGMW/gt-tools
 """
 from gt.utils.data.py_meshes import scale_volume, scene_setup
 from gt.utils import system_utils, iterable_utils
-from gt.utils.data_utils import DataDirConstants
+from gt.utils.data_utils import DataDirConstants, get_directory_file_index
+from gt.utils.component_utils import get_components
 from collections import namedtuple
 import maya.cmds as cmds
 import logging
@@ -59,10 +60,8 @@ def get_mesh_preview_image_path(mesh_name, parametric=False):
     _dir = DataDirConstants.DIR_MESHES
     if parametric:
         _dir = os.path.join(DataDirConstants.DIR_PARAMETRIC_MESHES, "preview_images")
-    for ext in ["jpg", "png"]:
-        path_to_image = os.path.join(_dir, f'{mesh_name}.{ext}')
-        if os.path.exists(path_to_image):
-            return path_to_image
+    preview_images = get_directory_file_index(_dir, extensions=["jpg", "png"])
+    return preview_images.get(mesh_name)
 
 
 def convert_bif_to_mesh():
@@ -122,7 +121,7 @@ def convert_bif_to_mesh():
                     except Exception as e:
                         logger.debug(str(e))
 
-                    vtx = cmds.ls(bif_mesh + '.vtx[*]', fl=True) or []
+                    vtx = get_components(bif_mesh, component_type="vtx")
                     if len(vtx) == 0:
                         try:
                             cmds.delete(bif_mesh)
@@ -142,6 +141,7 @@ def get_vertices(mesh):
     """
     Retrieves the vertices of a given mesh.
     This function returns a list of vertex names that belong to the specified mesh.
+    (See "get_vertex_set" to avoid creating one name per vertex)
 
     Args:
         mesh (str): The name of the mesh for which vertices will be retrieved.
@@ -159,11 +159,32 @@ def get_vertices(mesh):
         print(vertices)
         # A list: 'my_mesh.vtx[0]', 'my_mesh.vtx[1]', 'my_mesh.vtx[2]', ...
     """
+    return list(get_vertex_set(mesh))
 
+
+def get_vertex_set(mesh):
+    """
+    Retrieves the vertices of a given mesh as a component set.
+    It behaves like a list of vertex names, but the names are only created when requested.
+
+    Args:
+        mesh (str): The name of the mesh for which vertices will be retrieved.
+
+    Returns:
+        ComponentSet: A component set representing the vertices of the specified mesh.
+                      Use "get_indices" for their indices or "get_names" for compact names. e.g. "my_mesh.vtx[0:7]"
+
+    Raises:
+        ValueError: If the provided 'mesh' name does not correspond to an existing mesh.
+
+    Examples:
+        vertices = get_vertex_set('my_mesh')
+        print(vertices.get_names())
+        # ['my_mesh.vtx[0:7]']
+    """
     if not cmds.objExists(mesh):
         raise ValueError(f'The mesh "{mesh}" does not exist.')
-    vertices = cmds.ls(f"{mesh}.vtx[*]", flatten=True)
-    return vertices
+    return get_components(mesh, component_type="vtx")
 
 
 def import_obj_file(file_path):
@@ -2,6 +2,7 @@
 Scene Utilities
 github.com/TrevisanGMW/gt-tools
 """
+import maya.api.OpenMaya as OpenMaya
 import maya.cmds as cmds
 import subprocess
 import logging
@@ -13,6 +14,8 @@ logging.basicConfig()
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+_active_scene_query_cache = None  # Used by the query functions below while a "SceneQueryCache" context is active
+
 
 def get_frame_rate():
     """
@@ -116,6 +119,243 @@ def open_file_dir():
         cmds.warning('Unable to open directory. File was never saved.')
 
 
+class SceneQueryCache:
+    def __init__(self):
+        """
+        Memoizes scene queries that are repeated many times during long operations. (e.g. building a rig)
+        While used as a context manager ("with SceneQueryCache():"), the functions "get_objects_of_type",
+        "get_parent_path" and "attr_path_exists" answer from it.
+
+        Scene callbacks clear the cache when nodes are added, removed, renamed or re-parented.
+        Maya has no callback for attributes added to any node, so only existing attributes are cached.
+        Missing attributes are always queried, as they could be added with "cmds.addAttr" at any time.
+        """
+        self.objects_of_type = {}  # Key: object type, Value: list of long names
+        self.parent_paths = {}  # Key: object, Value: list with parent long name (empty if parented to the world)
+        self.existing_attrs = set()  # Attribute paths found in the scene
+        self.hit_count = 0
+        self.miss_count = 0
+        self.callback_ids = []
+        self.is_active = False
+
+    def __enter__(self):
+        """
+        Activates the cache, so the query functions answer from it.
+        If another cache is already active (nested contexts), the outer cache is used instead.
+        """
+        global _active_scene_query_cache
+        if _active_scene_query_cache is None:
+            _active_scene_query_cache = self
+            self.is_active = True
+            self.add_callbacks()
+        return _active_scene_query_cache
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """
+        Deactivates the cache and removes its scene callbacks.
+        """
+        global _active_scene_query_cache
+        if self.is_active:
+            self.remove_callbacks()
+            self.is_active = False
+            _active_scene_query_cache = None
+            logger.debug(f'Scene query cache: {self.hit_count} hits, {self.miss_count} misses.')
+
+    def add_callbacks(self):
+        """
+        Adds scene callbacks used to detect when nodes are added, removed, renamed or re-parented.
+        """
+        self.callback_ids.append(OpenMaya.MDGMessage.addNodeAddedCallback(self.on_scene_changed, "dependNode"))
+        self.callback_ids.append(OpenMaya.MDGMessage.addNodeRemovedCallback(self.on_scene_changed, "dependNode"))
+        self.callback_ids.append(OpenMaya.MNodeMessage.addNameChangedCallback(OpenMaya.MObject.kNullObj,
+                                                                              self.on_scene_changed))
+        self.callback_ids.append(OpenMaya.MDagMessage.addAllDagChangesCallback(self.on_scene_changed))
+
+    def remove_callbacks(self):
+        """
+        Removes scene callbacks added by this cache.
+        """
+        for callback_id in self.callback_ids:
+            try:
+                OpenMaya.MMessage.removeCallback(callback_id)
+            except Exception as e:
+                logger.debug(f'Unable to remove scene query cache callback. Issue: {str(e)}')
+        self.callback_ids = []
+
+    def on_scene_changed(self, *args):
+        """
+        Called when nodes are added, removed, renamed or re-parented. Clears all cached queries.
+        """
+        self.clear()
+
+    def clear(self, attributes_only=False):
+        """
+        Clears cached queries.
+        Args:
+            attributes_only (bool, optional): If active, only attribute queries are cleared.
+        """
+        self.existing_attrs.clear()
+        if not attributes_only:
+            self.objects_of_type.clear()
+            self.parent_paths.clear()
+
+    def get_stats(self):
+        """
+        Gets the number of queries answered from the cache (hits) and from the scene (misses).
+        Returns:
+            dict: A dictionary with the keys "hits" and "misses".
+        """
+        return {"hits": self.hit_count, "misses": self.miss_count}
+
+    def get_objects_of_type(self, obj_type):
+        """
+        Cached version of "cmds.ls(typ=obj_type, long=True)"
+        Args:
+            obj_type (str): Type of objects to list.
+        Returns:
+            list: Long names of the objects of the given type.
+        """
+        if obj_type in self.objects_of_type:
+            self.hit_count += 1
+        else:
+            self.miss_count += 1
+            self.objects_of_type[obj_type] = cmds.ls(typ=obj_type, long=True) or []
+        return list(self.objects_of_type.get(obj_type))
+
+    def get_parent_path(self, obj):
+        """
+        Cached version of "cmds.listRelatives(obj, parent=True, fullPath=True)"
+        Args:
+            obj (str): Object to get the parent of.
+        Returns:
+            list: A list with the long name of the parent. Empty if the object has no parent.
+        """
+        obj = str(obj)
+        if obj in self.parent_paths:
+            self.hit_count += 1
+        else:
+            self.miss_count += 1
+            self.parent_paths[obj] = cmds.listRelatives(obj, parent=True, fullPath=True) or []
+        return list(self.parent_paths.get(obj))
+
+    def attr_path_exists(self, attribute_path):
+        """
+        Cached version of "cmds.objExists(attribute_path)"
+        Only existing attributes are cached. Missing attributes are queried again every time.
+        Args:
+            attribute_path (str): Path to an attribute. e.g. "pCube1.tx"
+        Returns:
+            bool: True if the attribute exists, False otherwise.
+        """
+        attribute_path = str(attribute_path)
+        if attribute_path in self.existing_attrs:
+            self.hit_count += 1
+            return True
+        self.miss_count += 1
+        if cmds.objExists(attribute_path):
+            self.existing_attrs.add(attribute_path)
+            return True
+        return False
+
+
+class CreatedNodesRecorder:
+    def __init__(self):
+        """
+        Records the nodes created while used as a context manager: "with CreatedNodesRecorder() as recorder:"
+        Nodes are stored as handles, so nodes deleted or renamed after their creation are handled correctly.
+        """
+        self.node_handles = []
+        self.callback_id = None
+
+    def __enter__(self):
+        """
+        Starts recording created nodes.
+        """
+        self.callback_id = OpenMaya.MDGMessage.addNodeAddedCallback(self.on_node_added, "dependNode")
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """
+        Stops recording created nodes.
+        """
+        if self.callback_id is not None:
+            try:
+                OpenMaya.MMessage.removeCallback(self.callback_id)
+            except Exception as e:
+                logger.debug(f'Unable to remove created nodes recorder callback. Issue: {str(e)}')
+            self.callback_id = None
+
+    def on_node_added(self, node, *args):
+        """
+        Called when a node is created.
+        Args:
+            node (OpenMaya.MObject): Created node.
+        """
+        self.node_handles.append(OpenMaya.MObjectHandle(node))
+
+    def get_uuids(self):
+        """
+        Gets the Maya UUIDs of the recorded nodes that still exist.
+        Returns:
+            list: A list of Maya UUIDs (strings). Use "cmds.ls(uuids, long=True)" to get their names.
+        """
+        uuids = []
+        for handle in self.node_handles:
+            if handle.isValid() and handle.isAlive():
+                uuids.append(OpenMaya.MFnDependencyNode(handle.object()).uuid().asString())
+        return uuids
+
+
+def get_objects_of_type(obj_type):
+    """
+    Lists the objects of the given type. Answered from the active "SceneQueryCache" if there is one.
+    Args:
+        obj_type (str): Type of objects to list.
+    Returns:
+        list: Long names of the objects of the given type.
+    """
+    if _active_scene_query_cache is not None:
+        return _active_scene_query_cache.get_objects_of_type(obj_type)
+    return cmds.ls(typ=obj_type, long=True) or []
+
+
+def get_parent_path(obj):
+    """
+    Gets the parent of an object. Answered from the active "SceneQueryCache" if there is one.
+    Args:
+        obj (str): Object to get the parent of.
+    Returns:
+        list: A list with the long name of the parent. Empty if the object has no parent.
+    """
+    if _active_scene_query_cache is not None:
+        return _active_scene_query_cache.get_parent_path(obj)
+    return cmds.listRelatives(obj, parent=True, fullPath=True) or []
+
+
+def attr_path_exists(attribute_path):
+    """
+    Checks if an attribute exists. Answered from the active "SceneQueryCache" if there is one.
+    Args:
+        attribute_path (str): Path to an attribute. e.g. "pCube1.tx"
+    Returns:
+        bool: True if the attribute exists, False otherwise.
+    """
+    if _active_scene_query_cache is not None:
+        return _active_scene_query_cache.attr_path_exists(attribute_path)
+    return cmds.objExists(attribute_path)
+
+
+def invalidate_scene_query_cache(attributes_only=False):
+    """
+    Clears the active "SceneQueryCache" (if there is one). Used by helpers that change the scene in ways
+    the cache can't detect. (e.g. adding or deleting attributes)
+    Args:
+        attributes_only (bool, optional): If active, only attribute queries are cleared.
+    """
+    if _active_scene_query_cache is not None:
+        _active_scene_query_cache.clear(attributes_only=attributes_only)
+
+
 if __name__ == "__main__":
     from pprint import pprint
     out = None
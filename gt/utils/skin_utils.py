@@ -2,19 +2,42 @@
 Skin Utilities
 github.com/TrevisanGMW/gt-tools
 """
-from gt.utils.data_utils import write_json, read_json_dict
+from gt.utils.data_utils import write_json, read_json_dict, DataDirConstants
 from gt.utils.feedback_utils import print_when_true
-from gt.utils.string_utils import extract_digits
-from gt.utils.mesh_utils import get_vertices
+from gt.utils.plugin_utils import load_plugin
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import maya.api.OpenMayaAnim as OpenMayaAnim
+import maya.api.OpenMaya as OpenMaya
 import maya.cmds as cmds
 import os.path
+import contextlib
+import functools
 import logging
+import itertools
+import struct
+import array
+import json
+import zlib
+import time
+import sys
 
 # Logging Setup
 logging.basicConfig()
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# Constants
+SKIN_WEIGHTS_FILE_EXTENSION = "skwb"
+SKIN_WEIGHTS_FILE_MAGIC = b'GTSKWB'
+SKIN_WEIGHTS_FILE_VERSION = 1
+SKIN_WEIGHTS_FILE_HEADER_FORMAT = '<6sHI'  # Magic, version, index size
+SKIN_WEIGHTS_BLOCK_HEADER_FORMAT = '<III'  # Vertex count, weight count, data size
+SKIN_WEIGHTS_BLOCK_SIZE = 4096  # Vertices per block (Reading never decodes more than one block at a time)
+SKIN_WEIGHTS_IO_WORKERS = 4  # Threads compressing/writing or reading/decompressing skin weights files
+SKIN_EDIT_PLUGIN = os.path.join(DataDirConstants.DIR_PLUGINS, "gt_skin_weights_edit.py")
+SKIN_EDIT_COMMAND = "gtSkinWeightsEdit"
+_pending_skin_edit = {}  # Weights edit waiting to be run by the skin edit command. (See "run_undoable_skin_edit")
+
 
 def get_skin_cluster(obj):
     """
@@ -127,12 +150,450 @@ def get_skin_cluster_from_geometry(skin_cluster):
     return list(affected_geometry)
 
 
+class SkinWeights:
+    def __init__(self, influences, weights):
+        """
+        Skin weights of all vertices stored in a single flat array. (Compact alternative to the dictionary format)
+        The weight of vertex "v" for influence "i" is stored at the index "v * len(influences) + i".
+
+        Args:
+            influences (list): Influence names. Their order determines the order of the weights of each vertex.
+            weights (array.array, list): Flat list of weights. Its length must be a multiple of the influence count.
+
+        Raises:
+            ValueError: If the number of weights doesn't match the number of influences.
+        """
+        self.influences = list(influences)
+        if isinstance(weights, array.array) and weights.typecode == 'd':
+            self.weights = weights
+        else:
+            self.weights = array.array('d', weights)
+        if self.influences and len(self.weights) % len(self.influences):
+            raise ValueError(f'Invalid skin weights. {len(self.weights)} weights can\'t be split between '
+                             f'{len(self.influences)} influences.')
+
+    def __repr__(self):
+        """
+        Returns a short description of the skin weights (counts only, weights can be very long)
+        """
+        return f'SkinWeights(vertices={self.get_vertex_count()}, influences={len(self.influences)})'
+
+    def get_vertex_count(self):
+        """
+        Gets the number of vertices described by the weights.
+        Returns:
+            int: Number of vertices.
+        """
+        if not self.influences:
+            return 0
+        return len(self.weights) // len(self.influences)
+
+    def get_vertex_weights(self, vertex_id):
+        """
+        Gets the weights of a vertex for all influences.
+        Args:
+            vertex_id (int): Index of the vertex.
+        Returns:
+            array.array: Weights of the vertex. Same order as the influences.
+        """
+        influence_count = len(self.influences)
+        return self.weights[vertex_id * influence_count:(vertex_id + 1) * influence_count]
+
+    def get_sparse_weights(self, ignore_below=0.00000001):
+        """
+        Gets only the weights that affect the vertices in a compressed sparse row (CSR) layout.
+        The weights of vertex "v" are found between "offsets[v]" and "offsets[v + 1]".
+
+        Args:
+            ignore_below (float, optional): Weights smaller than this value are skipped.
+
+        Returns:
+            tuple: (offsets, influence_indices, values)
+                   offsets (array.array): Start of each vertex in the other arrays. (vertex count + 1 values)
+                   influence_indices (array.array): Index of the influence of each stored weight.
+                   values (array.array): Stored weights.
+        """
+        influence_count = len(self.influences) or 1
+        weights = self.weights
+        positions = [position for position, weight in enumerate(weights) if weight >= ignore_below]  # Single pass
+        vertex_counts = [0] * (self.get_vertex_count() + 1)
+        for position in positions:
+            vertex_counts[position // influence_count + 1] += 1
+        offsets = array.array('I', itertools.accumulate(vertex_counts))
+        influence_indices = array.array('I', [position % influence_count for position in positions])
+        values = array.array('d', [weights[position] for position in positions])
+        return offsets, influence_indices, values
+
+    def to_dict(self, ignore_below=0.00000001):
+        """
+        Gets the weights in the dictionary format. (Same format returned by "get_skin_weights")
+        Args:
+            ignore_below (float, optional): Weights smaller than this value are skipped.
+        Returns:
+            dict: Vertex indices (as strings) and a dictionary with the influences that affect them and their weights.
+                  e.g. {'0': {'joint1': 0.75, 'joint2': 0.25}, '1': {'joint2': 1.0}}
+        """
+        skin_data = {}
+        offsets, influence_indices, values = self.get_sparse_weights(ignore_below=ignore_below)
+        influences = self.influences
+        for vertex_id in range(len(offsets) - 1):
+            start, end = offsets[vertex_id], offsets[vertex_id + 1]
+            skin_data[str(vertex_id)] = {influences[influence_indices[index]]: values[index]
+                                         for index in range(start, end)}
+        return skin_data
+
+    @classmethod
+    def from_dict(cls, skin_data, influences=None):
+        """
+        Creates a SkinWeights object from weights in the dictionary format. (Same format returned by "get_skin_weights")
+        Vertices missing from the dictionary get zero weights.
+
+        Args:
+            skin_data (dict): Vertex indices (int or str) and a dictionary with influences and weights.
+                              e.g. {'0': {'joint1': 0.75, 'joint2': 0.25}, '1': {'joint2': 1.0}}
+            influences (list, optional): Influence order. If not provided, influences are sorted in the order
+                                         they are found. Influences missing from this list are added to its end.
+        Returns:
+            SkinWeights: Skin weights with the same values found in the dictionary.
+        """
+        influences = list(influences or [])
+        influence_indices = {influence: index for index, influence in enumerate(influences)}
+        vertex_weights = {}
+        for vertex_id, weights in skin_data.items():
+            vertex_weights[int(vertex_id)] = weights
+            for influence in weights:
+                if influence not in influence_indices:
+                    influence_indices[influence] = len(influences)
+                    influences.append(influence)
+        vertex_count = max(vertex_weights) + 1 if vertex_weights else 0
+        influence_count = len(influences)
+        flat_weights = array.array('d', bytes(8 * vertex_count * influence_count))  # Zeros
+        for vertex_id, weights in vertex_weights.items():
+            vertex_start = vertex_id * influence_count
+            for influence, weight in weights.items():
+                flat_weights[vertex_start + influence_indices[influence]] = weight
+        return cls(influences=influences, weights=flat_weights)
+
+    @classmethod
+    def from_sparse(cls, influences, offsets, influence_indices, values):
+        """
+        Creates a SkinWeights object from weights in the compressed sparse row (CSR) layout.
+        Reverse of "get_sparse_weights".
+
+        Args:
+            influences (list): Influence names.
+            offsets (array.array, list): Start of each vertex in the other arrays. (vertex count + 1 values)
+            influence_indices (array.array, list): Index of the influence of each stored weight.
+            values (array.array, list): Stored weights.
+        Returns:
+            SkinWeights: Skin weights with zeros where no weight was stored.
+        """
+        influence_count = len(influences)
+        vertex_count = len(offsets) - 1
+        flat_weights = array.array('d', bytes(8 * vertex_count * influence_count))  # Zeros
+        for vertex_id in range(vertex_count):
+            vertex_start = vertex_id * influence_count
+            for index in range(offsets[vertex_id], offsets[vertex_id + 1]):
+                flat_weights[vertex_start + influence_indices[index]] = values[index]
+        return cls(influences=influences, weights=flat_weights)
+
+    def get_block(self, start_vertex, vertex_count):
+        """
+        Gets a copy of the weights of a range of vertices.
+        Args:
+            start_vertex (int): Index of the first vertex.
+            vertex_count (int): Number of vertices to include.
+        Returns:
+            SkinWeights: Skin weights of the requested vertices. (Same influences)
+        """
+        influence_count = len(self.influences)
+        weights = self.weights[start_vertex * influence_count:(start_vertex + vertex_count) * influence_count]
+        return SkinWeights(influences=self.influences, weights=weights)
+
+
+def get_skin_cluster_fn(skin_cluster):
+    """
+    Gets an OpenMaya function set for the given skin cluster. Used to read and write weights in bulk.
+
+    Args:
+        skin_cluster (str): The name of the skin cluster.
+
+    Raises:
+        ValueError: If the provided skin_cluster does not exist in the scene.
+
+    Returns:
+        tuple: (skin_cluster_fn, geometry_path, vertex_count)
+               skin_cluster_fn (MFnSkinCluster): Function set attached to the skin cluster.
+               geometry_path (MDagPath): Path to the deformed geometry.
+               vertex_count (int): Number of vertices (components) in the deformed geometry.
+    """
+    if not cmds.objExists(skin_cluster):
+        raise ValueError("Skin cluster '{}' does not exist.".format(skin_cluster))
+    selection = OpenMaya.MSelectionList()
+    selection.add(skin_cluster)
+    skin_cluster_fn = OpenMayaAnim.MFnSkinCluster(selection.getDependNode(0))
+    geometry_path = skin_cluster_fn.getPathAtIndex(0)
+    vertex_count = OpenMaya.MItGeometry(geometry_path).count()
+    return skin_cluster_fn, geometry_path, vertex_count
+
+
+def get_vertex_components(vertex_ids):
+    """
+    Creates a vertex component object. Used to read or write the weights of multiple vertices in a single call.
+
+    Args:
+        vertex_ids (int, list): Vertex indices. If an integer is provided, all vertices from zero to it are used.
+
+    Returns:
+        MObject: A mesh vertex component with the requested indices.
+    """
+    component_fn = OpenMaya.MFnSingleIndexedComponent()
+    components = component_fn.create(OpenMaya.MFn.kMeshVertComponent)
+    if isinstance(vertex_ids, int):
+        component_fn.setCompleteData(vertex_ids)
+    else:
+        component_fn.addElements(list(vertex_ids))
+    return components
+
+
+def get_skin_weights_array(skin_cluster):
+    """
+    Retrieve the skin weights of all vertices of a skin cluster in a single call. ("MFnSkinCluster.getWeights")
+
+    Args:
+        skin_cluster (str): The name of the skin cluster to query.
+
+    Raises:
+        ValueError: If the provided skin_cluster does not exist in the scene.
+
+    Returns:
+        SkinWeights: Flat array with the weights of every vertex for every influence of the skin cluster.
+                     Use "to_dict()" to get the same dictionary returned by "get_skin_weights".
+    """
+    skin_cluster_fn, geometry_path, vertex_count = get_skin_cluster_fn(skin_cluster)
+    influences = [path.partialPathName() for path in skin_cluster_fn.influenceObjects()]
+    components = get_vertex_components(vertex_count)
+    weights, _influence_count = skin_cluster_fn.getWeights(geometry_path, components)
+    return SkinWeights(influences=influences, weights=array.array('d', weights))
+
+
+def get_influence_index_map(source_influences, target_influences, influence_remap=None):
+    """
+    Finds the index of each source influence in the target influences list.
+    Influences are matched by (in order): remapped name, exact name, and short name. (No path or namespace)
+
+    Args:
+        source_influences (list): Influence names found in the weights data.
+        target_influences (list): Influence names used by the skin cluster.
+        influence_remap (dict, optional): Source names (keys) and the target names to use instead (values).
+                                          e.g. {"old_root_jnt": "root_jnt"}
+
+    Returns:
+        dict: Source influence index (key) and target influence index (value). Unmatched influences are skipped.
+    """
+    influence_remap = influence_remap or {}
+
+    def get_short_name(name):
+        return name.split("|")[-1].split(":")[-1]
+
+    target_indices = {influence: index for index, influence in enumerate(target_influences)}
+    short_name_indices = {}
+    for index, influence in enumerate(target_influences):
+        short_name_indices.setdefault(get_short_name(influence), []).append(index)
+
+    index_map = {}
+    for source_index, influence in enumerate(source_influences):
+        influence = influence_remap.get(influence, influence)
+        if influence in target_indices:
+            index_map[source_index] = target_indices.get(influence)
+            continue
+        matches = short_name_indices.get(get_short_name(influence), [])
+        if len(matches) == 1:
+            index_map[source_index] = matches[0]
+    return index_map
+
+
+def set_skin_weights_array(skin_cluster, skin_weights, vertex_ids=None, normalize=True, influence_remap=None):
+    """
+    Applies skin weights to all influences of a skin cluster in a single call. ("MFnSkinCluster.setWeights")
+    Weights of influences that can't be found in the skin cluster are skipped (see "normalize").
+    The change is recorded as a single undoable command. (See "run_undoable_skin_edit")
+
+    Args:
+        skin_cluster (str): Name of the skin cluster to apply weights to.
+        skin_weights (SkinWeights): Weights to apply. Its influences are matched to the skin cluster influences.
+        vertex_ids (list, optional): Vertex index of each row of weights. If not provided, rows are applied to
+                                     vertices in order (row zero to vertex zero, and so on)
+        normalize (bool, optional): If active, the weights of each vertex are scaled so their sum is one.
+        influence_remap (dict, optional): Influence names found in the weights (keys) and the names to use instead
+                                          when they differ from the skin cluster influences (values)
+
+    Raises:
+        ValueError: If the specified skin cluster does not exist in the scene.
+
+    Returns:
+        SkinWeights: Weights found in the affected vertices before they were changed.
+    """
+    skin_cluster_fn, geometry_path, vertex_count = get_skin_cluster_fn(skin_cluster)
+    target_influences = [path.partialPathName() for path in skin_cluster_fn.influenceObjects()]
+    index_map = get_skin_weights_index_map(skin_weights=skin_weights, target_influences=target_influences,
+                                           influence_remap=influence_remap)
+    return run_undoable_skin_edit(functools.partial(apply_skin_weights_array, skin_cluster_fn=skin_cluster_fn,
+                                                    geometry_path=geometry_path, vertex_count=vertex_count,
+                                                    target_influences=target_influences, index_map=index_map,
+                                                    skin_weights=skin_weights, vertex_ids=vertex_ids,
+                                                    normalize=normalize))
+
+
+def run_undoable_skin_edit(skin_edit):
+    """
+    Runs a function that sets skin weights through the API as a single undoable command. ("gtSkinWeightsEdit")
+    The function receives a "weight_changes" list (keyword argument) that must be passed to every weights edit
+    (See "apply_skin_weights_array"), so the command can restore the previous weights when undone.
+    Args:
+        skin_edit (callable): Function receiving the "weight_changes" keyword argument.
+    Raises:
+        RuntimeError: If the skin edit plugin can't be loaded.
+    Returns:
+        any: The value returned by the skin edit function.
+    """
+    if not load_plugin(SKIN_EDIT_PLUGIN):
+        raise RuntimeError(f'Unable to load skin edit plugin: "{SKIN_EDIT_PLUGIN}".')
+    _pending_skin_edit.clear()
+    _pending_skin_edit["function"] = skin_edit
+    try:
+        getattr(cmds, SKIN_EDIT_COMMAND)()
+        return _pending_skin_edit.get("result")
+    finally:
+        _pending_skin_edit.clear()
+
+
+def run_pending_skin_edit(weight_changes):
+    """
+    Runs the weights edit waiting to be executed. Called by the skin edit command. (See "run_undoable_skin_edit")
+    Args:
+        weight_changes (list): Records the weights changes.
+    """
+    skin_edit = _pending_skin_edit.pop("function", None)
+    if skin_edit:
+        _pending_skin_edit["result"] = skin_edit(weight_changes=weight_changes)
+
+
+def get_skin_weights_index_map(skin_weights, target_influences, influence_remap=None):
+    """
+    Matches the influences of the skin weights to the skin cluster influences and warns about missing ones.
+    (See "get_influence_index_map")
+
+    Args:
+        skin_weights (SkinWeights): Weights to apply.
+        target_influences (list): Influence names used by the skin cluster.
+        influence_remap (dict, optional): Influence names found in the weights (keys) and the names to use instead.
+
+    Returns:
+        dict: Source influence index (key) and target influence index (value). Unmatched influences are skipped.
+    """
+    index_map = get_influence_index_map(source_influences=skin_weights.influences,
+                                        target_influences=target_influences,
+                                        influence_remap=influence_remap)
+    missing_influences = [influence for index, influence in enumerate(skin_weights.influences)
+                          if index not in index_map]
+    if missing_influences:
+        logger.warning(f'Skin weights of missing influences were skipped: "{", ".join(missing_influences)}".')
+    return index_map
+
+
+def apply_skin_weights_array(skin_cluster_fn, geometry_path, vertex_count, target_influences, index_map,
+                             skin_weights, vertex_ids=None, normalize=True, return_old_weights=True,
+                             weight_changes=None):
+    """
+    Applies skin weights using data already retrieved from the skin cluster. ("MFnSkinCluster.setWeights")
+    Used to apply many blocks of weights to the same skin cluster without querying it again for every block.
+    Vertices without weights for the skin cluster influences (all unmatched or zero) are skipped.
+
+    Args:
+        skin_cluster_fn (MFnSkinCluster): Function set attached to the skin cluster. (See "get_skin_cluster_fn")
+        geometry_path (MDagPath): Path to the deformed geometry.
+        vertex_count (int): Number of vertices (components) in the deformed geometry.
+        target_influences (list): Influence names used by the skin cluster.
+        index_map (dict): Source influence index (key) and target influence index (value).
+                          (See "get_skin_weights_index_map")
+        skin_weights (SkinWeights): Weights to apply.
+        vertex_ids (list, optional): Vertex index of each row of weights. If not provided, rows are applied to
+                                     vertices in order (row zero to vertex zero, and so on)
+        normalize (bool, optional): If active, the weights of each vertex are scaled so their sum is one.
+        return_old_weights (bool, optional): If active, the weights found before they were changed are returned.
+        weight_changes (list, optional): If provided, the change is added to it, so it can be undone.
+                                         Only available inside an undoable skin edit. (See "run_undoable_skin_edit")
+
+    Raises:
+        ValueError: If the number of vertex ids doesn't match the number of rows of weights.
+
+    Returns:
+        SkinWeights or None: Weights found in the applied vertices before they were changed.
+                             None if "return_old_weights" is False.
+    """
+    if vertex_ids is None:
+        vertex_ids = range(skin_weights.get_vertex_count())
+    vertex_ids = list(vertex_ids)
+    if len(vertex_ids) != skin_weights.get_vertex_count():
+        raise ValueError(f'Invalid vertex ids. Expected {skin_weights.get_vertex_count()} ids, '
+                         f'got {len(vertex_ids)}.')
+    valid_rows = [row for row, vertex_id in enumerate(vertex_ids) if 0 <= vertex_id < vertex_count]
+    if len(valid_rows) != len(vertex_ids):
+        logger.warning(f'Skin weights of {len(vertex_ids) - len(valid_rows)} vertices were skipped. '
+                       f'Vertex indices not found in "{geometry_path.partialPathName()}".')
+
+    # Build target weights (ordered by skin cluster influences)
+    source_count = len(skin_weights.influences)
+    target_count = len(target_influences)
+    source_weights = skin_weights.weights
+    target_weights = array.array('d')
+    applied_vertex_ids = []
+    empty_row = bytes(8 * target_count)
+    for source_row in valid_rows:
+        row_weights = array.array('d', empty_row)  # Zeros
+        source_start = source_row * source_count
+        for source_index, target_index in index_map.items():
+            row_weights[target_index] += source_weights[source_start + source_index]
+        total = sum(row_weights)
+        if total <= 0:
+            continue  # No weights for the skin cluster influences, vertex is kept as it is
+        if normalize and total != 1:
+            for target_index in range(target_count):
+                row_weights[target_index] /= total
+        target_weights.extend(row_weights)
+        applied_vertex_ids.append(vertex_ids[source_row])
+    if len(applied_vertex_ids) != len(valid_rows):
+        logger.debug(f'Skin weights of {len(valid_rows) - len(applied_vertex_ids)} vertices were skipped. '
+                     f'No weights found for the influences of "{geometry_path.partialPathName()}".')
+    if not applied_vertex_ids:
+        logger.debug(f'No skin weights to apply to "{geometry_path.partialPathName()}".')
+        return SkinWeights(influences=target_influences, weights=[]) if return_old_weights else None
+
+    components = get_vertex_components(applied_vertex_ids)
+    influence_indices = OpenMaya.MIntArray(list(range(target_count)))
+    new_weights = OpenMaya.MDoubleArray(target_weights)
+    record_change = weight_changes is not None
+    old_weights = skin_cluster_fn.setWeights(geometry_path, components, influence_indices, new_weights,
+                                             False, return_old_weights or record_change)  # normalize=False
+    if record_change:
+        weight_changes.append({"skin_cluster_fn": skin_cluster_fn,
+                               "geometry_path": geometry_path,
+                               "components": components,
+                               "influence_indices": influence_indices,
+                               "weights": new_weights,
+                               "old_weights": old_weights})
+    if return_old_weights:
+        return SkinWeights(influences=target_influences, weights=array.array('d', old_weights or []))
+
+
 def get_skin_weights(skin_cluster):
     """
     Retrieve skin weights data for a given skin cluster.
     This function returns skin weight information for each vertex in a specified skin cluster.
     The skin weights represent the influence of each bone (influence object) on the vertices of the geometry
     associated with the skin cluster.
+    The weights are read in bulk (see "get_skin_weights_array"), this is the dictionary view of the same data.
 
     Args:
         skin_cluster (str): The name of the skin cluster to query.
@@ -145,9 +606,9 @@ def get_skin_weights(skin_cluster):
         structured as follows:
 
         {
-            0: {'joint1': 0.75, 'joint2': 0.25},
-            1: {'joint2': 1.0},
-            2: {'joint3': 0.5, 'joint1': 0.5},
+            '0': {'joint1': 0.75, 'joint2': 0.25},
+            '1': {'joint2': 1.0},
+            '2': {'joint3': 0.5, 'joint1': 0.5},
             ...
         }
         This data assigns the weights for each vertex (index 0, 1, 2, ...) to the respective joints.
@@ -157,33 +618,21 @@ def get_skin_weights(skin_cluster):
         weights_data = get_skin_weights('skinCluster1')
         # Resulting output will be a dictionary containing skin weight data for each vertex in the cluster.
     """
-    if not cmds.objExists(skin_cluster):
-        raise ValueError("Skin cluster '{}' does not exist.".format(skin_cluster))
-
-    skin_data = {}
-    influences = get_influences(skin_cluster)
-    obj_name = get_skin_cluster_from_geometry(skin_cluster)
-    vertices = get_vertices(obj_name[0])
-
-    for vertex in vertices:
-        vert_id_split = vertex.split(".")
-        vert_id = extract_digits(vert_id_split[-1])  # get only vertex id
-        skin_data[vert_id] = {}
-        vert_influences = cmds.skinPercent(skin_cluster, vertex, query=True, transform=None, ignoreBelow=0.00000001)
+    return get_skin_weights_array(skin_cluster).to_dict()
 
-        for joint in vert_influences:
-            weight_val = cmds.skinPercent(skin_cluster, vertex, transform=joint, query=True)
-            skin_data[vert_id][joint] = weight_val
-    return skin_data
 
-
-def set_skin_weights(skin_cluster, skin_data):
+def set_skin_weights(skin_cluster, skin_data, normalize=True, influence_remap=None):
     """
-    Import skin weights from a JSON file and apply them to a given skin cluster.
+    Apply skin weights (dictionary format) to a given skin cluster.
+    Only the vertices found in the data are affected. All weights are applied in a single call.
+    (see "set_skin_weights_array")
 
     Args:
         skin_cluster (str): Name of the skin cluster to apply weights to.
-        skin_data (dict): File path of the JSON data containing skin weights.
+        skin_data (dict): Skin weights data. Same pattern returned by "get_skin_weights".
+        normalize (bool, optional): If active, the weights of each vertex are scaled so their sum is one.
+        influence_remap (dict, optional): Influence names found in the data (keys) and the names to use instead
+                                          when they differ from the skin cluster influences (values)
 
     Raises:
         ValueError: If the specified skin cluster does not exist in the scene.
@@ -200,13 +649,12 @@ def set_skin_weights(skin_cluster, skin_data):
     """
     if not cmds.objExists(skin_cluster):
         raise ValueError(f'Skin cluster "{skin_cluster}" does not exist.')
-    obj_name = get_skin_cluster_from_geometry(skin_cluster)[0]
-    for vertex_id in skin_data:
-        mesh_vertex = f"{obj_name}.vtx[{vertex_id}]"
-        for joint in skin_data[vertex_id].keys():
-            weight = skin_data[vertex_id][joint]
-            joint_weight_pair = [cmds.ls(joint, shortNames=True)[0], weight]
-            cmds.skinPercent(skin_cluster, mesh_vertex, transformValue=joint_weight_pair)
+    vertex_ids = sorted(skin_data, key=int)
+    rows = {row: skin_data[vertex_id] for row, vertex_id in enumerate(vertex_ids)}
+    skin_weights = SkinWeights.from_dict(rows)
+    set_skin_weights_array(skin_cluster=skin_cluster, skin_weights=skin_weights,
+                           vertex_ids=[int(vertex_id) for vertex_id in vertex_ids],
+                           normalize=normalize, influence_remap=influence_remap)
 
 
 def import_skin_weights_from_json(target_object, import_file_path):
@@ -228,6 +676,328 @@ def import_skin_weights_from_json(target_object, import_file_path):
     set_skin_weights(skin_cluster=skin_cluster, skin_data=skin_data)
 
 
+def get_little_endian_bytes(values):
+    """
+    Gets the bytes of an array using little-endian byte order. (Byte order used by the skin weights files)
+    Args:
+        values (array.array): Array to convert.
+    Returns:
+        bytes: Array data in little-endian byte order.
+    """
+    if sys.byteorder == 'big':
+        values = array.array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def read_little_endian_array(typecode, data, offset, count):
+    """
+    Reads an array written in little-endian byte order. (Byte order used by the skin weights files)
+    Args:
+        typecode (str): Array type code. e.g. "I" for unsigned integers, "f" for floats.
+        data (bytes): Data containing the array.
+        offset (int): Position of the first byte of the array.
+        count (int): Number of items in the array.
+    Returns:
+        tuple: (values, end) - The array and the position after its last byte.
+    """
+    values = array.array(typecode)
+    end = offset + count * values.itemsize
+    values.frombytes(data[offset:end])
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values, end
+
+
+def encode_skin_weights_blocks(skin_weights, block_size=SKIN_WEIGHTS_BLOCK_SIZE):
+    """
+    Converts skin weights to the uncompressed blocks of a skin weights file. (".skwb")
+    Each block stores only the weights that affect its vertices in a CSR layout (offsets, influence indices and
+    float32 values), so influence names are never repeated and a reader only needs one block in memory.
+    Encoding runs Python code (holds the GIL), while "write_skin_weights_blocks" mostly runs zlib and file writes,
+    which release it. Keeping them apart lets the writes run in background threads.
+
+    Args:
+        skin_weights (SkinWeights): Weights to encode.
+        block_size (int, optional): Number of vertices stored in each block.
+
+    Returns:
+        tuple: (index, blocks) - The file index (dict) and a list of blocks. Each block is a tuple with its
+               vertex count, weight count and data. e.g. (4096, 16384, b'...')
+    """
+    influence_count = len(skin_weights.influences)
+    vertex_count = skin_weights.get_vertex_count()
+    index_typecode = 'H' if influence_count <= 0xFFFF else 'I'
+    index = {'influences': skin_weights.influences,
+             'vertex_count': vertex_count,
+             'block_size': block_size,
+             'compression': None,
+             'index_type': index_typecode}
+    blocks = []
+    for start_vertex in range(0, vertex_count, block_size):
+        block = skin_weights.get_block(start_vertex=start_vertex, vertex_count=block_size)
+        offsets, influence_indices, values = block.get_sparse_weights()
+        data = (get_little_endian_bytes(offsets) +
+                get_little_endian_bytes(array.array(index_typecode, influence_indices)) +
+                get_little_endian_bytes(array.array('f', values)))
+        blocks.append((block.get_vertex_count(), len(values), data))
+    return index, blocks
+
+
+def write_skin_weights_blocks(file_path, index, blocks, compress=True):
+    """
+    Writes blocks created by "encode_skin_weights_blocks" to a skin weights file. (".skwb")
+    Compressing and writing release the GIL, so this function can run in background threads.
+
+    Args:
+        file_path (str): Path to the file. If it exists, it will be overwritten.
+        index (dict): File index returned by "encode_skin_weights_blocks".
+        blocks (list): Uncompressed blocks returned by "encode_skin_weights_blocks".
+        compress (bool, optional): If active, each block is compressed using zlib.
+
+    Returns:
+        str: Path to the written file.
+    """
+    index = dict(index, compression='zlib' if compress else None)
+    index = json.dumps(index, separators=(',', ':')).encode('utf-8')
+    with open(file_path, 'wb') as weights_file:
+        weights_file.write(struct.pack(SKIN_WEIGHTS_FILE_HEADER_FORMAT, SKIN_WEIGHTS_FILE_MAGIC,
+                                       SKIN_WEIGHTS_FILE_VERSION, len(index)))
+        weights_file.write(index)
+        for vertex_count, value_count, data in blocks:
+            if compress:
+                data = zlib.compress(data)
+            weights_file.write(struct.pack(SKIN_WEIGHTS_BLOCK_HEADER_FORMAT, vertex_count, value_count, len(data)))
+            weights_file.write(data)
+    return file_path
+
+
+def write_skin_weights_file(file_path, skin_weights, compress=True, block_size=SKIN_WEIGHTS_BLOCK_SIZE):
+    """
+    Writes skin weights to a compact binary file. (".skwb")
+    The file has a JSON index (influence names, vertex count, options) followed by blocks of vertices.
+    (See "encode_skin_weights_blocks" for the block layout)
+
+    Args:
+        file_path (str): Path to the file. If it exists, it will be overwritten.
+        skin_weights (SkinWeights): Weights to write.
+        compress (bool, optional): If active, each block is compressed using zlib.
+        block_size (int, optional): Number of vertices stored in each block.
+
+    Returns:
+        str: Path to the written file.
+    """
+    index, blocks = encode_skin_weights_blocks(skin_weights=skin_weights, block_size=block_size)
+    return write_skin_weights_blocks(file_path=file_path, index=index, blocks=blocks, compress=compress)
+
+
+def read_skin_weights_file_index(weights_file):
+    """
+    Reads the index of a skin weights file. The file position is moved to the first block.
+    Args:
+        weights_file (file): An open skin weights file (binary mode) positioned at its start.
+    Raises:
+        ValueError: If the file is not a valid skin weights file or was written by a newer version.
+    Returns:
+        dict: Index with the keys "influences", "vertex_count", "block_size", "compression" and "index_type".
+    """
+    header_size = struct.calcsize(SKIN_WEIGHTS_FILE_HEADER_FORMAT)
+    header = weights_file.read(header_size)
+    if len(header) < header_size:
+        raise ValueError(f'Invalid skin weights file: "{weights_file.name}".')
+    magic, version, index_size = struct.unpack(SKIN_WEIGHTS_FILE_HEADER_FORMAT, header)
+    if magic != SKIN_WEIGHTS_FILE_MAGIC:
+        raise ValueError(f'Invalid skin weights file: "{weights_file.name}".')
+    if version > SKIN_WEIGHTS_FILE_VERSION:
+        raise ValueError(f'Unsupported skin weights file version: "{version}". '
+                         f'Expected "{SKIN_WEIGHTS_FILE_VERSION}" or older.')
+    return json.loads(weights_file.read(index_size).decode('utf-8'))
+
+
+def decode_skin_weights_block(index, vertex_count, value_count, data):
+    """
+    Converts the uncompressed data of a skin weights file block back to skin weights.
+    Args:
+        index (dict): File index. (See "read_skin_weights_file_index")
+        vertex_count (int): Number of vertices in the block.
+        value_count (int): Number of weights stored in the block.
+        data (bytes): Uncompressed block data.
+    Returns:
+        SkinWeights: Skin weights of the vertices in the block.
+    """
+    offsets, end = read_little_endian_array('I', data, 0, vertex_count + 1)
+    influence_indices, end = read_little_endian_array(index.get('index_type') or 'I', data, end, value_count)
+    values, _end = read_little_endian_array('f', data, end, value_count)
+    return SkinWeights.from_sparse(influences=index.get('influences') or [], offsets=offsets,
+                                   influence_indices=influence_indices, values=values)
+
+
+def iter_skin_weights_file_blocks(file_path):
+    """
+    Reads the blocks of a skin weights file (".skwb") one at a time, without decoding them.
+
+    Args:
+        file_path (str): Path to a skin weights file.
+
+    Raises:
+        ValueError: If the file is not a valid skin weights file.
+
+    Yields:
+        tuple: (index, vertex_count, value_count, data) - The file index and the block with its data uncompressed.
+    """
+    block_header_size = struct.calcsize(SKIN_WEIGHTS_BLOCK_HEADER_FORMAT)
+    with open(file_path, 'rb') as weights_file:
+        index = read_skin_weights_file_index(weights_file)
+        compressed = index.get('compression') == 'zlib'
+        while True:
+            block_header = weights_file.read(block_header_size)
+            if len(block_header) < block_header_size:
+                break
+            vertex_count, value_count, data_size = struct.unpack(SKIN_WEIGHTS_BLOCK_HEADER_FORMAT, block_header)
+            data = weights_file.read(data_size)
+            if compressed:
+                data = zlib.decompress(data)
+            yield index, vertex_count, value_count, data
+
+
+def read_skin_weights_blocks(file_path):
+    """
+    Reads the index and all uncompressed blocks of a skin weights file. (".skwb")
+    Reading and decompressing release the GIL, so this function can run in background threads.
+    The blocks are decoded later by "decode_skin_weights_blocks".
+
+    Args:
+        file_path (str): Path to a skin weights file.
+
+    Raises:
+        ValueError: If the file is not a valid skin weights file.
+
+    Returns:
+        tuple: (index, blocks) - The file index (dict) and a list of (vertex_count, value_count, data) tuples.
+    """
+    blocks = []
+    index = None
+    for index, vertex_count, value_count, data in iter_skin_weights_file_blocks(file_path):
+        blocks.append((vertex_count, value_count, data))
+    if index is None:  # File without blocks
+        with open(file_path, 'rb') as weights_file:
+            index = read_skin_weights_file_index(weights_file)
+    return index, blocks
+
+
+def decode_skin_weights_blocks(index, blocks):
+    """
+    Converts the blocks returned by "read_skin_weights_blocks" to skin weights.
+    Args:
+        index (dict): File index.
+        blocks (list): Uncompressed blocks. A list of (vertex_count, value_count, data) tuples.
+    Returns:
+        SkinWeights: Skin weights of all vertices stored in the blocks.
+    """
+    weights = array.array('d')
+    for vertex_count, value_count, data in blocks:
+        weights.extend(decode_skin_weights_block(index=index, vertex_count=vertex_count,
+                                                 value_count=value_count, data=data).weights)
+    return SkinWeights(influences=index.get('influences') or [], weights=weights)
+
+
+def iter_skin_weights_file(file_path):
+    """
+    Reads a skin weights file (".skwb") one block at a time. The whole file is never loaded in memory.
+
+    Args:
+        file_path (str): Path to a skin weights file.
+
+    Raises:
+        ValueError: If the file is not a valid skin weights file.
+
+    Yields:
+        tuple: (start_vertex, skin_weights) - Index of the first vertex in the block and its weights (SkinWeights)
+    """
+    start_vertex = 0
+    for index, vertex_count, value_count, data in iter_skin_weights_file_blocks(file_path):
+        yield start_vertex, decode_skin_weights_block(index=index, vertex_count=vertex_count,
+                                                      value_count=value_count, data=data)
+        start_vertex += vertex_count
+
+
+def read_skin_weights_file(file_path):
+    """
+    Reads all weights stored in a skin weights file (".skwb").
+    Weights are stored as float32, so values can differ slightly from the ones that were written.
+
+    Args:
+        file_path (str): Path to a skin weights file.
+
+    Raises:
+        ValueError: If the file is not a valid skin weights file.
+
+    Returns:
+        SkinWeights: Skin weights of all vertices stored in the file.
+    """
+    index, blocks = read_skin_weights_blocks(file_path)
+    return decode_skin_weights_blocks(index=index, blocks=blocks)
+
+
+def import_skin_weights_from_file(target_object, import_file_path, normalize=True, influence_remap=None):
+    """
+    Imports skin weights from a skin weights file (".skwb") and applies them to the target object's skin cluster.
+    Weights are applied one block at a time, so the whole file is never decoded at once.
+    The skin cluster and its influences are only queried once for all blocks.
+    All blocks are applied in a single undoable command. (See "run_undoable_skin_edit")
+
+    Args:
+        target_object (str): The name of the target object to apply the skin weights to.
+        import_file_path (str): The file path of the skin weights file.
+        normalize (bool, optional): If active, the weights of each vertex are scaled so their sum is one.
+        influence_remap (dict, optional): Influence names found in the file (keys) and the names to use instead
+                                          when they differ from the skin cluster influences (values)
+
+    Raises:
+        ValueError: If the file is not a valid skin weights file.
+    """
+    skin_cluster = get_skin_cluster(target_object)
+    skin_cluster_fn, geometry_path, vertex_count = get_skin_cluster_fn(skin_cluster)
+    target_influences = [path.partialPathName() for path in skin_cluster_fn.influenceObjects()]
+
+    def apply_blocks(weight_changes):
+        index_map = None
+        for start_vertex, block in iter_skin_weights_file(import_file_path):
+            if index_map is None:  # All blocks share the same influences
+                index_map = get_skin_weights_index_map(skin_weights=block, target_influences=target_influences,
+                                                       influence_remap=influence_remap)
+            vertex_ids = range(start_vertex, start_vertex + block.get_vertex_count())
+            apply_skin_weights_array(skin_cluster_fn=skin_cluster_fn, geometry_path=geometry_path,
+                                     vertex_count=vertex_count, target_influences=target_influences,
+                                     index_map=index_map, skin_weights=block, vertex_ids=vertex_ids,
+                                     normalize=normalize, return_old_weights=False, weight_changes=weight_changes)
+
+    run_undoable_skin_edit(apply_blocks)
+
+
+def convert_skin_weights_json_to_file(json_file_path, file_path=None, compress=True):
+    """
+    Converts a skin weights JSON file (dictionary format) to a skin weights file (".skwb").
+
+    Args:
+        json_file_path (str): Path to a JSON file with skin weights. Same pattern returned by "get_skin_weights".
+        file_path (str, optional): Path to the converted file. If not provided, the JSON file path is used with
+                                   the skin weights file extension instead.
+        compress (bool, optional): If active, the data is compressed using zlib.
+
+    Returns:
+        str or None: Path to the converted file. None if it failed.
+    """
+    skin_data = read_json_dict(path=json_file_path)
+    if not skin_data:
+        logger.warning(f'Unable to convert skin weights. Missing or empty file: "{json_file_path}".')
+        return
+    if not file_path:
+        file_path = f'{os.path.splitext(json_file_path)[0]}.{SKIN_WEIGHTS_FILE_EXTENSION}'
+    skin_weights = SkinWeights.from_dict(skin_data)
+    return write_skin_weights_file(file_path=file_path, skin_weights=skin_weights, compress=compress)
+
+
 def bind_skin(joints, objects, bind_method=1, smooth_weights=0.5, maximum_influences=4):
     """
     Binds the specified joints to the given objects using the skinCluster command in Maya.
@@ -460,11 +1230,63 @@ def import_influences_from_target_folder(source_folder, verbose=False):
         print_when_true(input_string=f'Influences for {obj_name} imported from "{source_file_name}".', do_print=verbose)
 
 
-def export_weights_to_target_folder(obj_list, target_folder, verbose=False):
+def save_skin_weights(file_path, skin_weights, compress=True):
     """
-    WIP
-    TODO:
-        Check if exists, add existing checks, check pattern before using it Add suffix?
+    Writes skin weights to a file. The format is determined by the file extension.
+    ".skwb" files use the binary skin weights format, any other extension uses JSON (dictionary format).
+
+    Args:
+        file_path (str): Path to the file. If it exists, it will be overwritten.
+        skin_weights (SkinWeights): Weights to write.
+        compress (bool, optional): If active, binary files are compressed. (Ignored when writing JSON)
+
+    Returns:
+        str or None: Path to the written file. None if it failed.
+    """
+    if file_path.endswith(f'.{SKIN_WEIGHTS_FILE_EXTENSION}'):
+        return write_skin_weights_file(file_path=file_path, skin_weights=skin_weights, compress=compress)
+    return write_json(path=file_path, data=skin_weights.to_dict())
+
+
+def load_skin_weights(file_path):
+    """
+    Reads skin weights from a file. The format is determined by the file extension. (Reverse of "save_skin_weights")
+
+    Args:
+        file_path (str): Path to a skin weights file (".skwb") or a JSON file with skin weights.
+
+    Raises:
+        ValueError: If the file is not a valid skin weights file.
+
+    Returns:
+        SkinWeights or None: Weights found in the file. None if it failed.
+    """
+    if file_path.endswith(f'.{SKIN_WEIGHTS_FILE_EXTENSION}'):
+        return read_skin_weights_file(file_path)
+    skin_data = read_json_dict(path=file_path)
+    if skin_data:
+        return SkinWeights.from_dict(skin_data)
+
+
+def export_weights_to_target_folder(obj_list, target_folder, verbose=False, binary=False, compress=True,
+                                    max_workers=SKIN_WEIGHTS_IO_WORKERS):
+    """
+    Exports the skin weights of multiple objects to a folder. One file per object: "weights_<object>.<extension>"
+    Weights are extracted and encoded on the main thread (Maya API and Python code, both hold the GIL).
+    Compressing and writing the files release the GIL, so they run in background threads while the next object
+    is extracted. (See "encode_skin_weights_blocks" and "write_skin_weights_blocks")
+
+    Args:
+        obj_list (list, str): Skinned objects. If a string is provided it becomes a list with one item.
+        target_folder (str): Path to an existing folder.
+        verbose (bool, optional): If active, it will print the exported files and the time taken by each object.
+        binary (bool, optional): If active, weights are written to skin weights files (".skwb") instead of JSON.
+        compress (bool, optional): If active, binary files are compressed. (Ignored when writing JSON)
+        max_workers (int, optional): Number of threads used to write files.
+                                     If 1 or None, each file is written right after its extraction.
+
+    Returns:
+        list: A list of paths to the exported files.
     """
     if isinstance(obj_list, str):  # If a string is provided, convert it to list
         obj_list = [obj_list]
@@ -473,17 +1295,141 @@ def export_weights_to_target_folder(obj_list, target_folder, verbose=False):
         logger.warning(f'Unable to export skin weights. Missing target folder: {str(target_folder)}')
         return
 
-    exported_files = set()
-    for obj in obj_list:
-        file_name = f"weights_{obj}.json"
-        file_path = os.path.join(target_folder, file_name)
-        skin_cluster = get_skin_cluster(obj=obj)
-        skin_weights_data = get_skin_weights(skin_cluster=skin_cluster)
-        json_file = write_json(path=file_path, data=skin_weights_data)
-        if json_file:
-            exported_files.add(json_file)
-            print_when_true(input_string=f'Weights for "{obj}" exported to "{json_file}".', do_print=verbose)
-    return list(exported_files)
+    def write_weights(_file_path, _encoded_weights):
+        _start_time = time.perf_counter()
+        if binary:
+            _index, _blocks = _encoded_weights
+            _weights_file = write_skin_weights_blocks(file_path=_file_path, index=_index, blocks=_blocks,
+                                                      compress=compress)
+        else:
+            _weights_file = write_json(path=_file_path, data=_encoded_weights)
+        return _weights_file, time.perf_counter() - _start_time
+
+    def report_export(_obj, _vertex_count, _extract_time, get_result):
+        try:
+            weights_file, write_time = get_result()
+        except Exception as e:
+            logger.warning(f'Unable to export skin weights for "{_obj}". Issue: {e}')
+            return
+        if weights_file:
+            exported_files.append(weights_file)
+            vertices_per_second = _vertex_count / max(_extract_time + write_time, 1e-9)
+            print_when_true(input_string=f'Weights for "{_obj}" exported to "{weights_file}". '
+                                         f'(extract: {_extract_time:.3f}s, write: {write_time:.3f}s, '
+                                         f'{vertices_per_second:.0f} vertices/s)', do_print=verbose)
+
+    start_time = time.perf_counter()
+    extension = SKIN_WEIGHTS_FILE_EXTENSION if binary else "json"
+    exported_files = []
+    futures = {}
+    use_threads = max_workers is not None and max_workers > 1
+    with ThreadPoolExecutor(max_workers=max_workers) if use_threads else contextlib.nullcontext() as executor:
+        for obj in obj_list:
+            skin_cluster = get_skin_cluster(obj=obj)
+            if not skin_cluster:
+                logger.warning(f'Unable to export skin weights. Missing skin cluster for "{obj}".')
+                continue
+            extract_start_time = time.perf_counter()
+            skin_weights = get_skin_weights_array(skin_cluster=skin_cluster)
+            if binary:
+                encoded_weights = encode_skin_weights_blocks(skin_weights=skin_weights)
+            else:
+                encoded_weights = skin_weights.to_dict()
+            extract_time = time.perf_counter() - extract_start_time
+            file_path = os.path.join(target_folder, f"weights_{obj}.{extension}")
+            vertex_count = skin_weights.get_vertex_count()
+            if executor:
+                futures[executor.submit(write_weights, file_path, encoded_weights)] = (obj, vertex_count,
+                                                                                       extract_time)
+            else:
+                write_now = functools.partial(write_weights, file_path, encoded_weights)
+                report_export(obj, vertex_count, extract_time, write_now)
+        for future in as_completed(futures):
+            report_export(*futures.get(future), future.result)
+    logger.debug(f'Exported skin weights of {len(exported_files)} objects in '
+                 f'{time.perf_counter() - start_time:.3f} seconds.')
+    return sorted(exported_files)
+
+
+def import_weights_from_target_folder(source_folder, verbose=False, normalize=True, influence_remap=None,
+                                      max_workers=SKIN_WEIGHTS_IO_WORKERS):
+    """
+    Imports skin weights files created by "export_weights_to_target_folder". ("weights_<object>.<extension>")
+    Files are read and decompressed in background threads (both release the GIL), while weights are decoded and
+    applied on the main thread. (Python code and Maya API) Objects must already be bound.
+    (see "import_influences_from_target_folder")
+
+    Args:
+        source_folder (str): Path to a folder with skin weights files.
+        verbose (bool, optional): If active, it will print the imported files and the time taken by each object.
+        normalize (bool, optional): If active, the weights of each vertex are scaled so their sum is one.
+        influence_remap (dict, optional): Influence names found in the files (keys) and the names to use instead
+                                          when they differ from the skin cluster influences (values)
+        max_workers (int, optional): Number of threads used to read files.
+                                     If 1 or None, each file is read right before its weights are applied.
+
+    Returns:
+        list: A list of objects that received skin weights.
+    """
+    if not os.path.exists(source_folder) or not os.path.isdir(source_folder):
+        logger.warning(f'Unable to import skin weights. Missing source folder: {str(source_folder)}')
+        return
+
+    def read_weights(_file_path):
+        _start_time = time.perf_counter()
+        if _file_path.endswith(f'.{SKIN_WEIGHTS_FILE_EXTENSION}'):
+            _encoded_weights = read_skin_weights_blocks(_file_path)
+        else:
+            _encoded_weights = read_json_dict(path=_file_path)
+        return _encoded_weights, time.perf_counter() - _start_time
+
+    def apply_weights(_obj_name, _source_file_name, get_result):
+        try:
+            encoded_weights, read_time = get_result()
+            apply_start_time = time.perf_counter()
+            if not encoded_weights:
+                skin_weights = None
+            elif _source_file_name.endswith(f'.{SKIN_WEIGHTS_FILE_EXTENSION}'):
+                skin_weights = decode_skin_weights_blocks(*encoded_weights)
+            else:
+                skin_weights = SkinWeights.from_dict(encoded_weights)
+            skin_cluster = get_skin_cluster(_obj_name)
+        except Exception as e:
+            logger.warning(f'Unable to import skin weights from "{_source_file_name}". Issue: {e}')
+            return
+        if not skin_weights or not skin_cluster:
+            logger.warning(f'Unable to import skin weights from "{_source_file_name}". '
+                           f'Missing weights or skin cluster.')
+            return
+        set_skin_weights_array(skin_cluster=skin_cluster, skin_weights=skin_weights,
+                               normalize=normalize, influence_remap=influence_remap)
+        apply_time = time.perf_counter() - apply_start_time
+        imported_objects.append(_obj_name)
+        vertices_per_second = skin_weights.get_vertex_count() / max(read_time + apply_time, 1e-9)
+        print_when_true(input_string=f'Weights for "{_obj_name}" imported from "{_source_file_name}". '
+                                     f'(read: {read_time:.3f}s, apply: {apply_time:.3f}s, '
+                                     f'{vertices_per_second:.0f} vertices/s)', do_print=verbose)
+
+    start_time = time.perf_counter()
+    imported_objects = []
+    futures = {}
+    use_threads = max_workers is not None and max_workers > 1
+    with ThreadPoolExecutor(max_workers=max_workers) if use_threads else contextlib.nullcontext() as executor:
+        for source_file_name in sorted(os.listdir(source_folder)):
+            obj_name, extension = os.path.splitext(source_file_name)
+            if not obj_name.startswith("weights_") or extension not in (".json", f'.{SKIN_WEIGHTS_FILE_EXTENSION}'):
+                continue
+            obj_name = obj_name[len("weights_"):]
+            file_path = os.path.join(source_folder, source_file_name)
+            if executor:
+                futures[executor.submit(read_weights, file_path)] = (obj_name, source_file_name)
+            else:
+                apply_weights(obj_name, source_file_name, functools.partial(read_weights, file_path))
+        for future in as_completed(futures):
+            apply_weights(*futures.get(future), future.result)
+    logger.debug(f'Imported skin weights of {len(imported_objects)} objects in '
+                 f'{time.perf_counter() - start_time:.3f} seconds.')
+    return imported_objects
 
 
 if __name__ == "__main__":
@@ -362,6 +362,88 @@ def upper_first_char(input_string):
     return input_string[0].upper() + input_string[1:]
 
 
+class TrigramIndex:
+    def __init__(self, strings=None):
+        """
+        Index used to quickly find which strings contain a search term. (Case-insensitive substring search)
+        Every string is broken into trigrams (groups of three consecutive characters) and only the strings that
+        contain all trigrams of the search term are compared against it.
+
+        Args:
+            strings (list, optional): Initial list of strings. Their position in the list is used as their ID.
+        """
+        self.strings = []
+        self.trigrams = {}  # Trigram: set of IDs
+        for string in strings or []:
+            self.add(string)
+
+    @staticmethod
+    def get_trigrams(input_string):
+        """
+        Gets all trigrams (groups of three consecutive characters) found in a string.
+        e.g. "arrow" returns {"arr", "rro", "row"}
+
+        Args:
+            input_string (str): String to extract the trigrams from.
+
+        Returns:
+            set: A set with all trigrams. Empty if the string has less than three characters.
+        """
+        return {input_string[index:index + 3] for index in range(len(input_string) - 2)}
+
+    def add(self, input_string):
+        """
+        Adds a string to the index.
+
+        Args:
+            input_string (str): String to add.
+
+        Returns:
+            int: ID of the added string (its position in the index)
+        """
+        string_id = len(self.strings)
+        lower_string = str(input_string).lower()
+        self.strings.append(lower_string)
+        for trigram in self.get_trigrams(lower_string):
+            self.trigrams.setdefault(trigram, set()).add(string_id)
+        return string_id
+
+    def clear(self):
+        """
+        Removes all strings from the index.
+        """
+        self.strings = []
+        self.trigrams = {}
+
+    def search(self, search_term, candidates=None):
+        """
+        Gets the IDs of all strings that contain the search term.
+
+        Args:
+            search_term (str): Term to search for. Case-insensitive. An empty term matches all strings.
+            candidates (set, optional): If provided, only these IDs are considered.
+                                        e.g. The result of a shorter term the new term contains.
+        Returns:
+            set: IDs of the strings that contain the search term.
+        """
+        if candidates is None:
+            candidates = set(range(len(self.strings)))
+        search_term = str(search_term).lower()
+        if not search_term:
+            return set(candidates)
+        postings = []
+        for trigram in self.get_trigrams(search_term):
+            posting = self.trigrams.get(trigram)
+            if not posting:
+                return set()
+            postings.append(posting)
+        postings.sort(key=len)  # Smallest first, so the intersection shrinks as early as possible
+        for posting in postings:
+            candidates = candidates & posting
+            if not candidates:
+                return set()
+        return {string_id for string_id in candidates if search_term in self.strings[string_id]}
+
 
 if __name__ == "__main__":
     logger.setLevel(logging.DEBUG)
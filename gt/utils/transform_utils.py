@@ -3,12 +3,14 @@ Transform Utilities
 github.com/TrevisanGMW/gt-tools
 """
 from gt.utils.attr_utils import set_trs_attr, get_multiple_attr, set_attr
-from gt.utils.constraint_utils import equidistant_constraints
 from gt.utils.feedback_utils import FeedbackMessage
 from gt.utils.math_utils import matrix_mult
+import maya.api.OpenMaya as OpenMaya
 import maya.cmds as cmds
 import logging
+import array
 import sys
+import re
 
 
 # Logging Setup
@@ -22,6 +24,7 @@ class Vector3:
     """
     Represents a 3D vector with x, y, and z coordinates.
     """
+    __slots__ = ("x", "y", "z")  # No instance dictionary. Many vectors are created (e.g. two transforms per proxy)
 
     def __init__(self, x=0.0, y=0.0, z=0.0, xyz=None):
         """
@@ -294,6 +297,8 @@ class Vector3:
 
 # ------------------------------------------------- Transform Start -----------------------------------------------
 class Transform:
+    __slots__ = ("position", "rotation", "scale")
+
     def __init__(self, position=None, rotation=None, scale=None):
         """
         Initialize a Transform object using Vector3 objects for position, rotation, and scale
@@ -1026,6 +1031,227 @@ def overwrite_xyz_values(passthrough_xyz, overwrite_xyz=(0, 0, 0), overwrite_dim
     return result_val
 
 
+def _get_dag_path(obj):
+    """
+    Gets the DAG path of an object.
+    Args:
+        obj (str, Node): Name of the object. e.g. "pCube1"
+    Returns:
+        OpenMaya.MDagPath or None: The DAG path of the object. None if missing, not unique or not a DAG node.
+    """
+    if not obj:
+        return None
+    selection = OpenMaya.MSelectionList()
+    try:
+        selection.add(str(obj))
+        return selection.getDagPath(0)
+    except Exception as e:
+        logger.debug(f'Unable to get DAG path for "{str(obj)}". Issue: {str(e)}')
+        return None
+
+
+def get_world_matrices(obj_list):
+    """
+    Gets the world matrices of many objects in a single OpenMaya pass. (Instead of one "cmds.xform" call per object)
+    Args:
+        obj_list (list, str): Names of the objects. Strings are automatically converted to a list with a single item.
+    Returns:
+        list: One item per object. A flat list with 16 floats (same as "cmds.xform(q=True, m=True, ws=True)")
+              or None if the object is missing or isn't a DAG node.
+    """
+    if isinstance(obj_list, str):
+        obj_list = [obj_list]
+    matrices = []
+    for obj in obj_list:
+        dag_path = _get_dag_path(obj)
+        matrices.append(list(dag_path.inclusiveMatrix()) if dag_path else None)
+    return matrices
+
+
+def _get_world_transform_data(dag_path):
+    """
+    Gets the world values used when matching transforms.
+    Args:
+        dag_path (OpenMaya.MDagPath): Path to the object.
+    Returns:
+        tuple: World position (rotate pivot) as MVector, world rotation as MQuaternion and world scale as a list.
+    """
+    transformation = OpenMaya.MTransformationMatrix(dag_path.inclusiveMatrix())
+    if dag_path.hasFn(OpenMaya.MFn.kTransform):
+        position = OpenMaya.MVector(OpenMaya.MFnTransform(dag_path).rotatePivot(OpenMaya.MSpace.kWorld))
+    else:
+        position = transformation.translation(OpenMaya.MSpace.kWorld)
+    rotation = transformation.rotation(asQuaternion=True)
+    return position, rotation, list(transformation.scale(OpenMaya.MSpace.kWorld))
+
+
+def _get_joint_orient_data(dag_path):
+    """
+    Gets the joint orient matrix and the segment scale compensate state of a joint.
+    Args:
+        dag_path (OpenMaya.MDagPath): Path to the object.
+    Returns:
+        tuple: Joint orient as MMatrix (identity for other types) and segment scale compensate state (bool).
+    """
+    if not dag_path.hasFn(OpenMaya.MFn.kJoint):
+        return OpenMaya.MMatrix(), False
+    node_fn = OpenMaya.MFnDependencyNode(dag_path.node())
+    orient_plug = node_fn.findPlug("jointOrient", False)
+    orient = OpenMaya.MEulerRotation(*[orient_plug.child(index).asMAngle().asRadians() for index in range(3)])
+    return orient.asMatrix(), node_fn.findPlug("segmentScaleCompensate", False).asBool()
+
+
+def get_local_rotation(dag_path, world_rotation_matrix, parent_matrix):
+    """
+    Gets the rotate values that give a transform the provided world rotation.
+    Rotate order, rotate axis and joint orient are taken into account.
+    Args:
+        dag_path (OpenMaya.MDagPath): Path to the transform.
+        world_rotation_matrix (OpenMaya.MMatrix): Desired world rotation (without scale).
+        parent_matrix (OpenMaya.MMatrix): World matrix of the parent. e.g. "dag_path.exclusiveMatrix()"
+    Returns:
+        OpenMaya.MEulerRotation: Local rotation (radians) using the rotate order of the transform.
+    """
+    transform_fn = OpenMaya.MFnTransform(dag_path)
+    joint_orient, _ = _get_joint_orient_data(dag_path)
+    rotate_axis = transform_fn.rotateOrientation(OpenMaya.MSpace.kTransform).asMatrix()
+    parent_rotation = OpenMaya.MTransformationMatrix(parent_matrix).rotation(asQuaternion=True).asMatrix()
+    # Local rotation = rotate axis * rotate * joint orient (row vectors)
+    local = rotate_axis.inverse() * world_rotation_matrix * parent_rotation.inverse() * joint_orient.inverse()
+    return OpenMaya.MEulerRotation.decompose(local, transform_fn.rotation().order)
+
+
+def _set_world_transform(dag_path, position=None, rotation=None, scale=None,
+                         skip_translate=None, skip_rotate=None, skip_scale=None):
+    """
+    Sets the local translate, rotate and scale values of a transform, so it reaches the provided world values.
+    Parents, rotate order, rotate axis and joint orient are taken into account. Values are written with "setAttr",
+    so the operation can be undone.
+    Args:
+        dag_path (OpenMaya.MDagPath): Path to the transform receiving the update.
+        position (OpenMaya.MVector, optional): World position. If None, translation is not changed.
+        rotation (OpenMaya.MQuaternion, optional): World rotation. If None, rotation is not changed.
+        scale (list, optional): World scale (X, Y, Z). If None, scale is not changed.
+        skip_translate (str, list, optional): Translate dimensions to keep ("x", "y", "z").
+        skip_rotate (str, list, optional): Rotate dimensions to keep ("x", "y", "z"). Uses the target rotate order.
+        skip_scale (str, list, optional): Scale dimensions to keep ("x", "y", "z").
+    """
+    transform_fn = OpenMaya.MFnTransform(dag_path)
+    name = dag_path.fullPathName()
+    parent_matrix = dag_path.exclusiveMatrix()  # Read after previous writes (targets can be parented to each other)
+    world_transformation = OpenMaya.MTransformationMatrix(dag_path.inclusiveMatrix())
+    parent_transformation = OpenMaya.MTransformationMatrix(parent_matrix)
+    _, segment_scale_compensate = _get_joint_orient_data(dag_path)
+    try:
+        if position is not None:
+            if skip_translate:
+                current = OpenMaya.MPoint(transform_fn.translation(OpenMaya.MSpace.kTransform)) * parent_matrix
+                position = overwrite_xyz_values(list(position)[:3], list(current)[:3], skip_translate)
+            local = OpenMaya.MPoint(position[0], position[1], position[2]) * parent_matrix.inverse()
+            translation = [OpenMaya.MDistance.internalToUI(value) for value in (local.x, local.y, local.z)]
+            cmds.setAttr(f'{name}.translate', *translation)
+        if rotation is not None:
+            rotate_order = transform_fn.rotation().order
+            rotation_matrix = rotation.asMatrix()
+            if skip_rotate:
+                desired = OpenMaya.MEulerRotation.decompose(rotation_matrix, rotate_order)
+                current = OpenMaya.MEulerRotation.decompose(world_transformation.rotation(asQuaternion=True).asMatrix(),
+                                                            rotate_order)
+                desired = overwrite_xyz_values([desired.x, desired.y, desired.z],
+                                               [current.x, current.y, current.z], skip_rotate)
+                rotation_matrix = OpenMaya.MEulerRotation(*desired, rotate_order).asMatrix()
+            local = get_local_rotation(dag_path, rotation_matrix, parent_matrix)
+            rotate = [OpenMaya.MAngle.internalToUI(value) for value in (local.x, local.y, local.z)]
+            cmds.setAttr(f'{name}.rotate', *rotate)
+        if scale is not None:
+            if skip_scale:
+                scale = overwrite_xyz_values(scale, list(world_transformation.scale(OpenMaya.MSpace.kWorld)),
+                                             skip_scale)
+            parent_scale = [1, 1, 1]
+            if not segment_scale_compensate:  # Compensated joints ignore the parent scale
+                parent_scale = list(parent_transformation.scale(OpenMaya.MSpace.kWorld))
+            if any(abs(value) < 1e-10 for value in parent_scale):
+                logger.debug(f'Unable to match scale for "{name}". Parent scale is zero.')
+            else:
+                cmds.setAttr(f'{name}.scale', *[value / parent for value, parent in zip(scale, parent_scale)])
+    except Exception as e:
+        logger.warning(f'Unable to set transform values for "{name}". Issue: {str(e)}')
+
+
+def _get_transform_targets(target_list, operation="matching transform values"):
+    """
+    Gets the DAG paths of the target transforms. Missing targets and non-transforms are logged and ignored.
+    Args:
+        target_list (str, list, tuple): The name(s) of the target objects.
+        operation (str, optional): Description of the operation, used in the debug messages.
+    Returns:
+        list: A list of tuples with the index of the target (in the target list) and its DAG path.
+    """
+    if isinstance(target_list, str) or not isinstance(target_list, (list, tuple)):
+        target_list = [target_list]
+    targets = []
+    for index, target in enumerate(target_list):
+        dag_path = _get_dag_path(target)
+        if not dag_path or not dag_path.hasFn(OpenMaya.MFn.kTransform):
+            logger.debug(f'Missing target object "{str(target)}" while {operation}.')
+            continue
+        targets.append((index, dag_path))
+    return targets
+
+
+def match_transforms(source_list, target_list, translate=True, rotate=True, scale=True,
+                     skip_translate=None, skip_rotate=None, skip_scale=None):
+    """
+    Matches the world transform of many targets in bulk. Sources are read once in a single OpenMaya pass,
+    then the local values of each target are computed (accounting for its parents) and written with "setAttr".
+    Targets are updated in order, so a target parented under a previous target is placed correctly.
+    Translation uses the rotate pivot of the source and rotation uses the rotate order of the target.
+
+    Args:
+        source_list (str, Node, list): A single source for all targets or a list with one source per target.
+        target_list (str, list, tuple): The name(s) of the target objects (objects to receive transform update)
+        translate (bool, optional): Match translation if True.
+        rotate (bool, optional): Match rotation if True.
+        scale (bool, optional): Match scale if True.
+        skip_translate (str, list, optional): Dimensions to skip for translation ("x", "y", "z").
+        skip_rotate (str, list, optional): Dimensions to skip for rotation ("x", "y", "z").
+        skip_scale (str, list, optional): Dimensions to skip for scale ("x", "y", "z").
+    Returns:
+        list: Full paths of the updated targets.
+    """
+    if isinstance(target_list, str) or not isinstance(target_list, (list, tuple)):
+        target_list = [target_list]
+    if not isinstance(source_list, (list, tuple)):
+        source_list = [source_list]
+    if len(source_list) != 1 and len(source_list) != len(target_list):
+        logger.warning(f'Unable to match transforms. Received {len(source_list)} sources '
+                       f'for {len(target_list)} targets.')
+        return []
+
+    source_data = {}  # Key: source name, Value: world data (read once per source)
+    for source in source_list:
+        if str(source) in source_data:
+            continue
+        dag_path = _get_dag_path(source)
+        source_data[str(source)] = _get_world_transform_data(dag_path) if dag_path else None
+
+    updated_targets = []
+    for index, dag_path in _get_transform_targets(target_list):
+        source = source_list[0] if len(source_list) == 1 else source_list[index]
+        data = source_data.get(str(source))
+        if data is None:
+            logger.debug(f'Missing source object "{str(source)}" while matching transform values.')
+            continue
+        position, rotation, world_scale = data
+        _set_world_transform(dag_path,
+                             position=position if translate else None,
+                             rotation=rotation if rotate else None,
+                             scale=world_scale if scale else None,
+                             skip_translate=skip_translate, skip_rotate=skip_rotate, skip_scale=skip_scale)
+        updated_targets.append(dag_path.fullPathName())
+    return updated_targets
+
+
 def match_translate(source, target_list, skip=None):
     """
     Matches the translation values of an object by extracting the values from the source object and applying it to the
@@ -1039,16 +1265,7 @@ def match_translate(source, target_list, skip=None):
     if not source or not cmds.objExists(source):
         logger.debug(f'Missing source object "{str(source)}" while matching translate values.')
         return
-    if isinstance(target_list, str):
-        target_list = [target_list]
-    source_translation = cmds.xform(source, query=True, rotatePivot=True, worldSpace=True)
-    for target in target_list:
-        if not target or not cmds.objExists(target):
-            logger.debug(f'Missing target object "{str(target)}" while matching translate values.')
-            continue
-        target_translation = cmds.xform(target, query=True, translation=True, worldSpace=True)
-        target_translation = overwrite_xyz_values(source_translation, target_translation, skip)
-        cmds.xform(target, translation=target_translation, worldSpace=True)
+    match_transforms(source_list=source, target_list=target_list, rotate=False, scale=False, skip_translate=skip)
 
 
 def match_rotate(source, target_list, skip=None):
@@ -1064,16 +1281,7 @@ def match_rotate(source, target_list, skip=None):
     if not source or not cmds.objExists(source):
         logger.debug(f'Missing source object "{str(source)}" while matching rotate values.')
         return
-    if isinstance(target_list, str):
-        target_list = [target_list]
-    source_rotation = cmds.xform(source, query=True, rotation=True, worldSpace=True)
-    for target in target_list:
-        if not target or not cmds.objExists(target):
-            logger.debug(f'Missing target object "{str(target)}" while matching rotate values.')
-            continue
-        target_rotation = cmds.xform(target, query=True, rotation=True, worldSpace=True)
-        target_rotation = overwrite_xyz_values(source_rotation, target_rotation, skip)
-        cmds.xform(target, rotation=target_rotation, worldSpace=True)
+    match_transforms(source_list=source, target_list=target_list, translate=False, scale=False, skip_rotate=skip)
 
 
 def match_scale(source, target_list, skip=None):
@@ -1088,16 +1296,7 @@ def match_scale(source, target_list, skip=None):
     if not source or not cmds.objExists(source):
         logger.debug(f'Missing source object "{str(source)}" while matching scale values.')
         return
-    if isinstance(target_list, str):
-        target_list = [target_list]
-    source_scale = cmds.xform(source, query=True, scale=True, worldSpace=True)
-    for target in target_list:
-        if not target or not cmds.objExists(target):
-            logger.debug(f'Missing target object "{str(target)}" while matching scale values.')
-            continue
-        target_scale = cmds.xform(target, query=True, scale=True, worldSpace=True)
-        target_scale = overwrite_xyz_values(source_scale, target_scale, skip)
-        cmds.xform(target, scale=target_scale, worldSpace=True)
+    match_transforms(source_list=source, target_list=target_list, translate=False, rotate=False, skip_scale=skip)
 
 
 def match_transform(source, target_list, translate=True, rotate=True, scale=True,
@@ -1118,23 +1317,14 @@ def match_transform(source, target_list, translate=True, rotate=True, scale=True
     if not source or not cmds.objExists(source):
         logger.debug(f'Missing source object "{str(source)}" while matching transform values.')
         return
-
-    # Match translation
-    if translate:
-        match_translate(source=source, target_list=target_list, skip=skip_translate)
-
-    # Match rotation
-    if rotate:
-        match_rotate(source=source, target_list=target_list, skip=skip_rotate)
-
-    # Match scale
-    if scale:
-        match_scale(source=source, target_list=target_list, skip=skip_scale)
+    match_transforms(source_list=source, target_list=target_list, translate=translate, rotate=rotate, scale=scale,
+                     skip_translate=skip_translate, skip_rotate=skip_rotate, skip_scale=skip_scale)
 
 
 def set_equidistant_transforms(start, end, target_list, skip_start_end=True, constraint='parent'):
     """
     Sets equidistant transforms for a list of objects between a start and end point.
+    Values are blended the same way a constraint with two weighted targets would, but without creating constraints.
     Args:
         start (str, Node): Path to object where it should start. In A->B, this would be "A".
         end (str, Node): Path to the object where it should end. In A->B, this would be "B".
@@ -1143,13 +1333,48 @@ def set_equidistant_transforms(start, end, target_list, skip_start_end=True, con
                                          in-between start and end points, but not on top of start/end points.
         constraint (str): Which constraint type should be created. Supported: "parent", "point", "orient", "scale".
     """
-    constraints = equidistant_constraints(start=start,
-                                          end=end,
-                                          target_list=target_list,
-                                          skip_start_end=skip_start_end,
-                                          constraint=constraint)
-    if constraints:
-        cmds.delete(constraints)
+    channels = {"parent": (True, True, False),  # Translate, Rotate, Scale
+                "point": (True, False, False),
+                "orient": (False, True, False),
+                "scale": (False, False, True)}
+    if constraint not in channels:
+        logger.warning(f'Unable to set equidistant transforms. Invalid constraint type: "{str(constraint)}".')
+        return
+    if not target_list:
+        return
+    if isinstance(target_list, str):
+        target_list = [target_list]
+    start_path = _get_dag_path(start)
+    end_path = _get_dag_path(end)
+    if not start_path or not end_path:
+        logger.warning(f'Unable to set equidistant transforms. Missing start or end: "{str(start)}", "{str(end)}".')
+        return
+    start_position, start_rotation, start_scale = _get_world_transform_data(start_path)
+    end_position, end_rotation, end_scale = _get_world_transform_data(end_path)
+    if start_rotation.x * end_rotation.x + start_rotation.y * end_rotation.y + \
+            start_rotation.z * end_rotation.z + start_rotation.w * end_rotation.w < 0:
+        end_rotation = end_rotation.negateIt()  # Same hemisphere, so it blends through the shortest path
+
+    if skip_start_end:
+        step = 1.0 / (len(target_list) + 1)  # Start and end points are not used by targets
+        weights = [step * (index + 1) for index in range(len(target_list))]
+    else:
+        step = 1.0 / (len(target_list) - 1) if len(target_list) > 1 else 0  # -1 to reach both end points
+        weights = [step * index for index in range(len(target_list))]
+
+    translate, rotate, scale = channels.get(constraint)
+    for index, dag_path in _get_transform_targets(target_list, operation="setting equidistant transforms"):
+        weight = weights[index]
+        position = start_position * (1.0 - weight) + end_position * weight
+        # Normalized linear blend (same as the "Average" interpolation used by constraints)
+        rotation = OpenMaya.MQuaternion(*[start_value * (1.0 - weight) + end_value * weight
+                                          for start_value, end_value in zip(start_rotation, end_rotation)])
+        world_scale = [start_value * (1.0 - weight) + end_value * weight
+                       for start_value, end_value in zip(start_scale, end_scale)]
+        _set_world_transform(dag_path,
+                             position=position if translate else None,
+                             rotation=rotation.normalizeIt() if rotate else None,
+                             scale=world_scale if scale else None)
 
 
 def translate_shapes(obj_transform, offset):
@@ -1164,8 +1389,12 @@ def translate_shapes(obj_transform, offset):
         logger.debug("No shapes found for the given object.")
         return
     for shape in shapes:
-        from gt.utils.hierarchy_utils import get_shape_components
-        components = get_shape_components(shape)
+        from gt.utils.hierarchy_utils import get_shape_components, get_shape_component_set
+        components = get_shape_component_set(shape)
+        if components is not None:
+            components = components.get_names()  # Compact names. e.g. "mesh.vtx[0:7]"
+        else:
+            components = get_shape_components(shape)
         cmds.move(*offset, components, relative=True, objectSpace=True)
 
 
@@ -1182,8 +1411,12 @@ def rotate_shapes(obj_transform, offset, pivot=None):
         logger.debug("No shapes found for the given object.")
         return
     for shape in shapes:
-        from gt.utils.hierarchy_utils import get_shape_components
-        components = get_shape_components(shape)
+        from gt.utils.hierarchy_utils import get_shape_components, get_shape_component_set
+        components = get_shape_component_set(shape)
+        if components is not None:
+            components = components.get_names()  # Compact names. e.g. "mesh.vtx[0:7]"
+        else:
+            components = get_shape_components(shape)
         _rotate_parameters = {"relative": True, "objectSpace": True}
         if pivot:
             _rotate_parameters["pivot"] = pivot
@@ -1207,17 +1440,182 @@ def scale_shapes(obj_transform, offset, pivot=None):
     if offset and isinstance(offset, (int, float)):
         offset = (offset, offset, offset)
     for shape in shapes:
-        from gt.utils.hierarchy_utils import get_shape_components
-        components = get_shape_components(shape)
+        from gt.utils.hierarchy_utils import get_shape_components, get_shape_component_set
+        components = get_shape_component_set(shape)
+        if components is not None:
+            components = components.get_names()  # Compact names. e.g. "mesh.vtx[0:7]"
+        else:
+            components = get_shape_components(shape)
         _scale_parameters = {"relative": True, "objectSpace": True}
         if pivot:
             _scale_parameters["pivot"] = pivot
         cmds.scale(*offset, components, **_scale_parameters)
 
 
+def get_shape_points_fn(shape):
+    """
+    Gets an OpenMaya function set used to read and write all points of a shape in a single call.
+    Supported shapes: "mesh" (vertices) and "nurbsCurve" (CVs).
+
+    Args:
+        shape (str, MDagPath): Name of the shape (must be unique or a long name) or its path.
+
+    Returns:
+        MFnMesh, MFnNurbsCurve or None: Function set attached to the shape. None if missing or not supported.
+    """
+    try:
+        if isinstance(shape, OpenMaya.MDagPath):
+            dag_path = shape
+        else:
+            selection = OpenMaya.MSelectionList()
+            selection.add(str(shape))
+            dag_path = selection.getDagPath(0)
+        if dag_path.hasFn(OpenMaya.MFn.kMesh):
+            return OpenMaya.MFnMesh(dag_path)
+        if dag_path.hasFn(OpenMaya.MFn.kNurbsCurve):
+            return OpenMaya.MFnNurbsCurve(dag_path)
+    except Exception as e:
+        logger.debug(f'Unable to get shape function set for "{shape}". Issue: {e}')
+
+
+def get_component_positions(shape, world_space=True):
+    """
+    Gets the position of every point of a shape in a single call.
+    ("MFnMesh.getPoints" or "MFnNurbsCurve.cvPositions")
+    Periodic curves don't include their overlapping CVs, so every position matches a component id.
+
+    Args:
+        shape (str, MDagPath): Mesh or NURBS curve shape. (See "get_shape_points_fn")
+        world_space (bool, optional): If active, positions are in world space. If False, object space is used.
+
+    Returns:
+        array.array or None: Flat array of doubles indexed by component id. e.g. "vtx[1]" = positions[3:6]
+                             None if the shape is missing or not supported.
+    """
+    shape_fn = get_shape_points_fn(shape)
+    if shape_fn is None:
+        return
+    space = OpenMaya.MSpace.kWorld if world_space else OpenMaya.MSpace.kObject
+    if isinstance(shape_fn, OpenMaya.MFnMesh):
+        points = shape_fn.getPoints(space)
+        point_count = len(points)
+    else:
+        points = shape_fn.cvPositions(space)
+        point_count = len(points)
+        if shape_fn.form == OpenMaya.MFnNurbsCurve.kPeriodic:
+            point_count -= shape_fn.degree  # Skip overlapping CVs
+    positions = array.array('d', bytes(8 * 3 * point_count))  # Zeros
+    for index in range(point_count):
+        point = points[index]
+        positions[index * 3] = point.x
+        positions[index * 3 + 1] = point.y
+        positions[index * 3 + 2] = point.z
+    return positions
+
+
+def set_component_positions_no_undo(shape, positions, world_space=True):
+    """
+    Sets the position of every point of a shape in a single call.
+    ("MFnMesh.setPoints" or "MFnNurbsCurve.setCVPositions")
+    This operation can't be undone. Use "set_component_positions_from_dict" for an undoable alternative.
+    Overlapping CVs of periodic curves are updated to match the CVs they overlap.
+
+    Args:
+        shape (str, MDagPath): Mesh or NURBS curve shape. (See "get_shape_points_fn")
+        positions (array.array, list): Flat list of floats indexed by component id. (See "get_component_positions")
+        world_space (bool, optional): If active, positions are in world space. If False, object space is used.
+
+    Raises:
+        ValueError: If the number of positions doesn't match the number of points in the shape.
+
+    Returns:
+        array.array or None: Positions before they were changed. Points set through OpenMaya are not recorded in
+                             Maya's undo queue, use these to restore them if necessary.
+                             None if the shape is missing or not supported.
+    """
+    old_positions = get_component_positions(shape=shape, world_space=world_space)
+    if old_positions is None:
+        logger.debug(f'Unable to set component positions. Missing or unsupported shape: "{shape}".')
+        return
+    if len(positions) != len(old_positions):
+        raise ValueError(f'Invalid positions. Expected {len(old_positions)} values, got {len(positions)}.')
+    shape_fn = get_shape_points_fn(shape)
+    space = OpenMaya.MSpace.kWorld if world_space else OpenMaya.MSpace.kObject
+    points = OpenMaya.MPointArray()
+    for index in range(0, len(positions), 3):
+        points.append(OpenMaya.MPoint(positions[index], positions[index + 1], positions[index + 2]))
+    if isinstance(shape_fn, OpenMaya.MFnMesh):
+        shape_fn.setPoints(points, space)
+    else:
+        if shape_fn.form == OpenMaya.MFnNurbsCurve.kPeriodic:
+            for index in range(shape_fn.degree):
+                points.append(points[index])  # Overlapping CVs
+        shape_fn.setCVPositions(points, space)
+        shape_fn.updateCurve()
+    return old_positions
+
+
+def set_control_point_positions(shape, positions_by_id, world_space=True):
+    """
+    Sets the position of some points of a mesh or NURBS curve shape.
+    Uses one undoable "cmds.setAttr" call per range of consecutive points. ("pnts" or "controlPoints")
+    Control points store offsets (mesh tweaks) or positions (curves), so the difference between the new and the
+    current position of each point is added to its control point value.
+    Overlapping CVs of periodic curves are updated to match the CVs they overlap.
+
+    Args:
+        shape (str, MDagPath): Mesh or NURBS curve shape. (See "get_shape_points_fn")
+        positions_by_id (dict): Component ids (keys) and their new positions (values). e.g. {0: [0, 1, 0]}
+        world_space (bool, optional): If active, positions are in world space. If False, object space is used.
+
+    Raises:
+        ValueError: If the shape is missing, not supported or doesn't have the provided components.
+    """
+    if not isinstance(shape, OpenMaya.MDagPath):
+        selection = OpenMaya.MSelectionList()
+        selection.add(str(shape))
+        shape = selection.getDagPath(0)
+    current_positions = get_component_positions(shape=shape, world_space=False)
+    if current_positions is None or not positions_by_id or max(positions_by_id) * 3 >= len(current_positions):
+        raise ValueError(f'Missing or unsupported components in "{shape}".')
+    point_count = len(current_positions) // 3
+    is_mesh = shape.hasFn(OpenMaya.MFn.kMesh)
+    attr_name, data_type = ("pnts", "float3") if is_mesh else ("controlPoints", "double3")
+    inverse_matrix = shape.inclusiveMatrixInverse() if world_space else None
+    offsets = {}  # Difference between new and current object space positions
+    for component_id, pos in positions_by_id.items():
+        point = OpenMaya.MPoint(*pos)
+        if inverse_matrix is not None:
+            point *= inverse_matrix
+        current = current_positions[component_id * 3:component_id * 3 + 3]
+        offsets[component_id] = (point.x - current[0], point.y - current[1], point.z - current[2])
+    if not is_mesh:
+        shape_fn = get_shape_points_fn(shape)
+        if shape_fn.form == OpenMaya.MFnNurbsCurve.kPeriodic:
+            for component_id in range(shape_fn.degree):
+                if component_id in offsets:
+                    offsets[component_id + point_count] = offsets.get(component_id)  # Overlapping CVs
+
+    shape_path = shape.fullPathName()
+    sorted_ids = sorted(offsets)
+    range_start = 0
+    for index, component_id in enumerate(sorted_ids):
+        is_range_end = index + 1 == len(sorted_ids) or sorted_ids[index + 1] != component_id + 1
+        if not is_range_end:
+            continue
+        range_ids = sorted_ids[range_start:index + 1]
+        plug = f'{shape_path}.{attr_name}[{range_ids[0]}:{range_ids[-1]}]'
+        values = []
+        for range_id, old_value in zip(range_ids, cmds.getAttr(plug)):
+            values.extend(old + offset for old, offset in zip(old_value, offsets.get(range_id)))
+        cmds.setAttr(plug, *values, type=data_type)
+        range_start = index + 1
+
+
 def get_component_positions_as_dict(obj_transform, full_path=True, world_space=True):
     """
     Retrieves the positions of components (e.g., vertices) of a given object in the specified space.
+    Mesh and curve shapes are read in a single call (see "get_component_positions"), other shapes use "cmds.xform".
 
     Args:
         obj_transform (str): The transform node of the object.
@@ -1236,20 +1634,27 @@ def get_component_positions_as_dict(obj_transform, full_path=True, world_space=T
         logger.warning(f'Unable to get component position dictionary. Missing object: {str(obj_transform)}')
         return {}
     shapes = cmds.listRelatives(obj_transform, shapes=True, fullPath=True) or []
-    components = []
+    component_pos_dict = {}
     for shape in shapes:
+        positions = get_component_positions(shape=shape, world_space=world_space)
+        if positions:
+            component_type = "vtx" if cmds.nodeType(shape) == "mesh" else "cv"
+            first_component = cmds.ls(f'{shape}.{component_type}[0]', long=full_path) or []
+            if first_component:
+                prefix = first_component[0][:-len("[0]")]  # Same name returned by "cmds.ls" (transform or shape)
+                for index in range(0, len(positions), 3):
+                    component_pos_dict[f'{prefix}[{index // 3}]'] = list(positions[index:index + 3])
+                continue
         from gt.utils.hierarchy_utils import get_shape_components
-        components.extend(get_shape_components(shape=shape, mesh_component_type="vtx", full_path=full_path))
-    component_pos_dict = {}
-    for cv in components:
-        try:
-            if world_space:
-                pos = cmds.xform(cv, query=True, worldSpace=True, translation=True)
-            else:
-                pos = cmds.xform(cv, query=True, objectSpace=True, translation=True)
-            component_pos_dict[cv] = pos
-        except Exception as e:
-            logger.debug(f'Unable to get CV position. Issue: {e}')
+        for cv in get_shape_components(shape=shape, mesh_component_type="vtx", full_path=full_path):
+            try:
+                if world_space:
+                    pos = cmds.xform(cv, query=True, worldSpace=True, translation=True)
+                else:
+                    pos = cmds.xform(cv, query=True, objectSpace=True, translation=True)
+                component_pos_dict[cv] = pos
+            except Exception as e:
+                logger.debug(f'Unable to get CV position. Issue: {e}')
     return component_pos_dict
 
 
@@ -1257,6 +1662,8 @@ def set_component_positions_from_dict(component_pos_dict, world_space=True):
     """
     Sets the positions of components (e.g., vertices) based on a provided dictionary.
     Provided dictionary should use the component path as keys and a list or tuple with X, Y, and Z floats as value.
+    Vertices and curve CVs are grouped by shape and set with one "cmds.setAttr" call per range of consecutive points
+    (see "set_control_point_positions"), other components use "cmds.xform". The operation can be undone.
 
     Args:
         component_pos_dict (dict): A dictionary where component names are keys, and their new positions are values.
@@ -1266,14 +1673,30 @@ def set_component_positions_from_dict(component_pos_dict, world_space=True):
 
     Raises:
         Exception: If there is an issue setting the position, an exception is logged, and the operation continues.
-
-    Note:
-        This function utilizes the 'cmds.xform' function to set component positions.
     """
     if not isinstance(component_pos_dict, dict):
         logger.debug(f'Unable to set component positions. Invalid component position dictionary.')
         return
+    # Group components by shape. e.g. {"|curve.cv": {0: [0, 1, 0], 1: [0, 2, 0]}}
+    shape_components = {}
+    remaining = {}
     for cv, pos in component_pos_dict.items():
+        match = re.match(r'^(.+\.(?:vtx|cv))\[(\d+)\]$', str(cv))
+        if match and pos is not None and len(pos) == 3:
+            shape_components.setdefault(match.group(1), {})[int(match.group(2))] = pos
+        else:
+            remaining[cv] = pos
+    for prefix, positions_by_id in shape_components.items():
+        try:
+            selection = OpenMaya.MSelectionList()
+            selection.add(f'{prefix}[0]')
+            dag_path, _component = selection.getComponent(0)  # Shape path, even when named after its transform
+            set_control_point_positions(shape=dag_path, positions_by_id=positions_by_id, world_space=world_space)
+        except Exception as e:
+            logger.debug(f'Unable to set positions of "{prefix}" in bulk. Issue: {e}')
+            for component_id, pos in positions_by_id.items():
+                remaining[f'{prefix}[{component_id}]'] = pos
+    for cv, pos in remaining.items():
         try:
             if world_space:
                 cmds.xform(cv, worldSpace=True, translation=pos)
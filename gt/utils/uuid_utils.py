@@ -3,6 +3,7 @@ UUID Utilities
 github.com/TrevisanGMW/gt-tools
 """
 from gt.utils.attr_utils import add_attr, set_attr
+import maya.api.OpenMaya as OpenMaya
 import maya.cmds as cmds
 import logging
 import random
@@ -15,6 +16,8 @@ logging.basicConfig()
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+_active_uuid_attr_index = None  # Used by "get_object_from_uuid_attr" while a "UUIDAttrIndex" context is active
+
 
 def generate_uuid(short=False, short_length=8, remove_dashes=False):
     """
@@ -109,6 +112,8 @@ def get_object_from_uuid_attr(uuid_string, attr_name, obj_type="transform"):
     Returns:
         str, None: If found, the object with a matching UUID, otherwise None
     """
+    if _active_uuid_attr_index is not None:
+        return _active_uuid_attr_index.get_object(uuid_string=uuid_string, attr_name=attr_name, obj_type=obj_type)
     obj_list = cmds.ls(typ=obj_type, long=True) or []
     for obj in obj_list:
         if cmds.objExists(f'{obj}.{attr_name}'):
@@ -117,6 +122,167 @@ def get_object_from_uuid_attr(uuid_string, attr_name, obj_type="transform"):
                 return obj
 
 
+class UUIDAttrIndex:
+    def __init__(self):
+        """
+        Index of UUID attribute values, used to find objects without scanning the scene for every lookup.
+        While used as a context manager ("with UUIDAttrIndex():"), "get_object_from_uuid_attr" answers from it.
+
+        The index of an attribute is built in a single pass the first time it's requested.
+        Objects are stored using their Maya UUIDs, so renaming or re-parenting them doesn't invalidate the index.
+        Scene callbacks mark the index as outdated when nodes are added or removed, and so do attribute changes made
+        through "attr_utils.set_attr" and "attr_utils.add_attr" (see "invalidate_uuid_attr_index").
+        Outdated indices are only rebuilt when a lookup fails. Found objects are always validated.
+        """
+        self.indices = {}  # Key: (attr_name, obj_type), Value: {uuid_string: maya_uuid}
+        self.updated_keys = set()  # Indices built after the last node was added or removed
+        self.callback_ids = []
+        self.is_active = False
+        self.lookup_count = 0
+        self.build_count = 0
+
+    def __enter__(self):
+        """
+        Activates the index, so "get_object_from_uuid_attr" answers from it.
+        If another index is already active (nested contexts), the outer index is used instead.
+        """
+        global _active_uuid_attr_index
+        if _active_uuid_attr_index is None:
+            _active_uuid_attr_index = self
+            self.is_active = True
+            self.add_callbacks()
+        return _active_uuid_attr_index
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """
+        Deactivates the index and removes its scene callbacks.
+        """
+        global _active_uuid_attr_index
+        if self.is_active:
+            self.remove_callbacks()
+            self.is_active = False
+            _active_uuid_attr_index = None
+            logger.debug(f'UUID attribute index: {self.lookup_count} lookups, {self.build_count} index builds.')
+
+    def add_callbacks(self):
+        """
+        Adds scene callbacks used to detect when nodes are added or removed.
+        """
+        self.callback_ids.append(OpenMaya.MDGMessage.addNodeAddedCallback(self.on_scene_changed, "dependNode"))
+        self.callback_ids.append(OpenMaya.MDGMessage.addNodeRemovedCallback(self.on_scene_changed, "dependNode"))
+
+    def remove_callbacks(self):
+        """
+        Removes scene callbacks added by this index.
+        """
+        for callback_id in self.callback_ids:
+            try:
+                OpenMaya.MMessage.removeCallback(callback_id)
+            except Exception as e:
+                logger.debug(f'Unable to remove UUID attribute index callback. Issue: {str(e)}')
+        self.callback_ids = []
+
+    def on_scene_changed(self, *args):
+        """
+        Called when nodes are added or removed. Marks all indices as outdated.
+        """
+        self.updated_keys.clear()
+
+    def mark_outdated(self, attr_name=None):
+        """
+        Marks indices as outdated, so they are rebuilt when a lookup fails.
+        Args:
+            attr_name (str, optional): Only indices of this attribute are marked. If not provided, all are marked.
+        """
+        if attr_name is None:
+            self.updated_keys.clear()
+            return
+        for key in [key for key in self.updated_keys if key[0] == attr_name]:
+            self.updated_keys.discard(key)
+
+    def clear(self):
+        """
+        Removes all indices. They are built again when requested.
+        """
+        self.indices.clear()
+        self.updated_keys.clear()
+
+    def build_index(self, attr_name, obj_type="transform"):
+        """
+        Reads the UUID attribute of all objects of the given type. (Single pass through the scene)
+        When multiple objects have the same UUID, the first one is kept. (Same as "get_object_from_uuid_attr")
+        Args:
+            attr_name (string): Name of the attribute where the UUID is stored.
+            obj_type (optional, string): Type of objects to look for (default is "transform")
+        Returns:
+            dict: UUID attribute values (keys) and the Maya UUID of the object that has it (values)
+        """
+        index = {}
+        obj_list = cmds.ls(typ=obj_type, long=True) or []
+        for obj in obj_list:
+            if cmds.objExists(f'{obj}.{attr_name}'):
+                existing_uuid = cmds.getAttr(f'{obj}.{attr_name}')
+                if existing_uuid and existing_uuid not in index:
+                    index[existing_uuid] = get_uuid(obj)
+        key = (attr_name, obj_type)
+        self.indices[key] = index
+        self.updated_keys.add(key)
+        self.build_count += 1
+        return index
+
+    def get_indexed_object(self, uuid_string, attr_name, obj_type="transform"):
+        """
+        Gets an object from the index without updating it.
+        Args:
+            uuid_string (string): UUID to look for.
+            attr_name (string): Name of the attribute where the UUID is stored.
+            obj_type (optional, string): Type of objects to look for (default is "transform")
+        Returns:
+            tuple: (object, is_valid) - Long name of the object (None if not found), and False if the index has an
+                   entry for the UUID that is no longer valid (deleted object or different attribute value).
+        """
+        maya_uuid = self.indices.get((attr_name, obj_type), {}).get(uuid_string)
+        if not maya_uuid:
+            return None, True
+        obj = get_object_from_uuid(maya_uuid)
+        if obj and cmds.objExists(f'{obj}.{attr_name}') and cmds.getAttr(f'{obj}.{attr_name}') == uuid_string:
+            return obj, True
+        return None, False
+
+    def get_object(self, uuid_string, attr_name, obj_type="transform"):
+        """
+        Return object if provided UUID is present in it. Same as "get_object_from_uuid_attr", but using the index.
+        Args:
+            uuid_string (string): UUID to look for (if it matches, then the object is found)
+            attr_name (string): Name of the attribute where the UUID is stored.
+            obj_type (optional, string): Type of objects to look for (default is "transform")
+        Returns:
+            str, None: If found, the object with a matching UUID, otherwise None
+        """
+        self.lookup_count += 1
+        if not uuid_string:
+            return
+        key = (attr_name, obj_type)
+        if key not in self.indices:
+            self.build_index(attr_name=attr_name, obj_type=obj_type)
+        obj, is_valid = self.get_indexed_object(uuid_string=uuid_string, attr_name=attr_name, obj_type=obj_type)
+        if obj is None and (key not in self.updated_keys or not is_valid):
+            self.build_index(attr_name=attr_name, obj_type=obj_type)
+            obj, _ = self.get_indexed_object(uuid_string=uuid_string, attr_name=attr_name, obj_type=obj_type)
+        return obj
+
+
+def invalidate_uuid_attr_index(attr_name=None):
+    """
+    Marks the active "UUIDAttrIndex" (if there is one) as outdated. Used by helpers that change attribute values
+    the index callbacks can't detect. (e.g. "attr_utils.set_attr" setting a UUID on an existing object)
+    Args:
+        attr_name (str, optional): Name of the changed attribute. If not provided, all indices are marked.
+    """
+    if _active_uuid_attr_index is not None:
+        _active_uuid_attr_index.mark_outdated(attr_name=attr_name)
+
+
 def get_uuid(obj_name):
     """
     Get the UUID of a Maya object from its long name.
@@ -33,22 +33,27 @@ modules_to_test = [
     test_ui.test_input_window_text,
     test_ui.test_line_text_widget,
     test_ui.test_maya_menu,
+    test_ui.test_preview_image_loader,
     test_ui.test_progress_bar,
     test_ui.test_python_output_view,
     test_ui.test_qt_utils,
     test_ui.test_resource_library,
     # Tools
+    test_auto_rigger.test_rig_batch_builder,
     test_auto_rigger.test_rig_framework,
+    test_auto_rigger.test_rig_serialization,
     test_curve_library.test_curve_library_model,
     test_package_updater.test_package_updater_model,
     test_sample_tool.test_sample_tool_model,
     # Utils
     test_utils.test_alembic_utils,
     test_utils.test_anim_utils,
+    test_utils.test_array_math_utils,
     test_utils.test_attr_utils,
     test_utils.test_color_utils,
     test_utils.test_camera_utils,
     test_utils.test_cleanup_utils,
+    test_utils.test_component_utils,
     test_utils.test_constraint_utils,
     test_utils.test_control_data,
     test_utils.test_control_utils,
@@ -1 +1,3 @@
+from . import test_rig_batch_builder
 from . import test_rig_framework
+from . import test_rig_serialization
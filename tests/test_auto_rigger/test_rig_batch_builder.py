@@ -0,0 +1,81 @@
+import unittest
+import logging
+import sys
+import os
+
+# Logging Setup
+logging.basicConfig()
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+
+# Import Utility and Maya Test Tools
+test_utils_dir = os.path.dirname(__file__)
+tests_dir = os.path.dirname(test_utils_dir)
+package_root_dir = os.path.dirname(tests_dir)
+for to_append in [package_root_dir, tests_dir]:
+    if to_append not in sys.path:
+        sys.path.append(to_append)
+from gt.tools.auto_rigger.rigger_model import RiggerModel
+from gt.tools.auto_rigger import rig_batch_builder
+from tests import maya_test_tools
+cmds = maya_test_tools.cmds
+
+
+class TestRigBatchBuilder(unittest.TestCase):
+    def setUp(self):
+        maya_test_tools.force_new_scene()
+        self.temp_dir = maya_test_tools.generate_test_temp_dir()
+
+    def tearDown(self):
+        maya_test_tools.delete_test_temp_dir()
+
+    @classmethod
+    def setUpClass(cls):
+        maya_test_tools.import_maya_standalone(initialize=True)  # Start Maya Headless (mayapy.exe)
+
+    def test_get_project_files(self):
+        project_a = os.path.join(self.temp_dir, "project_a.json")
+        project_b = os.path.join(self.temp_dir, "project_b.rig")
+        for path in [project_a, project_b, os.path.join(self.temp_dir, "notes.txt"),
+                     os.path.join(self.temp_dir, rig_batch_builder.BATCH_REPORT_FILE_NAME)]:
+            with open(path, "w") as file:
+                file.write("{}")
+        result = rig_batch_builder.get_project_files([self.temp_dir, project_a, "missing_project.json"])
+        expected = [os.path.abspath(project_a), os.path.abspath(project_b)]
+        self.assertEqual(expected, result)
+
+    def test_get_output_names(self):
+        project_a = os.path.join("folder_a", "biped.json")
+        project_b = os.path.join("folder_b", "biped.rig")
+        project_c = os.path.join("folder_b", "biped_2.json")
+        project_d = os.path.join("folder_c", "Biped.json")
+        result = rig_batch_builder.get_output_names([project_a, project_b, project_c, project_d])
+        expected = {project_a: "biped", project_b: "biped_2", project_c: "biped_2_2", project_d: "Biped_3"}
+        self.assertEqual(expected, result)
+
+    def test_get_worker_command(self):
+        result = rig_batch_builder.get_worker_command(maya_python="mayapy", project_path="project.json",
+                                                      output_path="project.mb", result_path="result.json",
+                                                      build_rig=False)
+        self.assertEqual("mayapy", result[0])
+        self.assertEqual(["--worker", "project.json", "--output", "project.mb", "--result", "result.json",
+                          "--proxy-only"], result[2:])
+
+    def test_build_project_file(self):
+        project_path = os.path.join(self.temp_dir, "project.json")
+        output_path = os.path.join(self.temp_dir, "project.ma")
+        RiggerModel().save_project_to_file(path=project_path)
+        result = rig_batch_builder.build_project_file(project_path=project_path, output_path=output_path,
+                                                      build_rig=False)
+        self.assertTrue(os.path.exists(output_path))
+        self.assertIn("build_duration", result)
+        self.assertIn("profile", result)
+
+    def test_build_project_file_invalid(self):
+        project_path = os.path.join(self.temp_dir, "project.json")
+        output_path = os.path.join(self.temp_dir, "project.ma")
+        with open(project_path, "w") as file:
+            file.write("mocked_invalid_content")
+        with self.assertRaises(ValueError):
+            rig_batch_builder.build_project_file(project_path=project_path, output_path=output_path)
+        self.assertFalse(os.path.exists(output_path))
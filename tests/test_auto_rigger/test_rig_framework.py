@@ -124,6 +124,19 @@ class TestRigFramework(unittest.TestCase):
         expected = "proxy"
         self.assertEqual(expected, result.get_short_name())
 
+    def test_proxy_slots(self):
+        for obj in [self.proxy, self.proxy_data, rig_framework.OrientationData(), Transform()]:
+            self.assertFalse(hasattr(obj, "__dict__"))
+        with self.assertRaises(AttributeError):
+            self.proxy.unknown_attribute = True
+
+    def test_proxy_default_curve_name(self):
+        proxy = Proxy(name="description")
+        self.assertIsNone(proxy._curve)  # Created on first access
+        self.assertEqual("description", proxy.curve.get_name())
+        proxy.set_name("new_description")
+        self.assertEqual("new_description", proxy.curve.get_name())
+
     def test_proxy_get_name_default(self):
         result = self.proxy.get_name()
         expected = "proxy"
@@ -287,6 +300,184 @@ class TestRigFramework(unittest.TestCase):
         result = self.proxy.get_metadata()
         self.assertEqual(mocked_dict, result)
 
+    def test_proxy_dirty_keys(self):
+        self.assertTrue(self.proxy.is_dirty())  # Never built
+        self.proxy.update_built_snapshot()
+        self.assertFalse(self.proxy.is_dirty())
+        self.proxy.set_position(xyz=(1, 2, 3))
+        self.proxy.add_color(rgb_color=(1, 0, 0))
+        self.assertEqual({"transform", "attributes"}, self.proxy.get_dirty_keys())
+        self.proxy.update_built_snapshot()
+        self.proxy.add_to_attr_dict(attr="mockedAttr", value=1)  # In-place edits are detected
+        self.assertEqual({"attributes"}, self.proxy.get_dirty_keys())
+
+    def test_module_proxy_rebuild_required(self):
+        module = rig_framework.ModuleGeneric()
+        proxy = module.add_new_proxy()
+        self.assertTrue(module.is_proxy_rebuild_required())  # Never built
+        module.update_built_snapshot()
+        self.assertFalse(module.is_dirty())
+        proxy.set_position(xyz=(1, 2, 3))
+        self.assertTrue(module.is_dirty())
+        self.assertFalse(module.is_proxy_rebuild_required())  # Position is updated in place
+        module.set_prefix("mocked")
+        self.assertTrue(module.is_proxy_rebuild_required())
+        module.update_built_snapshot()
+        module.add_new_proxy()
+        self.assertTrue(module.is_proxy_rebuild_required())
+
+    def test_project_update_proxy(self):
+        project = rig_framework.RigProject()
+        module_a = rig_framework.ModuleGeneric()
+        proxy_a = module_a.add_new_proxy()
+        module_b = rig_framework.ModuleGeneric()
+        proxy_b = module_b.add_new_proxy()
+        proxy_b.set_parent_uuid_from_proxy(proxy_a)
+        project.add_to_modules([module_a, module_b])
+        self.assertFalse(project.is_proxy_update_possible())
+        project.build_proxy()
+        self.assertTrue(project.is_proxy_update_possible())
+        built_proxy_b = cmds.ls(rig_framework.find_proxy_from_uuid(proxy_b.get_uuid()), uuid=True)
+
+        proxy_b.set_position(xyz=(0, 5, 0))
+        self.assertTrue(project.update_proxy())
+        built_proxy = rig_framework.find_proxy_from_uuid(proxy_b.get_uuid())
+        position = cmds.xform(built_proxy, query=True, translation=True, worldSpace=True)
+        self.assertEqual([0, 5, 0], [round(value, 3) for value in position])
+        self.assertEqual(built_proxy_b, cmds.ls(built_proxy, uuid=True))  # Same object, not rebuilt
+
+        module_a.set_prefix("mocked")  # Rebuilds module A, B is kept and parented to the new proxy
+        self.assertTrue(project.update_proxy())
+        built_proxy_a = rig_framework.find_proxy_from_uuid(proxy_a.get_uuid())
+        self.assertTrue(str(built_proxy_a).endswith("mocked_proxy"))
+        built_proxy = rig_framework.find_proxy_from_uuid(proxy_b.get_uuid())
+        self.assertEqual(built_proxy_b, cmds.ls(built_proxy, uuid=True))
+        self.assertIn(str(built_proxy_a), str(built_proxy))
+
+    def test_project_proxy_scene_changes(self):
+        project = rig_framework.RigProject()
+        module = rig_framework.ModuleGeneric()
+        proxy = module.add_new_proxy()
+        proxy.set_position(xyz=(0, 5, 0))
+        project.add_to_modules(module)
+        self.assertFalse(project.has_proxy_scene_changes())  # Never built
+        project.build_proxy()
+        self.assertFalse(project.has_proxy_scene_changes())
+        proxy.set_position(xyz=(0, 10, 0))  # Data changes are not scene changes
+        self.assertFalse(project.has_proxy_scene_changes())
+        built_proxy = rig_framework.find_proxy_from_uuid(proxy.get_uuid())
+        cmds.setAttr(f'{built_proxy}.tx', 2)  # Moved in the viewport
+        self.assertTrue(project.has_proxy_scene_changes())
+
+    def test_module_hash(self):
+        module = rig_framework.ModuleGeneric()
+        module.add_new_proxy()
+        result = module.get_module_hash()
+        self.assertEqual(result, module.get_module_hash())
+        module.set_prefix("mocked")
+        self.assertNotEqual(result, module.get_module_hash())
+
+    def test_project_update_rig(self):
+        project = rig_framework.RigProject()
+        module_a = rig_framework.ModuleGeneric()
+        proxy_a = module_a.add_new_proxy()
+        module_b = rig_framework.ModuleGeneric()
+        proxy_b = module_b.add_new_proxy()
+        proxy_b.set_parent_uuid_from_proxy(proxy_a)
+        module_c = rig_framework.ModuleGeneric()
+        proxy_c = module_c.add_new_proxy()
+        project.add_to_modules([module_a, module_b, module_c])
+        project.build_proxy(optimized=True)
+        project.build_rig()
+        self.assertTrue(project.is_rig_update_possible())
+        self.assertEqual([], project.get_rig_modules_to_rebuild())
+        joint_b = cmds.ls(rig_framework.find_joint_from_uuid(proxy_b.get_uuid()), uuid=True)
+        joint_c = cmds.ls(rig_framework.find_joint_from_uuid(proxy_c.get_uuid()), uuid=True)
+
+        proxy_a.set_position(xyz=(0, 5, 0))
+        self.assertEqual([module_a, module_b], project.get_rig_modules_to_rebuild())  # B is parented to A
+        self.assertTrue(project.update_rig())
+        joint_a = rig_framework.find_joint_from_uuid(proxy_a.get_uuid())
+        position = cmds.xform(joint_a, query=True, translation=True, worldSpace=True)
+        self.assertEqual([0, 5, 0], [round(value, 3) for value in position])
+        self.assertNotEqual(joint_b, cmds.ls(rig_framework.find_joint_from_uuid(proxy_b.get_uuid()), uuid=True))
+        self.assertEqual(joint_c, cmds.ls(rig_framework.find_joint_from_uuid(proxy_c.get_uuid()), uuid=True))
+        self.assertEqual(3, len(cmds.ls(type="joint")))  # Old joints were deleted
+
+    def test_project_update_rig_nothing_changed(self):
+        project = rig_framework.RigProject()
+        module = rig_framework.ModuleGeneric()
+        module.add_new_proxy()
+        project.add_to_modules(module)
+        project.build_proxy(optimized=True)
+        project.build_rig()
+        cube = cmds.polyCube(name="mocked_cube")[0]
+        self.assertEqual([], project.get_rig_nodes_to_delete())
+        self.assertTrue(project.update_rig())
+        self.assertTrue(cmds.objExists(cube))  # Unrelated nodes are kept
+        self.assertTrue(rig_framework.find_rig_root_group())
+
+    def test_project_update_rig_new_module(self):
+        project = rig_framework.RigProject()
+        module_a = rig_framework.ModuleGeneric()
+        proxy_a = module_a.add_new_proxy()
+        project.add_to_modules(module_a)
+        project.build_proxy(optimized=True)
+        project.build_rig()
+        cube = cmds.polyCube(name="mocked_cube")[0]
+        joint_a = cmds.ls(rig_framework.find_joint_from_uuid(proxy_a.get_uuid()), uuid=True)
+
+        module_b = rig_framework.ModuleGeneric()
+        proxy_b = module_b.add_new_proxy()
+        project.add_to_modules(module_b)
+        self.assertEqual([module_b], project.get_rig_modules_to_rebuild())
+        self.assertEqual([], project.get_rig_nodes_to_delete())  # Nothing to delete, only a new module
+        self.assertTrue(project.update_rig())
+        self.assertTrue(cmds.objExists(cube))
+        self.assertEqual(joint_a, cmds.ls(rig_framework.find_joint_from_uuid(proxy_a.get_uuid()), uuid=True))
+        self.assertTrue(rig_framework.find_joint_from_uuid(proxy_b.get_uuid()))
+
+    def test_project_update_rig_skinned_joints(self):
+        project = rig_framework.RigProject()
+        module = rig_framework.ModuleGeneric()
+        proxy = module.add_new_proxy()
+        project.add_to_modules(module)
+        project.build_proxy(optimized=True)
+        project.build_rig()
+        joint = rig_framework.find_joint_from_uuid(proxy.get_uuid())
+        cube = cmds.polyCube(name="mocked_cube")[0]
+        cmds.skinCluster(str(joint), cube)
+        self.assertEqual([], project.get_rig_update_skinned_joints())  # Nothing changed
+        proxy.set_position(xyz=(0, 5, 0))
+        expected = cmds.ls(str(joint), long=True)
+        self.assertEqual(expected, project.get_rig_update_skinned_joints())
+        self.assertFalse(project.update_rig())  # Fully rebuilt instead
+
+    def test_build_profiler_phases(self):
+        from gt.tools.auto_rigger.rig_profiler import BuildProfiler, profile_phase, get_last_build_profiler
+        with BuildProfiler() as profiler:
+            with profile_phase("build_proxy", module="mocked_module"):
+                cmds.polyCube()
+            with profile_phase("build_rig", module="mocked_module"):
+                pass
+        self.assertEqual(profiler, get_last_build_profiler())
+        records = profiler.get_records()
+        self.assertEqual(["build_proxy", "build_rig"], [record.get("phase") for record in records])
+        self.assertTrue(records[0].get("nodes") > 0)
+        self.assertEqual(0, records[1].get("nodes"))
+        summary = profiler.get_summary(group_by="module")
+        self.assertEqual(["mocked_module"], list(summary))
+        self.assertEqual(2, summary.get("mocked_module").get("count"))
+        trace = profiler.get_chrome_trace()
+        self.assertEqual(2, len(trace.get("traceEvents")))
+        self.assertEqual("X", trace.get("traceEvents")[0].get("ph"))
+
+    def test_build_profiler_inactive(self):
+        from gt.tools.auto_rigger.rig_profiler import profile_phase
+        with profile_phase("build_rig", module="mocked_module"):
+            result = cmds.polyCube()
+        self.assertTrue(result)
+
     # Create find driver tests:
     # out_find_driver = self.find_driver(driver_type=RiggerDriverTypes.FK, proxy_purpose=self.hip)
     # out_find_module_drivers = self.find_module_drivers()
@@ -0,0 +1,77 @@
+import unittest
+import logging
+import sys
+import os
+
+# Logging Setup
+logging.basicConfig()
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+
+# Import Utility and Maya Test Tools
+test_utils_dir = os.path.dirname(__file__)
+tests_dir = os.path.dirname(test_utils_dir)
+package_root_dir = os.path.dirname(tests_dir)
+for to_append in [package_root_dir, tests_dir]:
+    if to_append not in sys.path:
+        sys.path.append(to_append)
+from gt.tools.auto_rigger.template_biped import create_template_biped
+from gt.tools.auto_rigger.rig_framework import RigProject
+from gt.tools.auto_rigger import rig_serialization
+from gt.utils.data_utils import write_json
+from tests import maya_test_tools
+
+
+class TestRigSerialization(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = maya_test_tools.generate_test_temp_dir()
+        self.project_dict = create_template_biped().get_project_as_dict()
+
+    def tearDown(self):
+        maya_test_tools.delete_test_temp_dir()
+
+    @classmethod
+    def setUpClass(cls):
+        maya_test_tools.import_maya_standalone(initialize=True)  # Start Maya Headless (mayapy.exe)
+
+    def test_encode_decode_project(self):
+        encoded = rig_serialization.encode_project_dict(self.project_dict)
+        self.assertEqual(rig_serialization.PROJECT_SCHEMA_NAME, encoded.get("schema"))
+        self.assertEqual(rig_serialization.PROJECT_SCHEMA_VERSION, encoded.get("version"))
+        self.assertEqual(len(set(encoded.get("uuids"))), len(encoded.get("uuids")))
+        self.assertEqual(0, len(encoded.get("transforms")) % rig_serialization.TRANSFORM_ROW_SIZE)
+        decoded = rig_serialization.decode_project_data(encoded)
+        project = RigProject().read_data_from_dict(decoded)
+        self.assertEqual(self.project_dict, project.get_project_as_dict())
+
+    def test_shared_transform_rows(self):
+        encoded = rig_serialization.encode_project_dict(self.project_dict)
+        proxy_count = sum(len(module.get("proxies")) for module in encoded.get("modules"))
+        row_count = len(encoded.get("transforms")) // rig_serialization.TRANSFORM_ROW_SIZE
+        self.assertLess(row_count, proxy_count * 2)  # Default offsets are stored once
+
+    def test_validate_project_data(self):
+        encoded = rig_serialization.encode_project_dict(self.project_dict)
+        rig_serialization.validate_project_data(encoded)  # Valid, no errors
+        encoded["modules"][0]["proxies"][0][1] = len(encoded.get("uuids"))
+        with self.assertRaises(ValueError):
+            rig_serialization.validate_project_data(encoded)
+        with self.assertRaises(ValueError):
+            rig_serialization.validate_project_data({"schema": rig_serialization.PROJECT_SCHEMA_NAME,
+                                                     "version": rig_serialization.PROJECT_SCHEMA_VERSION + 1})
+
+    def test_write_read_project_file(self):
+        for compress in [False, True]:
+            path = os.path.join(self.temp_dir, f'project_{compress}.rig')
+            rig_serialization.write_project_file(path=path, project_dict=self.project_dict, compress=compress)
+            with open(path, "rb") as project_file:
+                is_compressed = project_file.read().startswith(rig_serialization.PROJECT_FILE_MAGIC)
+            self.assertEqual(compress, is_compressed)
+            project = RigProject().read_data_from_dict(rig_serialization.read_project_file(path))
+            self.assertEqual(self.project_dict, project.get_project_as_dict())
+
+    def test_read_project_file_plain_dict(self):
+        path = os.path.join(self.temp_dir, "project.json")
+        write_json(path=path, data=self.project_dict)
+        result = rig_serialization.read_project_file(path)
+        self.assertEqual(len(self.project_dict.get("modules")), len(result.get("modules")))
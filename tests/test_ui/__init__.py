@@ -1,6 +1,7 @@
 from . import test_input_window_text
 from . import test_line_text_widget
 from . import test_maya_menu
+from . import test_preview_image_loader
 from . import test_progress_bar
 from . import test_python_output_view
 from . import test_qt_utils
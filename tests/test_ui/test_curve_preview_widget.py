@@ -0,0 +1,54 @@
+from PySide2.QtWidgets import QApplication
+import unittest
+import logging
+import sys
+import os
+
+# Logging Setup
+logging.basicConfig()
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+
+# Import Tested Script
+test_utils_dir = os.path.dirname(__file__)
+tests_dir = os.path.dirname(test_utils_dir)
+package_root_dir = os.path.dirname(tests_dir)
+for to_append in [package_root_dir, tests_dir]:
+    if to_append not in sys.path:
+        sys.path.append(to_append)
+from gt.ui.curve_preview_widget import CurvePreviewWidget
+
+
+class TestCurvePreviewWidget(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        app = QApplication.instance()
+        if not app:
+            cls.app = QApplication(sys.argv)
+
+    def setUp(self):
+        self.widget = CurvePreviewWidget(margin=0)
+        self.widget.resize(100, 100)
+        self.square_xz = {"points": [[0, 0, 0], [2, 0, 0], [2, 0, 1], [0, 0, 1]], "knot": [0, 1, 2, 3], "degree": 1}
+
+    def test_set_shapes(self):
+        self.widget.set_shapes([self.square_xz])
+        self.assertEqual(1, len(self.widget.curves_points))
+        self.assertEqual("", self.widget.message)
+
+    def test_set_message(self):
+        self.widget.set_shapes([self.square_xz])
+        self.widget.set_message("Invalid parameters")
+        self.assertEqual([], self.widget.curves_points)
+        self.assertEqual("Invalid parameters", self.widget.message)
+
+    def test_get_projection_axes(self):
+        self.widget.set_shapes([self.square_xz])
+        self.assertEqual((0, 2), self.widget.get_projection_axes())
+
+    def test_get_projected_polygons(self):
+        self.widget.set_shapes([self.square_xz])
+        polygons = self.widget.get_projected_polygons()
+        self.assertEqual(1, len(polygons))
+        points = [(round(point.x()), round(point.y())) for point in polygons[0]]
+        self.assertEqual([(0, 25), (100, 25), (100, 75), (0, 75)], points)  # Fitted and centered (keeps ratio)
@@ -44,6 +44,12 @@ class TestInputWindowText(unittest.TestCase):
         self.window.set_text_field_placeholder(expected_placeholder)
         self.assertEqual(self.window.text_field.placeholderText(), expected_placeholder)
 
+    def test_add_input_widget(self):
+        from PySide2.QtWidgets import QLabel
+        widget = QLabel("preview")
+        self.window.add_input_widget(widget)
+        self.assertEqual(widget, self.window.layout_input.itemAt(1).widget())
+
     def test_confirm_button_text(self):
         expected_button_text = "OK"
         self.window.set_confirm_button_text(expected_button_text)
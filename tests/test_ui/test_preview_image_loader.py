@@ -0,0 +1,104 @@
+from PySide2.QtWidgets import QApplication, QWidget
+from PySide2.QtCore import QSize
+from unittest.mock import MagicMock
+import unittest
+import logging
+import sys
+import os
+
+# Logging Setup
+logging.basicConfig()
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+
+# Import Tested Script
+test_utils_dir = os.path.dirname(__file__)
+tests_dir = os.path.dirname(test_utils_dir)
+package_root_dir = os.path.dirname(tests_dir)
+for to_append in [package_root_dir, tests_dir]:
+    if to_append not in sys.path:
+        sys.path.append(to_append)
+from gt.ui.preview_image_loader import PreviewImageLoader, get_preview_size
+from gt.ui import resource_library
+
+
+class TestPreviewImageLoader(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        app = QApplication.instance()
+        if not app:
+            cls.app = QApplication(sys.argv)
+
+    def setUp(self):
+        self.loader = PreviewImageLoader()
+        self.image_path = resource_library.Icon.library_missing_file
+
+    def wait_for_loader(self):
+        self.loader.wait_for_done()
+        QApplication.processEvents()  # Delivers queued "loaded" signals to the main thread
+
+    def test_get_cache_key(self):
+        result = self.loader.get_cache_key(image_path=self.image_path, size=QSize(64, 32))
+        expected = (self.image_path, os.path.getmtime(self.image_path), (64, 32))
+        self.assertEqual(expected, result)
+
+    def test_get_cache_key_missing_file(self):
+        result = self.loader.get_cache_key(image_path="mocked_missing_file.png")
+        expected = ("mocked_missing_file.png", None, None)
+        self.assertEqual(expected, result)
+
+    def test_request_pixmap(self):
+        mocked_slot = MagicMock()
+        self.loader.image_loaded.connect(mocked_slot)
+        result = self.loader.request_pixmap(image_path=self.image_path)
+        self.assertIsNone(result)  # Loading in the background
+        self.wait_for_loader()
+        mocked_slot.assert_called_once()
+        self.assertEqual(self.image_path, mocked_slot.call_args[0][0])
+        result = self.loader.request_pixmap(image_path=self.image_path)
+        self.assertFalse(result.isNull())  # Cached
+
+    def test_request_pixmap_scaled(self):
+        self.loader.request_pixmap(image_path=self.image_path, size=QSize(16, 16))
+        self.wait_for_loader()
+        result = self.loader.get_cached_pixmap(image_path=self.image_path, size=QSize(16, 16))
+        self.assertLessEqual(result.width(), 16)
+        self.assertLessEqual(result.height(), 16)
+
+    def test_get_preview_size(self):
+        widget = QWidget()
+        widget.resize(300, 200)
+        result = get_preview_size(widget, step=128, minimum=64)
+        side = -(-int(300 * widget.devicePixelRatioF()) // 128) * 128
+        self.assertEqual(QSize(side, side), result)
+
+    def test_get_preview_size_minimum(self):
+        widget = QWidget()
+        widget.resize(10, 10)
+        result = get_preview_size(widget, step=128, minimum=256)
+        self.assertGreaterEqual(result.width(), 256)
+        self.assertEqual(0, result.width() % 128)
+
+    def test_request_pixmap_missing_file(self):
+        mocked_slot = MagicMock()
+        self.loader.image_loaded.connect(mocked_slot)
+        self.loader.request_pixmap(image_path="mocked_missing_file.png")
+        self.wait_for_loader()
+        pixmap = mocked_slot.call_args[0][1]
+        self.assertTrue(pixmap.isNull())
+        self.assertEqual(0, len(self.loader.cache))
+
+    def test_cache_limit(self):
+        self.loader.max_cached = 2
+        for size in [8, 16, 32]:
+            self.loader.request_pixmap(image_path=self.image_path, size=QSize(size, size))
+            self.wait_for_loader()
+        self.assertEqual(2, len(self.loader.cache))
+        result = self.loader.get_cached_pixmap(image_path=self.image_path, size=QSize(8, 8))
+        self.assertIsNone(result)  # Least recently used was removed
+
+    def test_clear(self):
+        self.loader.request_pixmap(image_path=self.image_path)
+        self.wait_for_loader()
+        self.loader.clear()
+        self.assertEqual(0, len(self.loader.cache))
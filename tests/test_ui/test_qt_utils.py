@@ -394,3 +394,116 @@ class TestQtUtilities(unittest.TestCase):
         # Test with a negative screen number (screen_number = -1)
         with self.assertRaises(ValueError):
             qt_utils.get_screen_dpi_scale(-1)
+
+    def test_q_list_widget_filter(self):
+        from PySide2.QtWidgets import QListWidget
+        list_widget = QListWidget()
+        for name in ["circle", "circle_arrow", "square", "arrow"]:
+            list_widget.addItem(name)
+        list_filter = qt_utils.QListWidgetFilter(list_widget)
+        list_filter.rebuild_index()
+        list_widget.setCurrentRow(2)
+
+        result = list_filter.apply_filter("arr")
+        self.assertEqual({1, 3}, result)
+        hidden = [list_widget.item(row).isHidden() for row in range(list_widget.count())]
+        self.assertEqual([True, False, True, False], hidden)
+        self.assertEqual(1, list_widget.currentRow())  # Current item was hidden, first visible is selected
+
+        list_filter.apply_filter("arrow")
+        list_filter.apply_filter("ARROW")
+        hidden = [list_widget.item(row).isHidden() for row in range(list_widget.count())]
+        self.assertEqual([True, False, True, False], hidden)
+
+        list_filter.apply_filter("")
+        hidden = [list_widget.item(row).isHidden() for row in range(list_widget.count())]
+        self.assertEqual([False, False, False, False], hidden)
+
+    def test_q_list_widget_filter_rebuild_index(self):
+        from PySide2.QtWidgets import QListWidget
+        list_widget = QListWidget()
+        list_widget.addItem("circle")
+        list_filter = qt_utils.QListWidgetFilter(list_widget)
+        list_filter.rebuild_index()
+        list_filter.apply_filter("square")
+        self.assertTrue(list_widget.item(0).isHidden())
+        list_widget.addItem("square")
+        list_filter.rebuild_index()  # Keeps current filter
+        self.assertTrue(list_widget.item(0).isHidden())
+        self.assertFalse(list_widget.item(1).isHidden())
+
+    def test_q_list_widget_filter_metadata(self):
+        from PySide2.QtWidgets import QListWidget, QListWidgetItem
+        from PySide2.QtCore import Qt
+        list_widget = QListWidget()
+        items = [("circle", "Curve"), ("arrow", "User Curve"), ("square", None), ("curve_arrow", "Control")]
+        for name, item_type in items:
+            item = QListWidgetItem(name)
+            item.setData(Qt.UserRole, {"object": object(), "item_type": item_type})
+            list_widget.addItem(item)
+        list_filter = qt_utils.QListWidgetFilter(list_widget)
+        list_filter.rebuild_index()
+        result = list_filter.apply_filter("user")
+        self.assertEqual(set(), result)  # Types are not part of the name search
+        result = list_filter.apply_filter("curve")
+        self.assertEqual({3}, result)
+        result = list_filter.apply_filter("type:user")
+        self.assertEqual({1}, result)
+        result = list_filter.apply_filter("type:curve")
+        self.assertEqual({0}, result)
+        result = list_filter.apply_filter("arrow type:user_curve")
+        self.assertEqual({1}, result)
+        result = list_filter.apply_filter("TYPE:Curve type:control")
+        self.assertEqual({0, 3}, result)
+        result = list_filter.apply_filter("square")
+        self.assertEqual({2}, result)
+
+    def test_q_list_widget_filter_type_narrowing(self):
+        from PySide2.QtWidgets import QListWidget, QListWidgetItem
+        from PySide2.QtCore import Qt
+        list_widget = QListWidget()
+        for name, item_type in [("type_circle", "Curve"), ("arrow", "Control")]:
+            item = QListWidgetItem(name)
+            item.setData(Qt.UserRole, {"item_type": item_type})
+            list_widget.addItem(item)
+        list_filter = qt_utils.QListWidgetFilter(list_widget)
+        list_filter.rebuild_index()
+        self.assertEqual({0}, list_filter.apply_filter("typ"))
+        self.assertEqual({1}, list_filter.apply_filter("type:co"))  # Not narrower than "typ", full search
+        self.assertEqual({1}, list_filter.apply_filter("type:con"))
+        self.assertEqual({0, 1}, list_filter.apply_filter("type:c"))
+
+    def test_q_list_widget_filter_parse_filter_text(self):
+        result = qt_utils.QListWidgetFilter.parse_filter_text("arrow type:User")
+        self.assertEqual(("arrow", ["user"]), result)
+        result = qt_utils.QListWidgetFilter.parse_filter_text("my_type:x")
+        self.assertEqual(("my_type:x", []), result)
+
+    def test_q_list_widget_filter_get_search_text(self):
+        from PySide2.QtWidgets import QListWidgetItem
+        from PySide2.QtCore import Qt
+        item = QListWidgetItem("circle")
+        self.assertEqual("circle", qt_utils.QListWidgetFilter.get_search_text(item))
+        item.setData(Qt.UserRole, {"object": 1, "item_type": "Control"})
+        self.assertEqual("circle", qt_utils.QListWidgetFilter.get_search_text(item))
+
+    def test_q_list_widget_filter_get_item_type(self):
+        from PySide2.QtWidgets import QListWidgetItem
+        from PySide2.QtCore import Qt
+        item = QListWidgetItem("circle")
+        self.assertEqual("", qt_utils.QListWidgetFilter.get_item_type(item))
+        item.setData(Qt.UserRole, {"object": 1, "item_type": "User Curve"})
+        self.assertEqual("user_curve", qt_utils.QListWidgetFilter.get_item_type(item))
+
+    def test_q_list_widget_filter_debounce(self):
+        from PySide2.QtWidgets import QListWidget
+        list_widget = QListWidget()
+        list_widget.addItem("circle")
+        list_filter = qt_utils.QListWidgetFilter(list_widget)
+        list_filter.rebuild_index()
+        list_filter.set_filter_text("square")
+        self.assertFalse(list_widget.item(0).isHidden())  # Waiting for timer
+        self.assertTrue(list_filter.timer.isActive())
+        list_filter.apply_filter()  # Uses pending text
+        self.assertTrue(list_widget.item(0).isHidden())
+        self.assertFalse(list_filter.timer.isActive())
@@ -17,6 +17,7 @@ for to_append in [package_root_dir, tests_dir]:
         sys.path.append(to_append)
 from tests import maya_test_tools
 from gt.utils import anim_utils
+cmds = maya_test_tools.cmds
 
 
 def import_anim_test_file():
@@ -58,3 +59,65 @@ class TestAnimUtils(unittest.TestCase):
         result = anim_utils.delete_double_keyframes()
         expected = 3
         self.assertEqual(expected, result)
+
+    def test_get_world_space_samples(self):
+        cube = maya_test_tools.create_poly_cube(name="cube")
+        group = cmds.group(name="group", empty=True)
+        cmds.parent(cube, group)
+        cmds.setAttr(f"{group}.tx", 10)
+        cmds.setKeyframe(cube, attribute="ty", time=1, value=0)
+        cmds.setKeyframe(cube, attribute="ty", time=3, value=2)
+        cmds.currentTime(1)
+        result = anim_utils.get_world_space_samples(cube, start_frame=1, end_frame=3)
+        self.assertEqual(1, cmds.currentTime(q=True))  # Time is not changed
+        self.assertEqual(["|group|cube"], list(result.get("objects")))
+        translate = [round(value, 3) for value in result.get("objects").get("|group|cube").get("translate")]
+        expected = [10, 0, 0, 10, 1, 0, 10, 2, 0]
+        self.assertEqual(expected, translate)
+        rotate = [round(value, 3) for value in result.get("objects").get("|group|cube").get("rotate")]
+        self.assertEqual([0, 0, 0, 1] * 3, rotate)
+
+    def test_bake_world_space_samples(self):
+        cube = maya_test_tools.create_poly_cube(name="cube")
+        cmds.setKeyframe(cube, attribute="tx", time=1, value=0)
+        cmds.setKeyframe(cube, attribute="tx", time=5, value=4)
+        cmds.setKeyframe(cube, attribute="ry", time=1, value=0)
+        cmds.setKeyframe(cube, attribute="ry", time=5, value=90)
+        samples = anim_utils.get_world_space_samples(cube, start_frame=1, end_frame=5)
+        cmds.cutKey(cube, attribute=["tx", "ry"])
+        cmds.setAttr(f"{cube}.tx", 20)
+        result = anim_utils.bake_world_space_samples(samples)
+        self.assertEqual(["|cube"], result)
+        self.assertEqual(5, cmds.keyframe(f"{cube}.tx", q=True, keyframeCount=True))
+        for frame in range(1, 6):
+            cmds.currentTime(frame)
+            self.assertAlmostEqual(frame - 1, cmds.getAttr(f"{cube}.tx"), places=3)
+            self.assertAlmostEqual((frame - 1) * 22.5, cmds.getAttr(f"{cube}.ry"), places=3)
+
+    def test_bake_world_space_samples_undo(self):
+        cube = maya_test_tools.create_poly_cube(name="cube")
+        cmds.setKeyframe(cube, attribute="tx", time=1, value=0)
+        cmds.setKeyframe(cube, attribute="tx", time=5, value=4)
+        samples = anim_utils.get_world_space_samples(cube, start_frame=1, end_frame=5)
+        cmds.cutKey(cube, attribute="tx", time=(2, 5))
+        cmds.undoInfo(state=True)
+        anim_utils.bake_world_space_samples(samples)
+        self.assertEqual(5, cmds.keyframe(f"{cube}.tx", q=True, keyframeCount=True))
+        self.assertEqual(5, cmds.keyframe(f"{cube}.ty", q=True, keyframeCount=True))
+        cmds.undo()
+        self.assertEqual([0], cmds.keyframe(f"{cube}.tx", q=True, valueChange=True))
+        self.assertFalse(cmds.listConnections(f"{cube}.ty", source=True, destination=False))
+        cmds.redo()
+        self.assertEqual(5, cmds.keyframe(f"{cube}.tx", q=True, keyframeCount=True))
+
+    def test_set_keys_in_bulk_replaces_range(self):
+        import maya.api.OpenMaya as OpenMaya
+        cube = maya_test_tools.create_poly_cube(name="cube")
+        cmds.setKeyframe(cube, attribute="tx", time=2, value=5)
+        cmds.setKeyframe(cube, attribute="tx", time=10, value=5)
+        selection = OpenMaya.MSelectionList()
+        selection.add(f"{cube}.tx")
+        result = anim_utils.set_keys_in_bulk(selection.getPlug(0), frames=[1, 2, 3], values=[0, 1, 2])
+        self.assertTrue(result)
+        keys = cmds.keyframe(f"{cube}.tx", q=True, valueChange=True)
+        self.assertEqual([0, 1, 2, 5], keys)
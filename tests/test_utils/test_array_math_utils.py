@@ -0,0 +1,126 @@
+import unittest
+import logging
+import sys
+import os
+
+# Logging Setup
+logging.basicConfig()
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+
+# Import Utility
+test_utils_dir = os.path.dirname(__file__)
+tests_dir = os.path.dirname(test_utils_dir)
+package_root_dir = os.path.dirname(tests_dir)
+for to_append in [package_root_dir, tests_dir]:
+    if to_append not in sys.path:
+        sys.path.append(to_append)
+from gt.utils import array_math_utils
+from gt.utils.array_math_utils import MathBackends
+
+
+class TestArrayMathUtils(unittest.TestCase):
+    def setUp(self):
+        self.original_backend = array_math_utils.get_math_backend()
+        self.backends = [MathBackends.PYTHON]
+        if array_math_utils.is_numpy_available():
+            self.backends.append(MathBackends.NUMPY)
+        self.matrix = [0, 1, 0, 0,  # Rotated 90 degrees in Z, translated to (1, 2, 3)
+                       -1, 0, 0, 0,
+                       0, 0, 1, 0,
+                       1, 2, 3, 1]
+
+    def tearDown(self):
+        array_math_utils.set_math_backend(self.original_backend)
+
+    def assert_all_almost_equal(self, expected, result):
+        self.assertEqual(len(expected), len(result))
+        for expected_values, result_values in zip(expected, result):
+            for expected_value, result_value in zip(expected_values, result_values):
+                self.assertAlmostEqual(expected_value, result_value)
+
+    def test_set_math_backend(self):
+        array_math_utils.set_math_backend(MathBackends.PYTHON)
+        self.assertEqual(MathBackends.PYTHON, array_math_utils.get_math_backend())
+        with self.assertRaises(ValueError):
+            array_math_utils.set_math_backend("unknown")
+
+    def test_flatten_matrix(self):
+        nested = [[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0], [4, 5, 6, 1]]
+        expected = [1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, 4, 5, 6, 1]
+        self.assertEqual(expected, array_math_utils.flatten_matrix(nested))
+        self.assertEqual(expected, array_math_utils.flatten_matrix(tuple(expected)))
+        with self.assertRaises(ValueError):
+            array_math_utils.flatten_matrix([1, 0, 0])
+
+    def test_transform_points(self):
+        for backend in self.backends:
+            with self.subTest(backend=backend):
+                array_math_utils.set_math_backend(backend)
+                result = array_math_utils.transform_points(self.matrix, [(0, 0, 0), (1, 0, 0), (0, 1, 0)])
+                expected = [(1, 2, 3), (1, 3, 3), (0, 2, 3)]
+                self.assert_all_almost_equal(expected, result)
+                self.assertEqual([], array_math_utils.transform_points(self.matrix, []))
+
+    def test_multiply_matrices(self):
+        identity = [1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1]
+        parent = [1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, 10, 0, 0, 1]  # Translated to (10, 0, 0)
+        for backend in self.backends:
+            with self.subTest(backend=backend):
+                array_math_utils.set_math_backend(backend)
+                result = array_math_utils.multiply_matrices([identity, self.matrix], [parent])
+                expected = [parent, [0, 1, 0, 0, -1, 0, 0, 0, 0, 0, 1, 0, 11, 2, 3, 1]]
+                self.assert_all_almost_equal(expected, result)
+                with self.assertRaises(ValueError):
+                    array_math_utils.multiply_matrices([identity, identity], [parent, parent, parent])
+
+    def test_get_distances(self):
+        for backend in self.backends:
+            with self.subTest(backend=backend):
+                array_math_utils.set_math_backend(backend)
+                result = array_math_utils.get_distances([(0, 0, 0), (1, 1, 1)], [(0, 3, 4), (1, 1, 1)])
+                self.assertEqual([5, 0], result)
+                with self.assertRaises(ValueError):
+                    array_math_utils.get_distances([(0, 0, 0)], [])
+
+    def test_get_path_length(self):
+        for backend in self.backends:
+            with self.subTest(backend=backend):
+                array_math_utils.set_math_backend(backend)
+                points = [(0, 0, 0), (0, 0, 2), (2, 0, 2), (2, 0, 0), (6, 0, 0)]
+                self.assertEqual(10, array_math_utils.get_path_length(points))
+                self.assertEqual(0, array_math_utils.get_path_length(points[:1]))
+
+    def test_dot_and_cross_products(self):
+        for backend in self.backends:
+            with self.subTest(backend=backend):
+                array_math_utils.set_math_backend(backend)
+                vectors_a = [(1, 0, 0), (1, 2, 3)]
+                vectors_b = [(0, 1, 0), (4, 5, 6)]
+                self.assertEqual([0, 32], array_math_utils.dot_products(vectors_a, vectors_b))
+                expected = [[0, 0, 1], [-3, 6, -3]]
+                self.assertEqual(expected, array_math_utils.cross_products(vectors_a, vectors_b))
+
+    def test_get_points_center_and_bounds(self):
+        for backend in self.backends:
+            with self.subTest(backend=backend):
+                array_math_utils.set_math_backend(backend)
+                points = [(0, -2, 0), (1, 6, 4)]
+                self.assertEqual((0.5, 2, 2), array_math_utils.get_points_center(points))
+                self.assertEqual(((0, -2, 0), (1, 6, 4)), array_math_utils.get_points_bounds(points))
+                self.assertEqual((0, 0, 0), array_math_utils.get_points_center([]))
+                self.assertIsNone(array_math_utils.get_points_bounds([]))
+
+    def test_evaluate_curve_points(self):
+        points = [(0, 0, 0), (1, 1, 0), (2, 0, 0)]
+        result = array_math_utils.evaluate_curve_points(points=points, knots=[0, 0, 1, 1], degree=2,
+                                                        samples_per_span=4)
+        expected = [(0, 0, 0), (0.5, 0.375, 0), (1, 0.5, 0), (1.5, 0.375, 0), (2, 0, 0)]
+        self.assert_all_almost_equal(expected, result)
+
+    def test_evaluate_curve_points_linear(self):
+        points = [(0, 0, 0), (1, 0, 0), (1, 0, 1)]
+        result = array_math_utils.evaluate_curve_points(points=points, knots=[0, 1, 2], degree=1)
+        self.assertEqual(points, result)
+        result = array_math_utils.evaluate_curve_points(points=points, knots=[0, 1], degree=2)  # Invalid knots
+        self.assertEqual(points, result)
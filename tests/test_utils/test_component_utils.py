@@ -0,0 +1,111 @@
+import unittest
+import logging
+import sys
+import os
+
+# Logging Setup
+logging.basicConfig()
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+
+# Import Utility and Maya Test Tools
+test_utils_dir = os.path.dirname(__file__)
+tests_dir = os.path.dirname(test_utils_dir)
+package_root_dir = os.path.dirname(tests_dir)
+for to_append in [package_root_dir, tests_dir]:
+    if to_append not in sys.path:
+        sys.path.append(to_append)
+from tests import maya_test_tools
+from gt.utils import component_utils
+from gt.utils.component_utils import ComponentSet
+cmds = maya_test_tools.cmds
+
+
+class TestComponentUtils(unittest.TestCase):
+    def setUp(self):
+        maya_test_tools.force_new_scene()
+
+    @classmethod
+    def setUpClass(cls):
+        maya_test_tools.import_maya_standalone(initialize=True)  # Start Maya Headless (mayapy.exe)
+
+    def test_merge_index_ranges(self):
+        result = component_utils.merge_index_ranges([(4, 8), (0, 5), (10, 12), (12, 13), (20, 20)])
+        expected = [(0, 8), (10, 13)]
+        self.assertEqual(expected, result)
+
+    def test_get_index_ranges(self):
+        result = component_utils.get_index_ranges([5, 0, 2, 1, 2])
+        expected = [(0, 3), (5, 6)]
+        self.assertEqual(expected, result)
+
+    def test_component_set_from_indices(self):
+        component_set = ComponentSet.from_indices("mesh", "vtx", [0, 1, 2, 5])
+        self.assertEqual(4, len(component_set))
+        self.assertEqual([0, 1, 2, 5], component_set.get_indices())
+        self.assertEqual(["mesh.vtx[0:2]", "mesh.vtx[5]"], component_set.get_names())
+        expected = ["mesh.vtx[0]", "mesh.vtx[1]", "mesh.vtx[2]", "mesh.vtx[5]"]
+        self.assertEqual(expected, component_set.get_flattened_names())
+        self.assertEqual(expected, component_set)
+
+    def test_component_set_from_names(self):
+        component_set = ComponentSet.from_names(["mesh.vtx[0:2]", "mesh.vtx[5]", "mesh.vtx[3]"])
+        self.assertEqual("mesh", component_set.node)
+        self.assertEqual("vtx", component_set.component_type)
+        self.assertEqual([(0, 4), (5, 6)], component_set.get_ranges())
+        self.assertEqual(ComponentSet.from_indices("mesh", "vtx", [0, 1, 2, 3, 5]), component_set)
+
+    def test_component_set_from_names_invalid(self):
+        with self.assertRaises(ValueError):
+            ComponentSet.from_names(["mesh.vtx[0]", "other.vtx[1]"])
+        with self.assertRaises(ValueError):
+            ComponentSet.from_names(["mesh"])
+        self.assertEqual([], ComponentSet.from_names([]))
+
+    def test_component_set_indexing(self):
+        component_set = ComponentSet(node="mesh", component_type="cv", ranges=[(0, 3), (10, 12)])
+        self.assertEqual("mesh.cv[0]", component_set[0])
+        self.assertEqual("mesh.cv[10]", component_set[3])
+        self.assertEqual("mesh.cv[11]", component_set[-1])
+        self.assertEqual(["mesh.cv[2]", "mesh.cv[10]"], component_set[2:4])
+        with self.assertRaises(IndexError):
+            component_set[5]
+
+    def test_component_set_contains(self):
+        component_set = ComponentSet(node="mesh", component_type="vtx", ranges=[(0, 3), (10, 12)])
+        self.assertIn(2, component_set)
+        self.assertIn("mesh.vtx[11]", component_set)
+        self.assertNotIn(3, component_set)
+        self.assertNotIn("mesh.vtx[12]", component_set)
+        self.assertNotIn("mesh.e[1]", component_set)
+        self.assertNotIn("other.vtx[1]", component_set)
+
+    def test_component_set_operations(self):
+        set_a = ComponentSet.from_indices("mesh", "vtx", [0, 1, 2, 3, 4, 8, 9])
+        set_b = ComponentSet.from_indices("mesh", "vtx", [3, 4, 5, 9])
+        self.assertEqual([0, 1, 2, 3, 4, 5, 8, 9], (set_a | set_b).get_indices())
+        self.assertEqual([3, 4, 9], (set_a & set_b).get_indices())
+        self.assertEqual([0, 1, 2, 8], (set_a - set_b).get_indices())
+        self.assertEqual([5], (set_b - set_a).get_indices())
+        self.assertEqual(set_a, set_a | ComponentSet())
+
+    def test_component_set_operations_mismatch(self):
+        set_a = ComponentSet.from_count("mesh", "vtx", 8)
+        set_b = ComponentSet.from_count("mesh", "e", 12)
+        with self.assertRaises(ValueError):
+            set_a | set_b
+
+    def test_get_components(self):
+        cube = maya_test_tools.create_poly_cube(name="cube_one")
+        result = component_utils.get_components(cube)
+        self.assertIsInstance(result, ComponentSet)
+        self.assertEqual(["cube_one.vtx[0:7]"], result.get_names())
+        expected = ['cube_one.f[0]', 'cube_one.f[1]', 'cube_one.f[2]',
+                    'cube_one.f[3]', 'cube_one.f[4]', 'cube_one.f[5]']
+        self.assertEqual(expected, component_utils.get_components(cube, component_type="f"))
+
+    def test_get_components_curve(self):
+        curve = cmds.curve(point=[[0, 0, 0], [0, 1, 0], [0, 2, 0], [0, 3, 0]], degree=3, name="curve_one")
+        result = component_utils.get_components(curve, component_type="cv", full_path=True)
+        expected = ['|curve_one.cv[0]', '|curve_one.cv[1]', '|curve_one.cv[2]', '|curve_one.cv[3]']
+        self.assertEqual(expected, result)
@@ -191,6 +191,46 @@ class TestControlUtils(unittest.TestCase):
             if not control_obj.is_curve_valid():
                 raise Exception(f'Invalid control. Missing build function: "{ctrl_key}"')
 
+    def test_get_control_preview_data(self):
+        control_utils.clear_control_preview_cache()
+        calls = []
+
+        def build_circle(radius=1):
+            calls.append(radius)
+            circle = cmds.circle(radius=radius, normal=(0, 1, 0), constructionHistory=True)[0]
+            cmds.group(circle, name="mocked_grp")  # Extra nodes are also removed
+            return circle
+
+        cube = cmds.polyCube()[0]
+        cmds.select(cube)
+        nodes_before = cmds.ls()
+        result = control_utils.get_control_preview_data(build_function=build_circle, parameters={"radius": 2})
+        self.assertEqual(nodes_before, cmds.ls())  # Nothing was kept in the scene
+        self.assertEqual([cube], cmds.ls(selection=True))
+        self.assertEqual(1, len(result.get("shapes")))
+        shape_data = result.get("shapes")[0]
+        self.assertEqual(3, shape_data.get("degree"))
+        self.assertAlmostEqual(2, max(point[0] for point in shape_data.get("points")), places=0)
+
+        result_cached = control_utils.get_control_preview_data(build_function=build_circle, parameters={"radius": 2})
+        self.assertEqual(result, result_cached)
+        self.assertEqual([2], calls)  # Cached, the build function was not called again
+        control_utils.get_control_preview_data(build_function=build_circle, parameters={"radius": 3})
+        self.assertEqual([2, 3], calls)
+
+    def test_control_get_preview_curve(self):
+        def build_circle(radius=1):
+            return cmds.circle(radius=radius)[0]
+
+        control = Control(build_function=build_circle)
+        self.assertIsNone(control.get_preview_data(parameters={"invalid_key": 1}))
+        self.assertIsNone(control.get_preview_data(parameters="{invalid"))
+        curve = control.get_preview_curve(parameters="{'radius': 2}")
+        self.assertTrue(curve.is_curve_valid())
+        self.assertEqual(0, len(cmds.ls(type="nurbsCurve")))  # Only data, nothing in the scene
+        built_curve = curve.build()
+        self.assertTrue(cmds.objExists(built_curve))
+
     def test_get_control_preview_image_path(self):
         path = control_utils.get_control_preview_image_path("scalable_one_side_arrow")
         result = os.path.exists(path)
@@ -409,6 +409,27 @@ class TestCurveUtils(unittest.TestCase):
         expected = "|my_curve"
         self.assertEqual(expected, result)
 
+    def test_curve_build_shapes(self):
+        curve_shape_a = curve_utils.CurveShape(name="shape_a", points=[[0, 0, 0], [0, 0, -1]], degree=1)
+        curve_shape_b = curve_utils.CurveShape(name="shape_b", points=[[0, 0, 0], [1, 0, 0]], degree=1)
+        curve = curve_utils.Curve(name="my_curve", shapes=[curve_shape_a, curve_shape_b])
+        result = curve.build()
+        self.assertTrue(cmds.objExists("my_curve"))
+        shapes = cmds.listRelatives(result, shapes=True) or []
+        expected = ["shape_a", "shape_b"]
+        self.assertEqual(expected, shapes)
+        self.assertFalse(cmds.objExists("shape_b_transform"))
+
+    def test_curve_get_shapes_key(self):
+        curve_shape_a = curve_utils.CurveShape(name="shape_a", points=[[0, 0, 0], [0, 0, -1]], degree=1)
+        curve_shape_b = curve_utils.CurveShape(name="shape_a", points=[[0, 0, 0], [0, 0, -1]], degree=1)
+        curve_shape_c = curve_utils.CurveShape(name="shape_a", points=[[0, 0, 0], [0, 0, 1]], degree=1)
+        curve_a = curve_utils.Curve(name="curve_a", shapes=[curve_shape_a])
+        curve_b = curve_utils.Curve(name="curve_b", shapes=[curve_shape_b])
+        curve_c = curve_utils.Curve(name="curve_c", shapes=[curve_shape_c])
+        self.assertEqual(curve_a.get_shapes_key(), curve_b.get_shapes_key())
+        self.assertNotEqual(curve_a.get_shapes_key(), curve_c.get_shapes_key())
+
     def test_curve_transform(self):
         curve_shape_data = {'degree': 1,
                             'is_bezier': False,
@@ -545,9 +566,13 @@ class TestCurveUtils(unittest.TestCase):
         result = os.path.exists(path)
         self.assertTrue(result)
         result = os.path.basename(path)
-        expected = "circle.crv"
+        expected = "curves.crvb"
         self.assertEqual(expected, result)
 
+    def test_get_curve_path_missing(self):
+        result = curve_utils.get_curve_file_path("mocked_missing_curve")
+        self.assertIsNone(result)
+
     def test_get_curve_preview_image_path(self):
         path = curve_utils.get_curve_preview_image_path("circle")
         result = os.path.exists(path)
@@ -627,9 +652,66 @@ class TestCurveUtils(unittest.TestCase):
         with patch('gt.utils.curve_utils.Curves', new=MockedCurves):
             temp_folder = maya_test_tools.generate_test_temp_dir()
             curve_utils.generate_package_curves_thumbnails(target_dir=temp_folder)
-            expected = ['two_lines.jpg']
-            result = os.listdir(temp_folder)
+            expected = [curve_utils.CURVE_THUMBNAIL_MANIFEST, 'two_lines.jpg']
+            result = sorted(os.listdir(temp_folder))
+            self.assertEqual(expected, result)
+
+    @patch('gt.utils.curve_utils.generate_package_curve_thumbnail')
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_generate_curves_thumbnails_incremental(self, mock_stdout, mock_generate_thumbnail):
+        curve_data_path = os.path.join(maya_test_tools.get_data_dir_path(), 'two_lines.crv')
+        curve = curve_utils.Curve(data_from_file=curve_data_path)
+
+        class MockedCurves:  # Mocked curves class
+            two_lines = curve
+
+        def create_image(target_dir, curve):
+            with open(os.path.join(target_dir, f'{curve.get_name()}.jpg'), "w") as image_file:
+                image_file.write("image")
+        mock_generate_thumbnail.side_effect = create_image
+
+        with patch('gt.utils.curve_utils.Curves', new=MockedCurves):
+            temp_folder = maya_test_tools.generate_test_temp_dir()
+            result = curve_utils.generate_package_curves_thumbnails(target_dir=temp_folder, open_dir=False)
+            self.assertEqual(["two_lines"], result)
+            result = curve_utils.generate_package_curves_thumbnails(target_dir=temp_folder, open_dir=False)
+            self.assertEqual([], result)  # Nothing changed
+            self.assertEqual(1, mock_generate_thumbnail.call_count)
+            curve.shapes[0].points = [[0.0, 0.0, 0.0], [0.0, 0.0, 2.0]]  # Changed data
+            result = curve_utils.generate_package_curves_thumbnails(target_dir=temp_folder, open_dir=False)
+            self.assertEqual(["two_lines"], result)
+            result = curve_utils.generate_package_curves_thumbnails(target_dir=temp_folder, open_dir=False,
+                                                                    incremental=False)
+            self.assertEqual(["two_lines"], result)
+
+    def test_get_curve_thumbnail_hash(self):
+        curve_shape = curve_utils.CurveShape(name="my_curve", points=[[0, 0, 0], [0, 0, -1]], degree=1)
+        curve = curve_utils.Curve(name="my_curve", shapes=[curve_shape])
+        hash_a = curve_utils.get_curve_thumbnail_hash(curve=curve)
+        hash_b = curve_utils.get_curve_thumbnail_hash(curve=curve)
+        hash_c = curve_utils.get_curve_thumbnail_hash(curve=curve, rgb_color=(1, 0, 0))
+        self.assertEqual(hash_a, hash_b)
+        self.assertNotEqual(hash_a, hash_c)
+
+    def test_get_outdated_curve_thumbnails(self):
+        curve_shape = curve_utils.CurveShape(name="my_curve", points=[[0, 0, 0], [0, 0, -1]], degree=1)
+        curve = curve_utils.Curve(name="my_curve", shapes=[curve_shape])
+
+        class MockedCurves:  # Mocked curves class
+            my_curve = curve
+
+        with patch('gt.utils.curve_utils.Curves', new=MockedCurves):
+            temp_folder = maya_test_tools.generate_test_temp_dir()
+            result = curve_utils.get_outdated_curve_thumbnails(target_dir=temp_folder)
+            expected = {"my_curve": curve_utils.get_curve_thumbnail_hash(curve=curve)}
             self.assertEqual(expected, result)
+            curve_utils.update_curve_thumbnail_manifest(target_dir=temp_folder, thumbnail_hashes=expected)
+            result = curve_utils.get_outdated_curve_thumbnails(target_dir=temp_folder)
+            self.assertEqual(expected, result)  # Image is still missing
+            with open(os.path.join(temp_folder, "my_curve.jpg"), "w") as image_file:
+                image_file.write("image")
+            result = curve_utils.get_outdated_curve_thumbnails(target_dir=temp_folder)
+            self.assertEqual({}, result)
 
     def test_curve_get_name(self):
         curve_shape_data = {'name': 'my_curve',
@@ -661,13 +743,106 @@ class TestCurveUtils(unittest.TestCase):
         curve = curve_utils.get_curve(file_name="mocked_missing_file", curve_dir=maya_test_tools.get_data_dir_path())
         self.assertFalse(curve)
 
+    def test_lazy_curve(self):
+        lazy_curve = curve_utils.LazyCurve(file_name="two_lines", curve_dir=maya_test_tools.get_data_dir_path())
+
+        class MockedCurves:  # Mocked curves class
+            two_lines = lazy_curve
+
+        self.assertFalse(lazy_curve.is_loaded)
+        result = MockedCurves.two_lines
+        self.assertTrue(lazy_curve.is_loaded)
+        self.assertIsInstance(result, curve_utils.Curve)
+        self.assertIs(result, MockedCurves.two_lines)  # Memoized
+
+    def test_lazy_curve_clear(self):
+        lazy_curve = curve_utils.LazyCurve(file_name="two_lines", curve_dir=maya_test_tools.get_data_dir_path())
+
+        class MockedCurves:  # Mocked curves class
+            two_lines = lazy_curve
+
+        first_curve = MockedCurves.two_lines
+        lazy_curve.clear()
+        self.assertFalse(lazy_curve.is_loaded)
+        self.assertIsNot(first_curve, MockedCurves.two_lines)
+
+    def test_get_curve_library_names(self):
+        class MockedCurves:  # Mocked curves class
+            two_lines = curve_utils.LazyCurve(file_name="two_lines", curve_dir=maya_test_tools.get_data_dir_path())
+            circle = curve_utils.Curve(name="circle")
+            not_a_curve = "mocked_string"
+
+        result = curve_utils.get_curve_library_names(library=MockedCurves)
+        expected = ["two_lines", "circle"]
+        self.assertEqual(expected, result)
+        lazy_curve = vars(MockedCurves).get("two_lines")
+        self.assertFalse(lazy_curve.is_loaded)
+
+    def test_get_curve_from_package_bundle(self):
+        result = os.path.exists(curve_utils.PACKAGE_CURVE_BUNDLE)
+        self.assertTrue(result)
+        curve = curve_utils.get_curve(file_name="circle")
+        self.assertIsInstance(curve, curve_utils.Curve)
+        self.assertEqual("circle", curve.get_name())
+
+    def test_write_curve_bundle_round_trip(self):
+        temp_dir = maya_test_tools.generate_test_temp_dir()
+        bundle_path = os.path.join(temp_dir, "curves.crvb")
+        extract_dir = os.path.join(temp_dir, "extracted")
+        data_dir = maya_test_tools.get_data_dir_path()
+        result = curve_utils.write_curve_bundle(source_dir=data_dir, bundle_path=bundle_path)
+        self.assertEqual(bundle_path, result)
+        written_files = curve_utils.extract_curve_bundle(target_dir=extract_dir, bundle_path=bundle_path)
+        expected = [os.path.join(extract_dir, "two_lines.crv")]
+        self.assertEqual(expected, written_files)
+        with open(os.path.join(data_dir, "two_lines.crv"), 'r') as file:
+            expected = json.load(file)
+        with open(written_files[0], 'r') as file:
+            result = json.load(file)
+        self.assertEqual(expected, result)
+        curve_utils.get_curve_bundle(file_path=bundle_path).close()
+
+    def test_curve_bundle_get_curve(self):
+        temp_dir = maya_test_tools.generate_test_temp_dir()
+        bundle_path = os.path.join(temp_dir, "curves.crvb")
+        curve_utils.write_curve_bundle(source_dir=maya_test_tools.get_data_dir_path(), bundle_path=bundle_path)
+        bundle = curve_utils.CurveBundle(bundle_path)
+        self.assertEqual(["two_lines"], bundle.get_curve_names())
+        self.assertTrue(bundle.has_curve("two_lines"))
+        self.assertFalse(bundle.get_curve("mocked_missing_curve"))
+        curve = bundle.get_curve("two_lines")
+        self.assertIsInstance(curve, curve_utils.Curve)
+        bundle.close()
+
+    def test_curve_bundle_invalid_file(self):
+        temp_dir = maya_test_tools.generate_test_temp_dir()
+        invalid_bundle = os.path.join(temp_dir, "invalid.crvb")
+        with open(invalid_bundle, 'wb') as file:
+            file.write(b'mocked_invalid_content')
+        with self.assertRaises(ValueError):
+            curve_utils.CurveBundle(invalid_bundle)
+
+    def test_read_curve_from_bundle_file(self):
+        temp_dir = maya_test_tools.generate_test_temp_dir()
+        bundle_path = os.path.join(temp_dir, "curves.crvb")
+        curve_utils.write_curve_bundle(source_dir=maya_test_tools.get_data_dir_path(), bundle_path=bundle_path)
+        curve = curve_utils.Curve(name="two_lines", data_from_file=bundle_path)
+        self.assertTrue(curve.is_curve_valid())
+        curve_utils.get_curve_bundle(file_path=bundle_path).close()
+
     @patch('sys.stdout', new_callable=StringIO)
     def test_print_code_for_crv_files(self, mocked_stdout):
         data_dir = maya_test_tools.get_data_dir_path()
         result = curve_utils.print_code_for_crv_files(target_dir=data_dir, use_output_window=False)
-        expected = 'two_lines = get_curve(file_name="two_lines")'
+        expected = 'two_lines = LazyCurve(file_name="two_lines")'
         self.assertEqual(expected, result)
 
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_print_code_for_crv_files_package_bundle(self, mocked_stdout):
+        result = curve_utils.print_code_for_crv_files(use_output_window=False)
+        expected = 'circle = LazyCurve(file_name="circle")'
+        self.assertIn(expected, result.split('\n'))
+
     @patch('sys.stdout', new_callable=StringIO)
     def test_print_code_for_crv_files_ignore_private_files(self, mocked_stdout):
         temp_dir = maya_test_tools.generate_test_temp_dir()
@@ -679,7 +854,7 @@ class TestCurveUtils(unittest.TestCase):
         result = curve_utils.print_code_for_crv_files(target_dir=temp_dir,
                                                       ignore_private=True,
                                                       use_output_window=False)
-        expected = 'public = get_curve(file_name="public")'
+        expected = 'public = LazyCurve(file_name="public")'
         self.assertEqual(expected, result)
 
     @patch('sys.stdout', new_callable=StringIO)
@@ -693,7 +868,7 @@ class TestCurveUtils(unittest.TestCase):
         result = curve_utils.print_code_for_crv_files(target_dir=temp_dir,
                                                       ignore_private=False,
                                                       use_output_window=False)
-        expected = 'public = get_curve(file_name="public")\n_private = get_curve(file_name="_private")'
+        expected = 'public = LazyCurve(file_name="public")\n_private = LazyCurve(file_name="_private")'
         self.assertEqual(expected, result)
 
     def test_create_text(self):
@@ -811,40 +986,56 @@ class TestCurveUtils(unittest.TestCase):
 
     def test_get_python_shape_code(self):
         cube = maya_test_tools.create_poly_cube()
-        circle_one = cmds.circle()[0]
-        circle_two = cmds.circle()[0]
-        items = [circle_one, circle_two, cube]
-        expected = '# Shape state for "nurbsCircleShape1":\nfor cv in [(\'nurbsCircle1.cv[0]\', (0.0, 0.0, 0.0)), ' \
-                   '(\'nurbsCircle1.cv[1]\', (0.0, 0.0, 0.0)), (\'nurbsCircle1.cv[2]\', (0.0, 0.0, 0.0)), ' \
-                   '(\'nurbsCircle1.cv[3]\', (0.0, 0.0, 0.0)), (\'nurbsCircle1.cv[4]\', (0.0, 0.0, 0.0)), ' \
-                   '(\'nurbsCircle1.cv[5]\', (0.0, 0.0, 0.0)), (\'nurbsCircle1.cv[6]\', (0.0, 0.0, 0.0)), ' \
-                   '(\'nurbsCircle1.cv[7]\', (0.0, 0.0, 0.0))]:\n    cmds.xform(cv[0], os=True, t=cv[1])' \
-                   '\n\n# Shape state for "nurbsCircleShape2":\nfor cv in [(\'nurbsCircle2.cv[0]\', (0.0, 0.0, 0.0)),' \
-                   ' (\'nurbsCircle2.cv[1]\', (0.0, 0.0, 0.0)), (\'nurbsCircle2.cv[2]\', (0.0, 0.0, 0.0)), ' \
-                   '(\'nurbsCircle2.cv[3]\', (0.0, 0.0, 0.0)), (\'nurbsCircle2.cv[4]\', (0.0, 0.0, 0.0)), ' \
-                   '(\'nurbsCircle2.cv[5]\', (0.0, 0.0, 0.0)), (\'nurbsCircle2.cv[6]\', (0.0, 0.0, 0.0)), ' \
-                   '(\'nurbsCircle2.cv[7]\', (0.0, 0.0, 0.0))]:' \
-                   '\n    cmds.xform(cv[0], os=True, t=cv[1])'
+        curve_one = cmds.curve(point=[[0, 0, 0], [0, 0, -1]], degree=1, name="curve_one")
+        curve_two = cmds.curve(point=[[0, 0, 0], [1, 0, 0]], degree=1, name="curve_two")
+        items = [curve_one, curve_two, cube]
+        expected = '# Shape state for "curve_oneShape":\nfor cv in [(\'curve_one.cv[0]\', (0.0, 0.0, 0.0)), ' \
+                   '(\'curve_one.cv[1]\', (0.0, 0.0, -1.0))]:\n    cmds.xform(cv[0], os=True, t=cv[1])' \
+                   '\n\n# Shape state for "curve_twoShape":\nfor cv in [(\'curve_two.cv[0]\', (0.0, 0.0, 0.0)), ' \
+                   '(\'curve_two.cv[1]\', (1.0, 0.0, 0.0))]:\n    cmds.xform(cv[0], os=True, t=cv[1])'
         result = curve_utils.get_python_shape_code(crv_list=items)
         self.assertEqual(expected, result)
 
+    def test_get_python_shape_code_periodic(self):
+        circle = cmds.circle(ch=False)[0]
+        result = curve_utils.get_python_shape_code(crv_list=[circle])
+        expected_cvs = len(cmds.ls(f'{circle}.cv[*]', flatten=True))  # Overlapping CVs are not listed
+        self.assertEqual(expected_cvs, result.count(".cv["))
+
     def test_get_python_curve_code(self):
         cube = maya_test_tools.create_poly_cube()
-        circle_one = cmds.circle()[0]
-        circle_two = cmds.circle()[0]
-        items = [circle_one, circle_two, cube]
-        expected = '# Curve data for "nurbsCircleShape1":\ncmds.curve(point=[[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], ' \
-                   '[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], ' \
-                   '[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]], degree=3, periodic=2, ' \
-                   'knot=[-2.0, -1.0, 0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0], ' \
-                   'name=\'nurbsCircleShape1_transform\')\n\n# Curve data for "nurbsCircleShape2":\ncmds.curve(' \
-                   'point=[[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], ' \
-                   '[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], ' \
-                   '[0.0, 0.0, 0.0]], degree=3, periodic=2, knot=[-2.0, -1.0, 0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, ' \
-                   '7.0, 8.0, 9.0, 10.0], name=\'nurbsCircleShape2_transform\')'
+        curve_one = cmds.curve(point=[[0, 0, 0], [0, 0, -1]], degree=1, name="curve_one")
+        curve_two = cmds.curve(point=[[0, 0, 0], [1, 0, 0]], degree=1, name="curve_two")
+        items = [curve_one, curve_two, cube]
+        expected = '# Curve data for "curve_oneShape":\ncmds.curve(point=[[0.0, 0.0, 0.0], [0.0, 0.0, -1.0]], ' \
+                   'degree=1, name=\'curve_oneShape_transform\')\n\n# Curve data for "curve_twoShape":\n' \
+                   'cmds.curve(point=[[0.0, 0.0, 0.0], [1.0, 0.0, 0.0]], degree=1, name=\'curve_twoShape_transform\')'
         result = curve_utils.get_python_curve_code(crv_list=items)
         self.assertEqual(expected, result)
 
+    def test_get_curve_shape_data(self):
+        curve = cmds.curve(point=[[0, 0, 0], [0, 0, -1.23456]], degree=1, name="my_curve")
+        shape = cmds.listRelatives(curve, shapes=True)[0]
+        result = curve_utils.get_curve_shape_data(shape)
+        expected = {"points": [[0.0, 0.0, 0.0], [0.0, 0.0, -1.235]], "knot": [0.0, 1.0], "degree": 1, "form": 0}
+        self.assertEqual(expected, result)
+        result = curve_utils.get_curve_shape_data(shape, decimals=None)
+        self.assertEqual([0.0, 0.0, -1.23456], result.get("points")[1])
+
+    def test_get_curve_shape_data_periodic(self):
+        circle = cmds.circle(ch=False, degree=3, sections=8)[0]
+        shape = cmds.listRelatives(circle, shapes=True)[0]
+        result = curve_utils.get_curve_shape_data(shape)
+        self.assertEqual(2, result.get("form"))
+        self.assertEqual(3, result.get("degree"))
+        self.assertEqual(11, len(result.get("points")))  # 8 CVs + 3 overlapping CVs
+        self.assertEqual(result.get("points")[:3], result.get("points")[-3:])
+        self.assertEqual(13, len(result.get("knot")))  # CVs + degree - 1
+
+    def test_get_curve_shape_data_missing(self):
+        result = curve_utils.get_curve_shape_data("missing_shape")
+        self.assertIsNone(result)
+
     def test_set_curve_width(self):
         circle_one = cmds.circle()[0]
         result = curve_utils.set_curve_width(obj_list=circle_one, line_width=5)
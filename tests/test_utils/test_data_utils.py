@@ -322,6 +322,27 @@ class TestDataUtils(unittest.TestCase):
         self.assertTrue(os.path.exists(temp_file))
         self.assertTrue(os.path.isfile(temp_file))
 
+    def test_get_directory_file_index(self):
+        test_temp_dir = maya_test_tools.generate_test_temp_dir()
+        for file_name in ["image_a.png", "image_a.jpg", "image_b.png", "other.txt"]:
+            data_utils.make_empty_file(os.path.join(test_temp_dir, file_name))
+        result = data_utils.get_directory_file_index(test_temp_dir, extensions=["jpg", "png"])
+        expected = {"image_a": os.path.join(test_temp_dir, "image_a.jpg"),
+                    "image_b": os.path.join(test_temp_dir, "image_b.png")}
+        self.assertEqual(expected, result)
+
+    def test_get_directory_file_index_all_files(self):
+        test_temp_dir = maya_test_tools.generate_test_temp_dir()
+        data_utils.make_empty_file(os.path.join(test_temp_dir, "other.txt"))
+        result = data_utils.get_directory_file_index(test_temp_dir)
+        expected = {"other": os.path.join(test_temp_dir, "other.txt")}
+        self.assertEqual(expected, result)
+
+    def test_get_directory_file_index_missing_dir(self):
+        result = data_utils.get_directory_file_index("mocked_missing_dir")
+        expected = {}
+        self.assertEqual(expected, result)
+
     @patch('os.chmod')
     @patch('os.unlink')
     def test_on_rm_error(self, mock_chmod, mock_unlink):
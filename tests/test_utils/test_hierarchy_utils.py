@@ -320,6 +320,15 @@ class TestHierarchyUtils(unittest.TestCase):
                     'cube_one.vtx[4]', 'cube_one.vtx[5]', 'cube_one.vtx[6]', 'cube_one.vtx[7]']
         self.assertEqual(expected, components_vtx_a)
         self.assertEqual(expected, components_vtx_b)
+        self.assertIsInstance(components_vtx_a, list)
+
+    def test_get_shape_component_set_mesh_vtx(self):
+        cube = Node(self.cube_one)
+        cube_shape = cmds.listRelatives(cube, shapes=True)
+        result = hierarchy_utils.get_shape_component_set(shape=cube_shape[0], mesh_component_type="vtx")
+        self.assertEqual(['cube_one.vtx[0:7]'], result.get_names())
+        result = hierarchy_utils.get_shape_component_set(shape=cube_shape[0], mesh_component_type="all")
+        self.assertIsNone(result)
 
     def test_get_shape_components_mesh_edges(self):
         cube = Node(self.cube_one)
@@ -57,6 +57,15 @@ class TestMeshUtils(unittest.TestCase):
                     'pCube1.vtx[6]',
                     'pCube1.vtx[7]']
         self.assertEqual(expected, result)
+        self.assertIsInstance(result, list)
+
+    def test_get_vertex_set(self):
+        cube = maya_test_tools.create_poly_cube()
+        result = mesh_utils.get_vertex_set(cube)
+        self.assertEqual(['pCube1.vtx[0:7]'], result.get_names())
+        self.assertEqual(8, len(result))
+        with self.assertRaises(ValueError):
+            mesh_utils.get_vertex_set("mocked_missing_mesh")
 
     def test_get_vertices_triangle(self):
         mesh_utils.import_obj_file(self.triangle_file_path)
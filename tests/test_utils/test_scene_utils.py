@@ -17,6 +17,7 @@ for to_append in [package_root_dir, tests_dir]:
         sys.path.append(to_append)
 from tests import maya_test_tools
 from gt.utils import scene_utils
+cmds = maya_test_tools.cmds
 
 
 def import_test_scene():
@@ -53,3 +54,54 @@ class TestSceneUtils(unittest.TestCase):
         expected = 100
         result = scene_utils.get_distance_in_meters()
         self.assertEqual(expected, result)
+
+    def test_scene_query_cache(self):
+        cube = maya_test_tools.create_poly_cube()
+        with scene_utils.SceneQueryCache() as cache:
+            result = scene_utils.get_objects_of_type("mesh")
+            self.assertEqual([f'|{cube}|{cube}Shape'], result)
+            result = scene_utils.get_objects_of_type("mesh")
+            self.assertEqual([f'|{cube}|{cube}Shape'], result)
+            result = scene_utils.get_parent_path(f'|{cube}|{cube}Shape')
+            self.assertEqual([f'|{cube}'], result)
+            result = scene_utils.attr_path_exists(f'{cube}.tx')
+            self.assertTrue(result)
+            expected = {"hits": 1, "misses": 3}
+            self.assertEqual(expected, cache.get_stats())
+        self.assertEqual(None, scene_utils._active_scene_query_cache)
+
+    def test_scene_query_cache_scene_changes(self):
+        cube = maya_test_tools.create_poly_cube()
+        with scene_utils.SceneQueryCache():
+            self.assertEqual(1, len(scene_utils.get_objects_of_type("mesh")))
+            maya_test_tools.create_poly_cube()
+            self.assertEqual(2, len(scene_utils.get_objects_of_type("mesh")))  # Nodes added, cache cleared
+            self.assertFalse(scene_utils.attr_path_exists(f'{cube}.mockedAttr'))
+            from gt.utils.attr_utils import add_attr
+            add_attr(obj_list=cube, attributes="mockedAttr")
+            self.assertTrue(scene_utils.attr_path_exists(f'{cube}.mockedAttr'))  # Cleared by "add_attr"
+
+    def test_scene_query_cache_raw_add_attr(self):
+        cube = maya_test_tools.create_poly_cube()
+        with scene_utils.SceneQueryCache():
+            self.assertFalse(scene_utils.attr_path_exists(f'{cube}.mockedAttr'))
+            cmds.addAttr(cube, longName="mockedAttr")
+            self.assertTrue(scene_utils.attr_path_exists(f'{cube}.mockedAttr'))  # Missing attributes aren't cached
+
+    def test_invalidate_scene_query_cache(self):
+        cube = maya_test_tools.create_poly_cube()
+        with scene_utils.SceneQueryCache() as cache:
+            scene_utils.attr_path_exists(f'{cube}.tx')
+            scene_utils.invalidate_scene_query_cache(attributes_only=True)
+            self.assertEqual(set(), cache.existing_attrs)
+
+    def test_created_nodes_recorder(self):
+        existing_cube = maya_test_tools.create_poly_cube()
+        with scene_utils.CreatedNodesRecorder() as recorder:
+            cube = maya_test_tools.create_poly_cube()
+            deleted_cube = maya_test_tools.create_poly_cube()
+            cmds.delete(deleted_cube)
+        result = cmds.ls(recorder.get_uuids(), long=True)
+        self.assertIn(f'|{cube}', result)
+        self.assertNotIn(f'|{existing_cube}', result)
+        self.assertFalse(any(deleted_cube in node for node in result))
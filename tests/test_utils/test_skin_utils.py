@@ -1,5 +1,6 @@
 import unittest
 import logging
+import json
 import sys
 import os
 
@@ -102,6 +103,46 @@ class TestSkinUtils(unittest.TestCase):
                     '5': {'end_jnt': 1.0}}
         self.assertEqual(expected, result)
 
+    def test_get_skin_weights_missing_cluster(self):
+        with self.assertRaises(ValueError):
+            skin_utils.get_skin_weights("mocked_missing_cluster")
+
+    def test_get_skin_weights_array(self):
+        import_skinned_test_file()
+        result = skin_utils.get_skin_weights_array("skinCluster1")
+        self.assertIsInstance(result, skin_utils.SkinWeights)
+        self.assertEqual(['root_jnt', 'mid_jnt', 'end_jnt'], result.influences)
+        self.assertEqual(6, result.get_vertex_count())
+        self.assertEqual([1.0, 0.0, 0.0], list(result.get_vertex_weights(0)))
+        self.assertEqual([0.0, 1.0, 0.0], list(result.get_vertex_weights(3)))
+        self.assertEqual([0.0, 0.0, 1.0], list(result.get_vertex_weights(5)))
+
+    def test_skin_weights_invalid_length(self):
+        with self.assertRaises(ValueError):
+            skin_utils.SkinWeights(influences=['jnt_a', 'jnt_b'], weights=[1.0, 0.0, 1.0])
+
+    def test_skin_weights_get_sparse_weights(self):
+        skin_weights = skin_utils.SkinWeights(influences=['jnt_a', 'jnt_b'], weights=[1.0, 0.0, 0.25, 0.75])
+        offsets, influence_indices, values = skin_weights.get_sparse_weights()
+        self.assertEqual([0, 1, 3], list(offsets))
+        self.assertEqual([0, 0, 1], list(influence_indices))
+        self.assertEqual([1.0, 0.25, 0.75], list(values))
+
+    def test_skin_weights_to_dict(self):
+        skin_weights = skin_utils.SkinWeights(influences=['jnt_a', 'jnt_b'], weights=[1.0, 0.0, 0.25, 0.75])
+        result = skin_weights.to_dict()
+        expected = {'0': {'jnt_a': 1.0}, '1': {'jnt_a': 0.25, 'jnt_b': 0.75}}
+        self.assertEqual(expected, result)
+
+    def test_skin_weights_from_dict(self):
+        skin_data = {'0': {'jnt_a': 1.0}, '2': {'jnt_b': 0.75, 'jnt_a': 0.25}}
+        skin_weights = skin_utils.SkinWeights.from_dict(skin_data)
+        self.assertEqual(['jnt_a', 'jnt_b'], skin_weights.influences)
+        self.assertEqual([1.0, 0.0, 0.0, 0.0, 0.25, 0.75], list(skin_weights.weights))
+        skin_weights = skin_utils.SkinWeights.from_dict(skin_data, influences=['jnt_b'])
+        self.assertEqual(['jnt_b', 'jnt_a'], skin_weights.influences)
+        self.assertEqual({'0': {'jnt_a': 1.0}, '1': {}, '2': {'jnt_b': 0.75, 'jnt_a': 0.25}}, skin_weights.to_dict())
+
     def test_set_skin_weights(self):
         import_skinned_test_file()
         skin_data = {'0': {'root_jnt': 1.0},
@@ -118,6 +159,51 @@ class TestSkinUtils(unittest.TestCase):
         result = skin_utils.get_skin_weights(skin_cluster)
         self.assertEqual(skin_data, result)
 
+    def test_set_skin_weights_normalize(self):
+        import_skinned_test_file()
+        skin_data = {'0': {'root_jnt': 3.0, 'mid_jnt': 1.0}}
+        skin_utils.set_skin_weights(skin_cluster="skinCluster1", skin_data=skin_data)
+        result = skin_utils.get_skin_weights("skinCluster1")
+        self.assertEqual({'root_jnt': 0.75, 'mid_jnt': 0.25}, result.get('0'))
+        self.assertEqual({'end_jnt': 1.0}, result.get('5'))  # Vertices missing from the data are not affected
+
+    def test_set_skin_weights_undo(self):
+        import_skinned_test_file()
+        expected = skin_utils.get_skin_weights("skinCluster1")
+        cmds.undoInfo(state=True)
+        skin_data = {'0': {'end_jnt': 1.0}, '4': {'root_jnt': 1.0}}
+        skin_utils.set_skin_weights(skin_cluster="skinCluster1", skin_data=skin_data)
+        self.assertEqual({'end_jnt': 1.0}, skin_utils.get_skin_weights("skinCluster1").get('0'))
+        cmds.undo()
+        self.assertEqual(expected, skin_utils.get_skin_weights("skinCluster1"))
+        cmds.redo()
+        self.assertEqual({'root_jnt': 1.0}, skin_utils.get_skin_weights("skinCluster1").get('4'))
+
+    def test_set_skin_weights_unmatched_influences(self):
+        import_skinned_test_file()
+        expected = skin_utils.get_skin_weights("skinCluster1")
+        skin_data = {'0': {'missing_jnt': 1.0}, '1': {}, '2': {'root_jnt': 0.0}}
+        skin_utils.set_skin_weights(skin_cluster="skinCluster1", skin_data=skin_data)
+        self.assertEqual(expected, skin_utils.get_skin_weights("skinCluster1"))  # Vertices were skipped
+
+    def test_set_skin_weights_array(self):
+        import_skinned_test_file()
+        skin_weights = skin_utils.SkinWeights(influences=['renamed_end_jnt', 'root_jnt'],
+                                              weights=[1.0, 0.0, 0.5, 0.5])
+        result = skin_utils.set_skin_weights_array(skin_cluster="skinCluster1", skin_weights=skin_weights,
+                                                   vertex_ids=[0, 4], influence_remap={'renamed_end_jnt': 'end_jnt'})
+        self.assertEqual([1.0, 0.0, 0.0, 0.0, 0.0, 1.0], list(result.weights))  # Previous weights
+        weights = skin_utils.get_skin_weights("skinCluster1")
+        self.assertEqual({'end_jnt': 1.0}, weights.get('0'))
+        self.assertEqual({'root_jnt': 0.5, 'end_jnt': 0.5}, weights.get('4'))
+
+    def test_get_influence_index_map(self):
+        result = skin_utils.get_influence_index_map(source_influences=['ns:jnt_a', 'jnt_old', 'jnt_missing', 'jnt_c'],
+                                                    target_influences=['jnt_c', 'jnt_a', 'jnt_b'],
+                                                    influence_remap={'jnt_old': 'jnt_b'})
+        expected = {0: 1, 1: 2, 3: 0}
+        self.assertEqual(expected, result)
+
     def test_export_skin_weights_to_json(self):
         import_skinned_test_file()
         test_temp_dir = maya_test_tools.generate_test_temp_dir()
@@ -129,7 +215,6 @@ class TestSkinUtils(unittest.TestCase):
                      '4': {'end_jnt': 1.0},
                      '5': {'end_jnt': 1.0}}
         with open(temp_file, 'w') as file:
-            import json
             json.dump(skin_data, file)
         cmds.delete("skinCluster1")
         cmds.select(['root_jnt', 'mid_jnt', 'end_jnt', 'plane'])
@@ -139,6 +224,117 @@ class TestSkinUtils(unittest.TestCase):
         result = skin_utils.get_skin_weights(skin_cluster)
         self.assertEqual(skin_data, result)
 
+    def test_skin_weights_from_sparse(self):
+        skin_weights = skin_utils.SkinWeights.from_sparse(influences=['jnt_a', 'jnt_b'], offsets=[0, 1, 3],
+                                                          influence_indices=[0, 0, 1], values=[1.0, 0.25, 0.75])
+        self.assertEqual([1.0, 0.0, 0.25, 0.75], list(skin_weights.weights))
+
+    def test_write_read_skin_weights_file(self):
+        test_temp_dir = maya_test_tools.generate_test_temp_dir()
+        skin_weights = skin_utils.SkinWeights(influences=['jnt_a', 'jnt_b', 'jnt_c'],
+                                              weights=[1.0, 0.0, 0.0, 0.25, 0.75, 0.0, 0.0, 0.5, 0.5])
+        for compress in [True, False]:
+            temp_file = os.path.join(test_temp_dir, f"weights_{compress}.skwb")
+            result = skin_utils.write_skin_weights_file(file_path=temp_file, skin_weights=skin_weights,
+                                                        compress=compress, block_size=2)
+            self.assertEqual(temp_file, result)
+            result = skin_utils.read_skin_weights_file(temp_file)
+            self.assertEqual(skin_weights.influences, result.influences)
+            self.assertEqual(list(skin_weights.weights), list(result.weights))
+
+    def test_iter_skin_weights_file(self):
+        test_temp_dir = maya_test_tools.generate_test_temp_dir()
+        temp_file = os.path.join(test_temp_dir, "weights.skwb")
+        skin_weights = skin_utils.SkinWeights(influences=['jnt_a', 'jnt_b'], weights=[1.0, 0.0, 0.5, 0.5, 0.0, 1.0])
+        skin_utils.write_skin_weights_file(file_path=temp_file, skin_weights=skin_weights, block_size=2)
+        result = [(start_vertex, list(block.weights))
+                  for start_vertex, block in skin_utils.iter_skin_weights_file(temp_file)]
+        expected = [(0, [1.0, 0.0, 0.5, 0.5]), (2, [0.0, 1.0])]
+        self.assertEqual(expected, result)
+
+    def test_write_read_skin_weights_blocks(self):
+        test_temp_dir = maya_test_tools.generate_test_temp_dir()
+        temp_file = os.path.join(test_temp_dir, "weights.skwb")
+        skin_weights = skin_utils.SkinWeights(influences=['jnt_a', 'jnt_b'], weights=[1.0, 0.0, 0.5, 0.5, 0.0, 1.0])
+        index, blocks = skin_utils.encode_skin_weights_blocks(skin_weights=skin_weights, block_size=2)
+        self.assertEqual([(2, 3), (1, 1)], [(vertex_count, value_count) for vertex_count, value_count, _ in blocks])
+        result = skin_utils.write_skin_weights_blocks(file_path=temp_file, index=index, blocks=blocks)
+        self.assertEqual(temp_file, result)
+        index, blocks = skin_utils.read_skin_weights_blocks(temp_file)
+        self.assertEqual('zlib', index.get('compression'))
+        result = skin_utils.decode_skin_weights_blocks(index=index, blocks=blocks)
+        self.assertEqual(skin_weights.influences, result.influences)
+        self.assertEqual(list(skin_weights.weights), list(result.weights))
+
+    def test_read_skin_weights_file_invalid(self):
+        test_temp_dir = maya_test_tools.generate_test_temp_dir()
+        temp_file = os.path.join(test_temp_dir, "weights.skwb")
+        with open(temp_file, 'wb') as file:
+            file.write(b'mocked_invalid_data')
+        with self.assertRaises(ValueError):
+            skin_utils.read_skin_weights_file(temp_file)
+
+    def test_convert_skin_weights_json_to_file(self):
+        test_temp_dir = maya_test_tools.generate_test_temp_dir()
+        json_file = os.path.join(test_temp_dir, "weights.json")
+        skin_data = {'0': {'jnt_a': 1.0}, '1': {'jnt_a': 0.25, 'jnt_b': 0.75}}
+        with open(json_file, 'w') as file:
+            json.dump(skin_data, file)
+        result = skin_utils.convert_skin_weights_json_to_file(json_file)
+        expected = os.path.join(test_temp_dir, "weights.skwb")
+        self.assertEqual(expected, result)
+        self.assertEqual(skin_data, skin_utils.read_skin_weights_file(result).to_dict())
+
+    def test_export_import_skin_weights_file(self):
+        import_skinned_test_file()
+        test_temp_dir = maya_test_tools.generate_test_temp_dir()
+        expected = skin_utils.get_skin_weights("skinCluster1")
+        result = skin_utils.export_weights_to_target_folder(obj_list="plane", target_folder=test_temp_dir, binary=True)
+        expected_file = os.path.join(test_temp_dir, "weights_plane.skwb")
+        self.assertEqual([expected_file], result)
+        cmds.delete("skinCluster1")
+        cmds.select(['root_jnt', 'mid_jnt', 'end_jnt', 'plane'])
+        skin_cluster = cmds.skinCluster(tsb=True)[0]
+        skin_utils.import_skin_weights_from_file(target_object="plane", import_file_path=expected_file)
+        result = skin_utils.get_skin_weights(skin_cluster)
+        self.assertEqual(expected, result)
+
+    def test_save_load_skin_weights(self):
+        test_temp_dir = maya_test_tools.generate_test_temp_dir()
+        skin_weights = skin_utils.SkinWeights(influences=['jnt_a', 'jnt_b'], weights=[1.0, 0.0, 0.25, 0.75])
+        for file_name in ["weights.json", "weights.skwb"]:
+            temp_file = os.path.join(test_temp_dir, file_name)
+            skin_utils.save_skin_weights(file_path=temp_file, skin_weights=skin_weights)
+            result = skin_utils.load_skin_weights(temp_file)
+            self.assertEqual(skin_weights.influences, result.influences)
+            self.assertEqual(list(skin_weights.weights), list(result.weights))
+
+    def test_import_weights_from_target_folder(self):
+        import_skinned_test_file()
+        test_temp_dir = maya_test_tools.generate_test_temp_dir()
+        expected = skin_utils.get_skin_weights("skinCluster1")
+        skin_utils.export_weights_to_target_folder(obj_list="plane", target_folder=test_temp_dir, binary=True)
+        cmds.delete("skinCluster1")
+        cmds.select(['root_jnt', 'mid_jnt', 'end_jnt', 'plane'])
+        skin_cluster = cmds.skinCluster(tsb=True)[0]
+        result = skin_utils.import_weights_from_target_folder(source_folder=test_temp_dir)
+        self.assertEqual(["plane"], result)
+        result = skin_utils.get_skin_weights(skin_cluster)
+        self.assertEqual(expected, result)
+
+    def test_import_weights_from_target_folder_json(self):
+        import_skinned_test_file()
+        test_temp_dir = maya_test_tools.generate_test_temp_dir()
+        expected = skin_utils.get_skin_weights("skinCluster1")
+        skin_utils.export_weights_to_target_folder(obj_list="plane", target_folder=test_temp_dir, max_workers=1)
+        cmds.delete("skinCluster1")
+        cmds.select(['root_jnt', 'mid_jnt', 'end_jnt', 'plane'])
+        skin_cluster = cmds.skinCluster(tsb=True)[0]
+        result = skin_utils.import_weights_from_target_folder(source_folder=test_temp_dir, max_workers=1)
+        self.assertEqual(["plane"], result)
+        result = skin_utils.get_skin_weights(skin_cluster)
+        self.assertEqual(expected, result)
+
     def test_bind_skin(self):
         import_skinned_test_file()
         cmds.delete("skinCluster1")
@@ -442,3 +442,43 @@ class TestStringUtils(unittest.TestCase):
     def test_upper_first_char_with_none_input(self):
         with self.assertRaises(ValueError):
             string_utils.upper_first_char(None)
+
+    def test_trigram_index_get_trigrams(self):
+        result = string_utils.TrigramIndex.get_trigrams("arrow")
+        expected = {"arr", "rro", "row"}
+        self.assertEqual(expected, result)
+        result = string_utils.TrigramIndex.get_trigrams("ar")
+        self.assertEqual(set(), result)
+
+    def test_trigram_index_search(self):
+        index = string_utils.TrigramIndex(["circle_arrow", "square", "Arrow_Four_Sides", "circle"])
+        self.assertEqual({0, 2}, index.search("arrow"))
+        self.assertEqual({0, 2}, index.search("ARR"))
+        self.assertEqual({0, 3}, index.search("circle"))
+        self.assertEqual({1}, index.search("q"))
+        self.assertEqual({0, 1, 2, 3}, index.search(""))
+        self.assertEqual(set(), index.search("missing"))
+
+    def test_trigram_index_search_matches_substring(self):
+        names = ["circle_arrow", "arrow_circle", "rowing", "arrows", "narrow", "ar_row"]
+        index = string_utils.TrigramIndex(names)
+        for term in ["arrow", "row", "ar", "r", "w_c", "_", "circle_arrow", "xyz"]:
+            expected = {name_id for name_id, name in enumerate(names) if term in name}
+            self.assertEqual(expected, index.search(term), f'Unexpected result for "{term}"')
+
+    def test_trigram_index_search_candidates(self):
+        index = string_utils.TrigramIndex(["circle_arrow", "arrow", "square"])
+        previous_result = index.search("arr")
+        result = index.search("arrow", candidates=previous_result)
+        self.assertEqual({0, 1}, result)
+        result = index.search("arrow", candidates={1, 2})
+        self.assertEqual({1}, result)
+
+    def test_trigram_index_add_clear(self):
+        index = string_utils.TrigramIndex()
+        self.assertEqual(0, index.add("circle"))
+        self.assertEqual(1, index.add("square"))
+        self.assertEqual({1}, index.search("squ"))
+        index.clear()
+        self.assertEqual(set(), index.search("squ"))
+        self.assertEqual([], index.strings)
@@ -2,6 +2,7 @@ from unittest.mock import patch
 from io import StringIO
 import unittest
 import logging
+import array
 import sys
 import os
 
@@ -1234,6 +1235,66 @@ class TestTransformUtils(unittest.TestCase):
             self.assertAlmostEqualSigFig(expected_sca_y, result_y)
             self.assertAlmostEqualSigFig(expected_sca_z, result_z)
 
+    def test_match_transforms_multiple_sources(self):
+        cube_source_one = maya_test_tools.create_poly_cube()
+        cube_source_two = maya_test_tools.create_poly_cube()
+        cube_target_one = maya_test_tools.create_poly_cube()
+        cube_target_two = maya_test_tools.create_poly_cube()
+        cmds.setAttr(f'{cube_source_one}.translate', 1, 2, 3)
+        cmds.setAttr(f'{cube_source_two}.translate', 4, 5, 6)
+        cmds.setAttr(f'{cube_source_two}.rotate', 10, 20, 30)
+
+        result = transform_utils.match_transforms(source_list=[cube_source_one, cube_source_two],
+                                                  target_list=[cube_target_one, cube_target_two])
+        expected = [f'|{cube_target_one}', f'|{cube_target_two}']
+        self.assertEqual(expected, result)
+        self.assertEqual([(1, 2, 3)], cmds.getAttr(f'{cube_target_one}.translate'))
+        self.assertEqual([(4, 5, 6)], cmds.getAttr(f'{cube_target_two}.translate'))
+        for expected_value, result_value in zip([10, 20, 30], cmds.getAttr(f'{cube_target_two}.rotate')[0]):
+            self.assertAlmostEqualSigFig(expected_value, result_value)
+
+    def test_match_transforms_parented_targets(self):
+        cube_source = maya_test_tools.create_poly_cube()
+        cmds.setAttr(f'{cube_source}.translate', 1, 2, 3)
+        cmds.setAttr(f'{cube_source}.rotate', 0, 45, 0)
+        parent_grp = cmds.group(name="parent_grp", empty=True, world=True)
+        cmds.setAttr(f'{parent_grp}.translate', 5, 0, 0)
+        cmds.setAttr(f'{parent_grp}.rotate', 0, 90, 0)
+        cmds.setAttr(f'{parent_grp}.scale', 2, 2, 2)
+        target_one = cmds.group(name="target_one", empty=True, parent=parent_grp)
+        target_two = cmds.group(name="target_two", empty=True, parent=target_one)  # Child of another target
+
+        transform_utils.match_transform(source=cube_source, target_list=[target_one, target_two])
+
+        for target in [target_one, target_two]:
+            position = cmds.xform(target, query=True, translation=True, worldSpace=True)
+            rotation = cmds.xform(target, query=True, rotation=True, worldSpace=True)
+            for expected_value, result_value in zip([1, 2, 3], position):
+                self.assertAlmostEqualSigFig(expected_value, result_value)
+            for expected_value, result_value in zip([0, 45, 0], rotation):
+                self.assertAlmostEqualSigFig(expected_value, result_value)
+
+    def test_match_rotate_joint_orient(self):
+        cube_source = maya_test_tools.create_poly_cube()
+        cmds.setAttr(f'{cube_source}.rotate', 0, 45, 0)
+        cmds.select(clear=True)
+        joint = cmds.joint(name="target_jnt")
+        cmds.setAttr(f'{joint}.jointOrient', 0, 0, 90)
+
+        transform_utils.match_rotate(source=cube_source, target_list=joint)
+
+        rotation = cmds.xform(joint, query=True, rotation=True, worldSpace=True)
+        for expected_value, result_value in zip([0, 45, 0], rotation):
+            self.assertAlmostEqualSigFig(expected_value, result_value)
+        self.assertEqual([(0, 0, 90)], cmds.getAttr(f'{joint}.jointOrient'))
+
+    def test_get_world_matrices(self):
+        cube = maya_test_tools.create_poly_cube()
+        cmds.setAttr(f'{cube}.translate', 1, 2, 3)
+        result = transform_utils.get_world_matrices([cube, "missing_obj"])
+        expected = [[1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 1.0, 2.0, 3.0, 1.0], None]
+        self.assertEqual(expected, result)
+
     def test_set_equidistant_transforms(self):
         cube_start = maya_test_tools.create_poly_cube()
         cube_end = maya_test_tools.create_poly_cube()
@@ -1655,6 +1716,62 @@ class TestTransformUtils(unittest.TestCase):
         expected = [0.0, 1.0, 3.0]
         self.assertEqual(expected, result)
 
+    def test_get_component_positions_cube(self):
+        cube = maya_test_tools.create_poly_cube(name="mocked_cube")
+        cmds.move(0, 1, 0, cube)
+        result = transform_utils.get_component_positions(shape="mocked_cubeShape", world_space=True)
+        self.assertEqual(24, len(result))  # 8 vertices (X, Y, Z)
+        self.assertEqual([-0.5, 0.5, 0.5], list(result[0:3]))
+        self.assertEqual([0.5, 0.5, -0.5], list(result[21:24]))
+        result = transform_utils.get_component_positions(shape="mocked_cubeShape", world_space=False)
+        self.assertEqual([-0.5, -0.5, 0.5], list(result[0:3]))
+
+    def test_get_component_positions_periodic_curve(self):
+        circle = cmds.circle(name="mocked_circle", degree=3, sections=8, constructionHistory=False)[0]
+        result = transform_utils.get_component_positions(shape=f'{circle}Shape', world_space=True)
+        expected = len(cmds.ls(f'{circle}.cv[*]', flatten=True)) * 3  # Overlapping CVs are skipped
+        self.assertEqual(expected, len(result))
+
+    def test_get_component_positions_unsupported(self):
+        cmds.group(name="mocked_group", empty=True, world=True)
+        self.assertIsNone(transform_utils.get_component_positions(shape="mocked_group"))
+        self.assertIsNone(transform_utils.get_component_positions(shape="missing_shape"))
+
+    def test_set_component_positions_no_undo(self):
+        cube = maya_test_tools.create_poly_cube(name="mocked_cube")
+        cmds.move(0, 1, 0, cube)
+        positions = transform_utils.get_component_positions(shape="mocked_cubeShape", world_space=True)
+        positions[0:3] = array.array('d', [0.0, 0.0, 2.0])
+        old_positions = transform_utils.set_component_positions_no_undo(shape="mocked_cubeShape",
+                                                                        positions=positions, world_space=True)
+        self.assertEqual([-0.5, 0.5, 0.5], list(old_positions[0:3]))
+        result = cmds.xform('mocked_cube.vtx[0]', worldSpace=True, query=True, translation=True)
+        self.assertEqual([0.0, 0.0, 2.0], result)
+        with self.assertRaises(ValueError):
+            transform_utils.set_component_positions_no_undo(shape="mocked_cubeShape", positions=[0.0, 0.0, 0.0])
+
+    def test_set_control_point_positions(self):
+        cube = maya_test_tools.create_poly_cube(name="mocked_cube")
+        cmds.move(0, 1, 0, cube)
+        transform_utils.set_control_point_positions(shape="mocked_cubeShape",
+                                                    positions_by_id={0: [0, 0, 2], 1: [0, 0, 3], 5: [1, 1, 1]})
+        result = cmds.xform('mocked_cube.vtx[0]', worldSpace=True, query=True, translation=True)
+        self.assertEqual([0.0, 0.0, 2.0], [round(value, 3) for value in result])
+        result = cmds.xform('mocked_cube.vtx[5]', worldSpace=True, query=True, translation=True)
+        self.assertEqual([1.0, 1.0, 1.0], [round(value, 3) for value in result])
+        with self.assertRaises(ValueError):
+            transform_utils.set_control_point_positions(shape="mocked_cubeShape", positions_by_id={8: [0, 0, 0]})
+
+    def test_set_component_positions_from_dict_undo(self):
+        crv = cmds.curve(point=[[0.0, 0.0, 1.0], [0.0, 0.0, 0.0], [0.0, 0.0, -1.0]], degree=1, name='mocked_curve')
+        cmds.undoInfo(state=True)
+        transform_utils.set_component_positions_from_dict(component_pos_dict={'|mocked_curve.cv[1]': [0.0, 2.0, 0.0]})
+        result = cmds.xform(f'{crv}.cv[1]', worldSpace=True, query=True, translation=True)
+        self.assertEqual([0.0, 2.0, 0.0], result)
+        cmds.undo()
+        result = cmds.xform(f'{crv}.cv[1]', worldSpace=True, query=True, translation=True)
+        self.assertEqual([0.0, 0.0, 0.0], result)
+
     def test_get_directional_position_object_does_not_exist(self):
         object_name = "non_existing_object"
         logging.disable(logging.WARNING)
@@ -19,6 +19,7 @@ for to_append in [package_root_dir, tests_dir]:
         sys.path.append(to_append)
 from tests import maya_test_tools
 from gt.utils import uuid_utils
+from gt.utils import attr_utils
 cmds = maya_test_tools.cmds
 
 
@@ -180,6 +181,56 @@ class TestUUIDUtils(unittest.TestCase):
         expected = "|pCube1"
         self.assertEqual(expected, result)
 
+    def test_uuid_attr_index(self):
+        cube_one = maya_test_tools.create_poly_cube()
+        cube_two = maya_test_tools.create_poly_cube()
+        attr_name = "mockedAttrName"
+        created_uuid_attr = uuid_utils.add_uuid_attr([cube_one, cube_two], attr_name)
+        cmds.setAttr(created_uuid_attr[0], "mocked_uuid_value", typ="string")
+        cmds.setAttr(created_uuid_attr[1], "mocked_uuid_value_two", typ="string")
+        with uuid_utils.UUIDAttrIndex() as uuid_index:
+            result = uuid_utils.get_object_from_uuid_attr(uuid_string="mocked_uuid_value", attr_name=attr_name)
+            self.assertEqual("|pCube1", result)
+            result = uuid_utils.get_object_from_uuid_attr(uuid_string="mocked_uuid_value_two", attr_name=attr_name)
+            self.assertEqual("|pCube2", result)
+            self.assertEqual(1, uuid_index.build_count)
+            result = uuid_utils.get_object_from_uuid_attr(uuid_string="mocked_missing_uuid", attr_name=attr_name)
+            self.assertEqual(None, result)
+            self.assertEqual(1, uuid_index.build_count)  # No nodes were added, so the index is still up to date
+        self.assertEqual(None, uuid_utils._active_uuid_attr_index)
+
+    def test_uuid_attr_index_scene_changes(self):
+        cube_one = maya_test_tools.create_poly_cube()
+        attr_name = "mockedAttrName"
+        created_uuid_attr = uuid_utils.add_uuid_attr(cube_one, attr_name)
+        cmds.setAttr(created_uuid_attr[0], "mocked_uuid_value", typ="string")
+        with uuid_utils.UUIDAttrIndex():
+            result = uuid_utils.get_object_from_uuid_attr(uuid_string="mocked_uuid_value", attr_name=attr_name)
+            self.assertEqual("|pCube1", result)
+            cmds.rename(cube_one, "renamed_cube")
+            result = uuid_utils.get_object_from_uuid_attr(uuid_string="mocked_uuid_value", attr_name=attr_name)
+            self.assertEqual("|renamed_cube", result)
+            cube_two = maya_test_tools.create_poly_cube()
+            created_uuid_attr = uuid_utils.add_uuid_attr(cube_two, attr_name)
+            cmds.setAttr(created_uuid_attr[0], "mocked_uuid_value_two", typ="string")
+            result = uuid_utils.get_object_from_uuid_attr(uuid_string="mocked_uuid_value_two", attr_name=attr_name)
+            self.assertEqual("|pCube2", result)
+            cmds.delete("renamed_cube")
+            result = uuid_utils.get_object_from_uuid_attr(uuid_string="mocked_uuid_value", attr_name=attr_name)
+            self.assertEqual(None, result)
+
+    def test_uuid_attr_index_set_attr(self):
+        cube_one = maya_test_tools.create_poly_cube()
+        attr_name = "mockedAttrName"
+        created_uuid_attr = uuid_utils.add_uuid_attr(cube_one, attr_name, set_initial_uuid_value=False)
+        with uuid_utils.UUIDAttrIndex() as uuid_index:
+            result = uuid_utils.get_object_from_uuid_attr(uuid_string="mocked_uuid_value", attr_name=attr_name)
+            self.assertEqual(None, result)
+            attr_utils.set_attr(attribute_path=created_uuid_attr[0], value="mocked_uuid_value")
+            result = uuid_utils.get_object_from_uuid_attr(uuid_string="mocked_uuid_value", attr_name=attr_name)
+            self.assertEqual("|pCube1", result)
+            self.assertEqual(2, uuid_index.build_count)
+
     def test_get_uuid(self):
         cube = maya_test_tools.create_poly_cube()
 